@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+메일 발송 방식 처리량 벤치마크
+
+로컬 SMTP 대역 서버(utils.smtp_standin)를 띄우고 같은 메일을 다음 방식으로
+보내 초당 발송 수를 비교한다. 수신한 메일 수와 수신자가 맞는지도 함께 확인한다.
+    - SMTP (메일마다 새 연결): 연결 재사용 전 방식
+    - SMTP (연결 재사용): SmtpTransport
+    - 파일 저장: FileSinkTransport (maildir)
+
+사용법:
+    python -m benchmarks.bench_mail_transport [메일 수]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.mail_transport import FileSinkTransport, MailMessage, SmtpTransport  # noqa: E402
+from utils.smtp_standin import SmtpStandIn  # noqa: E402
+
+RECIPIENTS = ["a@example.com", "b@example.com"]
+HTML_BODY = "<html><body>" + "<p>데일리 리포트 작업 항목</p>" * 200 + "</body></html>"
+
+
+def send_all(transport, count):
+    """메일 count개 발송 후 걸린 시간(초) 반환"""
+    start = time.perf_counter()
+    for i in range(count):
+        transport.send(MailMessage(f"[벤치마크] 리포트 {i}", RECIPIENTS, HTML_BODY))
+    elapsed = time.perf_counter() - start
+    transport.close()
+    return elapsed
+
+
+class ReconnectingSmtpTransport(SmtpTransport):
+    """메일마다 연결을 새로 맺는 SMTP 발송 (비교용)"""
+
+    def send(self, message):
+        super().send(message)
+        self.close()
+
+
+def report(label, count, elapsed):
+    print(f"{label:<28} {elapsed:8.3f}초  {count / elapsed:10.1f}건/초")
+
+
+def main(count=500):
+    work_dir = tempfile.mkdtemp(prefix="bench_mail_")
+    try:
+        with SmtpStandIn() as server:
+            for label, transport_class in (("SMTP (메일마다 새 연결)", ReconnectingSmtpTransport),
+                                           ("SMTP (연결 재사용)", SmtpTransport)):
+                server.messages.clear()
+                sessions_before = server.session_count
+                transport = transport_class(host=server.host, port=server.port, sender="bench@localhost")
+                elapsed = send_all(transport, count)
+                report(label, count, elapsed)
+
+                assert len(server.messages) == count, f"수신 메일 수 불일치: {len(server.messages)}"
+                assert all(rcpt == RECIPIENTS for _, rcpt, _ in server.messages), "수신자 불일치"
+                print(f"{'':<28} 연결 {server.session_count - sessions_before}회, 수신 {len(server.messages)}건")
+
+        sink = FileSinkTransport(path=os.path.join(work_dir, "mail_sink"))
+        elapsed = send_all(sink, count)
+        report("파일 저장 (maildir)", count, elapsed)
+        saved = len(os.listdir(os.path.join(sink.path, "new")))
+        assert saved == count, f"저장된 메일 수 불일치: {saved}"
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
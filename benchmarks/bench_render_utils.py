@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+렌더링 공용 도구 마이크로 벤치마크
+
+큰 리포트 한 건 분량의 작업(기본 10,000개)을 기준으로 다음을 비교한다.
+    - HTML 이스케이프: 글자마다 사전 조회 후 join (이전 방식) / str.translate / str.replace (render_utils)
+    - 카테고리 색상 조회: 카테고리 목록 선형 탐색 (이전 방식) / CategoryColorMap
+두 방식의 결과가 같은지도 함께 확인한다.
+
+사용법:
+    python -m benchmarks.bench_render_utils [작업 수]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.category import Category  # noqa: E402
+from utils.render_utils import CategoryColorMap, escape_html  # noqa: E402
+
+LEGACY_ESCAPE_TABLE = {"&": "&amp;", '"': "&quot;", "'": "&#39;", ">": "&gt;", "<": "&lt;"}
+TRANSLATE_TABLE = str.maketrans(LEGACY_ESCAPE_TABLE)
+CATEGORY_COUNT = 12
+REPEAT = 5
+
+
+def legacy_escape_html(text):
+    """비교용: 이전 방식의 이스케이프"""
+    if not text:
+        return ""
+    return "".join(LEGACY_ESCAPE_TABLE.get(c, c) for c in text)
+
+
+def translate_escape_html(text):
+    """비교용: str.translate 이스케이프"""
+    return text.translate(TRANSLATE_TABLE) if text else ""
+
+
+def legacy_category_color(categories, category_name):
+    """비교용: 이전 방식의 색상 조회 (행마다 목록 선형 탐색)"""
+    for category in categories:
+        if category.name == category_name:
+            return category.color
+    return "#6c757d"
+
+
+def generate_texts(count, seed=0):
+    """작업 제목/내용 비슷한 문자열 생성 (일부에 HTML 특수문자 포함)"""
+    rng = random.Random(seed)
+    words = ["회의", "검토", "배포", "테스트", "Tester", "LB", "<긴급>", "A&B", "\"보고\"", "정리", "it's"]
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(3, 25))) for _ in range(count)]
+
+
+def best_of(func):
+    """REPEAT회 중 가장 빠른 시간(초)"""
+    return min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def report(label, results, count):
+    """results: [(이름, 초), ...] (첫 항목이 이전 방식)"""
+    print(label)
+    baseline = results[0][1]
+    for name, seconds in results:
+        print(f"  {name:<16} {seconds * 1000:8.2f} ms  ({seconds / count * 1e6:6.2f} us/건)"
+              f"  {baseline / seconds:5.1f}배")
+
+
+def main(count=10000):
+    texts = generate_texts(count)
+    expected = [legacy_escape_html(t) for t in texts]
+    for escape in (translate_escape_html, escape_html):
+        assert [escape(t) for t in texts] == expected, f"이스케이프 결과 불일치: {escape.__name__}"
+    report(f"HTML 이스케이프 (문자열 {count:,}개, 총 {sum(map(len, texts)):,}자)",
+           [(name, best_of(lambda escape=escape: [escape(t) for t in texts]))
+            for name, escape in (("이전 방식", legacy_escape_html), ("str.translate", translate_escape_html),
+                                 ("render_utils", escape_html))],
+           count)
+
+    categories = [Category(f"카테고리{i}", f"#{i:06x}") for i in range(CATEGORY_COUNT)]
+    rng = random.Random(1)
+    # 마지막 몇 개 카테고리와 삭제된 카테고리(목록에 없음)가 섞인 작업
+    names = [rng.choice([c.name for c in categories[-3:]] + ["삭제된 카테고리"]) for _ in range(count)]
+    color_map = CategoryColorMap(categories)
+    assert [legacy_category_color(categories, n) for n in names] == [color_map.get(n) for n in names], \
+        "색상 조회 결과 불일치"
+    report(f"카테고리 색상 조회 (작업 {count:,}개, 카테고리 {CATEGORY_COUNT}개)",
+           [("이전 방식", best_of(lambda: [legacy_category_color(categories, n) for n in names])),
+            ("render_utils", best_of(lambda: [color_map.get(n) for n in names]))],
+           count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
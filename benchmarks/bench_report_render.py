@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTML 리포트 렌더링 벤치마크
+
+작업 1,000개짜리 루틴 리포트(전체/완료/미완료 + 중요 일정)를 반복 생성해
+공용 렌더러(utils.report_renderer)와 이전 방식(f-string + 문자열 += 누적,
+작업마다 카테고리 선형 탐색)을 비교한다. 두 방식 모두 모든 작업 제목이
+결과에 들어갔는지 확인한다.
+
+사용법:
+    python -m benchmarks.bench_report_render [작업 수] [반복 횟수]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_task_model import generate_task_dicts  # noqa: E402
+from models.category import Category  # noqa: E402
+from models.task import Task  # noqa: E402
+from utils.report_renderer import ReportRenderer, _task_row, render_routine_report  # noqa: E402
+
+CATEGORIES = [Category("LB", "#e74c3c"), Category("Tester", "#3498db"), Category("PM", "#2ecc71"),
+              Category("ETC", "#95a5a6")]
+ROUTINE = {"name": "벤치마크 루틴", "content_types": ["all", "completed", "incomplete"],
+           "include_important_tasks": True, "memo": "벤치마크 메모\n둘째 줄"}
+DATE_STR = "2026-01-15"
+
+
+class LegacyReportBuilder:
+    """비교용: 공용 렌더러 도입 이전의 리포트 생성 방식"""
+
+    def __init__(self, categories):
+        self.categories = categories
+
+    def get_category_color(self, category_name):
+        for category in self.categories:
+            if category.name == category_name:
+                return category.color
+        return "#6c757d"
+
+    def escape_html(self, text):
+        if not text:
+            return ""
+        html_escape_table = {"&": "&amp;", '"': "&quot;", "'": "&#39;", ">": "&gt;", "<": "&lt;"}
+        return "".join(html_escape_table.get(c, c) for c in text)
+
+    def create_task_section(self, title, tasks):
+        task_rows = ""
+        for task in tasks:
+            status = "✅" if task.completed else "⏳"
+            text_style = "text-decoration: line-through; color: #666;" if task.completed else ""
+            importance = "⭐ " if task.important else ""
+            border_color = "#4caf50" if task.completed else "#2196f3"
+            content_row = (f'<tr><td style="font-size: 12px; color: #666; padding-top: 5px;">'
+                           f'{self.escape_html(task.content[:50])}</td></tr>') if task.content else ""
+            task_rows += f"""
+            <tr>
+                <td style="padding: 10px; background-color: #f8f9fa; border-left: 3px solid {border_color}; border-radius: 5px;">
+                    <table width="100%" cellpadding="0" cellspacing="0">
+                        <tr>
+                            <td style="{text_style}">
+                                <strong>{status} {importance}{self.escape_html(task.title)}</strong>
+                                <span style="background-color: {self.get_category_color(task.category)}; color: white; padding: 2px 6px; border-radius: 10px; font-size: 10px; margin-left: 10px;">
+                                    {task.category}
+                                </span>
+                            </td>
+                        </tr>
+                        {content_row}
+                    </table>
+                </td>
+            </tr>
+            <tr><td style="height: 5px;"></td></tr>
+            """
+        return f"""
+        <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
+            <tr><td style="padding: 10px 0 5px 0; border-bottom: 2px solid #e0e0e0;">
+                <h3 style="margin: 0; color: #333;">{title} ({len(tasks)}개)</h3>
+            </td></tr>
+            <tr><td style="height: 10px;"></td></tr>
+            {task_rows}
+        </table>
+        """
+
+    def render(self, tasks_data):
+        task_lists = ""
+        task_lists += self.create_task_section("📋 전체 작업", tasks_data["all"])
+        task_lists += self.create_task_section("✅ 완료된 작업", tasks_data["completed"])
+        task_lists += self.create_task_section("⏳ 미완료 작업", tasks_data["incomplete"])
+        task_lists += self.create_task_section("📌 미완료 중요 일정", tasks_data["important_tasks"][:10])
+        return f"""
+        <!DOCTYPE html>
+        <html><head><meta charset="utf-8"><title>루틴 리포트</title></head>
+        <body><table width="600" cellpadding="0" cellspacing="0"><tr><td>
+            <h2>📊 업무 현황</h2><p>{tasks_data['total']} / {tasks_data['completed_count']}</p>
+            {task_lists}
+        </td></tr></table></body></html>
+        """
+
+
+def build_tasks_data(count):
+    tasks = [Task.from_dict(task_dict) for task_dict in generate_task_dicts(count)]
+    for i, task in enumerate(tasks):
+        if i % 3 == 0:
+            task.content = f"작업 {i}의 상세 내용 <참고> & 메모 " * 3
+    completed = [task for task in tasks if task.completed]
+    return {
+        "all": tasks,
+        "completed": completed,
+        "incomplete": [task for task in tasks if not task.completed],
+        "total": len(tasks),
+        "completed_count": len(completed),
+        "important_tasks": [task for task in tasks if task.important and not task.completed],
+    }
+
+
+def time_renders(render, repeat):
+    """repeat회 렌더링의 평균 시간(초)과 마지막 결과 반환"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        html = render()
+    return (time.perf_counter() - start) / repeat, html
+
+
+def main(count=1000, repeat=20):
+    tasks_data = build_tasks_data(count)
+    print(f"작업 {count}개 리포트, {repeat}회 평균")
+
+    legacy = LegacyReportBuilder(CATEGORIES)
+    legacy_seconds, legacy_html = time_renders(lambda: legacy.render(tasks_data), repeat)
+
+    def render_new():
+        return render_routine_report(ReportRenderer(CATEGORIES), ROUTINE, tasks_data, DATE_STR)
+
+    _task_row.cache_clear()
+    cold_seconds, _ = time_renders(render_new, 1)
+    warm_seconds, new_html = time_renders(render_new, repeat)
+
+    print(f"{'이전 방식 (+= 누적)':<28} {legacy_seconds * 1000:8.2f} ms  ({len(legacy_html):,} 문자)")
+    print(f"{'공용 렌더러 (첫 렌더링)':<28} {cold_seconds * 1000:8.2f} ms")
+    print(f"{'공용 렌더러 (행 캐시 적중)':<28} {warm_seconds * 1000:8.2f} ms  ({len(new_html):,} 문자)")
+    print(f"{'속도 향상':<28} {legacy_seconds / warm_seconds:8.1f}배")
+    print(f"행 캐시: {_task_row.cache_info()}")
+
+    for task in tasks_data["all"]:
+        assert task.title in new_html and task.title in legacy_html, f"작업 누락: {task.title}"
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 20)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 검색 색인 벤치마크
+
+한글/영문 업무 용어를 섞은 임의 작업(기본 100,000개)으로 다음을 측정한다.
+    - 색인 생성 시간, 저장 시간/파일 크기, 저장된 색인 불러오기 + 작업과 맞추기 시간
+    - 질의별 검색 시간 (전체 작업 선형 탐색과 비교, 결과 작업 집합이 같은지 확인)
+
+사용법:
+    python -m benchmarks.bench_search_index [작업 수]
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.task import Task  # noqa: E402
+from utils.search_index import SearchIndex, parse_query, tokenize  # noqa: E402
+
+WORDS = ["회의", "주간", "보고서", "작성", "검토", "배포", "테스트", "장비", "점검", "고객", "미팅", "일정",
+         "정리", "문서", "업데이트", "버그", "수정", "릴리즈", "계획", "예산", "분석", "교육", "출장", "결재",
+         "요청", "협의", "LB", "Tester", "Handler", "API", "server", "DB", "migration", "review"]
+PARTICLES = ["", "를", "을", "에", "의", "와", "로"]
+QUERIES = ["회의", "보고서 작성", "회", "고객 미팅", "ser", "migration 검토", "결재를", "없는 단어"]
+REPEAT = 5
+
+
+def generate_tasks(count, seed=0):
+    """임의 작업 목록 생성 (제목 2~5단어, 내용 0~15단어, 약 3년치)"""
+    rng = random.Random(seed)
+
+    def phrase(low, high):
+        return " ".join(rng.choice(WORDS) + rng.choice(PARTICLES) for _ in range(rng.randint(low, high)))
+
+    start = date(2024, 1, 1)
+    tasks = []
+    for _ in range(count):
+        task = Task(phrase(2, 5), phrase(0, 15), created_date=(start + timedelta(days=rng.randrange(1000))).isoformat())
+        task.id = uuid.UUID(int=rng.getrandbits(128)).hex
+        tasks.append(task)
+    return tasks
+
+
+def term_matches(tokens, token, prefix):
+    """작업 토큰 집합이 질의 토큰 하나를 만족하는지 (색인 검색과 같은 규칙)"""
+    if len(token) == 1 and "가" <= token <= "힣":
+        return any(token in t for t in tokens)
+    if prefix:
+        return any(t.startswith(token) for t in tokens)
+    return token in tokens
+
+
+def linear_search(tasks, query):
+    """비교용: 모든 작업의 토큰을 매번 만들어 질의 토큰을 모두 포함하는 작업 찾기"""
+    terms = parse_query(query)
+    matched = []
+    for task in tasks:
+        tokens = set(tokenize(task.title)) | set(tokenize(task.content))
+        if all(term_matches(tokens, token, prefix) for token, prefix in terms):
+            matched.append(task.id)
+    return matched
+
+
+def best_of(func):
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(count=100000):
+    tasks = generate_tasks(count)
+    work_dir = tempfile.mkdtemp(prefix="bench_search_")
+    try:
+        index_file = os.path.join(work_dir, "search_index.json")
+        index = SearchIndex(index_file)
+        start = time.perf_counter()
+        index.sync(tasks)
+        print(f"색인 생성 (작업 {count:,}개): {time.perf_counter() - start:.2f}초, 토큰 {len(index.postings):,}종")
+
+        start = time.perf_counter()
+        index.save()
+        print(f"색인 저장: {time.perf_counter() - start:.2f}초, {os.path.getsize(index_file) / 1e6:.1f} MB")
+
+        reloaded = SearchIndex(index_file)
+        start = time.perf_counter()
+        reloaded.load()
+        tokenized = reloaded.sync(tasks)
+        print(f"저장된 색인 불러오기 + 맞추기: {time.perf_counter() - start:.2f}초 (다시 토큰화 {tokenized}개)")
+        assert reloaded.postings == index.postings, "불러온 색인이 원본과 다름"
+
+        print(f"\n{'질의':<18} {'결과':>8} {'색인 검색':>10} {'선형 탐색':>10}")
+        for query in QUERIES:
+            index_seconds, results = best_of(lambda: index.search(query, limit=count))
+            linear_seconds = time.perf_counter()
+            expected = linear_search(tasks, query)
+            linear_seconds = time.perf_counter() - linear_seconds
+            assert {task_id for task_id, _, _ in results} == set(expected), f"검색 결과 불일치: {query}"
+            print(f"{query:<18} {len(results):>8,} {index_seconds * 1000:>8.2f}ms {linear_seconds * 1000:>8.0f}ms")
+
+        print("\n상위 50개만 (검색창과 같은 조건)")
+        for query in QUERIES:
+            index_seconds, _ = best_of(lambda: index.search(query))
+            print(f"{query:<18} {index_seconds * 1000:>8.2f}ms")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
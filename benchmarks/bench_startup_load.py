@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+시작 시 작업 파일 로드 벤치마크
+
+같은 작업 데이터를 다음 방식으로 로드하여 시간을 비교한다.
+    - 이전 방식: 목록 형식 tasks.json + 레코드별 from_dict (__init__/uuid4 생성 포함)
+    - 레코드별 Task.from_dict: 목록 형식 tasks.json
+    - 일괄 로더: 스키마 버전 형식 tasks.json (검증 생략 경로)
+    - 일괄 로더 (이전 형식): 목록 형식 tasks.json (레코드별 검증 경로)
+
+사용법:
+    python -m benchmarks.bench_startup_load [작업 수]
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_task_model import LegacyTask, generate_task_dicts  # noqa: E402
+from models.task import Task  # noqa: E402
+from utils.task_loader import dump_task_records, load_tasks_file  # noqa: E402
+
+REPEAT = 3
+
+
+def best_of(func):
+    """여러 번 실행하여 가장 짧은 시간(초) 반환"""
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def load_per_record(path, task_class):
+    """이전 로드 방식: JSON 목록을 읽고 레코드마다 from_dict 호출"""
+    with open(path, "r", encoding="utf-8") as f:
+        tasks_data = json.load(f)
+    return [task_class.from_dict(task_dict) for task_dict in tasks_data]
+
+
+def main(count=100000):
+    tasks_data = generate_task_dicts(count)
+    work_dir = tempfile.mkdtemp(prefix="bench_startup_")
+    try:
+        legacy_file = os.path.join(work_dir, "tasks_legacy.json")
+        versioned_file = os.path.join(work_dir, "tasks.json")
+        with open(legacy_file, "w", encoding="utf-8") as f:
+            json.dump(tasks_data, f, ensure_ascii=False)
+        with open(versioned_file, "w", encoding="utf-8") as f:
+            json.dump(dump_task_records(tasks_data), f, ensure_ascii=False)
+
+        results = [
+            ("이전 방식 (LegacyTask.from_dict)", best_of(lambda: load_per_record(legacy_file, LegacyTask))),
+            ("레코드별 Task.from_dict", best_of(lambda: load_per_record(legacy_file, Task))),
+            ("일괄 로더", best_of(lambda: load_tasks_file(versioned_file))),
+            ("일괄 로더 (이전 형식, 검증)", best_of(lambda: load_tasks_file(legacy_file))),
+        ]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    baseline = results[0][1]
+    print(f"작업 {count:,}개 로드 (최선 {REPEAT}회)")
+    for name, seconds in results:
+        print(f"  {name:<32}{seconds:>8.3f}초  ({baseline / seconds:.1f}배)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
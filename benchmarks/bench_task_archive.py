@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+완료 작업 보관(콜드 아카이브) 벤치마크
+
+임의 작업(기본 100,000개, 약 3년치)을 JSON 저장소에 넣고 1년이 지난 완료 작업을 보관하기
+전후로 tasks.json 크기, 시작 로드/저장 시간, 보관된 달의 달력 통계 조회 시간, 전체 CSV
+내보내기 조회 시간을 비교한다. 보관 후에도 달력 통계와 내보내기 결과가 같은지 확인한다.
+
+사용법:
+    python -m benchmarks.bench_task_archive [작업 수]
+"""
+
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_task_model import generate_task_dicts  # noqa: E402
+from utils.durable_io import atomic_write_json  # noqa: E402
+from utils.storage import StorageManager  # noqa: E402
+from utils.task_archive import ARCHIVE_DIR_NAME  # noqa: E402
+from utils.task_loader import dump_task_records  # noqa: E402
+from utils.task_query import TaskQuery  # noqa: E402
+
+TODAY = date(2026, 10, 1)
+REPEAT = 3
+
+
+def best_of(func):
+    """여러 번 실행하여 (가장 짧은 시간(초), 마지막 결과) 반환"""
+    best, result = None, None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def measure(work_dir):
+    """(tasks.json 크기, 로드 초, 저장 초, 달력 통계 초, 내보내기 초, 통계, 내보내기 ID)"""
+    load_seconds, storage = best_of(lambda: StorageManager(work_dir))
+
+    def save():
+        storage.tasks_changed = True
+        storage.save_data()
+    save_seconds, _ = best_of(save)
+
+    def month_stats():
+        stats = {}
+        for month in range(1, 13):
+            stats.update(storage.get_month_stats(2024, month))
+        return stats
+    stats_seconds, stats = best_of(month_stats)
+
+    export_seconds, exported = best_of(lambda: sorted(task.id for task in storage.query_with_archive(TaskQuery())))
+    size = os.path.getsize(storage.tasks_file)
+    return size, load_seconds, save_seconds, stats_seconds, export_seconds, stats, exported
+
+
+def main(count=100000):
+    work_dir = tempfile.mkdtemp(prefix="bench_archive_")
+    try:
+        atomic_write_json(os.path.join(work_dir, "tasks.json"), dump_task_records(generate_task_dicts(count)),
+                          indent=None)
+        before = measure(work_dir)
+
+        storage = StorageManager(work_dir)
+        start = time.perf_counter()
+        archived = storage.archive_completed(365, today=TODAY)
+        archive_seconds = time.perf_counter() - start
+        archive_bytes = sum(os.path.getsize(path) for path in glob.glob(os.path.join(work_dir, ARCHIVE_DIR_NAME, "*")))
+
+        after = measure(work_dir)
+        assert after[5] == before[5], "달력 통계 불일치"
+        assert after[6] == before[6], "내보내기 결과 불일치"
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"작업 {count:,}개 중 완료 작업 {archived:,}개 보관 ({archive_seconds:.2f}초, "
+          f"보관 파일 {archive_bytes / 1024:,.0f} KB)\n")
+    print(f"{'항목':<22} {'보관 전':>12} {'보관 후':>12}")
+    print(f"{'tasks.json':<22} {before[0] / 1024:>9,.0f} KB {after[0] / 1024:>9,.0f} KB")
+    labels = ("시작 로드", "저장", "달력 통계 (2024년 12달)", "전체 내보내기 조회")
+    for i, label in enumerate(labels, 1):
+        print(f"{label:<22} {before[i] * 1000:>10.1f}ms {after[i] * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 모델 메모리/로드 시간 벤치마크
+
+__slots__ 기반 Task와 이전 방식(인스턴스 __dict__)의 작업 클래스를 비교한다.
+
+사용법:
+    python -m benchmarks.bench_task_model [작업 수]
+"""
+
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.task import Task  # noqa: E402
+
+
+class LegacyTask:
+    """비교용: __slots__ 도입 이전의 작업 클래스 (인스턴스 __dict__ 사용)"""
+
+    BG_COLORS = Task.BG_COLORS
+
+    def __init__(self, title, content="", category="ETC", important=False, completed=False, created_date=None,
+                 bg_color="none", order=None):
+        try:
+            self.id = uuid.uuid4().hex
+            self.title = title if title else "새 작업"
+            self.content = content if content else ""
+            self.category = category if category else "ETC"
+            self.created_date = created_date if created_date else datetime.now().strftime("%Y-%m-%d")
+            self.important = bool(important)
+            self.completed = bool(completed)
+            self.bg_color = bg_color if bg_color in self.BG_COLORS else "none"
+            self.order = order
+        except Exception as e:
+            print(f"작업 객체 생성 중 오류 발생: {e}")
+
+    @classmethod
+    def from_dict(cls, data):
+        task = cls(
+            title=data["title"],
+            content=data.get("content", ""),
+            category=data.get("category", "ETC"),
+            important=data.get("important", False),
+            completed=data.get("completed", False),
+            created_date=data.get("created_date"),
+            bg_color=data.get("bg_color", "none"),
+            order=data.get("order")
+        )
+        if "id" in data:
+            task.id = data["id"]
+        return task
+
+
+def generate_task_dicts(count, seed=0):
+    """임의 작업 딕셔너리 목록 생성 (약 3년치 이력)"""
+    rng = random.Random(seed)
+    categories = ["LB", "Tester", "PM", "ETC"]
+    start = date(2024, 1, 1)
+    tasks_data = []
+    for i in range(count):
+        created = start + timedelta(days=rng.randrange(1000))
+        tasks_data.append({
+            "id": uuid.UUID(int=rng.getrandbits(128)).hex,
+            "title": f"작업 {i}",
+            "content": "",
+            # JSON 로드와 같이 작업마다 별도의 문자열 객체가 되도록 생성
+            "category": "".join(list(rng.choice(categories))),
+            "created_date": created.isoformat(),
+            "important": rng.random() < 0.1,
+            "completed": rng.random() < 0.7,
+            "bg_color": "none",
+            "order": i % 20 + 1,
+        })
+    return tasks_data
+
+
+def measure(task_class, tasks_data):
+    """작업 목록 로드 시간(초)과 유지 메모리(바이트) 측정"""
+    gc.collect()
+    start = time.perf_counter()
+    tasks = [task_class.from_dict(task_dict) for task_dict in tasks_data]
+    load_seconds = time.perf_counter() - start
+    del tasks
+
+    gc.collect()
+    tracemalloc.start()
+    tasks = [task_class.from_dict(task_dict) for task_dict in tasks_data]
+    memory_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return load_seconds, memory_bytes
+
+
+def main(count=100000):
+    # 실제 로드와 같이 JSON을 거친 데이터로 측정
+    tasks_data = json.loads(json.dumps(generate_task_dicts(count)))
+
+    print(f"작업 {count:,}개")
+    print(f"{'클래스':<12}{'로드(초)':>12}{'메모리(MB)':>14}")
+    results = {}
+    for name, task_class in (("LegacyTask", LegacyTask), ("Task", Task)):
+        load_seconds, memory_bytes = measure(task_class, tasks_data)
+        results[name] = (load_seconds, memory_bytes)
+        print(f"{name:<12}{load_seconds:>12.3f}{memory_bytes / 1024 / 1024:>14.1f}")
+
+    legacy, current = results["LegacyTask"], results["Task"]
+    print(f"로드 시간 {current[0] / legacy[0] * 100:.0f}%, 메모리 {current[1] / legacy[1] * 100:.0f}% (이전 대비)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
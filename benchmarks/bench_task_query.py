@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 조회(TaskQuery) 벤치마크
+
+임의 작업(기본 100,000개, 약 3년치)의 메모리 인덱스에서 내보내기/리포트에서 쓰는
+조회 조건별로 이전 방식(전체 목록에 조건마다 리스트 컴프리헨션을 이어 붙임)과
+plan_query/execute_plan을 비교한다. 결과 작업 목록이 같은지도 확인한다.
+
+사용법:
+    python -m benchmarks.bench_task_query [작업 수]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_task_model import generate_task_dicts  # noqa: E402
+from models.task import Task  # noqa: E402
+from utils.storage import important_window_start  # noqa: E402
+from utils.task_index import TaskIndex  # noqa: E402
+from utils.task_query import ORDER_RECENT, TaskQuery, execute_plan, plan_query  # noqa: E402
+
+DATE_STR = "2025-06-15"
+REPEAT = 5
+
+CASES = [
+    ("하루 (리포트)", TaskQuery(DATE_STR, DATE_STR, ["LB"])),
+    ("이번 달", TaskQuery("2025-06-01", "2025-06-30")),
+    ("이번 달 + 카테고리 + 미완료", TaskQuery("2025-06-01", "2025-06-30", ["LB", "PM"], completed=False)),
+    ("중요 일정 30일 (리포트)", TaskQuery(important_window_start(DATE_STR, 30), DATE_STR, completed=False,
+                                     important=True, exclude_date=DATE_STR, order=ORDER_RECENT)),
+    ("전체 + 완료", TaskQuery(completed=True)),
+]
+
+
+def legacy_filter(tasks, query):
+    """비교용: 이전 방식 (조건마다 전체 목록을 다시 만듦)"""
+    if query.date_range:
+        tasks = [t for t in tasks if (query.start_date or "") <= t.created_date <= (query.end_date or "9999")]
+    if query.exclude_date:
+        tasks = [t for t in tasks if t.created_date != query.exclude_date]
+    if query.categories:
+        tasks = [t for t in tasks if t.category in query.categories]
+    if query.completed is not None:
+        tasks = [t for t in tasks if t.completed == query.completed]
+    if query.important is not None:
+        tasks = [t for t in tasks if t.important == query.important]
+    if query.order == ORDER_RECENT:
+        tasks.sort(key=lambda t: t.created_date, reverse=True)
+    return tasks
+
+
+def best_of(func):
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(count=100000):
+    tasks = [Task.from_dict(task_dict) for task_dict in generate_task_dicts(count)]
+    index = TaskIndex(tasks)
+
+    def run(query):
+        return list(execute_plan(query, plan_query(query, index), index, tasks))
+
+    print(f"{'조건':<26} {'결과':>7} {'경로':>15} {'이전 방식':>10} {'TaskQuery':>10}")
+    for label, query in CASES:
+        legacy_seconds, expected = best_of(lambda: legacy_filter(tasks, query))
+        query_seconds, result = best_of(lambda: run(query))
+        if query.date_range and query.start_date == query.end_date:
+            # 하루 조회는 order 순이므로 집합만 비교
+            assert {t.id for t in result} == {t.id for t in expected}, f"조회 결과 불일치: {label}"
+        else:
+            assert [t.id for t in result] == [t.id for t in expected], f"조회 결과 불일치: {label}"
+        plan = plan_query(query, index)
+        print(f"{label:<26} {len(result):>7,} {plan.source:>15} {legacy_seconds * 1000:>8.2f}ms "
+              f"{query_seconds * 1000:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 순서 변경(끌어 놓기) 벤치마크
+
+한 날짜에 작업 N개(기본 300개)를 두고 임의 위치 이동을 반복하면서
+저널/SQLite 저장소의 이동 1회당 시간, 바뀐 레코드 수, 저널 기록 크기를 잰다.
+이전 방식(이동마다 날짜 작업 전체의 order를 다시 매기고 전체 ID 목록을 기록)의
+레코드 수/저널 크기도 함께 출력한다. 매 이동 후 순서가 기대와 같은지 확인한다.
+
+사용법:
+    python -m benchmarks.bench_task_rank [작업 수] [이동 횟수]
+"""
+
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.task import Task  # noqa: E402
+from utils.storage import create_storage_manager  # noqa: E402
+
+DATE_STR = "2026-01-15"
+
+
+def run(backend, count, moves):
+    """(이동 1회당 초, 평균 바뀐 레코드 수, 이동 1회당 저널 바이트, 다시 매김 횟수)"""
+    work_dir = tempfile.mkdtemp(prefix=f"bench_rank_{backend}_")
+    try:
+        storage = create_storage_manager(work_dir, backend)
+        expected = []
+        for i in range(count):
+            task = Task(f"작업 {i}", created_date=DATE_STR)
+            storage.add_task(task)
+            expected.append(task.id)
+        storage.save_data()
+
+        journal_file = os.path.join(work_dir, "tasks.journal")
+        journal_start = os.path.getsize(journal_file) if os.path.exists(journal_file) else 0
+        rng = random.Random(0)
+        changed_records = 0
+        rebalances = 0
+        elapsed = 0.0
+        for _ in range(moves):
+            source, target = rng.randrange(count), rng.randrange(count)
+            before = {t.id: t.order for t in storage.get_tasks_by_date(DATE_STR)}
+
+            start = time.perf_counter()
+            storage.reorder_tasks(DATE_STR, source, target)
+            storage.save_data()
+            elapsed += time.perf_counter() - start
+
+            expected.insert(target, expected.pop(source))
+            after = storage.get_tasks_by_date(DATE_STR)
+            assert [t.id for t in after] == expected, "순서 불일치"
+            changed = sum(1 for t in after if before[t.id] != t.order)
+            changed_records += changed
+            rebalances += changed > 1
+
+        journal_bytes = 0
+        if backend == "journal":
+            journal_bytes = os.path.getsize(journal_file) - journal_start
+        storage.close()
+        return elapsed / moves, changed_records / moves, journal_bytes / moves, rebalances
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main(count=300, moves=1000):
+    legacy_op = {"op": "reorder", "date": DATE_STR, "ids": [os.urandom(16).hex() for _ in range(count)]}
+    legacy_bytes = len(json.dumps(legacy_op, ensure_ascii=False)) + 1
+    print(f"한 날짜 작업 {count}개, 임의 이동 {moves}회")
+    print(f"이전 방식: 이동당 레코드 {count}개 다시 매김, 저널 약 {legacy_bytes:,} B/회\n")
+    print(f"{'저장소':<8} {'시간/회':>10} {'레코드/회':>10} {'저널 B/회':>10} {'다시 매김':>8}")
+    for backend in ("journal", "sqlite"):
+        seconds, records, journal_bytes, rebalances = run(backend, count, moves)
+        print(f"{backend:<8} {seconds * 1000:>8.3f}ms {records:>10.2f} {journal_bytes:>10.0f} {rebalances:>8}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+벤치마크용 작업 데이터 생성기
+
+같은 DatasetSpec(시드 포함)이면 언제나 같은 작업(ID, 제목, 내용, 순서까지)을 만든다.
+커밋 사이의 벤치마크 결과를 비교할 때 데이터가 달라서 생기는 차이를 없애기 위함이다.
+
+    - tasks_per_day: 하루 평균 작업 수 (날마다 평균의 절반~1.5배 사이에서 정해짐)
+    - years: 이력 기간 (end_date까지 거슬러 올라가는 연수)
+    - categories: (카테고리, 비중) 목록
+    - content_sizes: (내용 글자 수, 비중) 목록
+    - important_ratio / completed_ratio: 중요/완료 작업 비율
+
+사용법:
+    python -m benchmarks.dataset [출력 디렉토리] [하루 작업 수] [연수] [저장 방식]
+"""
+
+import os
+import random
+import sys
+import uuid
+from collections import namedtuple
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.category import Category  # noqa: E402
+from models.task import Task  # noqa: E402
+from utils.storage import create_storage_manager  # noqa: E402
+from utils.task_rank import spread_ranks  # noqa: E402
+
+DatasetSpec = namedtuple(
+    "DatasetSpec",
+    "tasks_per_day years end_date categories content_sizes important_ratio completed_ratio seed",
+    defaults=(
+        20,
+        3,
+        "2026-06-30",
+        (("LB", 4), ("Tester", 3), ("Handler", 2), ("ETC", 1)),
+        ((0, 5), (80, 4), (600, 1)),
+        0.1,
+        0.7,
+        0,
+    ),
+)
+
+# 제목/내용에 쓰는 업무 용어 (검색 색인도 실제와 비슷하게 쌓이도록 한글/영문 혼합)
+WORDS = (
+    "회의", "보고서", "검토", "배포", "테스트", "수정", "고객", "일정", "정리", "분석",
+    "설계", "문서", "점검", "요청", "승인", "이슈", "장비", "교육", "예산", "계약",
+    "server", "build", "review", "release", "bug", "sprint", "deploy", "backup", "api", "login",
+)
+
+CATEGORY_COLORS = ("#4285F4", "#FBBC05", "#34A853", "#EA4335", "#9C27B0", "#00ACC1", "#FF7043", "#8D6E63")
+
+
+def _weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+
+def _text(rng, length):
+    """length 글자 안팎의 임의 문장"""
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def generate_task_dicts(spec=DatasetSpec()):
+    """DatasetSpec대로 작업 딕셔너리 목록 생성 (날짜 오름차순, 날짜 안에서는 order 순)"""
+    rng = random.Random(spec.seed)
+    end = date.fromisoformat(spec.end_date)
+    start = end - timedelta(days=round(365 * spec.years) - 1)
+    low, high = spec.tasks_per_day - spec.tasks_per_day // 2, spec.tasks_per_day + spec.tasks_per_day // 2
+
+    tasks_data = []
+    day = start
+    while day <= end:
+        date_str = day.isoformat()
+        count = rng.randint(low, high)
+        for order in spread_ranks(count):
+            tasks_data.append({
+                "id": uuid.UUID(int=rng.getrandbits(128)).hex,
+                "title": f"{_text(rng, 12)} {len(tasks_data)}",
+                "content": _text(rng, _weighted(rng, spec.content_sizes)),
+                "category": _weighted(rng, spec.categories),
+                "created_date": date_str,
+                "important": rng.random() < spec.important_ratio,
+                "completed": rng.random() < spec.completed_ratio,
+                "bg_color": "none",
+                "order": order,
+            })
+        day += timedelta(days=1)
+    return tasks_data
+
+
+def write_dataset(data_dir, spec=DatasetSpec(), backend="json"):
+    """데이터 디렉토리에 작업과 카테고리를 저장소 형식대로 기록
+
+    Args:
+        data_dir (str): 데이터 디렉토리 (이미 있는 ID의 작업은 건너뜀)
+        spec (DatasetSpec, optional): 데이터 설정
+        backend (str, optional): 저장 방식 ("json", "journal", "sqlite", "sharded")
+
+    Returns:
+        int: 기록한 작업 수
+    """
+    tasks_data = generate_task_dicts(spec)
+    storage = create_storage_manager(data_dir, backend)
+    try:
+        category_names = {category.name for category in storage.categories}
+        for i, (name, _weight) in enumerate(spec.categories):
+            if name not in category_names:
+                storage.add_category(Category(name, CATEGORY_COLORS[i % len(CATEGORY_COLORS)]))
+
+        storage.import_tasks(Task.from_record(task_dict) for task_dict in tasks_data)
+        if hasattr(storage, "compact"):
+            # 저널 저장소는 실제 사용처럼 스냅샷에서 시작하도록 압축
+            storage.compact(wait=True)
+    finally:
+        storage.close()
+    return len(tasks_data)
+
+
+def main(data_dir="bench_data", tasks_per_day=20, years=3, backend="json"):
+    spec = DatasetSpec(tasks_per_day=int(tasks_per_day), years=float(years))
+    count = write_dataset(data_dir, spec, backend)
+    print(f"작업 {count:,}개 생성: {data_dir} ({backend}, 하루 평균 {spec.tasks_per_day}개, {spec.years:g}년)")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:5])
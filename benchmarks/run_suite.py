@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+벤치마크 모음 (커밋 간 비교용)
+
+benchmarks.dataset으로 같은 데이터를 저장 방식별로 만든 뒤 다음 경로의 시간을 재고,
+결과를 JSON으로 남긴다. --compare로 이전 결과 파일을 주면 항목별 배율을 출력하고
+기준(--threshold)보다 느려진 항목이 있으면 종료 코드 1을 돌려준다.
+
+    - storage.load: 저장소 열기 (시작 로드)
+    - storage.update_save: 작업 하나 수정 후 저장
+    - query.tasks_by_date: 날짜별 작업 목록 (임의 날짜 200개)
+    - query.search: 검색어 5개 (색인을 만든 뒤)
+    - stats.day: 날짜 통계 (임의 날짜 200개)
+    - stats.month: 최근 12개월의 달력 통계
+    - report.collect: 리포트 데이터 수집 (임의 날짜 50개)
+    - report.render: 데일리 리포트 HTML 생성 (같은 50개)
+    - export.csv: 전체 작업 CSV 내보내기
+    - ui.task_list: 작업이 가장 많은 날의 목록 위젯 로드 + 그리기 (화면 없는 Qt)
+    - ui.calendar: 달력 위젯 통계 로드 + 그리기 (일반/달력 뷰 모드)
+PyQt6가 없으면 ui 항목은 건너뛰고 사유를 결과에 적는다.
+
+사용법:
+    python -m benchmarks.run_suite [--tasks-per-day 20] [--years 3] [--backends json,sqlite]
+                                   [--repeat 3] [--output results.json] [--compare 이전결과.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 화면 없이 Qt 위젯을 그리기 위해 PyQt6 임포트 전에 설정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks.dataset import DatasetSpec, write_dataset  # noqa: E402
+from utils.csv_exporter import CsvExporter  # noqa: E402
+from utils.report_renderer import ReportRenderer, render_daily_report  # noqa: E402
+from utils.storage import create_storage_manager  # noqa: E402
+from utils.task_query import TaskQuery  # noqa: E402
+
+RESULTS_SCHEMA_VERSION = 1
+BACKENDS = ("json", "journal", "sqlite", "sharded")
+SEARCH_QUERIES = ("회의", "배포 server", "보고서 검토", "bug", "고객 일정 정리")
+
+# 비교 시 이보다 짧은 항목은 잡음이 커서 느려짐 판정에서 제외 (초)
+MIN_COMPARE_SECONDS = 0.001
+
+
+def measure(func, repeat, setup=None):
+    """func를 repeat번 실행한 시간 (setup은 매번 실행 전에 호출하고 시간에서 제외)
+
+    Returns:
+        dict: best/median/runs (초)
+    """
+    runs = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return {"best": min(runs), "median": statistics.median(runs), "runs": runs}
+
+
+def git_commit():
+    """현재 커밋 (git이 없거나 저장소가 아니면 None)"""
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True,
+                                text=True, timeout=10).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+                               capture_output=True, text=True, timeout=30).stdout.strip()
+        return f"{commit}-dirty" if commit and dirty else commit or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def sample_dates(spec, count, seed=1):
+    """데이터 기간 안의 임의 날짜 (고정 시드)"""
+    rng = random.Random(seed)
+    end = date.fromisoformat(spec.end_date).toordinal()
+    start = end - round(365 * spec.years) + 1
+    return [date.fromordinal(rng.randint(start, end)).isoformat() for _ in range(count)]
+
+
+def recent_months(spec, count=12):
+    """데이터 마지막 달부터 거슬러 올라간 (연, 월) 목록"""
+    end = date.fromisoformat(spec.end_date)
+    months = []
+    year, month = end.year, end.month
+    for _ in range(count):
+        months.append((year, month))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return months
+
+
+def run_storage_cases(data_dir, backend, spec, repeat, work_dir):
+    """저장소/조회/통계/리포트/내보내기 항목"""
+    results = {}
+    storages = []
+
+    def open_storage():
+        storages.append(create_storage_manager(data_dir, backend))
+
+    results["storage.load"] = measure(open_storage, repeat)
+    for storage in storages[:-1]:
+        storage.close()
+    storage = storages[-1]
+
+    try:
+        dates = sample_dates(spec, 200)
+        report_dates = dates[:50]
+
+        target = storage.get_tasks_by_date(dates[0])[-1]
+
+        def update_save():
+            target.completed = not target.completed
+            storage.update_task(target.id, target)
+            storage.save_data()
+        results["storage.update_save"] = measure(update_save, repeat)
+
+        results["query.tasks_by_date"] = measure(lambda: [storage.get_tasks_by_date(d) for d in dates], repeat)
+
+        storage.get_search_index()
+        results["query.search"] = measure(lambda: [storage.search_tasks(q) for q in SEARCH_QUERIES], repeat)
+
+        results["stats.day"] = measure(lambda: [storage.get_task_stats(d) for d in dates], repeat)
+        months = recent_months(spec)
+        results["stats.month"] = measure(lambda: [storage.get_month_stats(y, m) for y, m in months], repeat)
+
+        reports = []
+
+        def collect():
+            reports[:] = [storage.collect_report_data(d) for d in report_dates]
+        results["report.collect"] = measure(collect, repeat)
+
+        renderer = ReportRenderer(storage.category_colors)
+        results["report.render"] = measure(
+            lambda: [render_daily_report(renderer, data, ["all", "completed", "incomplete"]) for data in reports],
+            repeat)
+
+        csv_path = os.path.join(work_dir, f"export_{backend}.csv")
+        results["export.csv"] = measure(
+            lambda: CsvExporter.export_tasks(storage.query_with_archive(TaskQuery()), csv_path), repeat)
+
+        ui_results, skipped = run_ui_cases(storage, dates, repeat)
+        results.update(ui_results)
+    finally:
+        storage.close()
+    return results, skipped
+
+
+_qt_app = None
+
+
+def run_ui_cases(storage, dates, repeat):
+    """화면 없는 Qt로 작업 목록/달력 위젯 그리기 (PyQt6가 없으면 건너뜀)
+
+    Returns:
+        tuple: (항목 결과, 건너뛴 항목 -> 사유)
+    """
+    global _qt_app
+    try:
+        from PyQt6.QtCore import QDate
+        from PyQt6.QtWidgets import QApplication
+        from ui.calendar_widget import CalendarWidget
+        from ui.task_list import TaskListWidget
+    except ImportError as e:
+        reason = f"PyQt6를 불러올 수 없음: {e}"
+        return {}, {"ui.task_list": reason, "ui.calendar": reason}
+
+    if _qt_app is None:
+        _qt_app = QApplication.instance() or QApplication([])
+
+    results = {}
+    busiest_date = max(dates, key=lambda d: len(storage.get_tasks_by_date(d)))
+    tasks = storage.get_tasks_by_date(busiest_date)
+
+    task_list = TaskListWidget(storage)
+    task_list.resize(480, 900)
+
+    def load_task_list():
+        task_list.load_tasks(tasks, busiest_date)
+        task_list.grab()
+        _qt_app.processEvents()
+
+    # 매번 다른 날짜에서 돌아오도록 해 위젯 재바인딩 경로도 포함
+    results["ui.task_list"] = measure(load_task_list, repeat,
+                                      setup=lambda: task_list.load_tasks([], ""))
+
+    calendar = CalendarWidget(storage)
+    calendar.resize(700, 520)
+    shown = QDate.fromString(busiest_date, "yyyy-MM-dd")
+
+    def paint_calendar():
+        calendar.setCurrentPage(shown.year(), shown.month())
+        calendar.update_calendar()
+        calendar.setCalendarViewMode(False)
+        calendar.grab()
+        calendar.setCalendarViewMode(True)
+        calendar.grab()
+        _qt_app.processEvents()
+
+    results["ui.calendar"] = measure(paint_calendar, repeat,
+                                     setup=lambda: calendar.setCurrentPage(shown.year() - 1, shown.month()))
+
+    storage.remove_change_listener(task_list.on_storage_changed)
+    storage.remove_change_listener(calendar.on_storage_changed)
+    task_list.deleteLater()
+    calendar.deleteLater()
+    return results, {}
+
+
+def compare_results(current, baseline, threshold):
+    """이전 결과와 항목별 best 시간 비교 출력
+
+    Returns:
+        list: threshold배보다 느려진 (저장 방식, 항목, 배율) 목록
+    """
+    regressions = []
+    print(f"\n비교 기준: {baseline['meta'].get('commit')} ({baseline['meta'].get('started')})")
+    print(f"{'저장 방식':<9} {'항목':<22} {'이전':>10} {'현재':>10} {'배율':>7}")
+    for backend, cases in current["results"].items():
+        base_cases = baseline.get("results", {}).get(backend, {})
+        for case, result in cases.items():
+            base = base_cases.get(case)
+            if base is None:
+                continue
+            ratio = result["best"] / base["best"] if base["best"] > 0 else float("inf")
+            mark = ""
+            if ratio > threshold and max(result["best"], base["best"]) >= MIN_COMPARE_SECONDS:
+                mark = "  느려짐"
+                regressions.append((backend, case, ratio))
+            elif ratio < 1 / threshold:
+                mark = "  빨라짐"
+            print(f"{backend:<9} {case:<22} {base['best'] * 1000:>8.2f}ms {result['best'] * 1000:>8.2f}ms "
+                  f"{ratio:>6.2f}x{mark}")
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run_suite", description="Todolist PM 벤치마크 모음")
+    defaults = DatasetSpec()
+    parser.add_argument("--tasks-per-day", type=int, default=defaults.tasks_per_day, help="하루 평균 작업 수")
+    parser.add_argument("--years", type=float, default=defaults.years, help="이력 기간 (년)")
+    parser.add_argument("--content-size", type=int, help="긴 내용 글자 수 (기본 분포의 600자 대신)")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="데이터 시드")
+    parser.add_argument("--backends", default="json,sqlite", help=f"저장 방식 목록 (쉼표로 구분: {','.join(BACKENDS)})")
+    parser.add_argument("--repeat", type=int, default=3, help="항목별 반복 횟수 (best/median 계산)")
+    parser.add_argument("--output", help="결과 JSON 파일 (기본값: 표준 출력에 요약만)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=1.2, help="느려짐 판정 배율 (기본값: 1.2)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    backends = [backend.strip() for backend in args.backends.split(",") if backend.strip()]
+    unknown = [backend for backend in backends if backend not in BACKENDS]
+    if unknown:
+        print(f"알 수 없는 저장 방식: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    spec = DatasetSpec(tasks_per_day=args.tasks_per_day, years=args.years, seed=args.seed)
+    if args.content_size is not None:
+        spec = spec._replace(content_sizes=((0, 5), (80, 4), (args.content_size, 1)))
+
+    output = {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "meta": {
+            "commit": git_commit(),
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "dataset": spec._asdict(),
+        },
+        "results": {},
+        "skipped": {},
+    }
+
+    work_dir = tempfile.mkdtemp(prefix="bench_suite_")
+    try:
+        for backend in backends:
+            data_dir = os.path.join(work_dir, backend)
+            start = time.perf_counter()
+            task_count = write_dataset(data_dir, spec, backend)
+            output["meta"]["task_count"] = task_count
+            print(f"[{backend}] 작업 {task_count:,}개 생성 ({time.perf_counter() - start:.1f}초)", file=sys.stderr)
+
+            results, skipped = run_storage_cases(data_dir, backend, spec, args.repeat, work_dir)
+            output["results"][backend] = results
+            output["skipped"].update(skipped)
+            for case, result in results.items():
+                print(f"[{backend}] {case:<22} best {result['best'] * 1000:>9.2f}ms  "
+                      f"median {result['median'] * 1000:>9.2f}ms", file=sys.stderr)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for case, reason in sorted(output["skipped"].items()):
+        print(f"건너뜀 {case}: {reason}", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(output, baseline, args.threshold)
+        if regressions:
+            print(f"\n{args.threshold}배 넘게 느려진 항목 {len(regressions)}개", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,14 +8,16 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer
 
 from ui.main_window import MainWindow
-from utils.storage import StorageManager
+from utils.logger import get_logger, setup_logging
+from utils.storage import create_storage_manager, load_storage_settings
+
+logger = get_logger("app")
 
 
 # 예외 처리기 설정
 def exception_hook(exctype, value, tb):
     """예외 처리기"""
-    error_msg = ''.join(traceback.format_exception(exctype, value, tb))
-    print(f"예외 발생:\n{error_msg}")
+    logger.critical("예외 발생", exc_info=(exctype, value, tb))
 
     # 오류 메시지를 파일에 저장
     with open("error_log.txt", 'a', encoding='utf-8') as f:
@@ -34,55 +36,52 @@ from datetime import datetime
 
 import_time = datetime.now()
 
-print(f"프로그램 시작: {import_time}")
-print("오류 발생 시 error_log.txt 파일을 확인하세요.")
-
 
 def main():
     """애플리케이션 진입점"""
     try:
-        print("QApplication 인스턴스 생성 시작...")
         # QApplication 인스턴스 생성
         app = QApplication(sys.argv)
         app.setApplicationName("MacOS Task Manager")
-        print("QApplication 인스턴스 생성 완료")
 
-        print("스타일시트 적용 시작...")
         # 스타일시트 적용 (맥OS 스타일)
         try:
             with open("resources/styles/macos_style.qss", "r", encoding="utf-8") as f:
                 app.setStyleSheet(f.read())
-            print("스타일시트 적용 완료")
         except Exception as e:
-            print(f"스타일시트 로딩 중 오류: {e}")
+            logger.warning("스타일시트 로딩 중 오류: %s", e)
+
+        # 스토리지 매니저 초기화 (data/storage_settings.json의 저장 방식 사용)
+        storage_manager = create_storage_manager()
+        logger.debug("스토리지 매니저 초기화 완료: %s", type(storage_manager).__name__)
 
-        print("스토리지 매니저 초기화 시작...")
-        # 스토리지 매니저 초기화
-        storage_manager = StorageManager()
-        print("스토리지 매니저 초기화 완료")
+        # 오래된 완료 작업 자동 보관 (data/storage_settings.json에 archive_age_days를 지정한 경우만,
+        # 기준일이 바뀌지 않았으면 archive_completed가 바로 반환)
+        archive_age_days = load_storage_settings().get("archive_age_days")
+        if archive_age_days:
+            try:
+                storage_manager.archive_completed(archive_age_days)
+            except Exception:
+                logger.exception("완료 작업 보관 중 오류")
 
-        print("메인 윈도우 생성 시작...")
         # 메인 윈도우 생성
         main_window = MainWindow(storage_manager)
-        print("메인 윈도우 생성 완료")
-
-        print("메인 윈도우 표시...")
         main_window.show()
-        print("메인 윈도우 표시 완료")
+        logger.debug("메인 윈도우 표시 완료")
 
-        print("자동 저장 타이머 설정...")
         # 자동 저장 타이머 설정 (1초 간격)
         auto_save_timer = QTimer()
         auto_save_timer.timeout.connect(storage_manager.save_data)
         auto_save_timer.start(1000)  # 1초마다 저장
-        print("자동 저장 타이머 설정 완료")
 
-        print("애플리케이션 실행...")
         # 애플리케이션 실행
-        return app.exec()
-    except Exception as e:
-        print(f"main() 함수 내에서 오류 발생: {e}")
-        traceback.print_exc()
+        exit_code = app.exec()
+
+        # 저장소 정리 (저널 기록/압축 대기, DB 연결 종료)
+        storage_manager.close()
+        return exit_code
+    except Exception:
+        logger.exception("main() 함수 내에서 오류 발생")
         return 1
 
 
@@ -91,15 +90,16 @@ if __name__ == "__main__":
     for dir_path in ["resources/icons", "resources/styles", "data"]:
         if not os.path.exists(dir_path):
             os.makedirs(dir_path, exist_ok=True)
-            print(f"디렉토리 생성: {dir_path}")
+
+    # 로깅 초기화 (디버그 모드는 data/logging_settings.json 또는 TODOLIST_DEBUG=1로 활성화)
+    log_file = setup_logging()
+    logger.info("프로그램 시작: %s (로그 파일: %s, 오류 기록: error_log.txt)", import_time, log_file)
 
     # 메인 함수 실행
     try:
-        print("메인 함수 실행 시작...")
         exit_code = main()
-        print(f"프로그램 정상 종료. 종료 코드: {exit_code}")
+        logger.info("프로그램 정상 종료. 종료 코드: %s", exit_code)
         sys.exit(exit_code)
-    except Exception as e:
-        print(f"프로그램 실행 중 치명적인 오류 발생: {e}")
-        traceback.print_exc()
+    except Exception:
+        logger.exception("프로그램 실행 중 치명적인 오류 발생")
         sys.exit(1)
\ No newline at end of file
@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import logging
+
+# utils 패키지가 models를 임포트하므로 utils.logger.get_logger와 같은 이름 규칙으로 직접 생성
+logger = logging.getLogger("todolist.category")
+
+
 class Category:
     """카테고리 클래스: 작업 분류 표현"""
 
@@ -42,9 +48,8 @@ class Category:
             "title": title,
             "content": content
         }
-        print(f"Category.add_template 호출: {template}")
         self.templates.append(template)
-        print(f"템플릿 추가 후 총 개수: {len(self.templates)}")
+        logger.debug("카테고리 '%s' 템플릿 추가: %s (총 %d개)", self.name, title, len(self.templates))
 
     def remove_template(self, index):
         """템플릿 삭제
@@ -55,14 +60,12 @@ class Category:
         Returns:
             bool: 삭제 성공 여부
         """
-        print(f"Category.remove_template 호출: index={index}, 현재 템플릿 수={len(self.templates)}")
         if 0 <= index < len(self.templates):
-            removed_template = self.templates[index]
-            print(f"삭제할 템플릿: {removed_template}")
-            del self.templates[index]
-            print(f"삭제 후 템플릿 수: {len(self.templates)}")
+            removed_template = self.templates.pop(index)
+            logger.debug("카테고리 '%s' 템플릿 삭제: %s (남은 %d개)",
+                         self.name, removed_template.get("title"), len(self.templates))
             return True
-        print("템플릿 삭제 실패: 잘못된 인덱스")
+        logger.warning("템플릿 삭제 실패: 잘못된 인덱스 %d (템플릿 %d개)", index, len(self.templates))
         return False
 
     def get_template(self, index):
@@ -93,7 +96,6 @@ class Category:
             "color": self.color,
             "templates": getattr(self, 'templates', [])  # templates 필드 안전하게 가져오기
         }
-        print(f"카테고리 '{self.name}' 저장 시 템플릿 수: {len(result['templates'])}")  # 디버그용
         return result
 
     @classmethod
@@ -107,7 +109,6 @@ class Category:
             Category: 생성된 Category 객체
         """
         templates = data.get("templates", [])
-        print(f"카테고리 '{data['name']}' 로드 시 템플릿 수: {len(templates)}")  # 디버그용
 
         return cls(
             name=data["name"],
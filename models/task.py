@@ -1,12 +1,40 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import logging
+import sys
 import uuid
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+
+# utils 패키지가 models를 임포트하므로 utils.logger.get_logger와 같은 이름 규칙으로 직접 생성
+logger = logging.getLogger("todolist.task")
+
+
+@lru_cache(maxsize=None)
+def date_to_ordinal(date_str):
+    """날짜 문자열(YYYY-MM-DD)을 서수 정수로 변환 (형식이 잘못되면 None)
+
+    같은 날짜 문자열이 반복되므로 결과를 캐시한다.
+    """
+    try:
+        return date.fromisoformat(date_str).toordinal()
+    except (TypeError, ValueError):
+        return None
 
 
 class Task:
-    """작업 클래스: 할 일 항목 표현"""
+    """작업 클래스: 할 일 항목 표현
+
+    작업 수가 많아도 메모리를 적게 쓰도록 __slots__로 속성을 고정한다.
+    카테고리 이름은 intern하여 같은 카테고리의 작업들이 하나의 문자열을 공유하고,
+    생성 날짜는 문자열과 함께 서수 정수(date_ordinal, 형식이 잘못되면 None)로도 보관한다.
+    date_ordinal은 날짜 차이 계산 등이 필요한 호출하는 쪽을 위한 값이며, 인덱스/조회/정렬은
+    YYYY-MM-DD 문자열을 그대로 비교하므로 내부에서는 사용하지 않는다.
+    """
+
+    __slots__ = ("id", "title", "content", "_category", "_created_date", "date_ordinal",
+                 "important", "completed", "bg_color", "order")
 
     # 배경색 상수 정의
     BG_COLORS = {
@@ -44,7 +72,7 @@ class Task:
             self.bg_color = bg_color if bg_color in self.BG_COLORS else "none"  # 배경색 설정
             self.order = order  # 작업 순서 (None이면 자동 할당)
         except Exception as e:
-            print(f"작업 객체 생성 중 오류 발생: {e}")
+            logger.error("작업 객체 생성 중 오류 발생: %s", e)
             # 기본값으로 초기화
             self.id = uuid.uuid4().hex
             self.title = "새 작업"
@@ -56,6 +84,25 @@ class Task:
             self.bg_color = "none"
             self.order = None
 
+    @property
+    def category(self):
+        """작업 카테고리 이름"""
+        return self._category
+
+    @category.setter
+    def category(self, value):
+        self._category = sys.intern(value) if isinstance(value, str) else value
+
+    @property
+    def created_date(self):
+        """작업 생성 날짜 (YYYY-MM-DD)"""
+        return self._created_date
+
+    @created_date.setter
+    def created_date(self, value):
+        self._created_date = value
+        self.date_ordinal = date_to_ordinal(value)
+
     def to_dict(self):
         """Task 객체를 딕셔너리로 변환 (JSON 저장용)"""
         try:
@@ -68,10 +115,10 @@ class Task:
                 "important": self.important,
                 "completed": self.completed,
                 "bg_color": self.bg_color,
-                "order": getattr(self, 'order', None)  # order 필드 추가
+                "order": self.order
             }
         except Exception as e:
-            print(f"작업 딕셔너리 변환 중 오류 발생: {e}")
+            logger.error("작업 딕셔너리 변환 중 오류 발생: %s", e)
             # 기본 딕셔너리 반환
             return {
                 "id": self.id,
@@ -102,27 +149,41 @@ class Task:
             if "title" not in data:
                 raise KeyError("필수 필드 'title'이 없습니다.")
 
-            task = cls(
-                title=data["title"],
-                content=data.get("content", ""),
-                category=data.get("category", "ETC"),
-                important=data.get("important", False),
-                completed=data.get("completed", False),
-                created_date=data.get("created_date"),
-                bg_color=data.get("bg_color", "none"),
-                order=data.get("order")  # order 필드 추가
-            )
-
-            # ID 설정
-            if "id" in data:
-                task.id = data["id"]
-
-            return task
+            return cls.from_record(data)
         except Exception as e:
-            print(f"딕셔너리에서 작업 객체 생성 중 오류 발생: {e}")
+            logger.error("딕셔너리에서 작업 객체 생성 중 오류 발생: %s", e)
             # 기본 Task 객체 생성
             return cls("오류 발생 작업", content="데이터 로드 중 오류가 발생했습니다.")
 
+    @classmethod
+    def from_record(cls, data):
+        """검증된 작업 레코드에서 바로 Task 객체 생성 (대량 로드용)
+
+        __init__(새 ID 생성)과 예외 처리를 거치지 않고 슬롯을 직접 채운다.
+        잘못된 레코드는 예외가 그대로 발생하므로 호출하는 쪽에서 처리한다.
+
+        Args:
+            data (dict): 작업 레코드
+
+        Returns:
+            Task: 생성된 Task 객체
+        """
+        task = cls.__new__(cls)
+        task.id = data["id"] if "id" in data else uuid.uuid4().hex
+        task.title = data["title"] or "새 작업"
+        task.content = data.get("content") or ""
+        category = data.get("category") or "ETC"
+        task._category = sys.intern(category) if isinstance(category, str) else category
+        created_date = data.get("created_date") or datetime.now().strftime("%Y-%m-%d")
+        task._created_date = created_date
+        task.date_ordinal = date_to_ordinal(created_date)
+        task.important = bool(data.get("important", False))
+        task.completed = bool(data.get("completed", False))
+        bg_color = data.get("bg_color", "none")
+        task.bg_color = bg_color if bg_color in cls.BG_COLORS else "none"
+        task.order = data.get("order")
+        return task
+
     def get_bg_color_hex(self):
         """배경색의 16진수 코드 반환"""
         return self.BG_COLORS.get(self.bg_color, self.BG_COLORS["none"])
\ No newline at end of file
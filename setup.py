@@ -26,6 +26,9 @@ build_options = {
         "pywintypes",
         "uuid",
         "json",
+        "sqlite3",
+        "smtplib",  # SMTP 발송용
+        "email",
         "datetime",
         "csv",
         "subprocess",
@@ -59,7 +62,6 @@ build_options = {
         "pygame",
         "unittest",
         "pydoc",
-        "email",
         "xml"
     ],
 
@@ -83,6 +85,12 @@ executables = [
         icon="resources/icons/app_icon.ico",  # ICO 파일 사용 (권장)
         shortcut_name="Todolist PM",  # 바로가기 이름
         shortcut_dir="DesktopFolder"  # 바탕화면에 바로가기 생성
+    ),
+    Executable(
+        script="utils/dispatch_daemon.py",  # 백그라운드 발송 데몬 (콘솔)
+        base=None,
+        target_name="TodolistDispatcher.exe",
+        icon="resources/icons/app_icon.ico"
     )
 ]
 
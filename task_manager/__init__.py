@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+명령줄 작업 관리 패키지 (화면 없이 실행, PyQt6를 임포트하지 않음)
+
+    python -m task_manager --help
+"""
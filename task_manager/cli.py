@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+명령줄 작업 관리 (서버 자동화용)
+
+화면 없이 저장소(StorageManager)를 직접 열어 작업을 추가/가져오기/조회하고 통계, CSV,
+데일리 리포트 HTML을 만든다. PyQt6와 ui 패키지는 임포트하지 않는다.
+
+사용법:
+    python -m task_manager add "제목" --category LB --date 2026-10-17 --important
+    python -m task_manager import tasks.jsonl          (CSV도 가능, 한 번에 저장)
+    python -m task_manager list --from 2026-10-01 --to 2026-10-31 --open
+    python -m task_manager stats --month 2026-10
+    python -m task_manager export out.csv --from 2026-01-01 --to 2026-12-31
+    python -m task_manager render-report --date 2026-10-17 -o report.html
+
+공통 옵션 --data-dir(기본값 data)과 --backend(기본값은 저장소 설정)는 하위 명령 앞에 둔다.
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+
+from models.task import Task, date_to_ordinal
+from utils.logger import get_logger, setup_logging
+from utils.storage import IMPORTANT_TASKS_DAYS, create_storage_manager
+from utils.task_query import ORDER_DATE, ORDER_STORAGE, TaskQuery
+
+logger = get_logger("cli")
+
+BACKENDS = ("json", "journal", "sqlite", "sharded")
+REPORT_CONTENT_TYPES = ("all", "completed", "incomplete")
+
+
+def date_arg(value):
+    """YYYY-MM-DD 날짜 인자 검사"""
+    if date_to_ordinal(value) is None:
+        raise argparse.ArgumentTypeError(f"날짜 형식이 아닙니다 (YYYY-MM-DD): {value}")
+    return value
+
+
+def month_arg(value):
+    """YYYY-MM 월 인자를 (연, 월)로 변환"""
+    try:
+        month = datetime.strptime(value, "%Y-%m")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"월 형식이 아닙니다 (YYYY-MM): {value}")
+    return month.year, month.month
+
+
+def today_str():
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def add_filter_arguments(parser):
+    """조회 조건 인자 (list/export 공용)"""
+    parser.add_argument("--date", type=date_arg, help="하루만 조회 (YYYY-MM-DD)")
+    parser.add_argument("--from", dest="start_date", type=date_arg, help="시작일 (포함)")
+    parser.add_argument("--to", dest="end_date", type=date_arg, help="종료일 (포함)")
+    parser.add_argument("--category", action="append", help="카테고리 (여러 번 지정 가능)")
+    status = parser.add_mutually_exclusive_group()
+    status.add_argument("--completed", dest="completed", action="store_const", const=True, help="완료 작업만")
+    status.add_argument("--open", dest="completed", action="store_const", const=False, help="미완료 작업만")
+    parser.add_argument("--important", action="store_const", const=True, help="중요 작업만")
+    parser.add_argument("--search", help="제목/내용 검색어 (모든 단어 포함)")
+
+
+def build_query(args, order):
+    """조회 조건 인자로 TaskQuery 생성"""
+    start_date, end_date = (args.date, args.date) if args.date else (args.start_date, args.end_date)
+    return TaskQuery(start_date, end_date, args.category, args.completed, args.important, args.search,
+                     order=order)
+
+
+def cmd_add(storage, args):
+    """작업 하나 추가"""
+    category_names = [category.name for category in storage.categories]
+    if args.category not in category_names:
+        print(f"알 수 없는 카테고리: {args.category} (사용 가능: {', '.join(category_names)})", file=sys.stderr)
+        return 1
+    if args.color not in Task.BG_COLORS:
+        print(f"알 수 없는 배경색: {args.color} (사용 가능: {', '.join(Task.BG_COLORS)})", file=sys.stderr)
+        return 1
+
+    task = Task(args.title, args.content, args.category, args.important, args.completed,
+                args.date or today_str(), args.color)
+    storage.add_task(task)
+    storage.save_data()
+    print(task.id)
+    return 0
+
+
+def cmd_import(storage, args):
+    """JSONL/CSV 파일의 작업을 한 번에 가져오기"""
+    from utils.task_import import load_import_file
+
+    try:
+        tasks, errors = load_import_file(args.file, args.format)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"파일을 읽을 수 없습니다: {e}", file=sys.stderr)
+        return 1
+
+    for line_number, error in errors:
+        print(f"{args.file}:{line_number}: {error}", file=sys.stderr)
+    if errors and not args.skip_invalid:
+        print(f"잘못된 레코드 {len(errors)}개가 있어 가져오지 않았습니다 (--skip-invalid로 나머지만 가져오기)",
+              file=sys.stderr)
+        return 1
+
+    category_names = {category.name for category in storage.categories}
+    unknown_categories = sorted({task.category for task in tasks} - category_names)
+    if unknown_categories:
+        logger.warning("등록되지 않은 카테고리: %s", ", ".join(unknown_categories))
+
+    if args.dry_run:
+        print(f"작업 {len(tasks)}개를 읽었습니다 (--dry-run, 저장하지 않음)")
+        return 0
+
+    added = storage.import_tasks(tasks)
+    print(f"작업 {added}개를 가져왔습니다 (이미 있는 작업 {len(tasks) - added}개 건너뜀)")
+    return 0
+
+
+def format_task_line(task):
+    """작업 한 줄 표시"""
+    return (f"{task.created_date}  [{'v' if task.completed else ' '}] {'!' if task.important else ' '} "
+            f"{task.category:<8} {task.title}  ({task.id})")
+
+
+def cmd_list(storage, args):
+    """조건에 맞는 작업 목록 출력 (날짜 순)"""
+    task_query = build_query(args, ORDER_DATE)
+    tasks = storage.query_with_archive(task_query) if args.archived else storage.query(task_query)
+
+    count = 0
+    for task in tasks:
+        if args.limit is not None and count >= args.limit:
+            break
+        print(json.dumps(task.to_dict(), ensure_ascii=False) if args.json else format_task_line(task))
+        count += 1
+    if not args.json:
+        print(f"작업 {count}개", file=sys.stderr)
+    return 0
+
+
+def format_stats_line(label, stats):
+    """통계 한 줄 표시"""
+    return (f"{label}  {stats['completed']}/{stats['total']} 완료 ({stats['completion_rate']:.0f}%)"
+            f"  중요 미완료 {stats['important_open']}")
+
+
+def cmd_stats(storage, args):
+    """날짜 또는 월의 작업 통계 출력"""
+    if args.month:
+        month_stats = storage.get_month_stats(*args.month)
+        if args.json:
+            print(json.dumps(month_stats, ensure_ascii=False, indent=2, sort_keys=True))
+            return 0
+        for date_str in sorted(month_stats):
+            print(format_stats_line(date_str, month_stats[date_str]))
+        total = sum(stats["total"] for stats in month_stats.values())
+        completed = sum(stats["completed"] for stats in month_stats.values())
+        important_open = sum(stats["important_open"] for stats in month_stats.values())
+        year, month = args.month
+        print(format_stats_line(f"{year:04d}-{month:02d} 합계", {
+            "total": total, "completed": completed, "important_open": important_open,
+            "completion_rate": completed / total * 100 if total else 0,
+        }))
+        return 0
+
+    date_str = args.date or today_str()
+    stats = storage.get_task_stats(date_str)
+    print(json.dumps(stats, ensure_ascii=False) if args.json else format_stats_line(date_str, stats))
+    return 0
+
+
+def cmd_export(storage, args):
+    """조건에 맞는 작업을 CSV로 내보내기 (보관된 작업 포함)"""
+    from utils.csv_exporter import CsvExporter
+
+    task_query = build_query(args, ORDER_DATE if args.sort else ORDER_STORAGE)
+    tasks = storage.query(task_query) if args.no_archive else storage.query_with_archive(task_query)
+    fields = args.fields.split(",") if args.fields else None
+    if not CsvExporter.export_tasks(tasks, args.output, include_header=not args.no_header, fields=fields):
+        print(f"CSV 내보내기에 실패했습니다: {args.output}", file=sys.stderr)
+        return 1
+    print(f"내보내기 완료: {args.output}", file=sys.stderr)
+    return 0
+
+
+def cmd_render_report(storage, args):
+    """데일리 리포트 HTML 생성 (리포트 화면과 같은 형식)"""
+    from utils.report_renderer import ReportRenderer, render_daily_report
+
+    date_str = args.date or today_str()
+    tasks_data = storage.collect_report_data(date_str, args.category, args.important_days)
+    html = render_daily_report(
+        ReportRenderer(storage.category_colors), tasks_data, args.content or ["all"],
+        selected_categories=args.category, include_important=not args.no_important, memo=args.memo)
+
+    if args.output in (None, "-"):
+        sys.stdout.write(html)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"리포트 저장: {args.output}", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    """명령줄 인자 파서"""
+    parser = argparse.ArgumentParser(prog="python -m task_manager", description="Todolist PM 명령줄 작업 관리")
+    parser.add_argument("--data-dir", default="data", help="데이터 디렉토리 (기본값: data)")
+    parser.add_argument("--backend", choices=BACKENDS, help="저장 방식 (기본값: 저장소 설정)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="디버그 로그 출력")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = subparsers.add_parser("add", help="작업 추가")
+    add_parser.add_argument("title", help="작업 제목")
+    add_parser.add_argument("--content", default="", help="작업 내용")
+    add_parser.add_argument("--category", default="ETC", help="카테고리 (기본값: ETC)")
+    add_parser.add_argument("--date", type=date_arg, help="날짜 (기본값: 오늘)")
+    add_parser.add_argument("--important", action="store_true", help="중요 작업")
+    add_parser.add_argument("--completed", action="store_true", help="완료 작업")
+    add_parser.add_argument("--color", default="none", help="배경색 (none/red/orange/yellow/green/blue/purple)")
+    add_parser.set_defaults(func=cmd_add)
+
+    import_parser = subparsers.add_parser("import", help="JSONL/CSV 파일에서 작업 일괄 가져오기")
+    import_parser.add_argument("file", help="가져올 파일")
+    import_parser.add_argument("--format", choices=("jsonl", "csv"), help="파일 형식 (기본값: 확장자로 추정)")
+    import_parser.add_argument("--skip-invalid", action="store_true", help="잘못된 레코드는 건너뛰고 나머지 가져오기")
+    import_parser.add_argument("--dry-run", action="store_true", help="검사만 하고 저장하지 않음")
+    import_parser.set_defaults(func=cmd_import)
+
+    list_parser = subparsers.add_parser("list", help="작업 목록")
+    add_filter_arguments(list_parser)
+    list_parser.add_argument("--archived", action="store_true", help="보관된 작업도 포함")
+    list_parser.add_argument("--limit", type=int, help="최대 출력 수")
+    list_parser.add_argument("--json", action="store_true", help="JSON Lines로 출력")
+    list_parser.set_defaults(func=cmd_list)
+
+    stats_parser = subparsers.add_parser("stats", help="작업 통계")
+    stats_target = stats_parser.add_mutually_exclusive_group()
+    stats_target.add_argument("--date", type=date_arg, help="날짜 (기본값: 오늘)")
+    stats_target.add_argument("--month", type=month_arg, help="월 (YYYY-MM, 날짜별 통계)")
+    stats_parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    stats_parser.set_defaults(func=cmd_stats)
+
+    export_parser = subparsers.add_parser("export", help="CSV 내보내기")
+    export_parser.add_argument("output", help="저장할 CSV 파일")
+    add_filter_arguments(export_parser)
+    export_parser.add_argument("--fields", help="내보낼 필드 (쉼표로 구분, 예: title,category,completed)")
+    export_parser.add_argument("--no-header", action="store_true", help="헤더 줄 생략")
+    export_parser.add_argument("--no-archive", action="store_true", help="보관된 작업 제외")
+    export_parser.add_argument("--sort", action="store_true", help="날짜 순으로 정렬")
+    export_parser.set_defaults(func=cmd_export)
+
+    report_parser = subparsers.add_parser("render-report", help="데일리 리포트 HTML 생성")
+    report_parser.add_argument("--date", type=date_arg, help="리포트 날짜 (기본값: 오늘)")
+    report_parser.add_argument("--category", action="append", help="카테고리 (여러 번 지정 가능, 기본값: 전체)")
+    report_parser.add_argument("--content", action="append", choices=REPORT_CONTENT_TYPES,
+                               help="작업 목록 종류 (여러 번 지정 가능, 기본값: all)")
+    report_parser.add_argument("--no-important", action="store_true", help="미완료 중요 일정 섹션 제외")
+    report_parser.add_argument("--important-days", type=int, default=IMPORTANT_TASKS_DAYS,
+                               help=f"중요 일정 조회 기간 (일, 기본값: {IMPORTANT_TASKS_DAYS})")
+    report_parser.add_argument("--memo", default="", help="추가 메모")
+    report_parser.add_argument("-o", "--output", help="저장할 파일 (기본값: 표준 출력)")
+    report_parser.set_defaults(func=cmd_render_report)
+
+    return parser
+
+
+def main(argv=None):
+    """명령줄 진입점
+
+    Returns:
+        int: 종료 코드 (0: 성공, 1: 실패, 2: 인자 오류)
+    """
+    args = build_parser().parse_args(argv)
+    setup_logging(debug=args.verbose, level="WARNING", log_dir=None)
+
+    storage = create_storage_manager(args.data_dir, args.backend)
+    try:
+        return args.func(storage, args)
+    except Exception as e:
+        logger.error("명령 실행 중 오류: %s", e, exc_info=args.verbose)
+        return 1
+    finally:
+        storage.close()
@@ -5,6 +5,13 @@ from PyQt6.QtWidgets import QCalendarWidget, QToolTip
 from PyQt6.QtCore import Qt, QDate, pyqtSignal, QRect, QPoint  # QRect와 QPoint 추가
 from PyQt6.QtGui import QPainter, QColor, QBrush, QPen, QFont
 
+from utils.logger import get_logger
+from utils.task_query import ORDER_DATE, TaskQuery
+
+logger = get_logger("ui")
+
+MAX_PREVIEW_ITEMS = 3  # 달력 뷰 모드에서 셀마다 표시할 작업 제목 수
+
 
 class CalendarWidget(QCalendarWidget):
     """작업 관리 달력 위젯"""
@@ -22,6 +29,8 @@ class CalendarWidget(QCalendarWidget):
 
         self.storage_manager = storage_manager
         self.calendar_view_mode = False  # 달력 뷰 모드 플래그
+        self.month_stats = {}  # 표시 중인 달력 그리드의 날짜별 통계 (날짜 -> 통계)
+        self.task_previews = {}  # 달력 뷰 모드에서 그릴 날짜별 (앞쪽 작업 목록, 전체 작업 수)
 
         # 달력 설정
         self.setGridVisible(True)
@@ -33,6 +42,10 @@ class CalendarWidget(QCalendarWidget):
 
         # 시그널 연결
         self.clicked.connect(self.on_date_clicked)
+        self.currentPageChanged.connect(self.on_page_changed)
+
+        # 저장소 변경 시 바뀐 날짜의 셀만 갱신
+        self.storage_manager.add_change_listener(self.on_storage_changed)
 
         # 달력 업데이트
         self.update_calendar()
@@ -45,11 +58,99 @@ class CalendarWidget(QCalendarWidget):
         """
         self.date_selected.emit(date)
 
+    def on_page_changed(self, year, month):
+        """표시 월 변경 시 통계 다시 불러오기
+
+        Args:
+            year (int): 표시 연도
+            month (int): 표시 월
+        """
+        self.update_calendar()
+
+    def load_month_stats(self):
+        """표시 중인 그리드(이전/현재/다음 달)의 날짜별 통계를 한 번에 불러오기"""
+        shown = QDate(self.yearShown(), self.monthShown(), 1)
+        month_stats = {}
+        for offset in (-1, 0, 1):
+            month_date = shown.addMonths(offset)
+            month_stats.update(self.storage_manager.get_month_stats(month_date.year(), month_date.month()))
+        self.month_stats = month_stats
+
+    def get_date_stats(self, date_str):
+        """캐시된 날짜 통계 조회 (작업이 없으면 None)"""
+        return self.month_stats.get(date_str)
+
+    def load_task_previews(self):
+        """달력 뷰 모드에서 셀에 그릴 작업 제목과 수를 한 번에 불러오기
+
+        셀마다 get_tasks_by_date와 같은 목록(다른 날짜의 중요 미완료 작업 + 그 날짜 작업)의
+        앞부분만 미리 만들어 두어, 그리는 중에는 저장소를 조회하지 않는다.
+        """
+        if not self.calendar_view_mode:
+            self.task_previews = {}
+            return
+
+        shown = QDate(self.yearShown(), self.monthShown(), 1)
+        start_date = shown.addMonths(-1).toString("yyyy-MM-dd")
+        end_date = shown.addMonths(2).addDays(-1).toString("yyyy-MM-dd")
+
+        date_tasks = {}
+        for task in self.storage_manager.query(TaskQuery(start_date=start_date, end_date=end_date,
+                                                         order=ORDER_DATE)):
+            date_tasks.setdefault(task.created_date, []).append(task)
+        important_tasks = list(self.storage_manager.query(TaskQuery(important=True, completed=False)))
+
+        task_previews = {}
+        for date_str, tasks in date_tasks.items():
+            other_important = [task for task in important_tasks if task.created_date != date_str]
+            preview = (other_important + tasks[:MAX_PREVIEW_ITEMS])[:MAX_PREVIEW_ITEMS]
+            task_previews[date_str] = (preview, len(other_important) + len(tasks))
+        self.task_previews = task_previews
+
     def update_calendar(self):
         """달력 데이터 업데이트"""
+        self.load_month_stats()
+        self.load_task_previews()
+
         # 달력 UI 갱신
         self.updateCells()
 
+    def is_date_in_grid(self, date_str):
+        """표시 중인 그리드(이전/현재/다음 달)에 포함된 날짜인지 여부"""
+        shown = QDate(self.yearShown(), self.monthShown(), 1)
+        first = shown.addMonths(-1).toString("yyyy-MM-dd")
+        last = shown.addMonths(2).addDays(-1).toString("yyyy-MM-dd")
+        return first <= date_str <= last
+
+    def on_storage_changed(self, changes):
+        """저장소 변경 알림 처리 (통계가 바뀐 날짜만 다시 조회하여 해당 셀만 다시 그림)
+
+        Args:
+            changes (TaskChangeSet): 변경 내역
+        """
+        try:
+            for date_str in changes.dates:
+                if not self.is_date_in_grid(date_str):
+                    continue
+                stats = self.storage_manager.get_task_stats(date_str)
+                if stats["total"] > 0:
+                    self.month_stats[date_str] = stats
+                else:
+                    self.month_stats.pop(date_str, None)
+
+            if self.calendar_view_mode:
+                # 달력 뷰 모드는 다른 날짜의 중요 작업도 모든 셀에 표시하므로 전체를 다시 그림
+                if changes.task_ids or changes.reordered_dates:
+                    self.load_task_previews()
+                    self.updateCells()
+                return
+
+            for date_str in changes.dates:
+                if self.is_date_in_grid(date_str):
+                    self.updateCell(QDate.fromString(date_str, "yyyy-MM-dd"))
+        except Exception as e:
+            logger.error("달력 셀 갱신 중 오류: %s", e)
+
     def setCalendarViewMode(self, enabled):
         """달력 뷰 모드 설정
 
@@ -57,6 +158,7 @@ class CalendarWidget(QCalendarWidget):
             enabled (bool): 달력 뷰 모드 활성화 여부
         """
         self.calendar_view_mode = enabled
+        self.load_task_previews()
         self.updateCells()  # 달력 셀 다시 그리기
 
     def paintCell(self, painter, rect, date):
@@ -73,11 +175,12 @@ class CalendarWidget(QCalendarWidget):
         # 날짜 문자열 변환 (YYYY-MM-DD)
         date_str = date.toString("yyyy-MM-dd")
 
-        # 날짜 통계 가져오기
-        stats = self.storage_manager.get_task_stats(date_str)
-        total_count = stats["total"]
+        # 날짜 통계 가져오기 (캐시된 월 통계 사용)
+        stats = self.get_date_stats(date_str)
+
+        if stats:
+            total_count = stats["total"]
 
-        if total_count > 0:
             # 작업이 있는 날짜 표시
             completion_rate = stats["completion_rate"]
 
@@ -114,19 +217,16 @@ class CalendarWidget(QCalendarWidget):
             # 달력 뷰 모드인 경우 작업 제목 표시
             if self.calendar_view_mode:
                 try:
-                    # 해당 날짜의 작업 목록 가져오기
-                    tasks = self.storage_manager.get_tasks_by_date(date_str)
+                    # 해당 날짜의 작업 목록 (update_calendar에서 미리 만든 앞부분과 전체 수)
+                    tasks, task_count = self.task_previews.get(date_str, ([], 0))
 
                     # 작업 표시 영역 계산
                     task_rect = rect.adjusted(2, 18, -2, -15)
-                    max_items = 3  # 최대 표시 항목 수
+                    max_items = MAX_PREVIEW_ITEMS  # 최대 표시 항목 수
                     item_height = min(15, task_rect.height() / max_items)
 
                     # 작업 목록 표시
-                    for i, task in enumerate(tasks[:max_items]):
-                        if i >= max_items:
-                            break
-
+                    for i, task in enumerate(tasks):
                         # 작업 항목 배경 설정
                         item_rect = QRect(
                             task_rect.left(),
@@ -173,18 +273,18 @@ class CalendarWidget(QCalendarWidget):
                         painter.restore()
 
                     # 추가 항목이 있음을 표시
-                    if len(tasks) > max_items:
+                    if task_count > max_items:
                         painter.save()
                         painter.setPen(QPen(QColor("#9E9E9E")))
                         painter.setFont(QFont(self.font().family(), 7))
                         painter.drawText(
                             rect.adjusted(0, rect.height() - 28, 0, -15),
                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom,
-                            f"+{len(tasks) - max_items}"
+                            f"+{task_count - max_items}"
                         )
                         painter.restore()
                 except Exception as e:
-                    print(f"달력 뷰 작업 표시 중 오류: {e}")
+                    logger.error("달력 뷰 작업 표시 중 오류: %s", e)
 
     def mouseMoveEvent(self, event):
         """마우스 이동 이벤트 처리 (툴팁 표시)
@@ -200,10 +300,10 @@ class CalendarWidget(QCalendarWidget):
             # 날짜 문자열 변환 (YYYY-MM-DD)
             date_str = date.toString("yyyy-MM-dd")
 
-            # 날짜 통계 가져오기
-            stats = self.storage_manager.get_task_stats(date_str)
+            # 날짜 통계 가져오기 (캐시된 월 통계 사용)
+            stats = self.get_date_stats(date_str)
 
-            if stats["total"] > 0:
+            if stats:
                 # 툴팁 내용 구성
                 tooltip = f"작업: {stats['total']}개\n"
                 tooltip += f"완료: {stats['completed']}개\n"
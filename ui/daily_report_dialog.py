@@ -3,7 +3,7 @@
 
 import os
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QCheckBox, QGroupBox, QDateEdit, QTextEdit,
@@ -13,6 +13,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QFont
 
+from utils.storage import IMPORTANT_TASKS_DAYS
+
 
 class AddressBookSelectionDialog(QDialog):
     """주소록 선택 대화상자 (데일리 리포트용)"""
@@ -499,82 +501,9 @@ class DailyReportDialog(QDialog):
             QMessageBox.critical(self, "미리보기 오류", f"미리보기 생성 중 오류가 발생했습니다:\n{e}")
 
     def collect_tasks_data(self, date_str):
-        """지정된 날짜의 작업 데이터 수집 (카테고리 필터 적용)"""
-        # 1단계: 해당 날짜에 생성된 작업만 먼저 필터링
-        all_tasks = self.storage_manager.get_tasks_by_date(date_str)
-        date_tasks = [t for t in all_tasks if t.created_date == date_str]
-
-        print(f"1단계 - 날짜별 필터링: {date_str}에 생성된 작업 {len(date_tasks)}개")
-
-        # 2단계: 카테고리 필터 적용
-        selected_categories = self.get_selected_categories()
-        if selected_categories is not None:  # 특정 카테고리만 선택된 경우
-            filtered_tasks = [t for t in date_tasks if t.category in selected_categories]
-            print(f"2단계 - 카테고리 필터링: {selected_categories} 카테고리로 필터링 -> {len(filtered_tasks)}개 작업")
-        else:
-            filtered_tasks = date_tasks
-            print(f"2단계 - 카테고리 필터링: 모든 카테고리 포함 -> {len(filtered_tasks)}개 작업")
-
-        return {
-            "all": filtered_tasks,
-            "completed": [t for t in filtered_tasks if t.completed],
-            "incomplete": [t for t in filtered_tasks if not t.completed],
-            "total": len(filtered_tasks),
-            "completed_count": len([t for t in filtered_tasks if t.completed]),
-            "completion_rate": (
-                    len([t for t in filtered_tasks if t.completed]) / len(
-                filtered_tasks) * 100) if filtered_tasks else 0
-        }
-
-    def collect_important_tasks(self, date_str):
-        """지난 30일간의 다른 날짜 미완료 중요 작업 수집 (카테고리 필터 적용)"""
-        if not self.include_important_check.isChecked():
-            return []
-
-        try:
-            # 지난 30일 범위 계산
-            current_date = datetime.strptime(date_str, "%Y-%m-%d")
-            start_date = current_date - timedelta(days=30)
-            start_date_str = start_date.strftime("%Y-%m-%d")
-
-            print(f"중요 작업 수집 범위: {start_date_str} ~ {date_str}")
-
-            # 모든 작업에서 조건에 맞는 작업 필터링
-            important_tasks = []
-            selected_categories = self.get_selected_categories()
-
-            for task in self.storage_manager.tasks:
-                # 1. 다른 날짜의 작업인지 확인
-                if task.created_date == date_str:
-                    continue
-
-                # 2. 지난 30일 범위 내인지 확인
-                if task.created_date < start_date_str or task.created_date > date_str:
-                    continue
-
-                # 3. 중요하고 미완료인지 확인
-                if not (task.important and not task.completed):
-                    continue
-
-                # 4. 카테고리 필터 적용
-                if selected_categories is not None:
-                    if task.category not in selected_categories:
-                        continue
-
-                important_tasks.append(task)
-
-            # 날짜순으로 정렬 (최신순)
-            important_tasks.sort(key=lambda x: x.created_date, reverse=True)
-
-            print(f"수집된 중요 작업 수: {len(important_tasks)}")
-            for task in important_tasks:
-                print(f"  - {task.created_date} [{task.category}] {task.title}")
-
-            return important_tasks
-
-        except Exception as e:
-            print(f"중요 작업 수집 중 오류: {e}")
-            return []
+        """지정된 날짜의 작업 데이터 수집 (카테고리 필터 적용, 설정 시 미완료 중요 일정 포함)"""
+        important_days = IMPORTANT_TASKS_DAYS if self.include_important_check.isChecked() else None
+        return self.storage_manager.collect_report_data(date_str, self.get_selected_categories(), important_days)
 
     def create_preview_text(self, tasks_data, date_str):
         """미리보기 텍스트 생성"""
@@ -619,7 +548,7 @@ class DailyReportDialog(QDialog):
 
         # 중요 일정 섹션 추가
         if self.include_important_check.isChecked():
-            important_tasks = self.collect_important_tasks(date_str)
+            important_tasks = tasks_data['important_tasks']
             if important_tasks:
                 preview += "📌 미완료 중요 일정 (지난 30일)\n"
                 for i, task in enumerate(important_tasks, 1):
@@ -661,8 +590,9 @@ class DailyReportDialog(QDialog):
                 success = self.send_daily_report(is_test=False)
 
                 if success:
-                    QMessageBox.information(self, "발송 완료",
-                                            f"데일리 리포트가 {len(self.selected_recipients)}명에게 성공적으로 발송되었습니다.")
+                    QMessageBox.information(self, "발송 요청 완료",
+                                            f"데일리 리포트를 {len(self.selected_recipients)}명에게 보내도록 발송 대기열에 추가했습니다.\n"
+                                            "발송 결과는 메인 창 상태 표시줄에 표시됩니다.")
                     self.accept()
                 else:
                     QMessageBox.critical(self, "발송 실패", "데일리 리포트 발송에 실패했습니다.")
@@ -697,38 +627,28 @@ class DailyReportDialog(QDialog):
     def send_daily_report(self, is_test=False):
         """실제 데일리 리포트 메일 발송"""
         try:
-            import win32com.client as win32
-
-            # Outlook 연결
-            outlook = win32.Dispatch('outlook.application')
-            mail = outlook.CreateItem(0)
+            from utils.mail_outbox import queue_mail
+            from utils.mail_transport import MailMessage
 
             # 메일 제목
             subject = self.subject_edit.text().strip()
             if is_test:
                 subject = "[테스트] " + subject
-            mail.Subject = subject
-
-            # 수신자
-            mail.To = "; ".join(self.selected_recipients)
 
             # 선택된 날짜
             selected_date = self.date_edit.date().toString("yyyy-MM-dd")
 
-            # 작업 데이터 수집 (카테고리 필터 적용)
+            # 작업 데이터 수집 (카테고리 필터 적용, 미완료 중요 일정 포함)
             tasks_data = self.collect_tasks_data(selected_date)
 
-            # 중요 작업 데이터 수집
-            important_tasks = self.collect_important_tasks(selected_date)
-
             # HTML 메일 내용 생성
-            html_body = self.create_html_report(tasks_data, important_tasks, selected_date, is_test)
-            mail.HTMLBody = html_body
+            html_body = self.create_html_report(tasks_data, tasks_data["important_tasks"], selected_date, is_test)
 
-            # 메일 발송
-            mail.Send()
+            # 발송 대기열에 추가 (발송은 백그라운드 워커가 처리)
+            data_dir = getattr(self.storage_manager, "data_dir", "data")
+            queue_mail(MailMessage(subject, self.selected_recipients, html_body), data_dir)
 
-            print(f"데일리 리포트 발송 완료: {subject}")
+            print(f"데일리 리포트 발송 대기열 추가: {subject}")
             return True
 
         except Exception as e:
@@ -736,314 +656,18 @@ class DailyReportDialog(QDialog):
             return False
 
     def create_html_report(self, tasks_data, important_tasks, date_str, is_test=False):
-        """HTML 데일리 리포트 생성 (Outlook 호환성 개선 + 카테고리 필터 정보 + 중요 일정 섹션 추가)"""
-        current_time = datetime.now().strftime("%Y년 %m월 %d일 %H:%M")
-        report_date = datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y년 %m월 %d일")
-
-        # 카테고리 필터 정보 - 수정된 로직
-        selected_categories = self.get_selected_categories()
-        category_filter_info = ""
-
-        print(f"HTML 생성 시 카테고리 필터: {selected_categories}")  # 디버그
-
-        if selected_categories is not None and len(selected_categories) > 0:
-            # 특정 카테고리가 선택된 경우
-            category_filter_info = f'''
-            <table width="100%" cellpadding="10" cellspacing="0" style="background-color: #e8f4fd; border: 1px solid #bee5eb; border-radius: 5px; margin-bottom: 20px;">
-                <tr><td style="text-align: center;">
-                    <strong>📂 포함된 카테고리:</strong> {', '.join(selected_categories)}
-                </td></tr>
-            </table>
-            '''
-        else:
-            # 모든 카테고리가 선택된 경우
-            category_filter_info = f'''
-            <table width="100%" cellpadding="10" cellspacing="0" style="background-color: #d4edda; border: 1px solid #c3e6cb; border-radius: 5px; margin-bottom: 20px;">
-                <tr><td style="text-align: center;">
-                    <strong>📂 포함된 카테고리:</strong> 모든 카테고리
-                </td></tr>
-            </table>
-            '''
-
-        # 테스트 메시지 (Outlook 호환)
-        test_message = ""
-        if is_test:
-            test_message = '''
-            <table width="100%" cellpadding="10" cellspacing="0" style="background-color: #fff3cd; border: 1px solid #ffeaa7; border-radius: 5px; margin-bottom: 20px;">
-                <tr><td style="text-align: center; font-weight: bold;">🧪 테스트 메일입니다</td></tr>
-            </table>
-            '''
-
-        # 작업 목록
-        task_lists = ""
-
-        if self.all_tasks_check.isChecked() and tasks_data['all']:
-            task_lists += self.create_outlook_task_section("📋 전체 작업", tasks_data['all'])
-        if self.completed_tasks_check.isChecked() and tasks_data['completed']:
-            task_lists += self.create_outlook_task_section("✅ 완료된 작업", tasks_data['completed'])
-        if self.incomplete_tasks_check.isChecked() and tasks_data['incomplete']:
-            task_lists += self.create_outlook_task_section("⏳ 미완료 작업", tasks_data['incomplete'])
-
-        # 중요 일정 섹션 (새로 추가)
-        important_section = ""
-        if self.include_important_check.isChecked() and important_tasks:
-            important_section = self.create_important_tasks_section(important_tasks)
-
-        # 추가 메모 섹션 (Outlook 호환)
-        memo_section = ""
-        memo = self.memo_edit.toPlainText().strip()
-        if memo:
-            memo_section = f'''
-            <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
-                <tr>
-                    <td style="padding: 10px 0 5px 0; border-bottom: 2px solid #e0e0e0;">
-                        <h3 style="margin: 0; color: #333;">📝 추가 메모</h3>
-                    </td>
-                </tr>
-                <tr>
-                    <td style="padding: 10px; background-color: #f8f9fa; border-radius: 5px;">
-                        {self.escape_html(memo).replace(chr(10), "<br>")}
-                    </td>
-                </tr>
-            </table>
-            '''
-
-        # Outlook 호환 HTML (테이블 기반 레이아웃)
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Todolist 리포트</title>
-            <!--[if mso]>
-            <style type="text/css">
-                table {{ border-collapse: collapse; }}
-                .header-table {{ background-color: #4facfe !important; }}
-            </style>
-            <![endif]-->
-        </head>
-        <body style="margin: 0; padding: 0; font-family: Arial, sans-serif; background-color: #f5f5f5;">
-
-            <!-- 메인 컨테이너 -->
-            <table width="100%" cellpadding="0" cellspacing="0" style="background-color: #f5f5f5; padding: 20px;">
-                <tr>
-                    <td align="center">
-
-                        <!-- 메일 내용 테이블 -->
-                        <table width="600" cellpadding="0" cellspacing="0" style="background-color: #ffffff; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); overflow: hidden;">
-
-                            <!-- 헤더 -->
-                            <tr>
-                                <td class="header-table" style="background-color: #4facfe; padding: 25px 20px; text-align: center;">
-                                    <h1 style="margin: 0 0 10px 0; color: #ffffff; font-size: 24px; font-weight: bold;">
-                                        📋 Todolist 리포트
-                                    </h1>
-                                    <div style="color: #ffffff; font-size: 16px; margin: 0;">
-                                        {current_time}
-                                    </div>
-                                </td>
-                            </tr>
-
-                            <!-- 메인 컨텐츠 -->
-                            <tr>
-                                <td style="padding: 25px 20px;">
-
-                                    {test_message}
-                                    {category_filter_info}
-
-                                    <!-- 데일리 리포트 요약 -->
-                                    <table width="100%" cellpadding="20" cellspacing="0" style="background-color: #e3f2fd; border-radius: 10px; margin-bottom: 20px;">
-                                        <tr>
-                                            <td>
-                                                <h2 style="margin: 0 0 15px 0; color: #1976d2; text-align: center;">📊 데일리 리포트</h2>
-
-                                                <!-- 통계 테이블 -->
-                                                <table width="100%" cellpadding="10" cellspacing="0">
-                                                    <tr>
-                                                        <td width="33%" style="text-align: center;">
-                                                            <div style="font-size: 24px; font-weight: bold; color: #2196f3;">{tasks_data['total']}</div>
-                                                            <div style="font-size: 12px; color: #666;">전체 작업</div>
-                                                        </td>
-                                                        <td width="33%" style="text-align: center;">
-                                                            <div style="font-size: 24px; font-weight: bold; color: #4caf50;">{tasks_data['completed_count']}</div>
-                                                            <div style="font-size: 12px; color: #666;">완료됨</div>
-                                                        </td>
-                                                        <td width="33%" style="text-align: center;">
-                                                            <div style="font-size: 24px; font-weight: bold; color: #f44336;">{tasks_data['total'] - tasks_data['completed_count']}</div>
-                                                            <div style="font-size: 12px; color: #666;">미완료</div>
-                                                        </td>
-                                                    </tr>
-                                                </table>
-
-                                                <!-- 완료율 -->
-                                                <table width="100%" cellpadding="10" cellspacing="0" style="background-color: #ffffff; border-radius: 5px; margin-top: 15px;">
-                                                    <tr>
-                                                        <td>
-                                                            <table width="100%" cellpadding="0" cellspacing="0">
-                                                                <tr>
-                                                                    <td style="font-weight: bold;">완료율</td>
-                                                                    <td style="text-align: right; font-weight: bold; color: #4caf50;">
-                                                                        {tasks_data['completion_rate']:.0f}%
-                                                                    </td>
-                                                                </tr>
-                                                            </table>
-                                                            <table width="100%" cellpadding="0" cellspacing="0" style="margin-top: 5px;">
-                                                                <tr>
-                                                                    <td style="background-color: #e0e0e0; height: 8px; border-radius: 4px;">
-                                                                        <div style="background-color: #4caf50; height: 8px; width: {tasks_data['completion_rate']:.0f}%; border-radius: 4px;"></div>
-                                                                    </td>
-                                                                </tr>
-                                                            </table>
-                                                        </td>
-                                                    </tr>
-                                                </table>
-                                            </td>
-                                        </tr>
-                                    </table>
-
-                                    {task_lists}
-                                    {important_section}
-                                    {memo_section}
-
-                                </td>
-                            </tr>
-
-                            <!-- 푸터 -->
-                            <tr>
-                                <td style="background-color: #f8f9fa; padding: 15px 20px; text-align: center; color: #666; font-size: 12px; border-top: 1px solid #e9ecef;">
-                                    🤖 Todolist PM에서 자동 생성됨 | {current_time}
-                                </td>
-                            </tr>
-
-                        </table>
-
-                    </td>
-                </tr>
-            </table>
-
-        </body>
-        </html>
-        """
-
-        return html
-
-    def create_outlook_task_section(self, title, tasks):
-        """Outlook 호환 작업 섹션 생성 (테이블 기반)"""
-        if not tasks:
-            return f"""
-            <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
-                <tr>
-                    <td style="padding: 10px 0 5px 0; border-bottom: 2px solid #e0e0e0;">
-                        <h3 style="margin: 0; color: #333;">{title}</h3>
-                    </td>
-                </tr>
-                <tr>
-                    <td style="text-align: center; color: #666; padding: 20px;">작업이 없습니다</td>
-                </tr>
-            </table>
-            """
-
-        task_rows = ""
-        for task in tasks:
-            status = "✓" if task.completed else "○"
-            text_style = "text-decoration: line-through; color: #666;" if task.completed else ""
-            importance = "★ " if task.important else ""
-            border_color = "#4caf50" if task.completed else "#2196f3"
-
-            task_rows += f"""
-            <tr>
-                <td style="padding: 10px; background-color: #f8f9fa; border-left: 3px solid {border_color}; border-radius: 5px;">
-                    <table width="100%" cellpadding="0" cellspacing="0">
-                        <tr>
-                            <td style="{text_style}">
-                                <strong>{status} {importance}{self.escape_html(task.title)}</strong>
-                                <span style="background-color: {self.get_category_color(task.category)}; color: white; padding: 2px 6px; border-radius: 10px; font-size: 10px; margin-left: 10px;">
-                                    {task.category}
-                                </span>
-                            </td>
-                        </tr>
-                        {f'<tr><td style="font-size: 12px; color: #666; padding-top: 5px;">{self.escape_html(task.content[:50])}</td></tr>' if task.content else ''}
-                    </table>
-                </td>
-            </tr>
-            <tr><td style="height: 5px;"></td></tr>
-            """
-
-        return f"""
-        <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
-            <tr>
-                <td style="padding: 10px 0 5px 0; border-bottom: 2px solid #e0e0e0;">
-                    <h3 style="margin: 0; color: #333;">{title}</h3>
-                </td>
-            </tr>
-            <tr><td style="height: 10px;"></td></tr>
-            {task_rows}
-        </table>
-        """
-
-    def create_important_tasks_section(self, important_tasks):
-        """중요 일정 섹션 생성 (테이블 기반)"""
-        if not important_tasks:
-            return ""
-
-        task_rows = ""
-        for task in important_tasks:
-            # 날짜 정보 추가
-            date_info = f"{task.created_date}"
-
-            task_rows += f"""
-            <tr>
-                <td style="padding: 10px; background-color: #fff3e0; border-left: 3px solid #ff9800; border-radius: 5px;">
-                    <table width="100%" cellpadding="0" cellspacing="0">
-                        <tr>
-                            <td>
-                                <strong>⭐ {self.escape_html(task.title)}</strong>
-                                <span style="background-color: {self.get_category_color(task.category)}; color: white; padding: 2px 6px; border-radius: 10px; font-size: 10px; margin-left: 10px;">
-                                    {task.category}
-                                </span>
-                                <span style="background-color: #9e9e9e; color: white; padding: 2px 6px; border-radius: 10px; font-size: 10px; margin-left: 5px;">
-                                    {date_info}
-                                </span>
-                            </td>
-                        </tr>
-                        {f'<tr><td style="font-size: 12px; color: #666; padding-top: 5px;">{self.escape_html(task.content[:50])}</td></tr>' if task.content else ''}
-                    </table>
-                </td>
-            </tr>
-            <tr><td style="height: 5px;"></td></tr>
-            """
-
-        return f"""
-        <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
-            <tr>
-                <td style="padding: 10px 0 5px 0; border-bottom: 2px solid #ff9800;">
-                    <h3 style="margin: 0; color: #f57c00;">📌 미완료 중요 일정 (지난 30일)</h3>
-                </td>
-            </tr>
-            <tr><td style="height: 10px;"></td></tr>
-            {task_rows}
-        </table>
-        """
-
-    def get_category_color(self, category_name):
-        """카테고리 색상 반환"""
-        for category in self.storage_manager.categories:
-            if category.name == category_name:
-                return category.color
-        return "#6c757d"  # 기본 색상
-
-    def escape_html(self, text):
-        """HTML 특수문자 이스케이프"""
-        if not text:
-            return ""
-
-        html_escape_table = {
-            "&": "&amp;",
-            '"': "&quot;",
-            "'": "&#39;",
-            ">": "&gt;",
-            "<": "&lt;",
-        }
-
-        return "".join(html_escape_table.get(c, c) for c in text)
\ No newline at end of file
+        """HTML 데일리 리포트 생성 (카테고리 필터 정보 + 중요 일정 섹션 포함)"""
+        from utils.report_renderer import ReportRenderer, render_daily_report
+
+        # 작업 목록 종류
+        content_types = [kind for kind, check in (("all", self.all_tasks_check),
+                                                  ("completed", self.completed_tasks_check),
+                                                  ("incomplete", self.incomplete_tasks_check))
+                         if check.isChecked()]
+
+        renderer = ReportRenderer(self.storage_manager.category_colors)
+        return render_daily_report(
+            renderer, dict(tasks_data, important_tasks=important_tasks), content_types,
+            selected_categories=self.get_selected_categories(),
+            include_important=self.include_important_check.isChecked(),
+            memo=self.memo_edit.toPlainText(), is_test=is_test)
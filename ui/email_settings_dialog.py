@@ -14,6 +14,10 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QTime, QDate, QTimer
 from PyQt6.QtGui import QFont
 
+from utils.durable_io import atomic_write_json, load_json_with_recovery
+from utils.routine_scheduler import merge_send_history
+from utils.storage import IMPORTANT_TASKS_DAYS
+
 
 class AddressBookSelectionDialog(QDialog):
     """주소록 선택 대화상자"""
@@ -759,8 +763,8 @@ class EmailSettingsDialog(QDialog):
 
             if success:
                 QMessageBox.information(
-                    self, "발송 완료",
-                    f"테스트 메일이 {len(recipients)}명에게 성공적으로 발송되었습니다."
+                    self, "발송 요청 완료",
+                    f"테스트 메일을 {len(recipients)}명에게 보내도록 발송 대기열에 추가했습니다."
                 )
             else:
                 QMessageBox.critical(
@@ -903,6 +907,7 @@ class EmailSettingsDialog(QDialog):
                 if routine["id"] == self.editing_routine_id:
                     routine_data["id"] = self.editing_routine_id
                     routine_data["created_at"] = routine.get("created_at", datetime.now().isoformat())
+                    routine_data["updated_at"] = datetime.now().isoformat()
                     routine_data["enabled"] = routine.get("enabled", True)
                     # 발송 이력 유지
                     routine_data["last_sent_date"] = routine.get("last_sent_date")
@@ -983,6 +988,7 @@ class EmailSettingsDialog(QDialog):
         for r in self.daily_routines:
             if r["id"] == routine_id:
                 r["enabled"] = not r.get("enabled", True)
+                r["updated_at"] = datetime.now().isoformat()
                 break
 
         self.refresh_routine_list()
@@ -1014,8 +1020,9 @@ class EmailSettingsDialog(QDialog):
                     # 발송 이력 업데이트
                     self.update_routine_send_history(routine["id"])
                     QMessageBox.information(
-                        self, "발송 완료",
-                        f"루틴 '{routine['name']}'이 성공적으로 발송되었습니다!"
+                        self, "발송 요청 완료",
+                        f"루틴 '{routine['name']}'을 발송 대기열에 추가했습니다.\n"
+                        "발송 결과는 메인 창 상태 표시줄에 표시됩니다."
                     )
                 else:
                     QMessageBox.critical(
@@ -1049,16 +1056,12 @@ class EmailSettingsDialog(QDialog):
     def send_routine_report(self, routine):
         """루틴 리포트 메일 발송 (daily_routine_checker와 동일한 로직)"""
         try:
-            import win32com.client as win32
-            from datetime import datetime, timedelta
-
-            # Outlook 연결
-            outlook = win32.Dispatch('outlook.application')
-            mail = outlook.CreateItem(0)
+            from datetime import datetime
+            from utils.mail_outbox import queue_mail
+            from utils.mail_transport import MailMessage
 
             # 메일 제목
             subject = routine.get("subject", "데일리 리포트")
-            mail.Subject = f"[즉시발송] {subject}"
 
             # 수신자
             recipients = routine.get("recipients", [])
@@ -1066,8 +1069,6 @@ class EmailSettingsDialog(QDialog):
                 print("수신자가 없어 루틴 실행을 건너뜁니다.")
                 return False
 
-            mail.To = "; ".join(recipients)
-
             # 현재 날짜 사용
             current_date = datetime.now().strftime("%Y-%m-%d")
 
@@ -1077,10 +1078,11 @@ class EmailSettingsDialog(QDialog):
 
             # HTML 메일 내용 생성
             html_body = self.create_routine_html_report(routine, tasks_data, current_date)
-            mail.HTMLBody = html_body
 
-            # 메일 발송
-            mail.Send()
+            # 발송 대기열에 추가 (발송은 백그라운드 워커가 처리)
+            data_dir = getattr(self.storage_manager, "data_dir", "data")
+            queue_mail(MailMessage(f"[즉시발송] {subject}", recipients, html_body), data_dir,
+                       description=f"루틴 {routine.get('name', subject)}")
 
             print(f"루틴 리포트 즉시 발송 완료: {routine.get('name', 'Unknown')}")
             return True
@@ -1090,372 +1092,16 @@ class EmailSettingsDialog(QDialog):
             return False
 
     def collect_routine_tasks_data(self, date_str, selected_categories=None, include_important_tasks=True):
-        """루틴용 작업 데이터 수집 (daily_routine_checker와 동일한 로직)"""
-        all_tasks = self.storage_manager.get_tasks_by_date(date_str)
-
-        # 1단계: 해당 날짜에 생성된 작업만 먼저 필터링
-        date_tasks = [t for t in all_tasks if t.created_date == date_str]
-        print(f"루틴 - 1단계 날짜별 필터링: {date_str}에 생성된 작업 {len(date_tasks)}개")
-
-        # 2단계: 카테고리 필터 적용
-        if selected_categories is not None and len(selected_categories) > 0:
-            filtered_tasks = [t for t in date_tasks if t.category in selected_categories]
-            print(f"루틴 - 2단계 카테고리 필터링: {selected_categories} 카테고리로 필터링 -> {len(filtered_tasks)}개 작업")
-        else:
-            filtered_tasks = date_tasks
-            print(f"루틴 - 2단계 카테고리 필터링: 모든 카테고리 포함 -> {len(filtered_tasks)}개 작업")
-
-        # 3단계: 미완료 중요 일정 수집 (설정 확인)
-        important_tasks = []
-        if include_important_tasks:
-            important_tasks = self.get_important_incomplete_tasks(date_str, selected_categories)
-            print(f"루틴 - 3단계 미완료 중요 일정: {len(important_tasks)}개")
-
-        return {
-            "all": filtered_tasks,
-            "completed": [t for t in filtered_tasks if t.completed],
-            "incomplete": [t for t in filtered_tasks if not t.completed],
-            "total": len(filtered_tasks),
-            "completed_count": len([t for t in filtered_tasks if t.completed]),
-            "completion_rate": (
-                    len([t for t in filtered_tasks if t.completed]) / len(
-                filtered_tasks) * 100) if filtered_tasks else 0,
-            "important_tasks": important_tasks
-        }
-
-    def get_important_incomplete_tasks(self, current_date, selected_categories):
-        """지난 30일간의 다른 날짜 미완료 중요 작업 수집"""
-        try:
-            from datetime import datetime, timedelta
-
-            # 30일 전 날짜 계산
-            current_dt = datetime.strptime(current_date, "%Y-%m-%d")
-            thirty_days_ago = current_dt - timedelta(days=30)
-            thirty_days_ago_str = thirty_days_ago.strftime("%Y-%m-%d")
-
-            # 모든 작업에서 조건에 맞는 작업 필터링
-            important_tasks = []
-            for task in self.storage_manager.tasks:
-                # 조건: 다른 날짜 + 미완료 + 중요 + 최근 30일 내
-                if (task.created_date != current_date and
-                        not task.completed and
-                        task.important and
-                        thirty_days_ago_str <= task.created_date <= current_date):
-
-                    # 카테고리 필터 적용
-                    if selected_categories is None or task.category in selected_categories:
-                        important_tasks.append(task)
-
-            # 날짜순으로 정렬 (최신순)
-            important_tasks.sort(key=lambda x: x.created_date, reverse=True)
-
-            print(f"루틴 - 미완료 중요 일정 수집: {len(important_tasks)}개 (기간: {thirty_days_ago_str} ~ {current_date})")
-            return important_tasks
-
-        except Exception as e:
-            print(f"루틴 - 미완료 중요 일정 수집 중 오류: {e}")
-            return []
+        """루틴용 작업 데이터 수집 (daily_routine_checker와 동일한 조회)"""
+        return self.storage_manager.collect_report_data(
+            date_str, selected_categories, IMPORTANT_TASKS_DAYS if include_important_tasks else None)
 
     def create_routine_html_report(self, routine, tasks_data, date_str):
-        """루틴용 HTML 리포트 생성 (daily_routine_checker와 동일한 로직)"""
-        from datetime import datetime
-
-        current_time = datetime.now().strftime("%Y년 %m월 %d일 %H:%M")
-        report_date = datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y년 %m월 %d일")
-
-        # 카테고리 필터 정보
-        selected_categories = routine.get("selected_categories")
-        category_filter_info = ""
-
-        if selected_categories is not None and len(selected_categories) > 0:
-            category_filter_info = f'''
-            <table width="100%" cellpadding="10" cellspacing="0" style="background-color: #e8f4fd; border: 1px solid #bee5eb; border-radius: 5px; margin-bottom: 20px;">
-                <tr><td style="text-align: center;">
-                    <strong>📂 포함된 카테고리:</strong> {', '.join(selected_categories)}
-                </td></tr>
-            </table>
-            '''
-        else:
-            category_filter_info = f'''
-            <table width="100%" cellpadding="10" cellspacing="0" style="background-color: #d4edda; border: 1px solid #c3e6cb; border-radius: 5px; margin-bottom: 20px;">
-                <tr><td style="text-align: center;">
-                    <strong>📂 포함된 카테고리:</strong> 모든 카테고리
-                </td></tr>
-            </table>
-            '''
-
-        # 즉시 발송 정보 섹션
-        immediate_send_info = f'''
-        <table width="100%" cellpadding="15" cellspacing="0" style="background-color: #fff3cd; border: 1px solid #ffc107; border-radius: 8px; margin-bottom: 20px;">
-            <tr>
-                <td style="text-align: center;">
-                    <strong style="color: #856404; font-size: 16px;">⚡ 즉시 발송 리포트</strong>
-                    <div style="font-size: 12px; color: #856404; margin-top: 5px;">
-                        루틴명: {routine.get('name', 'Unknown')} | 수동 실행
-                    </div>
-                </td>
-            </tr>
-        </table>
-        '''
-
-        # 작업 목록 섹션들
-        task_sections = ""
-        content_types = routine.get("content_types", ["all"])
-
-        if "all" in content_types and tasks_data['all']:
-            task_sections += self.create_outlook_task_section("📋 전체 작업", tasks_data['all'])
-
-        if "completed" in content_types and tasks_data['completed']:
-            task_sections += self.create_outlook_task_section("✅ 완료된 작업", tasks_data['completed'])
-
-        if "incomplete" in content_types and tasks_data['incomplete']:
-            task_sections += self.create_outlook_task_section("⏳ 미완료 작업", tasks_data['incomplete'])
-
-        # 미완료 중요 일정 섹션
-        important_section = ""
-        if routine.get("include_important_tasks", True) and tasks_data.get("important_tasks"):
-            important_section = self.create_important_tasks_section(tasks_data["important_tasks"][:10])
-
-        # 추가 메모 섹션
-        memo_section = ""
-        memo = routine.get("memo", "").strip()
-        if memo:
-            memo_section = f'''
-            <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
-                <tr>
-                    <td style="padding: 10px 0 5px 0; border-bottom: 2px solid #e0e0e0;">
-                        <h3 style="margin: 0; color: #333;">📝 추가 메모</h3>
-                    </td>
-                </tr>
-                <tr>
-                    <td style="padding: 10px; background-color: #f8f9fa; border-radius: 5px;">
-                        {self.escape_html(memo).replace(chr(10), "<br>")}
-                    </td>
-                </tr>
-            </table>
-            '''
-
-        # HTML 생성 (Outlook 호환)
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>루틴 리포트 (즉시 발송)</title>
-            <!--[if mso]>
-            <style type="text/css">
-                table {{ border-collapse: collapse; }}
-                .header-table {{ background-color: #4facfe !important; }}
-            </style>
-            <![endif]-->
-        </head>
-        <body style="margin: 0; padding: 0; font-family: Arial, sans-serif; background-color: #f5f5f5;">
-            <table width="100%" cellpadding="0" cellspacing="0" style="background-color: #f5f5f5; padding: 20px;">
-                <tr>
-                    <td align="center">
-                        <table width="600" cellpadding="0" cellspacing="0" style="background-color: #ffffff; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); overflow: hidden;">
-                            <tr>
-                                <td class="header-table" style="background-color: #4facfe; padding: 25px 20px; text-align: center;">
-                                    <h1 style="margin: 0 0 10px 0; color: #ffffff; font-size: 24px; font-weight: bold;">
-                                        ⚡ 루틴 리포트 (즉시 발송)
-                                    </h1>
-                                    <div style="color: #ffffff; font-size: 16px; margin: 0;">
-                                        {current_time}
-                                    </div>
-                                </td>
-                            </tr>
-                            <tr>
-                                <td style="padding: 25px 20px;">
-                                    {immediate_send_info}
-                                    {category_filter_info}
-
-                                    <!-- 데일리 리포트 요약 -->
-                                    <table width="100%" cellpadding="20" cellspacing="0" style="background-color: #e3f2fd; border-radius: 10px; margin-bottom: 20px;">
-                                        <tr>
-                                            <td>
-                                                <h2 style="margin: 0 0 15px 0; color: #1976d2; text-align: center;">📊 {report_date} 업무 현황</h2>
-                                                <table width="100%" cellpadding="10" cellspacing="0">
-                                                    <tr>
-                                                        <td width="33%" style="text-align: center;">
-                                                            <div style="font-size: 24px; font-weight: bold; color: #2196f3;">{tasks_data['total']}</div>
-                                                            <div style="font-size: 12px; color: #666;">전체 작업</div>
-                                                        </td>
-                                                        <td width="33%" style="text-align: center;">
-                                                            <div style="font-size: 24px; font-weight: bold; color: #4caf50;">{tasks_data['completed_count']}</div>
-                                                            <div style="font-size: 12px; color: #666;">완료됨</div>
-                                                        </td>
-                                                        <td width="33%" style="text-align: center;">
-                                                            <div style="font-size: 24px; font-weight: bold; color: #f44336;">{tasks_data['total'] - tasks_data['completed_count']}</div>
-                                                            <div style="font-size: 12px; color: #666;">미완료</div>
-                                                        </td>
-                                                    </tr>
-                                                </table>
-                                                <table width="100%" cellpadding="10" cellspacing="0" style="background-color: #ffffff; border-radius: 5px; margin-top: 15px;">
-                                                    <tr>
-                                                        <td>
-                                                            <table width="100%" cellpadding="0" cellspacing="0">
-                                                                <tr>
-                                                                    <td style="font-weight: bold;">완료율</td>
-                                                                    <td style="text-align: right; font-weight: bold; color: #4caf50;">
-                                                                        {tasks_data['completion_rate']:.0f}%
-                                                                    </td>
-                                                                </tr>
-                                                            </table>
-                                                            <table width="100%" cellpadding="0" cellspacing="0" style="margin-top: 5px;">
-                                                                <tr>
-                                                                    <td style="background-color: #e0e0e0; height: 8px; border-radius: 4px;">
-                                                                        <div style="background-color: #4caf50; height: 8px; width: {tasks_data['completion_rate']:.0f}%; border-radius: 4px;"></div>
-                                                                    </td>
-                                                                </tr>
-                                                            </table>
-                                                        </td>
-                                                    </tr>
-                                                </table>
-                                            </td>
-                                        </tr>
-                                    </table>
-
-                                    {task_sections}
-                                    {important_section}
-                                    {memo_section}
-                                </td>
-                            </tr>
-                            <tr>
-                                <td style="background-color: #f8f9fa; padding: 15px 20px; text-align: center; color: #666; font-size: 12px; border-top: 1px solid #e9ecef;">
-                                    ⚡ Todolist PM 루틴 즉시 발송 | {current_time}<br>
-                                    루틴: {routine.get('name', 'Unknown')} - {report_date}
-                                </td>
-                            </tr>
-                        </table>
-                    </td>
-                </tr>
-            </table>
-        </body>
-        </html>
-        """
-
-        return html
-
-    def create_outlook_task_section(self, title, tasks):
-        """Outlook 호환 작업 섹션 생성"""
-        if not tasks:
-            return f"""
-            <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
-                <tr>
-                    <td style="padding: 10px 0 5px 0; border-bottom: 2px solid #e0e0e0;">
-                        <h3 style="margin: 0; color: #333;">{title}</h3>
-                    </td>
-                </tr>
-                <tr>
-                    <td style="text-align: center; color: #666; padding: 20px;">해당하는 작업이 없습니다</td>
-                </tr>
-            </table>
-            """
-
-        task_rows = ""
-        for task in tasks:
-            status = "✅" if task.completed else "⏳"
-            text_style = "text-decoration: line-through; color: #666;" if task.completed else ""
-            importance = "⭐ " if task.important else ""
-            border_color = "#4caf50" if task.completed else "#2196f3"
-
-            task_rows += f"""
-            <tr>
-                <td style="padding: 10px; background-color: #f8f9fa; border-left: 3px solid {border_color}; border-radius: 5px;">
-                    <table width="100%" cellpadding="0" cellspacing="0">
-                        <tr>
-                            <td style="{text_style}">
-                                <strong>{status} {importance}{self.escape_html(task.title)}</strong>
-                                <span style="background-color: {self.get_category_color(task.category)}; color: white; padding: 2px 6px; border-radius: 10px; font-size: 10px; margin-left: 10px;">
-                                    {task.category}
-                                </span>
-                            </td>
-                        </tr>
-                        {f'<tr><td style="font-size: 12px; color: #666; padding-top: 5px;">{self.escape_html(task.content[:50])}</td></tr>' if task.content else ''}
-                    </table>
-                </td>
-            </tr>
-            <tr><td style="height: 5px;"></td></tr>
-            """
-
-        return f"""
-        <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
-            <tr>
-                <td style="padding: 10px 0 5px 0; border-bottom: 2px solid #e0e0e0;">
-                    <h3 style="margin: 0; color: #333;">{title} ({len(tasks)}개)</h3>
-                </td>
-            </tr>
-            <tr><td style="height: 10px;"></td></tr>
-            {task_rows}
-        </table>
-        """
-
-    def create_important_tasks_section(self, important_tasks):
-        """미완료 중요 일정 섹션 생성"""
-        if not important_tasks:
-            return ""
-
-        task_rows = ""
-        for task in important_tasks:
-            from datetime import datetime
-            date_display = datetime.strptime(task.created_date, "%Y-%m-%d").strftime("%m/%d")
-
-            task_rows += f"""
-            <tr>
-                <td style="padding: 10px; background-color: #fff3e0; border-left: 3px solid #ff6b00; border-radius: 5px;">
-                    <table width="100%" cellpadding="0" cellspacing="0">
-                        <tr>
-                            <td>
-                                <strong>⭐ {self.escape_html(task.title)}</strong>
-                                <span style="background-color: {self.get_category_color(task.category)}; color: white; padding: 2px 6px; border-radius: 10px; font-size: 10px; margin-left: 5px;">
-                                    {task.category}
-                                </span>
-                                <span style="background-color: #ff6b00; color: white; padding: 2px 6px; border-radius: 10px; font-size: 10px; margin-left: 5px;">
-                                    {date_display}
-                                </span>
-                            </td>
-                        </tr>
-                        {f'<tr><td style="font-size: 12px; color: #666; padding-top: 5px;">{self.escape_html(task.content[:50])}</td></tr>' if task.content else ''}
-                    </table>
-                </td>
-            </tr>
-            <tr><td style="height: 5px;"></td></tr>
-            """
-
-        return f"""
-        <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
-            <tr>
-                <td style="padding: 10px 0 5px 0; border-bottom: 2px solid #ff6b00;">
-                    <h3 style="margin: 0; color: #ff6b00;">📌 미완료 중요 일정 (최근 30일)</h3>
-                </td>
-            </tr>
-            <tr><td style="height: 10px;"></td></tr>
-            {task_rows}
-        </table>
-        """
-
-    def get_category_color(self, category_name):
-        """카테고리 색상 반환"""
-        for category in self.storage_manager.categories:
-            if category.name == category_name:
-                return category.color
-        return "#6c757d"
-
-    def escape_html(self, text):
-        """HTML 특수문자 이스케이프"""
-        if not text:
-            return ""
-
-        html_escape_table = {
-            "&": "&amp;",
-            '"': "&quot;",
-            "'": "&#39;",
-            ">": "&gt;",
-            "<": "&lt;",
-        }
+        """루틴용 HTML 리포트 생성 (daily_routine_checker와 같은 렌더러, 즉시 발송 표시)"""
+        from utils.report_renderer import ReportRenderer, render_routine_report
 
-        return "".join(html_escape_table.get(c, c) for c in text)
+        renderer = ReportRenderer(self.storage_manager.category_colors)
+        return render_routine_report(renderer, routine, tasks_data, date_str, immediate=True)
 
     def update_routine_send_history(self, routine_id):
         """루틴 발송 이력 업데이트"""
@@ -1727,6 +1373,9 @@ class EmailSettingsDialog(QDialog):
                 "period": "오늘",
                 "include_important_tasks": True  # 중요 일정 포함 기본값
             }
+            # 발송 방식(transport) 설정은 파일에서 직접 편집하므로 그대로 유지
+            if "transport" in self.email_settings:
+                email_settings["transport"] = self.email_settings["transport"]
             self.save_email_settings(email_settings)
 
             # 데일리 루틴 저장
@@ -1745,10 +1394,10 @@ class EmailSettingsDialog(QDialog):
     def load_email_settings(self):
         """메일 설정 로드"""
         try:
-            settings_file = "data/email_settings.json"
-            if os.path.exists(settings_file):
-                with open(settings_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+            settings = load_json_with_recovery("data/email_settings.json",
+                                               validate=lambda data: isinstance(data, dict))
+            if settings is not None:
+                return settings
         except Exception as e:
             print(f"메일 설정 로드 중 오류: {e}")
 
@@ -1763,11 +1412,7 @@ class EmailSettingsDialog(QDialog):
     def save_email_settings(self, settings):
         """메일 설정 저장"""
         try:
-            os.makedirs("data", exist_ok=True)
-            settings_file = "data/email_settings.json"
-
-            with open(settings_file, "w", encoding="utf-8") as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
+            atomic_write_json("data/email_settings.json", settings)
 
             print("메일 설정 저장 완료")
         except Exception as e:
@@ -1776,11 +1421,9 @@ class EmailSettingsDialog(QDialog):
     def load_daily_routines(self):
         """데일리 루틴 설정 로드"""
         try:
-            routines_file = "data/daily_routines.json"
-            if os.path.exists(routines_file):
-                with open(routines_file, "r", encoding="utf-8") as f:
-                    routines = json.load(f)
-
+            routines = load_json_with_recovery("data/daily_routines.json",
+                                               validate=lambda data: isinstance(data, list))
+            if routines is not None:
                 # 기존 루틴에 발송 이력 필드가 없으면 추가
                 for routine in routines:
                     if "last_sent_date" not in routine:
@@ -1801,11 +1444,9 @@ class EmailSettingsDialog(QDialog):
     def save_daily_routines(self):
         """데일리 루틴 설정 저장"""
         try:
-            os.makedirs("data", exist_ok=True)
-            routines_file = "data/daily_routines.json"
-
-            with open(routines_file, "w", encoding="utf-8") as f:
-                json.dump(self.daily_routines, f, ensure_ascii=False, indent=2)
+            # 대화상자가 열려 있는 동안 스케줄러가 기록한 발송 이력 유지
+            merge_send_history(self.daily_routines, "data/daily_routines.json")
+            atomic_write_json("data/daily_routines.json", self.daily_routines)
 
             print("데일리 루틴 저장 완료")
         except Exception as e:
@@ -12,6 +12,7 @@ from PyQt6.QtGui import QIcon
 from datetime import datetime
 from utils.date_utils import get_month_start_end, get_week_start_end, get_current_date_str
 from utils.csv_exporter import CsvExporter
+from utils.task_query import TaskQuery
 
 
 class ExportDialog(QDialog):
@@ -290,12 +291,9 @@ class ExportDialog(QDialog):
             include_header = self.header_check.isChecked()
             fields = self.get_selected_fields()
 
-            # 작업 필터링
-            filtered_tasks = CsvExporter.filter_tasks(
-                self.storage_manager.tasks,
-                date_range=date_range,
-                categories=categories,
-                completed=completed
+            # 작업 조회 (저장소 인덱스로 필터링, 보관된 작업은 해당 연도 파일만 쓰면서 하나씩 읽음)
+            filtered_tasks = self.storage_manager.query_with_archive(
+                TaskQuery.from_filters(date_range, categories, completed)
             )
 
             # CSV 내보내기
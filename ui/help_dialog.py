@@ -113,42 +113,22 @@ class BugReportDialog(QDialog):
             return
 
         try:
-            # pywin32 사용 가능 여부 확인
-            try:
-                import win32com.client as win32
-            except ImportError:
-                QMessageBox.critical(
-                    self, "메일 기능 사용 불가", 
-                    "pywin32 라이브러리가 설치되지 않았습니다.\n\n"
-                    "설치 방법:\n"
-                    "1. 명령 프롬프트를 관리자 권한으로 실행\n"
-                    "2. 'pip install pywin32' 입력\n"
-                    "3. 프로그램 재시작"
-                )
+            from utils.mail_outbox import queue_mail
+            from utils.mail_transport import MailMessage, get_transport
+
+            # 메일 기능 사용 가능 여부 확인 (설정된 발송 방식 기준)
+            transport = get_transport()
+            available, error_msg = transport.check_availability()
+            if not available:
+                QMessageBox.critical(self, "메일 기능 사용 불가", error_msg)
                 return
 
-            # Outlook 연결 시도
-            try:
-                outlook = win32.Dispatch('outlook.application')
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Outlook 연결 실패",
-                    f"Outlook 연결에 실패했습니다:\n{str(e)}\n\n"
-                    "Outlook이 설치되어 있고 로그인되어 있는지 확인하세요."
-                )
-                return
-
-            # 메일 생성
-            mail = outlook.CreateItem(0)
-            mail.To = "youngjun.ahn@amkor.co.kr"
-            mail.Subject = "Todolist 개선 개발 건"
-            
             # 현재 시간
             from datetime import datetime
             current_time = datetime.now().strftime("%Y년 %m월 %d일 %H:%M")
             
             # 메일 본문
-            mail.Body = f"""안녕하세요,
+            body = f"""안녕하세요,
 
 Todolist PM 사용자로부터 다음과 같은 피드백이 전송되었습니다.
 
@@ -163,12 +143,13 @@ Todolist PM 사용자로부터 다음과 같은 피드백이 전송되었습니
 ※ 이 메일은 Todolist PM에서 자동으로 전송되었습니다.
 """
 
-            # 메일 발송
-            mail.Send()
+            # 발송 대기열에 추가 (발송은 백그라운드 워커가 처리)
+            queue_mail(MailMessage("Todolist 개선 개발 건", ["youngjun.ahn@amkor.co.kr"], text_body=body),
+                       description="개발자 피드백")
 
             QMessageBox.information(
                 self, "전송 완료",
-                "개발자에게 메시지가 성공적으로 전송되었습니다.\n"
+                "개발자에게 보낼 메시지를 발송 대기열에 추가했습니다.\n"
                 "빠른 시일 내에 검토 후 연락드리겠습니다.\n\n"
                 "감사합니다! 🙏"
             )
@@ -5,18 +5,36 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QLabel, QPushButton, QMenuBar, QMenu, QMessageBox, QFileDialog
 )
-from PyQt6.QtCore import Qt, QDate, QTimer
+from PyQt6.QtCore import Qt, QDate, QTimer, QObject, pyqtSignal
 from PyQt6.QtGui import QAction, QIcon
 
 from datetime import datetime
 from ui.calendar_widget import CalendarWidget
 from ui.task_list import TaskListWidget
+from ui.task_search import TaskSearchBox
 from ui.task_form import TaskForm
 from ui.export_dialog import ExportDialog
 from ui.category_dialog import CategoryDialog
 from ui.daily_report_dialog import DailyReportDialog
 from utils.date_utils import get_current_date_str, format_date_for_display
 from utils.daily_routine_checker import DailyRoutineChecker
+from utils.dispatch_daemon import is_dispatcher_running
+from utils.mail_outbox import get_outbox
+from utils.routine_scheduler import MAX_TIMER_SECONDS, RoutineScheduler
+from utils.storage import load_storage_settings
+from utils.task_archive import DEFAULT_ARCHIVE_AGE_DAYS
+from utils.logger import get_logger
+
+logger = get_logger("ui")
+
+
+class OutboxStatusRelay(QObject):
+    """발송 대기열 상태 알림을 GUI 스레드로 전달 (워커 스레드에서 호출됨)"""
+
+    status_changed = pyqtSignal(str, str, str)  # 설명, 상태, 오류 메시지
+
+    def __call__(self, entry, status):
+        self.status_changed.emit(entry.get("description") or "", status, entry.get("last_error") or "")
 
 
 class MainWindow(QMainWindow):
@@ -90,6 +108,11 @@ class MainWindow(QMainWindow):
 
         top_bar_layout.addStretch()
 
+        # 작업 검색 (결과 선택 시 해당 날짜로 이동)
+        self.search_box = TaskSearchBox(self.storage_manager)
+        self.search_box.task_selected.connect(self.on_search_result_selected)
+        top_bar_layout.addWidget(self.search_box)
+
         # 데일리 리포트 버튼 (새로 추가)
         self.daily_report_button = QPushButton("📊 데일리 리포트")
         self.daily_report_button.setStyleSheet("""
@@ -122,9 +145,8 @@ class MainWindow(QMainWindow):
 
         task_layout.addWidget(top_bar)
 
-        # 작업 목록
+        # 작업 목록 (작업 변경은 저장소 변경 알림으로 목록과 달력에 각각 반영됨)
         self.task_list = TaskListWidget(self.storage_manager)
-        self.task_list.task_edited.connect(self.refresh_ui)
         task_layout.addWidget(self.task_list)
 
         self.splitter.addWidget(self.task_container)
@@ -138,11 +160,22 @@ class MainWindow(QMainWindow):
         # 달력 뷰 모드 상태 초기화
         self.calendar_view_mode = False
 
-        # 데일리 루틴 체커 초기화 및 타이머 설정
+        # 데일리 루틴/메일 예약 스케줄러 (가장 이른 발송 시각에 맞춘 단발 타이머 하나)
         self.routine_checker = DailyRoutineChecker(self.storage_manager)
+        self.scheduler = RoutineScheduler(self.storage_manager, self.routine_checker)
         self.routine_timer = QTimer()
+        self.routine_timer.setSingleShot(True)
         self.routine_timer.timeout.connect(self.check_daily_routines)
-        self.routine_timer.start(60000)  # 1분마다 체크
+        self.scheduler.plan()
+
+        # 메일 발송 대기열 워커 (발송은 백그라운드에서, 결과는 상태 표시줄에 표시)
+        self.outbox = get_outbox()
+        self.outbox_relay = OutboxStatusRelay(self)
+        self.outbox_relay.status_changed.connect(self.on_outbox_status)
+        self.outbox.add_status_listener(self.outbox_relay)
+        self.outbox.start()
+
+        self.check_daily_routines()  # 놓친 발송 실행 후 타이머 설정
 
     def setup_menu_bar(self):
         """메뉴바 설정"""
@@ -165,6 +198,11 @@ class MainWindow(QMainWindow):
         export_action.triggered.connect(self.on_export_csv)
         file_menu.addAction(export_action)
 
+        # 오래된 완료 작업 보관
+        archive_action = QAction("오래된 완료 작업 보관...", self)
+        archive_action.triggered.connect(self.on_archive_completed)
+        file_menu.addAction(archive_action)
+
         file_menu.addSeparator()
 
         # 종료
@@ -173,6 +211,21 @@ class MainWindow(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
+        # 편집 메뉴
+        edit_menu = menubar.addMenu("편집")
+        edit_menu.aboutToShow.connect(self.update_undo_actions)
+
+        # 실행 취소 / 다시 실행
+        self.undo_action = QAction("실행 취소", self)
+        self.undo_action.setShortcut("Ctrl+Z")
+        self.undo_action.triggered.connect(self.on_undo)
+        edit_menu.addAction(self.undo_action)
+
+        self.redo_action = QAction("다시 실행", self)
+        self.redo_action.setShortcut("Ctrl+Y")
+        self.redo_action.triggered.connect(self.on_redo)
+        edit_menu.addAction(self.redo_action)
+
         # 보기 메뉴
         view_menu = menubar.addMenu("보기")
 
@@ -182,6 +235,12 @@ class MainWindow(QMainWindow):
         today_action.triggered.connect(self.go_to_today)
         view_menu.addAction(today_action)
 
+        # 작업 검색
+        search_action = QAction("작업 검색", self)
+        search_action.setShortcut("Ctrl+F")
+        search_action.triggered.connect(self.focus_search)
+        view_menu.addAction(search_action)
+
         # 달력 뷰 모드 전환
         self.calendar_view_action = QAction("달력 뷰", self)
         self.calendar_view_action.setShortcut("Ctrl+D")
@@ -230,7 +289,7 @@ class MainWindow(QMainWindow):
             self.date_label.setText(format_date_for_display(selected_date))
             self.load_current_date_tasks()
         except Exception as e:
-            print(f"날짜 선택 처리 중 오류: {e}")
+            logger.error("날짜 선택 처리 중 오류: %s", e)
 
     def load_current_date_tasks(self):
         """현재 선택된 날짜의 작업 로드"""
@@ -238,16 +297,46 @@ class MainWindow(QMainWindow):
             tasks = self.storage_manager.get_tasks_by_date(self.current_date)
             self.task_list.load_tasks(tasks, self.current_date)
         except Exception as e:
-            print(f"작업 로드 중 오류: {e}")
+            logger.error("작업 로드 중 오류: %s", e)
 
     def on_add_task(self):
         """새 작업 추가 버튼 클릭 이벤트 처리"""
         try:
+            # 추가된 작업은 저장소 변경 알림으로 목록과 달력에 반영됨
             dialog = TaskForm(self.storage_manager, self.current_date)
-            if dialog.exec():
+            dialog.exec()
+        except Exception as e:
+            logger.error("작업 추가 중 오류: %s", e)
+
+    def update_undo_actions(self):
+        """편집 메뉴를 열 때 실행 취소/다시 실행 항목에 다음 단계 표시"""
+        history = self.storage_manager.undo_history
+        undo_label, redo_label = history.undo_label(), history.redo_label()
+        self.undo_action.setText(f"실행 취소: {undo_label}" if undo_label else "실행 취소")
+        self.redo_action.setText(f"다시 실행: {redo_label}" if redo_label else "다시 실행")
+        # 단축키는 메뉴를 열지 않고도 눌리므로 항목은 비활성화하지 않고 처리 함수에서 확인
+
+    def on_undo(self):
+        """마지막 변경 되돌리기 (Ctrl+Z)"""
+        try:
+            label = self.storage_manager.undo_history.undo()
+            self.statusBar().showMessage(f"실행 취소: {label}" if label else "되돌릴 작업이 없습니다", 5000)
+            if label:
                 self.refresh_ui()
         except Exception as e:
-            print(f"작업 추가 중 오류: {e}")
+            logger.error("실행 취소 중 오류: %s", e)
+            QMessageBox.critical(self, "오류", f"실행 취소 중 오류가 발생했습니다:\n{e}")
+
+    def on_redo(self):
+        """되돌린 변경 다시 실행 (Ctrl+Y)"""
+        try:
+            label = self.storage_manager.undo_history.redo()
+            self.statusBar().showMessage(f"다시 실행: {label}" if label else "다시 실행할 작업이 없습니다", 5000)
+            if label:
+                self.refresh_ui()
+        except Exception as e:
+            logger.error("다시 실행 중 오류: %s", e)
+            QMessageBox.critical(self, "오류", f"다시 실행 중 오류가 발생했습니다:\n{e}")
 
     def on_daily_report(self):
         """데일리 리포트 버튼 클릭 처리"""
@@ -255,7 +344,7 @@ class MainWindow(QMainWindow):
             dialog = DailyReportDialog(self.storage_manager, self.current_date)
             dialog.exec()
         except Exception as e:
-            print(f"데일리 리포트 중 오류: {e}")
+            logger.error("데일리 리포트 중 오류: %s", e)
             QMessageBox.critical(self, "오류", f"데일리 리포트 중 오류가 발생했습니다:\n{e}")
 
     def show_options_menu(self):
@@ -294,7 +383,7 @@ class MainWindow(QMainWindow):
             if dialog.exec():
                 self.refresh_ui()
         except Exception as e:
-            print(f"카테고리 관리 중 오류: {e}")
+            logger.error("카테고리 관리 중 오류: %s", e)
 
     def on_export_csv(self):
         """CSV 내보내기 대화상자 표시"""
@@ -302,7 +391,30 @@ class MainWindow(QMainWindow):
             dialog = ExportDialog(self.storage_manager)
             dialog.exec()
         except Exception as e:
-            print(f"CSV 내보내기 중 오류: {e}")
+            logger.error("CSV 내보내기 중 오류: %s", e)
+
+    def on_archive_completed(self):
+        """오래된 완료 작업을 보관 파일로 옮기기 (확인 후 실행)"""
+        try:
+            settings = load_storage_settings(self.storage_manager.data_dir)
+            age_days = settings.get("archive_age_days") or DEFAULT_ARCHIVE_AGE_DAYS
+            reply = QMessageBox.question(
+                self, "완료 작업 보관",
+                f"{age_days}일보다 오래된 완료 작업을 보관 파일(data/archive)로 옮깁니다.\n"
+                "보관한 작업은 작업 목록과 검색에서 빠지고, 통계와 CSV 내보내기에는 계속 포함됩니다.\n"
+                "실행 취소 기록은 비워집니다. 계속하시겠습니까?"
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                return
+
+            count = self.storage_manager.archive_completed(age_days, force=True)
+            self.statusBar().showMessage(
+                f"완료 작업 {count}개를 보관했습니다" if count else "보관할 완료 작업이 없습니다", 5000)
+            if count:
+                self.refresh_ui()
+        except Exception as e:
+            logger.error("완료 작업 보관 중 오류: %s", e)
+            QMessageBox.critical(self, "오류", f"완료 작업 보관 중 오류가 발생했습니다:\n{e}")
 
     def go_to_today(self):
         """오늘 날짜로 이동"""
@@ -311,7 +423,27 @@ class MainWindow(QMainWindow):
             self.calendar_widget.setSelectedDate(today)
             self.on_date_selected(today)
         except Exception as e:
-            print(f"오늘 날짜로 이동 중 오류: {e}")
+            logger.error("오늘 날짜로 이동 중 오류: %s", e)
+
+    def focus_search(self):
+        """검색 입력창으로 포커스 이동"""
+        self.search_box.setFocus()
+        self.search_box.selectAll()
+
+    def on_search_result_selected(self, date_str, task_id):
+        """검색 결과 선택 시 작업 날짜로 이동하고 해당 작업을 펼쳐 보여줌
+
+        Args:
+            date_str (str): 작업 날짜 (YYYY-MM-DD)
+            task_id (str): 작업 ID
+        """
+        try:
+            date = QDate.fromString(date_str, "yyyy-MM-dd")
+            self.calendar_widget.setSelectedDate(date)
+            self.on_date_selected(date)
+            self.task_list.reveal_task(task_id)
+        except Exception as e:
+            logger.error("검색 결과로 이동 중 오류: %s", e)
 
     def toggle_calendar_view(self, checked):
         """달력 뷰 모드 전환
@@ -346,14 +478,45 @@ class MainWindow(QMainWindow):
             # UI 새로고침
             self.refresh_ui()
         except Exception as e:
-            print(f"달력 뷰 모드 전환 중 오류 발생: {e}")
+            logger.error("달력 뷰 모드 전환 중 오류 발생: %s", e)
 
     def check_daily_routines(self):
-        """데일리 루틴 체크 (1분마다 실행)"""
+        """발송 시각이 된 루틴/메일 예약 실행 후 다음 발송 시각에 타이머 설정"""
+        if is_dispatcher_running():
+            # 백그라운드 발송 데몬이 실행 중이면 발송은 데몬에 맡기고 나중에 다시 확인
+            self.routine_timer.start(MAX_TIMER_SECONDS * 1000)
+            return
+
         try:
-            self.routine_checker.check_and_execute_routines()
+            self.scheduler.replan_if_changed()
+            self.scheduler.run_due()
         except Exception as e:
-            print(f"데일리 루틴 체크 중 오류: {e}")
+            logger.error("데일리 루틴 체크 중 오류: %s", e)
+        self.schedule_next_check()
+
+    def schedule_next_check(self):
+        """가장 이른 발송 시각에 맞춰 타이머 설정"""
+        self.routine_timer.start(int(self.scheduler.next_delay() * 1000))
+
+    def replan_schedules(self):
+        """루틴/예약 설정 변경 후 발송 계획 다시 세우기"""
+        try:
+            if self.scheduler.replan_if_changed():
+                self.check_daily_routines()
+        except Exception as e:
+            logger.error("발송 계획 갱신 중 오류: %s", e)
+
+    def on_outbox_status(self, description, status, error):
+        """메일 발송 상태를 상태 표시줄에 표시"""
+        if status == "queued":
+            message = f"메일 발송 대기 중: {description}"
+        elif status == "sent":
+            message = f"메일 발송 완료: {description}"
+        elif status == "retry":
+            message = f"메일 발송 실패, 잠시 후 다시 시도합니다: {description} ({error})"
+        else:
+            message = f"메일 발송 실패: {description} ({error})"
+        self.statusBar().showMessage(message, 10000)
 
     def refresh_ui(self):
         """UI 새로고침"""
@@ -361,7 +524,7 @@ class MainWindow(QMainWindow):
             self.load_current_date_tasks()
             self.calendar_widget.update_calendar()
         except Exception as e:
-            print(f"UI 새로고침 중 오류: {e}")
+            logger.error("UI 새로고침 중 오류: %s", e)
 
     def closeEvent(self, event):
         """애플리케이션 종료 이벤트 처리
@@ -373,6 +536,15 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'routine_timer'):
             self.routine_timer.stop()
 
+        # 발송 워커 종료 (남은 메일은 대기열에 남아 다음 실행 또는 발송 데몬이 발송)
+        if hasattr(self, 'outbox'):
+            self.outbox.remove_status_listener(self.outbox_relay)
+            self.outbox.stop()
+
+        # 유지 중인 SMTP 연결 정리
+        from utils.mail_transport import close_transports
+        close_transports()
+
         # 종료 전에 데이터 저장
         self.storage_manager.save_data()
         event.accept()
@@ -383,8 +555,9 @@ class MainWindow(QMainWindow):
             from ui.email_settings_dialog import EmailSettingsDialog
             dialog = EmailSettingsDialog(self.storage_manager)
             dialog.exec()
+            self.replan_schedules()
         except Exception as e:
-            print(f"메일 설정 중 오류: {e}")
+            logger.error("메일 설정 중 오류: %s", e)
             QMessageBox.critical(self, "오류", f"메일 설정 중 오류가 발생했습니다:\n{e}")
 
     def on_simple_email(self):
@@ -393,8 +566,9 @@ class MainWindow(QMainWindow):
             from ui.simple_email_dialog import SimpleEmailDialog
             dialog = SimpleEmailDialog(self.storage_manager)
             dialog.exec()
+            self.replan_schedules()
         except Exception as e:
-            print(f"메일 관리 중 오류: {e}")
+            logger.error("메일 관리 중 오류: %s", e)
             QMessageBox.critical(self, "오류", f"메일 관리 중 오류가 발생했습니다:\n{e}")
 
     def on_show_help(self):
@@ -404,7 +578,7 @@ class MainWindow(QMainWindow):
             dialog = HelpDialog(self)
             dialog.exec()
         except Exception as e:
-            print(f"도움말 표시 중 오류: {e}")
+            logger.error("도움말 표시 중 오류: %s", e)
             QMessageBox.critical(self, "오류", f"도움말 표시 중 오류가 발생했습니다:\n{e}")
 
     def on_email_schedule(self):
@@ -414,5 +588,5 @@ class MainWindow(QMainWindow):
             dialog = EmailScheduleDialog(self.storage_manager)
             dialog.exec()
         except Exception as e:
-            print(f"메일 예약 관리 중 오류: {e}")
+            logger.error("메일 예약 관리 중 오류: %s", e)
             QMessageBox.critical(self, "오류", f"메일 예약 관리 중 오류가 발생했습니다:\n{e}")
\ No newline at end of file
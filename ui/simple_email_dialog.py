@@ -10,9 +10,12 @@ from PyQt6.QtWidgets import (
     QListWidget, QListWidgetItem, QMessageBox, QFrame,
     QButtonGroup, QRadioButton, QDateEdit, QScrollArea, QWidget
 )
-from PyQt6.QtCore import Qt, QTime, QDate, QTimer
+from PyQt6.QtCore import Qt, QTime, QDate
 from PyQt6.QtGui import QFont
 
+from utils.durable_io import atomic_write_json, load_json_with_recovery
+from utils.routine_scheduler import EMAIL_SCHEDULES_FILE, merge_send_history
+
 
 class SimpleEmailDialog(QDialog):
     """간단한 메일 관리 대화상자 - 모든 기능을 하나로 통합"""
@@ -23,10 +26,7 @@ class SimpleEmailDialog(QDialog):
         self.storage_manager = storage_manager
         self.email_schedules = self.load_email_schedules()
 
-        # 자동 발송 타이머 (1분마다)
-        self.auto_timer = QTimer()
-        self.auto_timer.timeout.connect(self.check_auto_send)
-        self.auto_timer.start(60000)
+        # 자동 발송은 MainWindow의 RoutineScheduler가 예약 파일을 보고 처리함
 
         self.setWindowTitle("📧 메일 관리")
         self.setMinimumSize(950, 750)  # 크기 증가 (카테고리 선택 영역 추가로)
@@ -706,7 +706,7 @@ class SimpleEmailDialog(QDialog):
         if self.send_email(schedule):
             # 발송 성공 시 발송 이력 업데이트
             self.update_schedule_send_history(schedule)
-            QMessageBox.information(self, "발송완료", f"'{schedule['name']}' 메일을 발송했습니다!")
+            QMessageBox.information(self, "발송요청", f"'{schedule['name']}' 메일을 발송 대기열에 추가했습니다.")
 
     def update_schedule_send_history(self, schedule):
         """예약 발송 이력 업데이트"""
@@ -731,61 +731,6 @@ class SimpleEmailDialog(QDialog):
         except Exception as e:
             print(f"예약 발송 이력 업데이트 중 오류: {e}")
 
-    def check_auto_send(self):
-        """자동 발송 체크 (1분마다 실행)"""
-        try:
-            now = datetime.now()
-            current_date = now.strftime("%Y-%m-%d")
-            current_time = now.strftime("%H:%M")
-            current_weekday = now.weekday()
-
-            for schedule in self.email_schedules:
-                if not schedule.get("enabled", True):
-                    continue
-
-                if schedule.get("send_time") != current_time:
-                    continue
-
-                if schedule.get("last_sent_date") == current_date:
-                    continue
-
-                should_send = False
-
-                if schedule.get("is_recurring", False):
-                    freq = schedule.get("frequency", "daily")
-                    if freq == "daily":
-                        should_send = True
-                    elif freq == "weekly":
-                        # 매주 발송: 지정된 요일인지 확인
-                        schedule_weekday = schedule.get("weekday", "monday")
-                        weekday_map = {
-                            "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
-                            "friday": 4, "saturday": 5, "sunday": 6
-                        }
-                        target_weekday = weekday_map.get(schedule_weekday, 0)
-                        if current_weekday == target_weekday:
-                            should_send = True
-                else:
-                    if schedule.get("send_date") == current_date:
-                        should_send = True
-
-                if should_send:
-                    if self.send_email(schedule):
-                        # 발송 이력 업데이트
-                        schedule["last_sent_date"] = current_date
-                        schedule["last_sent_time"] = current_time
-                        schedule["total_sent_count"] = schedule.get("total_sent_count", 0) + 1
-
-                        if not schedule.get("is_recurring", False):
-                            schedule["enabled"] = False
-
-                        self.save_email_schedules()
-                        self.load_schedule_list()
-                        print(f"자동 발송 완료: {schedule['name']} (총 {schedule['total_sent_count']}회)")
-
-        except Exception as e:
-            print(f"자동 발송 체크 오류: {e}")
-
     def on_schedule_clicked(self, item):
         """예약 선택시"""
         pass
@@ -820,6 +765,7 @@ class SimpleEmailDialog(QDialog):
         for s in self.email_schedules:
             if s["id"] == schedule_id:
                 s["enabled"] = not s.get("enabled", True)
+                s["updated_at"] = datetime.now().isoformat()
                 break
 
         self.save_email_schedules()
@@ -848,7 +794,7 @@ class SimpleEmailDialog(QDialog):
         }
 
         if self.send_email(temp_schedule, is_test=True):
-            QMessageBox.information(self, "테스트완료", f"{len(recipients)}명에게 테스트 메일을 발송했습니다!")
+            QMessageBox.information(self, "테스트요청", f"{len(recipients)}명에게 보낼 테스트 메일을 발송 대기열에 추가했습니다.")
 
     def send_email(self, schedule, is_test=False):
         """실제 메일 발송"""
@@ -874,11 +820,9 @@ class SimpleEmailDialog(QDialog):
     def load_email_schedules(self):
         """예약 데이터 로드"""
         try:
-            file_path = "data/email_schedules.json"
-            if os.path.exists(file_path):
-                with open(file_path, "r", encoding="utf-8") as f:
-                    schedules = json.load(f)
-
+            schedules = load_json_with_recovery(EMAIL_SCHEDULES_FILE,
+                                                validate=lambda data: isinstance(data, list))
+            if schedules is not None:
                 # 기존 예약에 중요 일정 포함 필드가 없으면 기본값으로 추가
                 for schedule in schedules:
                     if "last_sent_date" not in schedule:
@@ -898,15 +842,8 @@ class SimpleEmailDialog(QDialog):
     def save_email_schedules(self):
         """예약 데이터 저장"""
         try:
-            os.makedirs("data", exist_ok=True)
-            file_path = "data/email_schedules.json"
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(self.email_schedules, f, ensure_ascii=False, indent=2)
+            # 대화상자가 열려 있는 동안 스케줄러가 기록한 발송 이력 유지
+            merge_send_history(self.email_schedules, EMAIL_SCHEDULES_FILE)
+            atomic_write_json(EMAIL_SCHEDULES_FILE, self.email_schedules)
         except Exception as e:
             print(f"예약 저장 오류: {e}")
-
-    def closeEvent(self, event):
-        """창 닫기 시 타이머 정리"""
-        if hasattr(self, 'auto_timer'):
-            self.auto_timer.stop()
-        event.accept()
\ No newline at end of file
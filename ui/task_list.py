@@ -1,3 +1,5 @@
+from bisect import bisect_left, bisect_right
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QFrame,
     QLabel, QPushButton, QCheckBox, QMessageBox, QApplication,
@@ -7,7 +9,21 @@ from PyQt6.QtCore import Qt, pyqtSignal, QPoint
 from PyQt6.QtGui import QIcon, QColor, QDrag, QPixmap, QPainter
 from PyQt6.QtCore import QMimeData
 
+from models.category import Category
 from ui.task_form import TaskForm
+from utils.logger import get_logger
+from utils.task_index import order_key
+
+logger = get_logger("ui")
+
+# 가상화 목록 설정
+ROW_HEIGHT_ESTIMATE = 70  # 아직 측정하지 않은 행의 예상 높이 (px)
+OVERSCAN_ROWS = 5  # 화면 위아래로 미리 배치해 둘 행 수
+
+
+def priority_group(task):
+    """우선순위 그룹 (0: 중요 미완료, 1: 일반 미완료, 2: 중요 완료, 3: 일반 완료)"""
+    return (2 if task.completed else 0) + (0 if task.important else 1)
 
 
 class EmailRecipientDialog(QDialog):
@@ -73,7 +89,7 @@ class EmailRecipientDialog(QDialog):
                 self.recipients_list.addItem(item)
 
         except Exception as e:
-            print(f"수신자 목록 로드 중 오류: {e}")
+            logger.error("수신자 목록 로드 중 오류: %s", e)
             item = QListWidgetItem("수신자 목록을 로드할 수 없습니다.")
             item.setFlags(Qt.ItemFlag.NoItemFlags)
             self.recipients_list.addItem(item)
@@ -101,6 +117,7 @@ class TaskItemWidget(QFrame):
     task_toggled = pyqtSignal(str, bool)  # 작업 완료 상태 변경 (id, completed)
     edit_task = pyqtSignal(str)  # 작업 편집 요청 (id)
     delete_task = pyqtSignal(str)  # 작업 삭제 요청 (id)
+    content_toggled = pyqtSignal(str, bool)  # 내용 확장 상태 변경 (id, expanded)
 
     def __init__(self, task, current_date, storage_manager=None):
         """작업 항목 위젯 초기화
@@ -117,35 +134,25 @@ class TaskItemWidget(QFrame):
         self.storage_manager = storage_manager
         self.drag_start_position = QPoint()
         self.content_expanded = False  # 내용 확장 상태
+        self.style_key = None  # 마지막으로 적용한 스타일 상태 (같으면 스타일시트 재적용 생략)
+        self.function_buttons = []  # (기능 버튼, 글자색) 목록
 
         # 스타일 설정
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setFrameShadow(QFrame.Shadow.Raised)
         self.setLineWidth(1)
 
-        # 다른 날짜의 중요 작업인 경우 스타일 변경
-        is_other_date = task.created_date != current_date
-
-        if is_other_date and task.important and not task.completed:
-            self.setStyleSheet(
-                "background-color: #FFF8E1; border: 1px solid #FFE082; border-radius: 5px; margin: 2px;"
-            )
-        else:
-            self.setStyleSheet(
-                "background-color: #FFFFFF; border: 1px solid #E0E0E0; border-radius: 5px; margin: 2px;"
-            )
-
         # 레이아웃 설정
         self.init_ui()
+        self.update_view()
 
     def init_ui(self):
-        """UI 초기화"""
+        """UI 초기화 (하위 위젯은 한 번만 만들고 bind 시 내용만 갱신)"""
         main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
 
         # 완료 체크박스
         self.complete_checkbox = QCheckBox()
-        self.complete_checkbox.setChecked(self.task.completed)
         self.complete_checkbox.toggled.connect(self.on_complete_toggled)
         main_layout.addWidget(self.complete_checkbox)
 
@@ -161,67 +168,35 @@ class TaskItemWidget(QFrame):
         title_layout = QHBoxLayout()
 
         # 중요 표시 아이콘 (완료 여부와 관계없이 중요 작업이면 표시)
-        if self.task.important:
-            important_icon = QLabel("🔥")
-            important_icon.setStyleSheet("""
-                font-size: 16px;
-                font-weight: bold;
-                margin-right: 5px;
-                border: none;
-            """)
-            important_icon.setToolTip("중요 작업")
-            title_layout.addWidget(important_icon)
+        self.important_icon = QLabel("🔥")
+        self.important_icon.setStyleSheet("""
+            font-size: 16px;
+            font-weight: bold;
+            margin-right: 5px;
+            border: none;
+        """)
+        self.important_icon.setToolTip("중요 작업")
+        title_layout.addWidget(self.important_icon)
 
         # 카테고리 라벨
-        category_label = QLabel(self.task.category)
-        if self.task.important and not self.task.completed:
-            category_label.setStyleSheet(
-                f"color: white; background-color: {self.get_category_color()}; "
-                f"padding: 2px 5px; border: none; border-radius: 3px; font-size: 10px;"
-            )
-        else:
-            category_label.setStyleSheet(
-                f"color: white; background-color: {self.get_category_color()}; "
-                f"padding: 2px 5px; border-radius: 3px; font-size: 10px;"
-            )
-        category_label.setMaximumHeight(20)
-        title_layout.addWidget(category_label)
+        self.category_label = QLabel()
+        self.category_label.setMaximumHeight(20)
+        title_layout.addWidget(self.category_label)
 
         # 제목 라벨
-        title_text = self.task.title
-        if self.task.important and not self.task.completed:
-            title_text = f"【중요】{self.task.title}"
-
-        title_label = QLabel(title_text)
-        title_label.setWordWrap(True)  # 제목 줄바꿈 허용
-
-        # 제목 스타일 설정
-        if self.task.completed:
-            title_label.setStyleSheet("text-decoration: line-through; color: #9E9E9E; font-size: 14px; border: none;")
-        elif self.task.important:
-            title_label.setStyleSheet("""
-                font-weight: bold; 
-                font-size: 15px; 
-                color: #D32F2F;
-                text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
-                border: none;
-            """)
-        else:
-            title_label.setStyleSheet("font-weight: bold; font-size: 14px; border: none;")
-
-        title_layout.addWidget(title_label, stretch=1)
+        self.title_label = QLabel()
+        self.title_label.setWordWrap(True)  # 제목 줄바꿈 허용
+        title_layout.addWidget(self.title_label, stretch=1)
 
         # 다른 날짜의 작업인 경우 날짜 표시
-        if self.task.created_date != self.current_date:
-            date_label = QLabel(self.task.created_date)
-            date_label.setStyleSheet("color: #9E9E9E; font-size: 10px; border: none;")
-            title_layout.addWidget(date_label)
+        self.date_label = QLabel()
+        self.date_label.setStyleSheet("color: #9E9E9E; font-size: 10px; border: none;")
+        title_layout.addWidget(self.date_label)
 
         info_layout.addLayout(title_layout)
 
-        # 내용 라벨 (있는 경우에만)
-        if self.task.content:
-            self.create_content_area(info_layout)
+        # 내용 라벨 (내용이 있는 경우에만 표시)
+        self.create_content_area(info_layout)
 
         main_layout.addWidget(info_widget, stretch=1)
 
@@ -234,12 +209,9 @@ class TaskItemWidget(QFrame):
         button_layout.setSpacing(3)  # 버튼 간격 줄임
 
         # 더보기 버튼 (내용이 길 때만 표시)
-        if self.task.content and self.needs_truncation():
-            self.toggle_button = self.create_function_button("더보기")
-            self.toggle_button.clicked.connect(self.toggle_content)
-            button_layout.addWidget(self.toggle_button)
-        else:
-            self.toggle_button = None
+        self.toggle_button = self.create_function_button("더보기")
+        self.toggle_button.clicked.connect(self.toggle_content)
+        button_layout.addWidget(self.toggle_button)
 
         # 메일 발송 버튼
         self.email_button = self.create_function_button("메일")
@@ -258,14 +230,94 @@ class TaskItemWidget(QFrame):
 
         main_layout.addWidget(button_widget)
 
-        # 작업 배경색 설정
-        self.apply_task_style()
+    def bind(self, task, current_date, expanded=False):
+        """위젯을 다른 작업(또는 갱신된 같은 작업) 표시에 재사용
+
+        Args:
+            task (Task): 표시할 작업 객체
+            current_date (str): 현재 선택된 날짜
+            expanded (bool, optional): 내용 확장 상태
+        """
+        self.task = task
+        self.current_date = current_date
+        self.content_expanded = expanded
+        self.update_view()
+
+    def update_view(self):
+        """현재 작업 상태로 하위 위젯 내용과 스타일 갱신"""
+        task = self.task
+        highlighted = task.important and not task.completed
+        is_other_date = task.created_date != self.current_date
+
+        # 체크박스 (프로그램에서 바꾸는 값이므로 완료 시그널을 보내지 않음)
+        self.complete_checkbox.blockSignals(True)
+        self.complete_checkbox.setChecked(task.completed)
+        self.complete_checkbox.blockSignals(False)
+
+        self.important_icon.setVisible(task.important)
+        self.category_label.setText(task.category)
+
+        title_text = f"【중요】{task.title}" if highlighted else task.title
+        self.title_label.setText(title_text)
+
+        self.date_label.setVisible(is_other_date)
+        if is_other_date:
+            self.date_label.setText(task.created_date)
+
+        has_content = bool(task.content)
+        self.content_label.setVisible(has_content)
+        self.toggle_button.setVisible(has_content and self.needs_truncation())
+        if has_content:
+            self.content_label.setText(self.get_content_text())
+            self.toggle_button.setText("접기" if self.content_expanded else "더보기")
+
+        # 스타일시트 적용은 비용이 크므로 표시 상태가 바뀐 경우에만 다시 적용
+        style_key = (task.important, task.completed, is_other_date, task.bg_color, self.get_category_color())
+        if style_key != self.style_key:
+            self.style_key = style_key
+            self.update_label_styles()
+            for button, color in self.function_buttons:
+                self.apply_function_button_style(button, color)
+            self.update_content_style()
+            self.apply_task_style()
+
+    def update_label_styles(self):
+        """카테고리/제목 라벨 스타일 갱신"""
+        if self.task.important and not self.task.completed:
+            self.category_label.setStyleSheet(
+                f"color: white; background-color: {self.get_category_color()}; "
+                f"padding: 2px 5px; border: none; border-radius: 3px; font-size: 10px;"
+            )
+        else:
+            self.category_label.setStyleSheet(
+                f"color: white; background-color: {self.get_category_color()}; "
+                f"padding: 2px 5px; border-radius: 3px; font-size: 10px;"
+            )
+
+        # 제목 스타일 설정
+        if self.task.completed:
+            self.title_label.setStyleSheet("text-decoration: line-through; color: #9E9E9E; font-size: 14px; border: none;")
+        elif self.task.important:
+            self.title_label.setStyleSheet("""
+                font-weight: bold; 
+                font-size: 15px; 
+                color: #D32F2F;
+                text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
+                border: none;
+            """)
+        else:
+            self.title_label.setStyleSheet("font-weight: bold; font-size: 14px; border: none;")
 
     def create_function_button(self, text, color="#333333"):
         """통일된 스타일의 기능 버튼 생성"""
         button = QPushButton(text)
         button.setFixedSize(35, 22)  # 크기 축소 (기존 40x25 → 35x22)
 
+        self.function_buttons.append((button, color))
+        return button
+
+    def apply_function_button_style(self, button, color):
+        """작업 중요도에 맞는 기능 버튼 스타일 적용"""
         if self.task.important and not self.task.completed:
             # 중요 작업용 스타일 (테두리 없음)
             button.setStyleSheet(f"""
@@ -307,8 +359,6 @@ class TaskItemWidget(QFrame):
                 }}
             """)
 
-        return button
-
     def needs_truncation(self):
         """내용 줄임이 필요한지 확인"""
         if not self.task.content:
@@ -318,66 +368,38 @@ class TaskItemWidget(QFrame):
         lines = content_text.split('\n')
         return len(lines) > 2 or len(content_text) > 80
 
-    def create_content_area(self, parent_layout):
-        """내용 영역 생성 (줄임/확장 기능 포함)"""
+    def get_content_text(self):
+        """현재 확장 상태에 맞는 내용 텍스트 (긴 내용은 줄임)"""
         content_text = self.task.content.strip()
+        if self.content_expanded or not self.needs_truncation():
+            return content_text
 
-        # 내용 길이 체크
-        needs_truncation = self.needs_truncation()
-
-        if needs_truncation:
-            # 줄임 버전 생성
-            lines = content_text.split('\n')
-            if len(lines) > 2:
-                truncated_text = '\n'.join(lines[:2])
-            else:
-                truncated_text = content_text[:80]
-
-            if len(truncated_text) < len(content_text):
-                truncated_text += "..."
-
-            # 내용 라벨
-            self.content_label = QLabel(truncated_text if not self.content_expanded else content_text)
-            self.content_label.setWordWrap(True)
-            self.content_label.setMaximumWidth(580)  # 내용 최대 너비 제한
-
-            parent_layout.addWidget(self.content_label)
+        lines = content_text.split('\n')
+        if len(lines) > 2:
+            truncated_text = '\n'.join(lines[:2])
         else:
-            # 짧은 내용은 그대로 표시
-            self.content_label = QLabel(content_text)
-            self.content_label.setWordWrap(True)
-            self.content_label.setMaximumWidth(580)  # 내용 최대 너비 제한
-            parent_layout.addWidget(self.content_label)
+            truncated_text = content_text[:80]
 
-        # 내용 스타일 설정
-        self.update_content_style()
+        if len(truncated_text) < len(content_text):
+            truncated_text += "..."
+        return truncated_text
+
+    def create_content_area(self, parent_layout):
+        """내용 영역 생성 (줄임/확장 기능 포함)"""
+        self.content_label = QLabel()
+        self.content_label.setWordWrap(True)
+        self.content_label.setMaximumWidth(580)  # 내용 최대 너비 제한
+        parent_layout.addWidget(self.content_label)
 
     def toggle_content(self):
         """내용 확장/축소 토글"""
-        if not self.toggle_button:
+        if not self.needs_truncation():
             return
 
         self.content_expanded = not self.content_expanded
-
-        content_text = self.task.content.strip()
-
-        if self.content_expanded:
-            # 전체 내용 표시
-            self.content_label.setText(content_text)
-            self.toggle_button.setText("접기")
-        else:
-            # 줄인 내용 표시
-            lines = content_text.split('\n')
-            if len(lines) > 2:
-                truncated_text = '\n'.join(lines[:2])
-            else:
-                truncated_text = content_text[:80]
-
-            if len(truncated_text) < len(content_text):
-                truncated_text += "..."
-
-            self.content_label.setText(truncated_text)
-            self.toggle_button.setText("더보기")
+        self.content_label.setText(self.get_content_text())
+        self.toggle_button.setText("접기" if self.content_expanded else "더보기")
+        self.content_toggled.emit(self.task.id, self.content_expanded)
 
     def update_content_style(self):
         """내용 스타일 업데이트"""
@@ -395,20 +417,11 @@ class TaskItemWidget(QFrame):
                 self.content_label.setStyleSheet("color: #616161; font-size: 12px; border: none;")
 
     def get_category_color(self):
-        """작업 카테고리에 해당하는 색상 반환"""
+        """작업 카테고리에 해당하는 색상 반환 (등록되지 않은 카테고리는 기본 색상)"""
+        default_color = Category.DEFAULT_COLORS.get(self.task.category, "#9E9E9E")
         if self.storage_manager:
-            for category in self.storage_manager.categories:
-                if category.name == self.task.category:
-                    return category.color
-
-        # 기본 색상
-        default_colors = {
-            "LB": "#4285F4",
-            "Tester": "#FBBC05",
-            "Handler": "#34A853",
-            "ETC": "#EA4335"
-        }
-        return default_colors.get(self.task.category, "#9E9E9E")
+            return self.storage_manager.category_colors.get(self.task.category, default_color)
+        return default_color
 
     def on_complete_toggled(self, checked):
         """완료 상태 변경 처리"""
@@ -434,192 +447,42 @@ class TaskItemWidget(QFrame):
                 if recipients:
                     success = self.send_task_email(recipients)
                     if success:
-                        QMessageBox.information(self, "메일 발송 완료",
-                                                f"'{self.task.title}' 일정이 {len(recipients)}명에게 발송되었습니다.")
+                        QMessageBox.information(self, "메일 발송 요청 완료",
+                                                f"'{self.task.title}' 일정을 {len(recipients)}명에게 보내도록 발송 대기열에 추가했습니다.")
                     else:
                         QMessageBox.critical(self, "메일 발송 실패",
                                              "메일 발송에 실패했습니다.\nOutlook이 실행 중인지 확인하세요.")
 
         except Exception as e:
-            print(f"메일 발송 중 오류: {e}")
+            logger.error("메일 발송 중 오류: %s", e)
             QMessageBox.critical(self, "오류", f"메일 발송 중 오류가 발생했습니다:\n{e}")
 
     def send_task_email(self, recipients):
         """개별 작업 메일 발송 (테이블 기반, Outlook 호환성 개선)"""
         try:
-            import win32com.client as win32
-            from datetime import datetime
-
-            # Outlook 연결
-            outlook = win32.Dispatch('outlook.application')
-            mail = outlook.CreateItem(0)
+            from utils.mail_outbox import queue_mail
+            from utils.mail_transport import MailMessage
+            from utils.report_renderer import ReportRenderer
 
             # 메일 제목 설정
             status = "완료" if self.task.completed else "미완료"
-            mail.Subject = f"[{status}] {self.task.title}"
-
-            # 수신자 설정
-            mail.To = "; ".join(recipients)
-
-            # 메일 내용 생성 (테이블 기반)
-            current_time = datetime.now().strftime("%Y년 %m월 %d일 %H:%M")
-
-            html_body = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="utf-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>일정 공유</title>
-                <!--[if mso]>
-                <style type="text/css">
-                    table {{ border-collapse: collapse; }}
-                    .header-table {{ background-color: #4facfe !important; }}
-                </style>
-                <![endif]-->
-            </head>
-            <body style="margin: 0; padding: 0; font-family: Arial, sans-serif; background-color: #f5f5f5;">
-
-                <!-- 메인 컨테이너 -->
-                <table width="100%" cellpadding="0" cellspacing="0" style="background-color: #f5f5f5; padding: 20px;">
-                    <tr>
-                        <td align="center">
-
-                            <!-- 메일 내용 테이블 -->
-                            <table width="600" cellpadding="0" cellspacing="0" style="background-color: #ffffff; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); overflow: hidden;">
-
-                                <!-- 헤더 -->
-                                <tr>
-                                    <td class="header-table" style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); padding: 25px 20px; text-align: center;">
-                                        <h1 style="margin: 0 0 10px 0; color: #ffffff; font-size: 24px; font-weight: bold;">
-                                            📋 일정 공유
-                                        </h1>
-                                        <div style="color: #ffffff; font-size: 16px; margin: 0;">
-                                            {current_time}
-                                        </div>
-                                    </td>
-                                </tr>
-
-                                <!-- 메인 컨텐츠 -->
-                                <tr>
-                                    <td style="padding: 25px 20px;">
-
-                                        <!-- 상태 표시 -->
-                                        <table width="100%" cellpadding="10" cellspacing="0" style="margin-bottom: 20px;">
-                                            <tr>
-                                                <td style="text-align: center;">
-                                                    <span style="display: inline-block; padding: 8px 20px; border-radius: 20px; font-weight: bold; background: {'#4CAF50' if self.task.completed else '#FF9800'}; color: white; font-size: 14px;">
-                                                        {status}
-                                                    </span>
-                                                </td>
-                                            </tr>
-                                        </table>
-
-                                        <!-- 작업 제목 -->
-                                        <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
-                                            <tr>
-                                                <td>
-                                                    <h2 style="color: #333; margin: 0; font-size: 20px; text-align: center;">
-                                                        {self.escape_html(self.task.title)}
-                                                    </h2>
-                                                </td>
-                                            </tr>
-                                        </table>
-
-                                        <!-- 작업 정보 -->
-                                        <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom: 20px;">
-                                            <tr>
-                                                <td style="padding: 10px 0; border-bottom: 1px solid #eee;">
-                                                    <table width="100%" cellpadding="0" cellspacing="0">
-                                                        <tr>
-                                                            <td style="font-weight: bold; color: #333; width: 80px;">카테고리:</td>
-                                                            <td>
-                                                                <span style="background: {self.get_category_color()}; color: white; padding: 4px 12px; border-radius: 15px; font-size: 12px; font-weight: bold;">
-                                                                    {self.task.category}
-                                                                </span>
-                                                            </td>
-                                                        </tr>
-                                                    </table>
-                                                </td>
-                                            </tr>
-                                            <tr>
-                                                <td style="padding: 10px 0; border-bottom: 1px solid #eee;">
-                                                    <table width="100%" cellpadding="0" cellspacing="0">
-                                                        <tr>
-                                                            <td style="font-weight: bold; color: #333; width: 80px;">생성일:</td>
-                                                            <td style="color: #666;">{self.task.created_date}</td>
-                                                        </tr>
-                                                    </table>
-                                                </td>
-                                            </tr>
-                                            {f'''<tr>
-                                                <td style="padding: 10px 0;">
-                                                    <table width="100%" cellpadding="0" cellspacing="0">
-                                                        <tr>
-                                                            <td style="font-weight: bold; color: #333; width: 80px; vertical-align: top;">내용:</td>
-                                                            <td style="color: #666; line-height: 1.6;">{self.escape_html(self.task.content).replace(chr(10), "<br>")}</td>
-                                                        </tr>
-                                                    </table>
-                                                </td>
-                                            </tr>''' if self.task.content else '''<tr>
-                                                <td style="padding: 10px 0;">
-                                                    <table width="100%" cellpadding="0" cellspacing="0">
-                                                        <tr>
-                                                            <td style="font-weight: bold; color: #333; width: 80px;">내용:</td>
-                                                            <td style="color: #999; font-style: italic;">내용이 없습니다.</td>
-                                                        </tr>
-                                                    </table>
-                                                </td>
-                                            </tr>'''}
-                                        </table>
-
-                                    </td>
-                                </tr>
-
-                                <!-- 푸터 -->
-                                <tr>
-                                    <td style="background-color: #f8f9fa; padding: 15px 20px; text-align: center; color: #666; font-size: 12px; border-top: 1px solid #e9ecef;">
-                                        🤖 Todolist PM에서 자동 생성 | {current_time}
-                                    </td>
-                                </tr>
-
-                            </table>
-
-                        </td>
-                    </tr>
-                </table>
-
-            </body>
-            </html>
-            """
+            subject = f"[{status}] {self.task.title}"
 
-            mail.HTMLBody = html_body
+            # 메일 내용 생성 (카테고리 색상은 목록 표시와 동일하게)
+            renderer = ReportRenderer(self.storage_manager.category_colors if self.storage_manager else ())
+            html_body = renderer.render_task_share(self.task, category_color=self.get_category_color())
 
-            # 메일 발송
-            mail.Send()
+            # 발송 대기열에 추가 (발송은 백그라운드 워커가 처리)
+            data_dir = getattr(self.storage_manager, "data_dir", "data")
+            queue_mail(MailMessage(subject, recipients, html_body), data_dir)
 
-            print(f"개별 작업 메일 발송 완료: {self.task.title}")
+            logger.info("개별 작업 메일 발송 대기열 추가: %s", self.task.title)
             return True
 
         except Exception as e:
-            print(f"개별 작업 메일 발송 중 오류: {e}")
+            logger.error("개별 작업 메일 발송 중 오류: %s", e)
             return False
 
-    def escape_html(self, text):
-        """HTML 특수문자 이스케이프"""
-        if not text:
-            return ""
-
-        html_escape_table = {
-            "&": "&amp;",
-            '"': "&quot;",
-            "'": "&#39;",
-            ">": "&gt;",
-            "<": "&lt;",
-        }
-
-        return "".join(html_escape_table.get(c, c) for c in text)
-
     def on_edit_clicked(self):
         """편집 버튼 클릭 처리"""
         self.edit_task.emit(self.task.id)
@@ -649,7 +512,7 @@ class TaskItemWidget(QFrame):
                 bg_color = self.task.get_bg_color_hex()
                 border_color = bg_color
             except Exception as e:
-                print(f"배경색 설정 중 오류: {e}")
+                logger.error("배경색 설정 중 오류: %s", e)
 
         border_width = "3px" if (self.task.important and not self.task.completed) else "1px"
 
@@ -724,22 +587,43 @@ class TaskItemWidget(QFrame):
 
 
 class TaskListWidget(QScrollArea):
-    """작업 목록 위젯"""
+    """작업 목록 위젯
+
+    화면에 보이는 행(과 위아래 여유 행)만 TaskItemWidget으로 배치하고, 나머지 행은
+    위/아래 여백 위젯의 높이로 대신한다. 스크롤하거나 목록을 갱신할 때는 위젯을
+    새로 만들지 않고 풀에 모아 둔 위젯을 다른 작업에 다시 바인딩한다.
+    """
 
     # 커스텀 시그널
     task_edited = pyqtSignal()
 
-    def __init__(self, storage_manager):
-        """작업 목록 위젯 초기화"""
+    def __init__(self, storage_manager, virtualized=True):
+        """작업 목록 위젯 초기화
+
+        Args:
+            storage_manager (StorageManager): 스토리지 매니저
+            virtualized (bool, optional): 보이는 행만 위젯으로 배치할지 여부.
+                False이면 모든 행을 배치한다 (위젯 재사용은 동일)
+        """
         super().__init__()
 
         self.storage_manager = storage_manager
+        self.virtualized = virtualized
         self.tasks = []
         self.current_date = ""
         self.drag_source_index = -1
         self.drag_target_index = -1
         self.saved_scroll_position = 0  # 스크롤 위치 저장
 
+        # 가상화 목록 상태
+        self.row_widgets = {}  # 작업 ID -> 배치된 위젯
+        self.widget_pool = []  # 재사용 대기 위젯
+        self.row_heights = {}  # 작업 ID -> 측정된 행 높이
+        self.row_offsets = [0]  # 행별 시작 위치 (행 높이 + 간격 누적)
+        self.expanded_task_ids = set()  # 내용이 펼쳐진 작업 ID
+        self.visible_range = (0, 0)  # 배치된 행 범위 [시작, 끝)
+        self.updating_rows = False
+
         # 드래그 앤 드롭 활성화
         self.setAcceptDrops(True)
 
@@ -752,14 +636,28 @@ class TaskListWidget(QScrollArea):
         self.container = QWidget()
         self.setWidget(self.container)
 
-        # 레이아웃
+        # 레이아웃 (위 여백, 배치된 행, 아래 여백, 빈 상태 메시지 순)
         self.layout = QVBoxLayout(self.container)
         self.layout.setSpacing(5)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
+        self.top_spacer = QWidget()
+        self.top_spacer.hide()
+        self.layout.addWidget(self.top_spacer)
+
+        self.bottom_spacer = QWidget()
+        self.bottom_spacer.hide()
+        self.layout.addWidget(self.bottom_spacer)
+
         # 빈 상태 메시지
         self.create_empty_label()
 
+        # 스크롤 시 보이는 행 갱신
+        self.verticalScrollBar().valueChanged.connect(self.update_visible_rows)
+
+        # 저장소 변경 시 바뀐 행만 갱신
+        self.storage_manager.add_change_listener(self.on_storage_changed)
+
     def create_empty_label(self):
         """빈 상태 메시지 라벨 생성"""
         try:
@@ -768,7 +666,7 @@ class TaskListWidget(QScrollArea):
             self.empty_label.setStyleSheet("color: #9E9E9E; font-size: 14px; padding: 20px;")
             self.layout.addWidget(self.empty_label)
         except Exception as e:
-            print(f"빈 라벨 생성 중 오류 발생: {e}")
+            logger.error("빈 라벨 생성 중 오류 발생: %s", e)
 
     def save_scroll_position(self):
         """현재 스크롤 위치 저장"""
@@ -789,246 +687,351 @@ class TaskListWidget(QScrollArea):
                     return i
 
         except Exception as e:
-            print(f"작업 인덱스 찾기 중 오류: {e}")
+            logger.error("작업 인덱스 찾기 중 오류: %s", e)
         return -1
 
     def load_tasks(self, tasks, current_date):
-        """작업 목록 로드"""
+        """작업 목록 로드 (보이는 행만 기존 위젯에 다시 바인딩)"""
         try:
             # 스크롤 위치 저장
             self.save_scroll_position()
 
-            # 기존 작업 위젯 제거
-            self.clear_tasks()
+            if current_date != self.current_date:
+                self.expanded_task_ids.clear()
 
             self.tasks = tasks
             self.current_date = current_date
 
+            # 현재 목록에 없는 작업의 측정 높이와 확장 상태는 버림
+            task_ids = {task.id for task in tasks}
+            self.row_heights = {task_id: height for task_id, height in self.row_heights.items() if task_id in task_ids}
+            self.expanded_task_ids.intersection_update(task_ids)
+
             # 빈 라벨이 없으면 새로 생성
             if not hasattr(self, 'empty_label') or self.empty_label is None:
                 self.create_empty_label()
 
-            if tasks:
-                try:
-                    # 작업이 있으면 빈 라벨 숨기기
-                    if self.empty_label is not None:
-                        self.empty_label.hide()
-                except (RuntimeError, AttributeError) as e:
-                    print(f"빈 라벨 숨기기 중 오류: {e}")
-                    self.create_empty_label()
-                    self.empty_label.hide()
-
-                # 작업 위젯 추가
-                for task in tasks:
-                    try:
-                        task_widget = TaskItemWidget(task, current_date, self.storage_manager)
-
-                        # 시그널 연결
-                        task_widget.task_toggled.connect(self.on_task_toggled)
-                        task_widget.edit_task.connect(self.on_edit_task)
-                        task_widget.delete_task.connect(self.on_delete_task)
-
-                        self.layout.addWidget(task_widget)
-                    except Exception as e:
-                        print(f"작업 위젯 추가 중 오류: {e}")
-            else:
-                try:
-                    # 작업이 없으면 빈 라벨 표시
-                    if self.empty_label is not None:
-                        self.empty_label.show()
-                except (RuntimeError, AttributeError) as e:
-                    print(f"빈 라벨 표시 중 오류: {e}")
-                    self.create_empty_label()
-                    self.empty_label.show()
+            try:
+                # 작업이 있으면 빈 라벨 숨기기
+                self.empty_label.setVisible(not tasks)
+            except RuntimeError as e:
+                logger.error("빈 라벨 표시 상태 변경 중 오류: %s", e)
+                self.create_empty_label()
+                self.empty_label.setVisible(not tasks)
+
+            # 작업 내용이 바뀌었을 수 있으므로 배치된 행은 모두 다시 바인딩
+            self.update_visible_rows(self.saved_scroll_position, rebind=True)
 
             # 스크롤 위치 복원
             self.restore_scroll_position()
 
         except Exception as e:
-            print(f"작업 목록 로드 중 오류 발생: {e}")
+            logger.exception("작업 목록 로드 중 오류 발생: %s", e)
+
+    def patch_tasks(self, tasks, changed_ids=()):
+        """변경된 작업 목록을 기존 행에 반영
+
+        배치된 위젯은 작업 ID 기준으로 그대로 유지하고 내용이 바뀐 행만 다시 바인딩하므로
+        스크롤 위치와 포커스가 유지된다.
+
+        Args:
+            tasks (list): 새 작업 목록 (표시 순서)
+            changed_ids (iterable, optional): 내용이 바뀐 작업 ID
+        """
+        try:
+            changed_ids = set(changed_ids)
+            self.tasks = tasks
+
+            task_ids = {task.id for task in tasks}
+            self.expanded_task_ids.intersection_update(task_ids)
+            for task_id in changed_ids:
+                self.row_heights.pop(task_id, None)
+
+            self.empty_label.setVisible(not tasks)
+
+            # 내용이 바뀌었거나 다른 객체로 다시 조회된 행만 다시 바인딩
+            tasks_by_id = {task.id: task for task in tasks}
+            for task_id, widget in self.row_widgets.items():
+                task = tasks_by_id.get(task_id)
+                if task is not None and (task_id in changed_ids or widget.task is not task):
+                    widget.bind(task, self.current_date, task_id in self.expanded_task_ids)
+
+            self.update_visible_rows()
+
+        except Exception as e:
+            logger.exception("작업 목록 부분 갱신 중 오류 발생: %s", e)
+
+    def is_change_relevant(self, changes):
+        """변경 내역이 현재 목록에 영향을 주는지 확인"""
+        if changes.categories_changed:
+            return True
+        if self.current_date in changes.dates or self.current_date in changes.reordered_dates:
+            return True
+        if changes.task_ids & {task.id for task in self.tasks}:
+            return True
+
+        # 다른 날짜 작업이라도 중요 미완료 작업이면 모든 날짜 목록에 표시됨
+        for task_id in changes.added | changes.updated:
+            task = self.storage_manager.get_task(task_id)
+            if task is not None and task.important and not task.completed:
+                return True
+        return False
+
+    def on_storage_changed(self, changes):
+        """저장소 변경 알림 처리 (현재 날짜 목록을 다시 조회하여 바뀐 행만 갱신)
+
+        Args:
+            changes (TaskChangeSet): 변경 내역
+        """
+        if not self.current_date or not self.is_change_relevant(changes):
+            return
+
+        changed_ids = changes.task_ids
+        if changes.categories_changed:
+            # 카테고리 색상은 모든 행에 영향을 줌
+            changed_ids = changed_ids | set(self.row_widgets)
+
+        tasks = self.storage_manager.get_tasks_by_date(self.current_date)
+        self.patch_tasks(tasks, changed_ids)
 
     def clear_tasks(self):
-        """작업 위젯 모두 제거"""
+        """배치된 작업 위젯을 모두 풀로 반환"""
         try:
-            # 빈 라벨을 제외한 모든 위젯 제거
-            while self.layout.count() > 0:
-                item = self.layout.takeAt(0)
-                if item is None:
-                    continue
+            for widget in self.row_widgets.values():
+                self.release_widget(widget)
+            self.row_widgets.clear()
+            self.visible_range = (0, 0)
 
-                widget = item.widget()
-                if widget is None:
-                    continue
+            self.top_spacer.hide()
+            self.bottom_spacer.hide()
 
-                if hasattr(self, 'empty_label') and widget == self.empty_label:
-                    continue
+        except Exception as e:
+            logger.error("작업 위젯 제거 중 오류 발생: %s", e)
+
+    def acquire_widget(self, task):
+        """풀에서 작업 위젯을 꺼내 바인딩 (풀이 비었으면 새로 생성)"""
+        if self.widget_pool:
+            widget = self.widget_pool.pop()
+            widget.bind(task, self.current_date, task.id in self.expanded_task_ids)
+            return widget
+
+        widget = TaskItemWidget(task, self.current_date, self.storage_manager)
+        widget.content_expanded = task.id in self.expanded_task_ids
+        if widget.content_expanded:
+            widget.update_view()
+
+        # 시그널 연결 (위젯을 재사용하므로 생성 시 한 번만)
+        widget.task_toggled.connect(self.on_task_toggled)
+        widget.edit_task.connect(self.on_edit_task)
+        widget.delete_task.connect(self.on_delete_task)
+        widget.content_toggled.connect(self.on_content_toggled)
+        return widget
+
+    def release_widget(self, widget):
+        """작업 위젯을 레이아웃에서 빼서 풀로 반환"""
+        self.layout.removeWidget(widget)
+        widget.hide()
+        self.widget_pool.append(widget)
+
+    def measure_row_height(self, widget):
+        """배치된 행 위젯의 높이 측정 (줄바꿈 라벨을 고려하여 현재 너비 기준)"""
+        margins = self.layout.contentsMargins()
+        width = self.viewport().width() - margins.left() - margins.right()
+        height = widget.heightForWidth(width) if widget.hasHeightForWidth() else -1
+        return height if height > 0 else widget.sizeHint().height()
+
+    def rebuild_row_offsets(self):
+        """행별 시작 위치 다시 계산 (측정하지 않은 행은 예상 높이 사용)"""
+        spacing = self.layout.spacing()
+        offsets = [0]
+        total = 0
+        for task in self.tasks:
+            total += self.row_heights.get(task.id, ROW_HEIGHT_ESTIMATE) + spacing
+            offsets.append(total)
+        self.row_offsets = offsets
+
+    def get_visible_range(self, scroll_value=None):
+        """배치할 행 범위 [시작, 끝) 계산 (위아래 여유 행 포함)"""
+        count = len(self.tasks)
+        if not self.virtualized or count == 0:
+            return 0, count
+
+        if scroll_value is None:
+            scroll_value = self.verticalScrollBar().value()
+        top = scroll_value - self.layout.contentsMargins().top()
+        bottom = top + self.viewport().height()
+
+        first = min(max(bisect_right(self.row_offsets, top) - 1 - OVERSCAN_ROWS, 0), count)
+        last = min(bisect_left(self.row_offsets, bottom) + OVERSCAN_ROWS, count)
+        return first, max(first, last)
+
+    def update_visible_rows(self, scroll_value=None, rebind=False):
+        """보이는 행 범위에 위젯을 배치하고 보이지 않는 행은 여백으로 대체
 
-                try:
-                    widget.setParent(None)
-                    widget.deleteLater()
-                except RuntimeError:
-                    pass
+        Args:
+            scroll_value (int, optional): 기준 스크롤 위치. 기본값은 현재 위치
+            rebind (bool, optional): 이미 배치된 행도 작업 내용을 다시 반영할지 여부
+        """
+        if self.updating_rows:
+            return
 
-            # 빈 라벨이 제거되었을 수 있으므로 재확인
-            if not hasattr(self, 'empty_label') or self.empty_label is None:
-                self.create_empty_label()
+        self.updating_rows = True
+        try:
+            self.rebuild_row_offsets()
+            first, last = self.get_visible_range(scroll_value)
+            visible_tasks = self.tasks[first:last]
+            visible_ids = {task.id for task in visible_tasks}
 
-            # 빈 라벨을 레이아웃에 다시 추가
-            self.layout.addWidget(self.empty_label)
+            # 범위를 벗어난 행의 위젯은 풀로 반환
+            for task_id in [task_id for task_id in self.row_widgets if task_id not in visible_ids]:
+                self.release_widget(self.row_widgets.pop(task_id))
+
+            for task in visible_tasks:
+                widget = self.row_widgets.get(task.id)
+                if widget is None:
+                    self.row_widgets[task.id] = self.acquire_widget(task)
+                elif rebind:
+                    widget.bind(task, self.current_date, task.id in self.expanded_task_ids)
+
+            # 위 여백 다음 위치부터 작업 순서대로 배치 (이미 제자리에 있는 위젯은 그대로 둠)
+            for position, task in enumerate(visible_tasks, start=1):
+                widget = self.row_widgets[task.id]
+                if self.layout.indexOf(widget) != position:
+                    self.layout.removeWidget(widget)
+                    self.layout.insertWidget(position, widget)
+                    widget.show()
+            self.visible_range = (first, last)
+
+            # 배치된 행의 실제 높이 반영
+            heights_changed = False
+            for task in visible_tasks:
+                height = self.measure_row_height(self.row_widgets[task.id])
+                if self.row_heights.get(task.id) != height:
+                    self.row_heights[task.id] = height
+                    heights_changed = True
+            if heights_changed:
+                self.rebuild_row_offsets()
+
+            self.update_spacers(first, last)
 
         except Exception as e:
-            print(f"작업 위젯 제거 중 오류 발생: {e}")
+            logger.exception("보이는 작업 행 갱신 중 오류 발생: %s", e)
+        finally:
+            self.updating_rows = False
+
+    def update_spacers(self, first, last):
+        """배치하지 않은 위/아래 행 높이만큼 여백 설정"""
+        spacing = self.layout.spacing()
+        count = len(self.tasks)
+
+        # 숨긴 위젯에는 레이아웃 간격이 붙지 않으므로 여백 높이에서 간격 하나를 뺌
+        if first > 0:
+            self.top_spacer.setFixedHeight(max(self.row_offsets[first] - spacing, 0))
+            self.top_spacer.show()
+        else:
+            self.top_spacer.hide()
+
+        if last < count:
+            self.bottom_spacer.setFixedHeight(max(self.row_offsets[count] - self.row_offsets[last] - spacing, 0))
+            self.bottom_spacer.show()
+        else:
+            self.bottom_spacer.hide()
+
+    def on_content_toggled(self, task_id, expanded):
+        """작업 내용 확장 상태 변경 처리 (행 높이 다시 측정)"""
+        if expanded:
+            self.expanded_task_ids.add(task_id)
+        else:
+            self.expanded_task_ids.discard(task_id)
+        self.update_visible_rows()
+
+    def reveal_task(self, task_id):
+        """작업 행이 보이도록 스크롤하고 내용을 펼침 (검색 결과 선택 시)
+
+        Returns:
+            bool: 현재 목록에 작업이 있었는지 여부
+        """
+        for index, task in enumerate(self.tasks):
+            if task.id == task_id:
+                break
+        else:
+            return False
+
+        self.expanded_task_ids.add(task_id)
+        self.rebuild_row_offsets()
+        self.verticalScrollBar().setValue(self.row_offsets[index])
+        self.update_visible_rows(rebind=True)
+        return True
+
+    def resizeEvent(self, event):
+        """크기 변경 시 보이는 행과 행 높이 갱신"""
+        super().resizeEvent(event)
+        self.update_visible_rows()
 
     def on_task_toggled(self, task_id, completed):
-        """작업 완료 상태 변경 처리"""
+        """작업 완료 상태 변경 처리 (변경 알림으로 해당 행만 갱신됨)"""
         try:
-            # 스크롤 위치 저장
-            self.save_scroll_position()
-
             # 작업 찾기
             for task in self.tasks:
                 if task.id == task_id:
-                    # 작업 상태 업데이트
-                    task.completed = completed
-                    self.storage_manager.update_task(task_id, task)
+                    # 상태 변경과 순서 재정렬을 한 번의 변경 알림으로 묶음
+                    with self.storage_manager.batch_changes():
+                        # 작업 상태 업데이트
+                        task.completed = completed
+                        self.storage_manager.update_task(task_id, task)
 
-                    # 작업 순서 재정렬 (완료/미완료 및 중요도 고려)
-                    self.reorder_tasks_by_priority(task)
+                        # 작업 순서 재정렬 (완료/미완료 및 중요도 고려)
+                        self.reorder_tasks_by_priority(task)
 
                     self.task_edited.emit()
                     break
 
-            # 스크롤 위치 복원
-            self.restore_scroll_position()
-
         except Exception as e:
-            print(f"작업 완료 상태 변경 중 오류 발생: {e}")
+            logger.error("작업 완료 상태 변경 중 오류 발생: %s", e)
 
     def reorder_tasks_by_priority(self, changed_task):
-        """작업 순서를 우선순위에 따라 재정렬 (완료 상태 변경 시 호출)"""
+        """상태가 바뀐 작업을 우선순위 그룹 위치로 이동 (완료 상태 변경 시 호출)
+
+        그룹 순서: 중요 미완료 -> 일반 미완료 -> 중요 완료 -> 일반 완료.
+        다른 작업은 그대로 두고 바뀐 작업 하나의 order만 바꾼다.
+        """
         try:
-            # 해당 날짜의 작업들만 필터링
-            date_tasks = [t for t in self.tasks if t.created_date == changed_task.created_date]
+            # 해당 날짜의 작업들만 (order 순)
+            date_tasks = sorted(
+                (t for t in self.tasks if t.created_date == changed_task.created_date),
+                key=order_key
+            )
 
             if len(date_tasks) <= 1:
                 return
 
-            # 작업을 4개 그룹으로 분리
-            important_incomplete = [t for t in date_tasks if t.important and not t.completed]
-            normal_incomplete = [t for t in date_tasks if not t.important and not t.completed]
-            important_completed = [t for t in date_tasks if t.important and t.completed]
-            normal_completed = [t for t in date_tasks if not t.important and t.completed]
-
-            # 각 그룹 내에서 기존 순서 유지 (order 기준 정렬)
-            important_incomplete.sort(key=lambda x: getattr(x, 'order', 999))
-            normal_incomplete.sort(key=lambda x: getattr(x, 'order', 999))
-            important_completed.sort(key=lambda x: getattr(x, 'order', 999))
-            normal_completed.sort(key=lambda x: getattr(x, 'order', 999))
-
-            # 새로운 순서 할당
-            order_counter = 1
-
-            # 1. 중요 미완료 작업들 (최우선)
-            for task in important_incomplete:
-                task.order = order_counter
-                order_counter += 1
-
-            # 2. 일반 미완료 작업들
-            for task in normal_incomplete:
-                task.order = order_counter
-                order_counter += 1
-
-            # 3. 중요 완료 작업들
-            for task in important_completed:
-                task.order = order_counter
-                order_counter += 1
-
-            # 4. 일반 완료 작업들 (최하위)
-            for task in normal_completed:
-                task.order = order_counter
-                order_counter += 1
-
-            # 저장소에 변경사항 반영
-            for task in date_tasks:
-                self.storage_manager.update_task(task.id, task)
+            # 같은 그룹 안에서는 기존 순서 유지: 바뀐 작업보다 뒤에 와야 하는 첫 작업 앞으로
+            changed_key = (priority_group(changed_task), order_key(changed_task))
+            others = [t for t in date_tasks if t.id != changed_task.id]
+            target_index = len(others)
+            for i, task in enumerate(others):
+                if (priority_group(task), order_key(task)) > changed_key:
+                    target_index = i
+                    break
+
+            self.storage_manager.move_task(changed_task.id, target_index)
 
             # 즉시 저장
             self.storage_manager.save_data()
 
-            status = "완료" if changed_task.completed else "미완료"
-            importance = "중요" if changed_task.important else "일반"
-            print(f"{importance} 작업 '{changed_task.title}'이 {status} 상태로 변경되어 우선순위에 따라 재정렬됨")
+            logger.debug("작업 '%s' 상태 변경(중요=%s, 완료=%s)으로 %d번째로 이동",
+                         changed_task.title, changed_task.important, changed_task.completed, target_index)
 
         except Exception as e:
-            print(f"작업 우선순위 재정렬 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("작업 우선순위 재정렬 중 오류: %s", e)
 
     def move_task_to_bottom(self, completed_task):
-        """완료된 작업을 해당 날짜 작업 목록의 맨 아래로 이동 (중요도 고려)"""
-        try:
-            # 해당 날짜의 작업들만 필터링
-            date_tasks = [t for t in self.tasks if t.created_date == completed_task.created_date]
-
-            if len(date_tasks) <= 1:
-                return  # 작업이 1개 이하면 이동할 필요 없음
-
-            # 작업을 4개 그룹으로 분리
-            important_incomplete = [t for t in date_tasks if t.important and not t.completed]
-            normal_incomplete = [t for t in date_tasks if not t.important and not t.completed]
-            important_completed = [t for t in date_tasks if t.important and t.completed]
-            normal_completed = [t for t in date_tasks if not t.important and t.completed]
-
-            # 각 그룹 내에서 기존 순서 유지 (order 기준 정렬)
-            important_incomplete.sort(key=lambda x: getattr(x, 'order', 999))
-            normal_incomplete.sort(key=lambda x: getattr(x, 'order', 999))
-            important_completed.sort(key=lambda x: getattr(x, 'order', 999))
-            normal_completed.sort(key=lambda x: getattr(x, 'order', 999))
-
-            # 새로운 순서 할당
-            # 1. 중요 미완료 작업들 (맨 위)
-            order_counter = 1
-            for task in important_incomplete:
-                task.order = order_counter
-                order_counter += 1
-
-            # 2. 일반 미완료 작업들
-            for task in normal_incomplete:
-                task.order = order_counter
-                order_counter += 1
-
-            # 3. 중요 완료 작업들
-            for task in important_completed:
-                task.order = order_counter
-                order_counter += 1
-
-            # 4. 일반 완료 작업들 (맨 아래)
-            for task in normal_completed:
-                task.order = order_counter
-                order_counter += 1
-
-            # 저장소에 변경사항 반영
-            for task in date_tasks:
-                self.storage_manager.update_task(task.id, task)
-
-            # 즉시 저장
-            self.storage_manager.save_data()
-
-            status = "완료" if completed_task.completed else "미완료"
-            importance = "중요" if completed_task.important else "일반"
-            print(f"{importance} 작업 '{completed_task.title}'이 {status} 상태로 변경되어 적절한 위치로 이동")
-
-        except Exception as e:
-            print(f"작업 이동 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
+        """완료된 작업을 해당 날짜 작업 목록의 완료 그룹으로 이동 (중요도 고려)"""
+        self.reorder_tasks_by_priority(completed_task)
 
     def on_edit_task(self, task_id):
         """작업 편집 대화상자 표시"""
         try:
-            # 스크롤 위치 저장
-            self.save_scroll_position()
-
             # 작업 찾기
             for task in self.tasks:
                 if task.id == task_id:
@@ -1038,18 +1041,12 @@ class TaskListWidget(QScrollArea):
                         self.task_edited.emit()
                     break
 
-            # 스크롤 위치 복원
-            self.restore_scroll_position()
-
         except Exception as e:
-            print(f"작업 편집 중 오류 발생: {e}")
+            logger.error("작업 편집 중 오류 발생: %s", e)
 
     def on_delete_task(self, task_id):
         """작업 삭제 확인 및 처리"""
         try:
-            # 스크롤 위치 저장
-            self.save_scroll_position()
-
             # 확인 메시지 표시
             reply = QMessageBox.question(
                 self,
@@ -1064,59 +1061,41 @@ class TaskListWidget(QScrollArea):
                 if self.storage_manager.delete_task(task_id):
                     self.task_edited.emit()
 
-            # 스크롤 위치 복원
-            self.restore_scroll_position()
-
         except Exception as e:
-            print(f"작업 삭제 중 오류 발생: {e}")
+            logger.error("작업 삭제 중 오류 발생: %s", e)
 
     def reorder_tasks(self, source_index, target_index):
         """작업 순서 변경"""
         try:
-            # 스크롤 위치 저장
-            self.save_scroll_position()
-
             # 해당 날짜의 작업만 필터링
             date_only_tasks = [t for t in self.tasks if t.created_date == self.current_date]
 
             # 인덱스 범위 검사
             if source_index < 0 or source_index >= len(date_only_tasks):
-                print(f"잘못된 소스 인덱스: {source_index}, 날짜별 작업 수: {len(date_only_tasks)}")
+                logger.warning("잘못된 소스 인덱스: %d, 날짜별 작업 수: %d", source_index, len(date_only_tasks))
                 return
             if target_index < 0 or target_index >= len(date_only_tasks):
-                print(f"잘못된 타겟 인덱스: {target_index}, 날짜별 작업 수: {len(date_only_tasks)}")
+                logger.warning("잘못된 타겟 인덱스: %d, 날짜별 작업 수: %d", target_index, len(date_only_tasks))
                 return
             if source_index == target_index:
                 return
 
-            print(f"UI에서 순서 변경 요청: {source_index} -> {target_index}")
-
             # 저장소에서 순서 변경 처리
             success = self.storage_manager.reorder_tasks(self.current_date, source_index, target_index)
 
             if success:
-                # 즉시 저장
+                # 즉시 저장 (목록은 저장소 변경 알림으로 갱신됨)
                 self.storage_manager.save_data()
-                print("데이터 즉시 저장 완료")
-
-                # UI 업데이트 - 저장소에서 다시 데이터 가져오기
-                updated_tasks = self.storage_manager.get_tasks_by_date(self.current_date)
-                self.load_tasks(updated_tasks, self.current_date)
 
                 # 변경 알림
                 self.task_edited.emit()
 
-                print(f"UI 작업 순서 변경 완료: {source_index} -> {target_index}")
+                logger.debug("UI 작업 순서 변경 완료: %d -> %d", source_index, target_index)
             else:
-                print("작업 순서 변경 실패")
-
-            # 스크롤 위치 복원
-            self.restore_scroll_position()
+                logger.warning("작업 순서 변경 실패: %d -> %d", source_index, target_index)
 
         except Exception as e:
-            print(f"UI 작업 순서 변경 중 오류 발생: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("UI 작업 순서 변경 중 오류 발생: %s", e)
 
     def get_task_widget_at_position(self, pos):
         """주어진 위치의 작업 위젯과 인덱스 반환"""
@@ -1127,16 +1106,8 @@ class TaskListWidget(QScrollArea):
             # 해당 날짜의 작업만 필터링
             date_only_tasks = [t for t in self.tasks if t.created_date == self.current_date]
 
-            # 위치에 있는 위젯 찾기
-            for i in range(self.layout.count()):
-                item = self.layout.itemAt(i)
-                if item is None:
-                    continue
-
-                widget = item.widget()
-                if widget is None or (hasattr(self, 'empty_label') and widget == self.empty_label):
-                    continue
-
+            # 위치에 있는 위젯 찾기 (배치된 행만 확인)
+            for widget in self.row_widgets.values():
                 # 위젯의 영역 확인
                 rect = widget.geometry()
                 if rect.contains(container_pos):
@@ -1147,7 +1118,7 @@ class TaskListWidget(QScrollArea):
                             return (widget, task_idx)
 
         except Exception as e:
-            print(f"작업 위젯 찾기 중 오류 발생: {e}")
+            logger.error("작업 위젯 찾기 중 오류 발생: %s", e)
 
         return (None, -1)
 
@@ -1163,14 +1134,14 @@ class TaskListWidget(QScrollArea):
 
                 if 0 <= self.drag_source_index < len(date_only_tasks):
                     event.accept()
-                    print(f"드래그 시작: 인덱스 {self.drag_source_index}")
+                    logger.debug("드래그 시작: 인덱스 %d", self.drag_source_index)
                 else:
-                    print(f"드래그 인덱스 범위 오류: {self.drag_source_index}")
+                    logger.warning("드래그 인덱스 범위 오류: %d", self.drag_source_index)
                     event.ignore()
             else:
                 event.ignore()
         except Exception as e:
-            print(f"드래그 시작 이벤트 처리 중 오류: {e}")
+            logger.error("드래그 시작 이벤트 처리 중 오류: %s", e)
             event.ignore()
 
     def dragMoveEvent(self, event):
@@ -1194,19 +1165,21 @@ class TaskListWidget(QScrollArea):
                 # 대상 위젯 강조
                 if hasattr(widget, 'apply_task_style'):
                     widget.setStyleSheet(widget.styleSheet() + " border: 2px dashed #4285F4;")
+                    # 강조한 채로 풀에 반환되어도 다음 바인딩 때 스타일을 다시 적용하도록 함
+                    widget.style_key = None
 
                 event.accept()
             else:
                 self.drag_target_index = -1
                 event.ignore()
         except Exception as e:
-            print(f"드래그 이동 이벤트 처리 중 오류: {e}")
+            logger.error("드래그 이동 이벤트 처리 중 오류: %s", e)
             event.ignore()
 
     def dropEvent(self, event):
         """드롭 이벤트 처리"""
         try:
-            print(f"드롭 이벤트: 소스={self.drag_source_index}, 타겟={self.drag_target_index}")
+            logger.debug("드롭 이벤트: 소스=%s, 타겟=%s", self.drag_source_index, self.drag_target_index)
 
             if (self.drag_source_index >= 0 and self.drag_target_index >= 0 and
                     self.drag_source_index != self.drag_target_index):
@@ -1228,7 +1201,7 @@ class TaskListWidget(QScrollArea):
                     item.widget().apply_task_style()
 
         except Exception as e:
-            print(f"드롭 이벤트 처리 중 오류: {e}")
+            logger.error("드롭 이벤트 처리 중 오류: %s", e)
             event.ignore()
 
     def dragLeaveEvent(self, event):
@@ -1240,4 +1213,4 @@ class TaskListWidget(QScrollArea):
                 if item and item.widget() and hasattr(item.widget(), 'apply_task_style'):
                     item.widget().apply_task_style()
         except Exception as e:
-            print(f"드래그 떠남 이벤트 처리 중 오류: {e}")
\ No newline at end of file
+            logger.error("드래그 떠남 이벤트 처리 중 오류: %s", e)
\ No newline at end of file
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt6.QtWidgets import QLineEdit, QListWidget, QListWidgetItem, QFrame
+from PyQt6.QtCore import Qt, QTimer, QPoint, pyqtSignal
+
+from utils.logger import get_logger
+
+logger = get_logger("ui")
+
+SEARCH_DELAY_MS = 150  # 입력이 멈춘 뒤 검색까지 대기 시간
+MAX_RESULTS = 30
+TITLE_PREVIEW_LENGTH = 40
+
+
+class TaskSearchBox(QLineEdit):
+    """작업 검색 입력창 (입력하는 동안 아래에 결과 목록 표시)"""
+
+    # 결과 선택 시 (날짜 YYYY-MM-DD, 작업 ID)
+    task_selected = pyqtSignal(str, str)
+
+    def __init__(self, storage_manager, parent=None):
+        """검색 입력창 초기화
+
+        Args:
+            storage_manager (StorageManager): 데이터 저장소 관리자
+            parent (QWidget, optional): 부모 위젯
+        """
+        super().__init__(parent)
+
+        self.storage_manager = storage_manager
+
+        self.setPlaceholderText("🔍 작업 검색 (제목/내용)")
+        self.setClearButtonEnabled(True)
+        self.setMinimumWidth(220)
+
+        # 결과 목록 팝업 (입력 포커스는 입력창에 남김)
+        self.results_popup = QListWidget()
+        self.results_popup.setWindowFlags(Qt.WindowType.ToolTip | Qt.WindowType.FramelessWindowHint)
+        self.results_popup.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.results_popup.setFrameShape(QFrame.Shape.StyledPanel)
+        self.results_popup.setStyleSheet("QListWidget { font-size: 12px; } QListWidget::item { padding: 4px; }")
+        self.results_popup.itemClicked.connect(self.on_result_activated)
+
+        # 입력할 때마다 검색하지 않도록 잠시 모았다가 검색
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.run_search)
+
+        self.textChanged.connect(self.on_text_changed)
+        self.returnPressed.connect(self.on_return_pressed)
+
+    def on_text_changed(self, text):
+        """입력 변경 처리"""
+        if text.strip():
+            self.search_timer.start()
+        else:
+            self.search_timer.stop()
+            self.results_popup.hide()
+
+    def run_search(self):
+        """검색 실행 후 결과 목록 표시"""
+        query = self.text()
+        try:
+            tasks = self.storage_manager.search_tasks(query, limit=MAX_RESULTS)
+        except Exception as e:
+            logger.error("작업 검색 중 오류: %s", e)
+            return
+
+        self.results_popup.clear()
+        if not tasks:
+            item = QListWidgetItem("검색 결과가 없습니다")
+            item.setFlags(Qt.ItemFlag.NoItemFlags)
+            self.results_popup.addItem(item)
+        for task in tasks:
+            title = task.title if len(task.title) <= TITLE_PREVIEW_LENGTH else task.title[:TITLE_PREVIEW_LENGTH] + "…"
+            status = "✅" if task.completed else ("⭐" if task.important else "⏳")
+            item = QListWidgetItem(f"{task.created_date}  {status} [{task.category}] {title}")
+            item.setData(Qt.ItemDataRole.UserRole, (task.created_date, task.id))
+            if task.content:
+                item.setToolTip(task.content[:200])
+            self.results_popup.addItem(item)
+
+        self.show_popup()
+        logger.debug("작업 검색: '%s' -> %d개", query, len(tasks))
+
+    def show_popup(self):
+        """입력창 바로 아래에 결과 목록 표시"""
+        popup = self.results_popup
+        rows = min(popup.count(), 10)
+        row_height = popup.sizeHintForRow(0) if popup.count() else 20
+        popup.setFixedSize(max(self.width(), 420), rows * row_height + 2 * popup.frameWidth())
+        popup.move(self.mapToGlobal(QPoint(0, self.height())))
+        popup.setCurrentRow(0 if popup.item(0) and popup.item(0).flags() else -1)
+        popup.show()
+
+    def keyPressEvent(self, event):
+        """결과 목록이 열려 있으면 위/아래 키로 선택, Esc로 닫기"""
+        popup = self.results_popup
+        if popup.isVisible():
+            key = event.key()
+            if key in (Qt.Key.Key_Down, Qt.Key.Key_Up):
+                step = 1 if key == Qt.Key.Key_Down else -1
+                row = min(max(popup.currentRow() + step, 0), popup.count() - 1)
+                popup.setCurrentRow(row)
+                return
+            if key == Qt.Key.Key_Escape:
+                popup.hide()
+                return
+        super().keyPressEvent(event)
+
+    def on_return_pressed(self):
+        """Enter: 선택된 결과로 이동 (목록이 닫혀 있으면 바로 검색)"""
+        if self.search_timer.isActive() or not self.results_popup.isVisible():
+            self.search_timer.stop()
+            self.run_search()
+            return
+        item = self.results_popup.currentItem()
+        if item is not None:
+            self.on_result_activated(item)
+
+    def on_result_activated(self, item):
+        """결과 선택 처리"""
+        data = item.data(Qt.ItemDataRole.UserRole)
+        if not data:
+            return
+        self.results_popup.hide()
+        date_str, task_id = data
+        self.task_selected.emit(date_str, task_id)
+
+    def focusOutEvent(self, event):
+        """입력창을 벗어나면 결과 목록 닫기 (목록 클릭이 먼저 처리되도록 잠시 뒤에)"""
+        super().focusOutEvent(event)
+        QTimer.singleShot(200, self.results_popup.hide)
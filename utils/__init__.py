@@ -5,7 +5,7 @@
 유틸리티 패키지 초기화 파일
 """
 
-from utils.storage import StorageManager
+from utils.storage import StorageManager, create_storage_manager
 from utils.date_utils import (
     get_current_date_str,
     get_month_calendar,
@@ -18,6 +18,7 @@ from utils.csv_exporter import CsvExporter
 
 __all__ = [
     'StorageManager',
+    'create_storage_manager',
     'get_current_date_str',
     'get_month_calendar',
     'get_month_days',
@@ -4,6 +4,22 @@
 import csv
 from datetime import datetime
 
+from utils.logger import get_logger
+from utils.task_query import TaskQuery
+
+logger = get_logger("export")
+
+# 내보내기 필드 -> CSV 헤더 (가져오기에서도 같은 헤더를 인식)
+CSV_FIELD_LABELS = {
+    "id": "ID",
+    "title": "제목",
+    "content": "내용",
+    "category": "카테고리",
+    "created_date": "생성일",
+    "important": "중요",
+    "completed": "완료"
+}
+
 
 class CsvExporter:
     """CSV 내보내기 기능 클래스"""
@@ -13,7 +29,7 @@ class CsvExporter:
         """작업 목록을 CSV 파일로 내보내기
 
         Args:
-            tasks (list): 작업 객체 목록
+            tasks (iterable): 작업 객체 목록 (storage_manager.query() 결과도 가능)
             file_path (str): CSV 파일 저장 경로
             include_header (bool, optional): 헤더 포함 여부. 기본값은 True
             fields (list, optional): 포함할 필드 목록. 기본값은 모든 필드
@@ -21,22 +37,11 @@ class CsvExporter:
         Returns:
             bool: 내보내기 성공 여부
         """
-        # 기본 필드 설정
-        available_fields = {
-            "id": "ID",
-            "title": "제목",
-            "content": "내용",
-            "category": "카테고리",
-            "created_date": "생성일",
-            "important": "중요",
-            "completed": "완료"
-        }
-
         # 사용할 필드 결정
         if fields is None:
-            export_fields = list(available_fields.keys())
+            export_fields = list(CSV_FIELD_LABELS.keys())
         else:
-            export_fields = [f for f in fields if f in available_fields]
+            export_fields = [f for f in fields if f in CSV_FIELD_LABELS]
 
         try:
             with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
@@ -44,7 +49,7 @@ class CsvExporter:
 
                 # 헤더 작성
                 if include_header:
-                    header = [available_fields[field] for field in export_fields]
+                    header = [CSV_FIELD_LABELS[field] for field in export_fields]
                     writer.writerow(header)
 
                 # 데이터 작성
@@ -63,12 +68,12 @@ class CsvExporter:
             return True
 
         except Exception as e:
-            print(f"CSV 내보내기 중 오류 발생: {e}")
+            logger.error("CSV 내보내기 중 오류 발생: %s", e)
             return False
 
     @staticmethod
     def filter_tasks(tasks, date_range=None, categories=None, completed=None):
-        """작업 목록 필터링
+        """작업 목록 필터링 (저장소 밖의 작업 목록용, 저장소 작업은 storage_manager.query() 사용)
 
         Args:
             tasks (list): 작업 객체 목록
@@ -79,28 +84,4 @@ class CsvExporter:
         Returns:
             list: 필터링된 작업 목록
         """
-        filtered_tasks = tasks
-
-        # 날짜 범위 필터링
-        if date_range:
-            start_date, end_date = date_range
-            filtered_tasks = [
-                task for task in filtered_tasks
-                if start_date <= task.created_date <= end_date
-            ]
-
-        # 카테고리 필터링
-        if categories:
-            filtered_tasks = [
-                task for task in filtered_tasks
-                if task.category in categories
-            ]
-
-        # 완료 상태 필터링
-        if completed is not None:
-            filtered_tasks = [
-                task for task in filtered_tasks
-                if task.completed == completed
-            ]
-
-        return filtered_tasks
\ No newline at end of file
+        return list(TaskQuery.from_filters(date_range, categories, completed).filter(tasks))
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+백그라운드 발송 데몬
+
+GUI 없이 계속 실행되면서 데일리 루틴과 메일 예약을 모두 담당한다.
+작업 저장소는 시작 시 한 번 로드하여 메모리에 유지하고, 데이터 디렉토리의
+파일 변경을 감시하여 작업 파일이 바뀌었을 때만 다시 로드한다. 발송 시각 계산은
+GUI와 같은 RoutineScheduler를 사용하므로 발송마다 새 프로세스를 띄우지 않는다.
+작성한 메일은 발송 대기열(data/outbox)에 넣고, 대기열은 데몬 안의 발송 워커가
+재시도를 포함하여 처리한다.
+
+실행 중에는 data/dispatcher.lock을 주기적으로 갱신하며, GUI는 이 파일이 최근에
+갱신되어 있으면 발송을 데몬에 맡기고 직접 보내지 않는다.
+
+사용법:
+    python -m utils.dispatch_daemon [--data-dir data] [--once] [--debug]
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.daily_routine_checker import DailyRoutineChecker
+from utils.logger import get_logger, setup_logging
+from utils.mail_outbox import get_outbox
+from utils.mail_transport import close_transports, init_mail_thread
+from utils.routine_scheduler import RoutineScheduler
+from utils.storage import create_storage_manager
+
+logger = get_logger("dispatch")
+
+LOCK_FILE_NAME = "dispatcher.lock"
+# 데이터 디렉토리 변경 확인 간격 (초). 파일 수정 시각만 확인하므로 비용이 작음
+WATCH_INTERVAL = 2.0
+# 잠금 파일이 이 시간(초) 넘게 갱신되지 않으면 데몬이 종료된 것으로 봄
+LOCK_STALE_SECONDS = 30.0
+
+# 작업 저장소를 이루는 파일 (바뀌면 저장소를 다시 로드)
+STORE_FILE_PREFIXES = ("tasks", "categories", "storage_settings")
+SHARD_DIR_NAME = "tasks"
+
+
+def lock_path(data_dir="data"):
+    """잠금 파일 경로"""
+    return os.path.join(data_dir, LOCK_FILE_NAME)
+
+
+def is_dispatcher_running(data_dir="data"):
+    """다른 프로세스에서 발송 데몬이 실행 중인지 확인 (잠금 파일 갱신 시각 기준)"""
+    try:
+        return time.time() - os.stat(lock_path(data_dir)).st_mtime < LOCK_STALE_SECONDS
+    except OSError:
+        return False
+
+
+def scan_store_files(data_dir):
+    """작업 저장소 파일의 (수정 시각, 크기) 목록"""
+    stamps = {}
+    for directory in (data_dir, os.path.join(data_dir, SHARD_DIR_NAME)):
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if directory == data_dir and not entry.name.startswith(STORE_FILE_PREFIXES):
+                continue
+            stat = entry.stat()
+            stamps[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+class DispatchDaemon:
+    """asyncio 기반 루틴/메일 예약 발송 데몬"""
+
+    def __init__(self, data_dir="data", watch_interval=WATCH_INTERVAL):
+        """발송 데몬 초기화
+
+        Args:
+            data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+            watch_interval (float, optional): 파일 변경 확인 간격 (초)
+        """
+        self.data_dir = data_dir
+        self.watch_interval = watch_interval
+        self.lock_file = lock_path(data_dir)
+
+        self.storage_manager = create_storage_manager(data_dir)
+        self.store_stamps = scan_store_files(data_dir)
+        self.scheduler = self._create_scheduler()
+        # 메일 발송 대기열 (GUI와 같은 data/outbox를 함께 처리)
+        self.outbox = get_outbox(data_dir)
+
+        # 리포트 작성은 순서대로 하나씩 (저장소 조회가 이벤트 루프를 막지 않도록 별도 스레드)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dispatch",
+                                           initializer=init_mail_thread)
+        self._stop_event = None
+
+    def _create_scheduler(self):
+        """현재 저장소로 스케줄러 생성"""
+        routine_checker = DailyRoutineChecker(self.storage_manager, self.data_dir)
+        return RoutineScheduler(self.storage_manager, routine_checker,
+                                email_schedules_file=os.path.join(self.data_dir, "email_schedules.json"))
+
+    def touch_lock(self):
+        """잠금 파일 갱신 (GUI가 데몬 실행 여부를 판단하는 기준)"""
+        try:
+            with open(self.lock_file, "w", encoding="utf-8") as f:
+                f.write(str(os.getpid()))
+        except OSError as e:
+            logger.warning("잠금 파일 갱신 실패: %s", e)
+
+    def release_lock(self):
+        """잠금 파일 제거"""
+        try:
+            os.remove(self.lock_file)
+        except OSError:
+            pass
+
+    def reload_store_if_changed(self):
+        """작업 파일이 바뀌었으면 저장소를 다시 로드
+
+        Returns:
+            bool: 다시 로드했는지 여부
+        """
+        stamps = scan_store_files(self.data_dir)
+        if stamps == self.store_stamps:
+            return False
+
+        self.store_stamps = stamps
+        old_storage = self.storage_manager
+        self.storage_manager = create_storage_manager(self.data_dir)
+        self.scheduler.storage_manager = self.storage_manager
+        self.scheduler.routine_checker.storage_manager = self.storage_manager
+        try:
+            old_storage.close()
+        except Exception as e:
+            logger.warning("이전 저장소 정리 중 오류: %s", e)
+        logger.info("작업 파일 변경 감지: 저장소 다시 로드")
+        return True
+
+    def check_changes(self):
+        """데이터 디렉토리 변경 확인 (설정 변경 시 발송 계획 갱신)"""
+        self.reload_store_if_changed()
+        if self.scheduler.replan_if_changed():
+            logger.info("루틴/예약 설정 변경 감지: 발송 계획 갱신 (%d건)", len(self.scheduler.heap))
+
+    async def dispatch_due(self):
+        """발송 시각이 된 작업의 메일을 작성하여 발송 대기열에 추가"""
+        loop = asyncio.get_running_loop()
+        executed = await loop.run_in_executor(self.executor, self.scheduler.run_due)
+        if executed:
+            logger.info("발송 대기열 추가: %s", ", ".join(executed))
+        return executed
+
+    def stop(self):
+        """데몬 종료 요청"""
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def _install_signal_handlers(self, loop):
+        """종료 시그널 처리 (지원하지 않는 플랫폼은 KeyboardInterrupt로 종료)"""
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError, AttributeError):
+                pass
+
+    async def run(self, once=False):
+        """발송 루프 실행
+
+        Args:
+            once (bool, optional): 현재 시각까지의 발송(놓친 발송 포함)만 처리하고 종료
+        """
+        self._stop_event = asyncio.Event()
+        self._install_signal_handlers(asyncio.get_running_loop())
+
+        self.scheduler.plan()
+        if not once:
+            self.outbox.start()
+        logger.info("발송 데몬 시작: %s (발송 예정 %d건)", os.path.abspath(self.data_dir), len(self.scheduler.heap))
+
+        try:
+            while not self._stop_event.is_set():
+                self.touch_lock()
+                self.check_changes()
+                if self.scheduler.next_delay() == 0:
+                    await self.dispatch_due()
+                if once:
+                    # 대기열에 있는 메일도 이번에 한 번 발송 시도
+                    await asyncio.get_running_loop().run_in_executor(self.executor, self.outbox.process_due)
+                    break
+
+                # 다음 발송 시각과 파일 변경 확인 중 먼저 오는 시점까지 대기
+                timeout = min(self.scheduler.next_delay(), self.watch_interval)
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.release_lock()
+            self.outbox.stop()
+            self.executor.shutdown(wait=True)
+            close_transports()
+            self.storage_manager.close()
+            logger.info("발송 데몬 종료")
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="Todolist 루틴/메일 예약 발송 데몬")
+    parser.add_argument("--data-dir", default="data", help="데이터 디렉토리 (기본값: data)")
+    parser.add_argument("--once", action="store_true", help="현재 시각까지의 발송만 처리하고 종료")
+    parser.add_argument("--debug", action="store_true", help="디버그 로그 출력")
+    parser.add_argument("--log-dir", default="logs", help="로그 디렉토리 (기본값: logs)")
+    args = parser.parse_args(argv)
+
+    setup_logging(debug=True if args.debug else None, log_dir=args.log_dir)
+
+    if is_dispatcher_running(args.data_dir):
+        logger.error("이미 발송 데몬이 실행 중입니다: %s", lock_path(args.data_dir))
+        return 1
+
+    daemon = DispatchDaemon(args.data_dir)
+    try:
+        asyncio.run(daemon.run(once=args.once))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
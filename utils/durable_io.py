@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+안전한 파일 저장 유틸리티
+
+모든 JSON 데이터 파일은 다음 순서로 저장한다.
+    1. 같은 디렉토리의 임시 파일에 기록 후 fsync
+    2. 기존 파일을 data/backups/에 스냅샷으로 보관 (하드 링크, 일정 간격마다)
+    3. 임시 파일을 원래 이름으로 원자적 교체(os.replace) 후 디렉토리 fsync
+
+저장 도중 종료되어도 원본 또는 새 파일 중 하나는 온전히 남으며,
+원본이 손상된 경우 로드 시 가장 최근의 유효한 스냅샷으로 자동 복구한다.
+"""
+
+import glob
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+
+from utils.logger import get_logger
+
+logger = get_logger("storage")
+
+# 파일별 보관할 스냅샷 수
+SNAPSHOT_COUNT = 5
+
+# 스냅샷 생성 최소 간격 (초). 자주 저장해도 스냅샷 비용은 이 간격당 1회로 제한됨
+SNAPSHOT_INTERVAL = 300
+
+BACKUP_DIR_NAME = "backups"
+
+# 파일 경로별 마지막 스냅샷 시각
+_last_snapshot_time = {}
+
+
+def _backup_dir(path):
+    """파일의 스냅샷 보관 디렉토리"""
+    return os.path.join(os.path.dirname(os.path.abspath(path)), BACKUP_DIR_NAME)
+
+
+def list_snapshots(path):
+    """파일의 스냅샷 목록 (최신순)
+
+    Args:
+        path (str): 원본 파일 경로
+
+    Returns:
+        list: 스냅샷 파일 경로 목록
+    """
+    pattern = os.path.join(_backup_dir(path), f"{os.path.basename(path)}.*.bak")
+    return sorted(glob.glob(pattern), reverse=True)
+
+
+def _fsync_dir(dir_path):
+    """디렉토리 엔트리(이름 변경) 반영 (POSIX 전용, Windows는 건너뜀)"""
+    if os.name != "posix":
+        return
+    fd = os.open(dir_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _take_snapshot(path, snapshots):
+    """기존 파일을 스냅샷으로 보관하고 오래된 스냅샷 정리"""
+    backup_dir = _backup_dir(path)
+    os.makedirs(backup_dir, exist_ok=True)
+
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    snapshot_path = os.path.join(backup_dir, f"{os.path.basename(path)}.{stamp}.bak")
+
+    try:
+        # 곧 교체될 파일이므로 복사 대신 하드 링크로 보관 (데이터 크기와 무관한 비용)
+        os.link(path, snapshot_path)
+    except OSError:
+        shutil.copy2(path, snapshot_path)
+
+    for old_snapshot in list_snapshots(path)[snapshots:]:
+        try:
+            os.remove(old_snapshot)
+        except OSError as e:
+            logger.warning("오래된 스냅샷 삭제 실패: %s (%s)", old_snapshot, e)
+
+
+def atomic_write_json(path, data, indent=2, snapshots=SNAPSHOT_COUNT, snapshot_interval=SNAPSHOT_INTERVAL):
+    """JSON 데이터를 원자적으로 저장
+
+    Args:
+        path (str): 저장할 파일 경로
+        data: JSON으로 직렬화할 데이터
+        indent (int, optional): 들여쓰기. None이면 한 줄로 저장
+        snapshots (int, optional): 보관할 스냅샷 수. 0이면 스냅샷을 만들지 않음
+        snapshot_interval (float, optional): 스냅샷 생성 최소 간격 (초)
+    """
+    dir_path = os.path.dirname(os.path.abspath(path))
+    os.makedirs(dir_path, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=dir_path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if snapshots > 0 and os.path.exists(path):
+            now = time.monotonic()
+            last = _last_snapshot_time.get(path)
+            if last is None or now - last >= snapshot_interval:
+                try:
+                    _take_snapshot(path, snapshots)
+                    _last_snapshot_time[path] = now
+                except OSError as e:
+                    logger.warning("스냅샷 생성 실패 (저장은 계속 진행): %s", e)
+
+        os.replace(temp_path, path)
+        _fsync_dir(dir_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_json_with_recovery(path, default=None, validate=None):
+    """JSON 파일 로드 (손상 시 최신 유효 스냅샷으로 자동 복구)
+
+    복구에 성공하면 손상된 파일은 <파일명>.corrupt-<시각>으로 보관하고
+    복구된 내용으로 원본을 다시 저장한다.
+
+    Args:
+        path (str): 파일 경로
+        default: 파일이 없거나 복구할 수 없을 때 반환할 값
+        validate (callable, optional): 로드된 데이터가 유효한지 검사하는 함수
+
+    Returns:
+        로드된 데이터 또는 default
+    """
+    if not os.path.exists(path):
+        return default
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if validate is None or validate(data):
+            return data
+        logger.error("데이터 형식이 올바르지 않습니다: %s", path)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+        logger.error("데이터 파일 손상 감지: %s (%s)", path, e)
+
+    # 손상된 원본은 덮어쓰지 않도록 따로 보관
+    corrupt_path = f"{path}.corrupt-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    try:
+        os.replace(path, corrupt_path)
+        logger.warning("손상된 파일 보관: %s", corrupt_path)
+    except OSError as e:
+        logger.error("손상된 파일 보관 실패: %s", e)
+
+    for snapshot_path in list_snapshots(path):
+        try:
+            with open(snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if validate is not None and not validate(data):
+                continue
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+            continue
+
+        logger.warning("스냅샷에서 복구: %s", snapshot_path)
+        try:
+            atomic_write_json(path, data, snapshots=0)
+        except OSError as e:
+            logger.error("복구 데이터 저장 실패: %s", e)
+        return data
+
+    logger.error("복구 가능한 스냅샷이 없습니다: %s", path)
+    return default
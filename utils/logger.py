@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+로깅 설정
+
+모든 모듈은 print 대신 get_logger("<하위 시스템>")로 얻은 로거를 사용한다.
+메시지는 logger.debug("작업 %d개", count)처럼 인자를 따로 넘겨, 해당 레벨이
+꺼져 있으면 문자열을 만들지 않도록 한다. 반복문에서 여러 줄을 남기는 경우에는
+logger.isEnabledFor(logging.DEBUG)로 먼저 확인한다.
+
+기본 레벨은 INFO이며 디버그 모드는 꺼져 있다. 다음 방법으로 조정할 수 있다.
+    - data/logging_settings.json
+        {"debug": false, "level": "INFO", "levels": {"storage": "DEBUG"}}
+    - 환경 변수 TODOLIST_DEBUG=1 (디버그 모드)
+    - setup_logging(debug=True, levels={...})
+
+로그는 콘솔과 logs/app.log(크기 기준 순환)에 기록된다.
+"""
+
+import json
+import logging
+import os
+from logging.handlers import RotatingFileHandler
+
+# 최상위 로거 이름 (하위 시스템 로거는 "todolist.<이름>")
+ROOT_LOGGER_NAME = "todolist"
+
+LOG_DIR = "logs"
+LOG_FILE_NAME = "app.log"
+LOG_FILE_MAX_BYTES = 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+
+LOGGING_SETTINGS_FILE = os.path.join("data", "logging_settings.json")
+DEBUG_ENV_VAR = "TODOLIST_DEBUG"
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+CONSOLE_FORMAT = "[%(levelname)s] %(name)s: %(message)s"
+
+
+def get_logger(subsystem):
+    """하위 시스템 로거 조회
+
+    Args:
+        subsystem (str): 하위 시스템 이름 (예: "storage", "email", "ui")
+
+    Returns:
+        logging.Logger: 로거
+    """
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{subsystem}")
+
+
+def load_logging_settings(settings_file=LOGGING_SETTINGS_FILE):
+    """로깅 설정 파일 로드 (없거나 잘못되면 빈 설정)"""
+    try:
+        with open(settings_file, "r", encoding="utf-8") as f:
+            settings = json.load(f)
+        return settings if isinstance(settings, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _parse_level(level, default):
+    """레벨 이름 또는 숫자를 logging 레벨로 변환"""
+    if isinstance(level, int):
+        return level
+    if isinstance(level, str):
+        value = logging.getLevelName(level.upper())
+        if isinstance(value, int):
+            return value
+    return default
+
+
+def setup_logging(debug=None, level=None, levels=None, log_dir=LOG_DIR, console=True,
+                  settings_file=LOGGING_SETTINGS_FILE):
+    """로깅 초기화 (프로그램 시작 시 한 번 호출)
+
+    인자로 지정하지 않은 항목은 설정 파일과 환경 변수를 따른다.
+
+    Args:
+        debug (bool, optional): 디버그 모드 (모든 하위 시스템 DEBUG)
+        level (str, optional): 기본 레벨. 기본값은 INFO
+        levels (dict, optional): 하위 시스템별 레벨 (예: {"storage": "DEBUG"})
+        log_dir (str, optional): 로그 파일 디렉토리. None이면 파일에 기록하지 않음
+        console (bool, optional): 콘솔 출력 여부
+        settings_file (str, optional): 로깅 설정 파일 경로
+
+    Returns:
+        str: 로그 파일 경로 (파일에 기록하지 않으면 None)
+    """
+    settings = load_logging_settings(settings_file)
+
+    if debug is None:
+        debug = bool(settings.get("debug", False)) or os.environ.get(DEBUG_ENV_VAR, "") not in ("", "0")
+    base_level = logging.DEBUG if debug else _parse_level(level or settings.get("level"), logging.INFO)
+
+    subsystem_levels = dict(settings.get("levels") or {})
+    subsystem_levels.update(levels or {})
+
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    root_logger.setLevel(base_level)
+    root_logger.propagate = False
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        handler.close()
+
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        root_logger.addHandler(console_handler)
+
+    log_file = None
+    if log_dir:
+        try:
+            os.makedirs(log_dir, exist_ok=True)
+            log_file = os.path.join(log_dir, LOG_FILE_NAME)
+            file_handler = RotatingFileHandler(log_file, maxBytes=LOG_FILE_MAX_BYTES,
+                                               backupCount=LOG_FILE_BACKUP_COUNT, encoding="utf-8")
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            root_logger.addHandler(file_handler)
+        except OSError as e:
+            log_file = None
+            root_logger.warning("로그 파일을 열 수 없습니다: %s", e)
+
+    for subsystem, subsystem_level in subsystem_levels.items():
+        get_logger(subsystem).setLevel(_parse_level(subsystem_level, logging.NOTSET))
+
+    return log_file
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+메일 발송 대기열 (outbox)
+
+메일 내용은 호출한 스레드에서 만들고 data/outbox/pending/에 파일로 넣기만 한다.
+실제 발송(Outlook/SMTP 호출)은 백그라운드 워커가 정해진 동시 발송 수 안에서
+처리하므로 GUI 스레드가 멈추지 않는다.
+
+    data/outbox/pending/<id>.json   발송 대기 (재시도 대기 포함)
+    data/outbox/sending/<id>.json   발송 중
+    data/outbox/sent/<id>.json      발송 완료 (중복 확인용으로 일정 기간 보관)
+    data/outbox/failed/<id>.json    재시도 횟수 초과
+
+발송할 항목은 pending에서 sending으로 이름을 바꿔(os.replace) 가져오므로, GUI와
+발송 데몬이 같은 대기열을 함께 처리해도 한 항목은 한 번만 발송된다. 실패하면
+지수적으로 늘어나는 간격 뒤에 다시 시도한다.
+
+중복 키(예: 루틴 ID + 날짜)를 주면 항목 ID를 키에서 만들어, 같은 키의 메일이 이미
+대기 중이거나 발송되었으면 다시 넣지 않는다.
+"""
+
+import hashlib
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from utils.durable_io import atomic_write_json, load_json_with_recovery
+from utils.logger import get_logger
+from utils.mail_transport import MailMessage, get_transport, init_mail_thread
+
+logger = get_logger("email")
+
+OUTBOX_DIR_NAME = "outbox"
+PENDING, SENDING, SENT, FAILED = "pending", "sending", "sent", "failed"
+
+# 동시에 발송하는 최대 메일 수
+MAX_CONCURRENCY = 2
+# 이 횟수만큼 실패하면 failed로 옮기고 더 이상 시도하지 않음
+MAX_ATTEMPTS = 6
+# 재시도 간격 (초): 30초, 1분, 2분, ... 최대 1시간
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+# 다른 프로세스가 넣은 항목을 확인하는 간격 (초)
+POLL_INTERVAL = 5.0
+# 발송 중 상태로 이 시간(초) 넘게 남은 항목은 발송하던 프로세스가 종료된 것으로 보고 다시 대기
+STALE_SENDING_SECONDS = 600
+# 발송 완료 항목 보관 기간 (초). 이 기간 안에는 같은 중복 키로 다시 넣지 않음
+SENT_RETENTION_SECONDS = 7 * 24 * 3600
+
+
+def retry_delay(attempts):
+    """실패 횟수에 따른 재시도 대기 시간 (초)"""
+    return min(RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), RETRY_MAX_SECONDS)
+
+
+def dedup_entry_id(dedup_key):
+    """중복 키로 만든 항목 ID (같은 키는 항상 같은 파일 이름)"""
+    return "k" + hashlib.sha1(dedup_key.encode("utf-8")).hexdigest()[:24]
+
+
+class Outbox:
+    """파일 기반 메일 발송 대기열과 발송 워커
+
+    상태 리스너는 callback(entry, status)로 호출된다. status는 "queued", "sent",
+    "retry", "failed" 중 하나이며, 발송 워커 스레드에서 호출될 수 있다.
+    """
+
+    def __init__(self, data_dir="data", max_concurrency=MAX_CONCURRENCY, clock=time.time):
+        """발송 대기열 초기화
+
+        Args:
+            data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+            max_concurrency (int, optional): 동시에 발송하는 최대 메일 수
+            clock (callable, optional): 현재 시각(epoch 초) 함수 (테스트용)
+        """
+        self.data_dir = data_dir
+        self.root = os.path.join(data_dir, OUTBOX_DIR_NAME)
+        self.max_concurrency = max(1, max_concurrency)
+        self.clock = clock
+
+        self.status_listeners = []
+        self._due_times = {}     # pending 항목 ID -> 다음 시도 시각 (파일을 매번 읽지 않도록)
+        self._in_flight = set()
+        self._cond = threading.Condition()
+        self._worker = None
+        self._executor = None
+        self._stopping = False
+
+    # --- 파일 ---
+
+    def _dir(self, state):
+        return os.path.join(self.root, state)
+
+    def _path(self, state, entry_id):
+        return os.path.join(self.root, state, f"{entry_id}.json")
+
+    def _read(self, path):
+        return load_json_with_recovery(path, validate=lambda data: isinstance(data, dict))
+
+    def _write(self, state, entry):
+        atomic_write_json(self._path(state, entry["id"]), entry, snapshots=0)
+
+    def _list_ids(self, state):
+        try:
+            names = os.listdir(self._dir(state))
+        except FileNotFoundError:
+            return []
+        return [name[:-len(".json")] for name in names if name.endswith(".json")]
+
+    # --- 상태 알림 ---
+
+    def add_status_listener(self, callback):
+        """발송 상태 변경 리스너 등록"""
+        if callback not in self.status_listeners:
+            self.status_listeners.append(callback)
+
+    def remove_status_listener(self, callback):
+        """발송 상태 변경 리스너 해제"""
+        if callback in self.status_listeners:
+            self.status_listeners.remove(callback)
+
+    def _notify(self, entry, status):
+        for callback in list(self.status_listeners):
+            try:
+                callback(entry, status)
+            except Exception as e:
+                logger.error("발송 상태 리스너 오류: %s", e)
+
+    # --- 대기열 ---
+
+    def enqueue(self, message, dedup_key=None, description=None):
+        """메일을 발송 대기열에 추가
+
+        Args:
+            message (MailMessage): 발송할 메일
+            dedup_key (str, optional): 중복 키. 같은 키의 메일이 대기/발송 중이거나 이미 발송되었으면 추가하지 않음
+            description (str, optional): 상태 표시용 설명. 기본값은 메일 제목
+
+        Returns:
+            str: 추가된 항목 ID (중복으로 추가하지 않았으면 None)
+        """
+        entry_id = dedup_entry_id(dedup_key) if dedup_key else uuid.uuid4().hex
+        if dedup_key:
+            for state in (PENDING, SENDING, SENT):
+                if os.path.exists(self._path(state, entry_id)):
+                    logger.info("이미 발송 대기열에 있는 메일이라 건너뜁니다: %s", dedup_key)
+                    return None
+            # 재시도 횟수를 넘겨 실패한 메일은 다시 넣을 수 있음
+            try:
+                os.remove(self._path(FAILED, entry_id))
+            except FileNotFoundError:
+                pass
+
+        now = self.clock()
+        entry = {
+            "id": entry_id,
+            "dedup_key": dedup_key,
+            "description": description or message.subject,
+            "subject": message.subject,
+            "recipients": message.recipients,
+            "html_body": message.html_body,
+            "text_body": message.text_body,
+            "created": datetime.fromtimestamp(now).isoformat(timespec="seconds"),
+            "attempts": 0,
+            "next_attempt_at": now,
+            "last_error": None,
+        }
+        self._write(PENDING, entry)
+        logger.info("메일 발송 대기열 추가: %s (수신자 %d명)", entry["description"], len(message.recipients))
+
+        with self._cond:
+            self._due_times[entry_id] = now
+            self._cond.notify_all()
+        self._notify(entry, "queued")
+        return entry_id
+
+    def pending_count(self):
+        """발송 대기/발송 중인 메일 수"""
+        return len(self._list_ids(PENDING)) + len(self._list_ids(SENDING))
+
+    def failed_entries(self):
+        """재시도 횟수를 넘겨 실패한 항목 목록"""
+        entries = [self._read(self._path(FAILED, entry_id)) for entry_id in self._list_ids(FAILED)]
+        return [entry for entry in entries if entry]
+
+    def _refresh_due_times(self):
+        """pending 디렉토리의 항목과 다음 시도 시각 갱신 (새 항목만 파일을 읽음)"""
+        pending_ids = set(self._list_ids(PENDING))
+        for entry_id in list(self._due_times):
+            if entry_id not in pending_ids:
+                del self._due_times[entry_id]
+        for entry_id in pending_ids - self._due_times.keys():
+            entry = self._read(self._path(PENDING, entry_id))
+            if entry is not None:
+                self._due_times[entry_id] = entry.get("next_attempt_at", 0)
+
+    def _claim(self, entry_id):
+        """pending 항목을 sending으로 옮겨 가져오기 (다른 프로세스가 먼저 가져갔으면 None)"""
+        os.makedirs(self._dir(SENDING), exist_ok=True)
+        sending_path = self._path(SENDING, entry_id)
+        try:
+            os.replace(self._path(PENDING, entry_id), sending_path)
+        except FileNotFoundError:
+            return None
+
+        entry = self._read(sending_path)
+        if entry is None:
+            return None
+        if entry.get("next_attempt_at", 0) > self.clock():
+            # 다른 프로세스가 재시도 시각을 늦춰 둔 항목
+            os.replace(sending_path, self._path(PENDING, entry_id))
+            self._due_times[entry_id] = entry["next_attempt_at"]
+            return None
+        # 발송 중 상태가 오래 남은 항목을 판단하는 기준 시각
+        os.utime(sending_path)
+        return entry
+
+    def recover_stale(self):
+        """발송하던 프로세스가 종료되어 sending에 남은 항목을 다시 대기 상태로"""
+        now = time.time()
+        for entry_id in self._list_ids(SENDING):
+            if entry_id in self._in_flight:
+                continue
+            path = self._path(SENDING, entry_id)
+            try:
+                if now - os.stat(path).st_mtime < STALE_SENDING_SECONDS:
+                    continue
+                os.makedirs(self._dir(PENDING), exist_ok=True)
+                os.replace(path, self._path(PENDING, entry_id))
+                logger.warning("발송이 끝나지 않은 메일을 다시 대기열에 넣습니다: %s", entry_id)
+            except FileNotFoundError:
+                continue
+
+    def prune_sent(self):
+        """보관 기간이 지난 발송 완료 항목 삭제"""
+        cutoff = time.time() - SENT_RETENTION_SECONDS
+        for entry_id in self._list_ids(SENT):
+            path = self._path(SENT, entry_id)
+            try:
+                if os.stat(path).st_mtime < cutoff:
+                    os.remove(path)
+            except FileNotFoundError:
+                continue
+
+    # --- 발송 ---
+
+    def _deliver(self, entry):
+        """가져온 항목 하나 발송 후 결과에 따라 sent/pending/failed로 옮기기"""
+        entry_id = entry["id"]
+        sending_path = self._path(SENDING, entry_id)
+        message = MailMessage(entry["subject"], entry["recipients"], entry.get("html_body"), entry.get("text_body"))
+        try:
+            get_transport(self.data_dir).send(message)
+        except Exception as e:
+            entry["attempts"] = entry.get("attempts", 0) + 1
+            entry["last_error"] = str(e)
+            if entry["attempts"] >= MAX_ATTEMPTS:
+                state, status = FAILED, "failed"
+                logger.error("메일 발송 실패 (%d회 시도, 중단): %s - %s", entry["attempts"], entry["description"], e)
+            else:
+                state, status = PENDING, "retry"
+                entry["next_attempt_at"] = self.clock() + retry_delay(entry["attempts"])
+                logger.warning("메일 발송 실패 (%d회째, %d초 후 재시도): %s - %s", entry["attempts"],
+                               retry_delay(entry["attempts"]), entry["description"], e)
+        else:
+            entry["attempts"] = entry.get("attempts", 0) + 1
+            entry["last_error"] = None
+            entry["sent_at"] = datetime.fromtimestamp(self.clock()).isoformat(timespec="seconds")
+            # 중복 확인에 필요한 정보만 남김
+            entry.pop("html_body", None)
+            entry.pop("text_body", None)
+            state, status = SENT, "sent"
+            logger.info("메일 발송 완료: %s", entry["description"])
+
+        self._write(SENDING, entry)
+        os.makedirs(self._dir(state), exist_ok=True)
+        os.replace(sending_path, self._path(state, entry_id))
+        if state == PENDING:
+            with self._cond:
+                self._due_times[entry_id] = entry["next_attempt_at"]
+        self._notify(entry, status)
+
+    def process_due(self):
+        """발송 시각이 된 항목을 현재 스레드에서 모두 발송 (워커 없이 한 번 처리할 때)
+
+        Returns:
+            int: 발송을 시도한 항목 수
+        """
+        self.recover_stale()
+        self._refresh_due_times()
+        now = self.clock()
+        count = 0
+        for entry_id, due_time in sorted(self._due_times.items(), key=lambda item: item[1]):
+            if due_time > now:
+                continue
+            entry = self._claim(entry_id)
+            if entry is None:
+                continue
+            self._deliver(entry)
+            count += 1
+        return count
+
+    def _deliver_in_worker(self, entry):
+        try:
+            self._deliver(entry)
+        except Exception as e:
+            logger.error("메일 발송 처리 중 오류: %s (%s)", entry.get("id"), e)
+        finally:
+            with self._cond:
+                self._in_flight.discard(entry["id"])
+                self._cond.notify_all()
+
+    def _run(self):
+        """워커 루프: 발송 시각이 된 항목을 동시 발송 수 안에서 발송 스레드에 넘김"""
+        self.recover_stale()
+        self.prune_sent()
+        last_poll = 0.0
+        with self._cond:
+            while not self._stopping:
+                now = self.clock()
+                if time.monotonic() - last_poll >= POLL_INTERVAL:
+                    self._refresh_due_times()
+                    last_poll = time.monotonic()
+
+                due_ids = sorted((due_time, entry_id) for entry_id, due_time in self._due_times.items()
+                                 if due_time <= now and entry_id not in self._in_flight)
+                for _, entry_id in due_ids:
+                    if len(self._in_flight) >= self.max_concurrency:
+                        break
+                    self._due_times.pop(entry_id, None)
+                    entry = self._claim(entry_id)
+                    if entry is None:
+                        continue
+                    self._in_flight.add(entry_id)
+                    self._executor.submit(self._deliver_in_worker, entry)
+
+                # 다음 재시도 시각, 발송 완료 또는 새 항목 추가 중 먼저 오는 시점까지 대기
+                timeout = POLL_INTERVAL
+                waiting = [due_time for entry_id, due_time in self._due_times.items()
+                           if entry_id not in self._in_flight]
+                if waiting and len(self._in_flight) < self.max_concurrency:
+                    timeout = min(timeout, max(min(waiting) - now, 0.05))
+                self._cond.wait(timeout)
+
+    def start(self):
+        """백그라운드 발송 워커 시작 (이미 실행 중이면 무시)"""
+        if self._worker is not None:
+            return
+        self._stopping = False
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="outbox",
+                                            initializer=init_mail_thread)
+        self._worker = threading.Thread(target=self._run, name="outbox-worker", daemon=True)
+        self._worker.start()
+
+    def stop(self, wait=True):
+        """발송 워커 종료 (대기 중인 메일은 파일로 남아 다음 실행 때 발송)
+
+        Args:
+            wait (bool, optional): 발송 중인 메일이 끝날 때까지 기다릴지 여부
+        """
+        if self._worker is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._worker.join()
+        self._executor.shutdown(wait=wait)
+        self._worker = None
+        self._executor = None
+
+
+# 데이터 디렉토리별 대기열 (프로세스 안에서는 하나만 사용)
+_outboxes = {}
+_outboxes_lock = threading.Lock()
+
+
+def get_outbox(data_dir="data"):
+    """데이터 디렉토리의 발송 대기열
+
+    Args:
+        data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+
+    Returns:
+        Outbox: 발송 대기열
+    """
+    key = os.path.abspath(data_dir)
+    with _outboxes_lock:
+        outbox = _outboxes.get(key)
+        if outbox is None:
+            outbox = _outboxes[key] = Outbox(data_dir)
+        return outbox
+
+
+def queue_mail(message, data_dir="data", dedup_key=None, description=None):
+    """메일을 발송 대기열에 추가 (발송은 워커가 처리)
+
+    Args:
+        message (MailMessage): 발송할 메일
+        data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+        dedup_key (str, optional): 중복 키
+        description (str, optional): 상태 표시용 설명
+
+    Returns:
+        str: 추가된 항목 ID (중복으로 추가하지 않았으면 None)
+    """
+    return get_outbox(data_dir).enqueue(message, dedup_key, description)
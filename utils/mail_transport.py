@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+메일 발송 방식(transport)
+
+메일 내용(제목, 수신자, 본문)은 MailMessage로 만들고 실제 발송은 설정에서 고른
+transport가 담당한다.
+    - outlook: 로컬 Outlook(pywin32)으로 발송 (기본값)
+    - smtp: smtplib로 SMTP 서버에 직접 발송. 연결을 유지하여 다음 메일에 재사용
+    - file: 보내지 않고 maildir 형식 디렉토리에 .eml로 저장 (점검/오프라인 테스트용)
+
+설정은 data/email_settings.json의 "transport" 항목에 둔다.
+    {"transport": {"type": "smtp", "host": "smtp.example.com", "port": 587,
+                   "username": "...", "password": "...", "starttls": true,
+                   "sender": "todolist@example.com"}}
+
+오프라인 테스트는 utils/smtp_standin.py의 로컬 SMTP 서버를 host/port로 지정하면 된다.
+"""
+
+import mailbox
+import os
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+from email.utils import formatdate, make_msgid
+
+from utils.durable_io import load_json_with_recovery
+from utils.logger import get_logger
+
+logger = get_logger("email")
+
+EMAIL_SETTINGS_FILE = "email_settings.json"
+DEFAULT_TRANSPORT = "outlook"
+FILE_SINK_DIR_NAME = "mail_sink"
+
+# SMTP 연결을 재사용하기 전 NOOP으로 살아 있는지 확인하는 유휴 시간 (초)
+SMTP_IDLE_CHECK_SECONDS = 30
+# 이 시간(초) 넘게 쓰지 않은 SMTP 연결은 닫고 새로 연결 (서버 쪽 유휴 종료 대비)
+SMTP_IDLE_CLOSE_SECONDS = 300
+
+PYWIN32_MISSING_MESSAGE = ("pywin32 라이브러리가 설치되지 않았습니다.\n\n설치 방법:\n"
+                           "1. 명령 프롬프트를 관리자 권한으로 실행\n"
+                           "2. 'pip install pywin32' 입력\n3. 프로그램 재시작")
+
+
+def init_mail_thread():
+    """발송 스레드 초기화 (Outlook COM은 스레드마다 초기화 필요)"""
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except ImportError:
+        pass
+
+
+class MailMessage:
+    """발송할 메일
+
+    Attributes:
+        subject (str): 제목
+        recipients (list): 수신자 주소 목록
+        html_body (str): HTML 본문 (없으면 text_body만 사용)
+        text_body (str): 일반 텍스트 본문
+    """
+
+    __slots__ = ("subject", "recipients", "html_body", "text_body")
+
+    def __init__(self, subject, recipients, html_body=None, text_body=None):
+        self.subject = subject
+        self.recipients = [address for address in recipients if address]
+        self.html_body = html_body
+        self.text_body = text_body
+
+    def __repr__(self):
+        return f"MailMessage(subject={self.subject!r}, recipients={self.recipients!r})"
+
+    def to_mime(self, sender):
+        """MIME 메시지로 변환 (SMTP/파일 저장용)
+
+        Args:
+            sender (str): 보내는 사람 주소
+
+        Returns:
+            EmailMessage: MIME 메시지
+        """
+        mime = EmailMessage()
+        mime["Subject"] = self.subject
+        mime["From"] = sender
+        mime["To"] = ", ".join(self.recipients)
+        mime["Date"] = formatdate(localtime=True)
+        mime["Message-ID"] = make_msgid(domain="todolist.local")
+        mime.set_content(self.text_body or "")
+        if self.html_body is not None:
+            mime.add_alternative(self.html_body, subtype="html")
+        return mime
+
+
+class MailTransport:
+    """메일 발송 방식 기본 클래스
+
+    send()는 실패 시 예외를 그대로 올리므로 호출하는 쪽에서 오류를 처리한다.
+    """
+
+    name = ""
+
+    def check_availability(self):
+        """발송 가능 여부 확인
+
+        Returns:
+            tuple: (사용 가능 여부, 불가 사유 메시지)
+        """
+        return True, ""
+
+    def send(self, message):
+        """메일 발송
+
+        Args:
+            message (MailMessage): 발송할 메일
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """열려 있는 연결 정리"""
+
+
+class OutlookTransport(MailTransport):
+    """로컬 Outlook으로 발송 (Windows + pywin32 필요)
+
+    Outlook COM 객체는 만든 스레드에서만 쓸 수 있으므로 발송할 때마다 가져온다.
+    """
+
+    name = "outlook"
+
+    def __init__(self, **options):
+        pass
+
+    def _dispatch(self):
+        import win32com.client as win32
+        return win32.Dispatch("outlook.application")
+
+    def check_availability(self):
+        """Outlook 연결 가능 여부 확인"""
+        try:
+            self._dispatch()
+        except ImportError:
+            return False, PYWIN32_MISSING_MESSAGE
+        except Exception as e:
+            return False, f"Outlook 연결에 실패했습니다:\n{str(e)}\n\nOutlook이 설치되어 있고 로그인되어 있는지 확인하세요."
+        return True, ""
+
+    def send(self, message):
+        """Outlook 메일 항목을 만들어 발송"""
+        mail = self._dispatch().CreateItem(0)
+        mail.Subject = message.subject
+        mail.To = "; ".join(message.recipients)
+        if message.html_body is not None:
+            mail.HTMLBody = message.html_body
+        else:
+            mail.Body = message.text_body or ""
+        mail.Send()
+
+
+class SmtpTransport(MailTransport):
+    """SMTP 서버로 직접 발송 (연결 재사용)
+
+    한 번 연결하면 닫지 않고 다음 발송에 다시 쓴다. 오래 쉬었던 연결은 NOOP으로
+    확인하고, 발송 중 연결이 끊어져 있으면 한 번 다시 연결하여 재시도한다.
+    여러 스레드에서 호출해도 연결은 하나만 쓰도록 잠금으로 보호한다.
+    """
+
+    name = "smtp"
+
+    def __init__(self, host="localhost", port=None, username=None, password=None, sender=None,
+                 starttls=False, ssl=False, timeout=30, **options):
+        """SMTP 발송 방식 초기화
+
+        Args:
+            host (str, optional): SMTP 서버 주소
+            port (int, optional): 포트. 기본값은 ssl이면 465, 아니면 25
+            username (str, optional): 로그인 사용자 (없으면 인증하지 않음)
+            password (str, optional): 로그인 비밀번호
+            sender (str, optional): 보내는 사람 주소. 기본값은 username
+            starttls (bool, optional): 연결 후 STARTTLS 사용 여부
+            ssl (bool, optional): 처음부터 SSL로 연결할지 여부
+            timeout (float, optional): 소켓 타임아웃 (초)
+        """
+        self.host = host
+        self.port = int(port) if port else (465 if ssl else 25)
+        self.username = username
+        self.password = password
+        self.sender = sender or username or "todolist@localhost"
+        self.starttls = starttls
+        self.ssl = ssl
+        self.timeout = timeout
+
+        self._connection = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+        self.connect_count = 0  # 새로 연결한 횟수 (재사용 확인용)
+
+    def _connect(self):
+        """SMTP 서버에 새로 연결하고 로그인"""
+        smtp_class = smtplib.SMTP_SSL if self.ssl else smtplib.SMTP
+        connection = smtp_class(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls and not self.ssl:
+                connection.starttls()
+            if self.username:
+                connection.login(self.username, self.password or "")
+        except Exception:
+            connection.close()
+            raise
+        self.connect_count += 1
+        logger.debug("SMTP 연결: %s:%s", self.host, self.port)
+        return connection
+
+    def _drop_connection(self):
+        """현재 연결 닫기 (이미 끊어진 연결이어도 무시)"""
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            connection.close()
+
+    def _get_connection(self):
+        """재사용할 연결 (없거나 끊어졌으면 새로 연결)"""
+        if self._connection is not None:
+            idle = time.monotonic() - self._last_used
+            if idle > SMTP_IDLE_CLOSE_SECONDS:
+                self._drop_connection()
+            elif idle > SMTP_IDLE_CHECK_SECONDS:
+                try:
+                    if self._connection.noop()[0] != 250:
+                        self._drop_connection()
+                except (smtplib.SMTPException, OSError):
+                    self._drop_connection()
+        if self._connection is None:
+            self._connection = self._connect()
+        return self._connection
+
+    def check_availability(self):
+        """SMTP 서버 연결 가능 여부 확인 (연결은 이후 발송에 재사용)"""
+        with self._lock:
+            try:
+                self._get_connection()
+                self._last_used = time.monotonic()
+            except (smtplib.SMTPException, OSError) as e:
+                return False, f"SMTP 서버 연결에 실패했습니다:\n{self.host}:{self.port}\n{e}"
+        return True, ""
+
+    def send(self, message):
+        """SMTP로 발송 (끊어진 연결이면 한 번 다시 연결하여 재시도)"""
+        mime = message.to_mime(self.sender)
+        with self._lock:
+            try:
+                self._get_connection().send_message(mime, self.sender, message.recipients)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPHeloError, ConnectionError):
+                self._drop_connection()
+                self._get_connection().send_message(mime, self.sender, message.recipients)
+            self._last_used = time.monotonic()
+
+    def close(self):
+        """SMTP 연결 종료"""
+        with self._lock:
+            self._drop_connection()
+
+
+class FileSinkTransport(MailTransport):
+    """보내지 않고 maildir 디렉토리에 저장
+
+    maildir 규칙대로 tmp/에 쓴 뒤 new/로 옮기므로, 다른 프로세스가 new/를 읽을 때
+    쓰는 중인 파일을 보는 일이 없다.
+    """
+
+    name = "file"
+
+    def __init__(self, path=None, sender=None, data_dir="data", **options):
+        """파일 저장 방식 초기화
+
+        Args:
+            path (str, optional): maildir 경로. 기본값은 data_dir/mail_sink
+            sender (str, optional): 보내는 사람 주소
+            data_dir (str, optional): 데이터 디렉토리
+        """
+        self.path = path or os.path.join(data_dir, FILE_SINK_DIR_NAME)
+        self.sender = sender or "todolist@localhost"
+        self._maildir = None
+        self._lock = threading.Lock()
+
+    def _get_maildir(self):
+        if self._maildir is None:
+            self._maildir = mailbox.Maildir(self.path, create=True)
+        return self._maildir
+
+    def check_availability(self):
+        """저장 디렉토리 생성 가능 여부 확인"""
+        with self._lock:
+            try:
+                self._get_maildir()
+            except OSError as e:
+                return False, f"메일 저장 디렉토리를 만들 수 없습니다:\n{self.path}\n{e}"
+        return True, ""
+
+    def send(self, message):
+        """메일을 maildir의 new/에 저장"""
+        mime = message.to_mime(self.sender)
+        with self._lock:
+            key = self._get_maildir().add(mime)
+        logger.debug("메일 파일 저장: %s (%s)", message.subject, key)
+
+
+TRANSPORT_TYPES = {
+    OutlookTransport.name: OutlookTransport,
+    SmtpTransport.name: SmtpTransport,
+    FileSinkTransport.name: FileSinkTransport,
+}
+
+# 데이터 디렉토리별 (설정, transport). 설정이 같으면 같은 객체(SMTP 연결)를 재사용
+_transports = {}
+_transports_lock = threading.Lock()
+
+
+def load_transport_settings(data_dir="data"):
+    """메일 설정의 transport 항목 읽기
+
+    Args:
+        data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+
+    Returns:
+        dict: transport 설정 (없으면 Outlook 기본 설정)
+    """
+    settings = load_json_with_recovery(os.path.join(data_dir, EMAIL_SETTINGS_FILE), default={},
+                                       validate=lambda data: isinstance(data, dict))
+    transport_settings = settings.get("transport")
+    if isinstance(transport_settings, str):
+        return {"type": transport_settings}
+    if isinstance(transport_settings, dict):
+        return dict(transport_settings)
+    return {"type": DEFAULT_TRANSPORT}
+
+
+def create_transport(transport_settings, data_dir="data"):
+    """설정으로 transport 생성
+
+    Args:
+        transport_settings (dict): transport 설정 ("type"과 각 방식의 옵션)
+        data_dir (str, optional): 데이터 디렉토리 (파일 저장 기본 경로 기준)
+
+    Returns:
+        MailTransport: 생성된 transport
+    """
+    options = dict(transport_settings)
+    transport_type = options.pop("type", DEFAULT_TRANSPORT)
+    transport_class = TRANSPORT_TYPES.get(transport_type)
+    if transport_class is None:
+        logger.warning("알 수 없는 메일 발송 방식 '%s': %s 사용", transport_type, DEFAULT_TRANSPORT)
+        transport_class = TRANSPORT_TYPES[DEFAULT_TRANSPORT]
+    if transport_class is FileSinkTransport:
+        options["data_dir"] = data_dir
+    return transport_class(**options)
+
+
+def get_transport(data_dir="data"):
+    """현재 설정의 transport (설정이 바뀌지 않았으면 이전 객체 재사용)
+
+    Args:
+        data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+
+    Returns:
+        MailTransport: 발송에 사용할 transport
+    """
+    transport_settings = load_transport_settings(data_dir)
+    key = os.path.abspath(data_dir)
+    with _transports_lock:
+        cached = _transports.get(key)
+        if cached is not None and cached[0] == transport_settings:
+            return cached[1]
+        if cached is not None:
+            cached[1].close()
+        transport = create_transport(transport_settings, data_dir)
+        _transports[key] = (transport_settings, transport)
+        return transport
+
+
+def close_transports():
+    """캐시된 모든 transport의 연결 정리 (종료 시)"""
+    with _transports_lock:
+        for _, transport in _transports.values():
+            transport.close()
+        _transports.clear()
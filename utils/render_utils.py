@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+리포트/화면 렌더링 공용 도구
+
+- escape_html: 사용자 입력을 HTML에 넣기 전에 변환
+- CategoryColorMap: 카테고리 이름 -> 색상 조회표
+
+StorageManager가 CategoryColorMap을 하나 보유하고 카테고리가 추가/삭제될 때마다
+다시 만들므로, 작업 행마다 카테고리 목록을 훑지 않고 storage_manager.category_colors에서
+바로 색상을 찾는다.
+"""
+
+DEFAULT_CATEGORY_COLOR = "#6c757d"
+
+
+def escape_html(text):
+    """HTML 특수문자 이스케이프
+
+    글자 단위 변환(str.translate 포함)은 한글처럼 ASCII가 아닌 문자열에서 느리므로
+    문자열 전체를 한 번에 훑는 str.replace를 특수문자마다 적용한다. &를 가장 먼저 바꾼다.
+    """
+    if not text:
+        return ""
+    return (text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            .replace('"', "&quot;").replace("'", "&#39;"))
+
+
+def escape_multiline(text):
+    """여러 줄 텍스트를 이스케이프하고 줄바꿈을 <br>로 변환"""
+    return escape_html(text).replace("\n", "<br>")
+
+
+class CategoryColorMap:
+    """카테고리 이름 -> 색상 조회표
+
+    Args:
+        categories (iterable, optional): Category 목록
+        default (str, optional): 없는 카테고리의 색상
+    """
+
+    def __init__(self, categories=(), default=DEFAULT_CATEGORY_COLOR):
+        self.default = default
+        self.rebuild(categories)
+
+    def rebuild(self, categories):
+        """카테고리 목록으로 조회표 다시 만들기 (같은 이름이 여러 개면 앞의 것이 우선)"""
+        colors = {}
+        for category in categories:
+            colors.setdefault(category.name, category.color)
+        self._colors = colors
+
+    def get(self, category_name, default=None):
+        """카테고리 색상 (없으면 default, 지정하지 않으면 기본 색상)"""
+        return self._colors.get(category_name, self.default if default is None else default)
+
+    def __contains__(self, category_name):
+        return category_name in self._colors
+
+    def __len__(self):
+        return len(self._colors)
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+HTML 메일 리포트 렌더러
+
+메일/루틴/데일리 리포트와 개별 일정 공유 메일이 모두 같은 Outlook 호환(테이블 기반)
+HTML을 사용하므로, 템플릿을 utils/report_templates/에 한 곳에 두고 여기서 조립한다.
+
+템플릿의 {{이름}} 자리는 처음 사용할 때 한 번 분석하여 고정 문자열과 값 자리의
+목록으로 만들어 두고, 렌더링할 때는 값만 채워 "".join으로 합친다. 같은 작업의 행
+HTML은 내용이 같으면 캐시된 조각을 재사용한다.
+
+템플릿에 넣는 값은 이미 HTML로 안전한 문자열이어야 한다. 사용자 입력(제목, 내용,
+카테고리 이름, 메모 등)은 escape_html로 변환한 뒤 넣는다. 이스케이프와 카테고리 색상
+조회는 utils.render_utils를 사용한다.
+"""
+
+import os
+import re
+from datetime import datetime
+from functools import lru_cache
+
+from utils.render_utils import CategoryColorMap, escape_html, escape_multiline
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "report_templates")
+# 작업 내용은 리포트에서 앞부분만 표시
+CONTENT_PREVIEW_LENGTH = 50
+# 중요 일정 섹션에 표시하는 최대 작업 수
+IMPORTANT_TASKS_LIMIT = 10
+# 작업 행 조각 캐시 크기
+ROW_CACHE_SIZE = 4096
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+# 리포트에 넣는 작업 목록 종류 (설정의 content_types 값, 섹션 제목)
+CONTENT_SECTIONS = (
+    ("all", "📋 전체 작업"),
+    ("completed", "✅ 완료된 작업"),
+    ("incomplete", "⏳ 미완료 작업"),
+)
+
+
+class CompiledTemplate:
+    """{{이름}} 자리를 미리 분석해 둔 템플릿"""
+
+    __slots__ = ("parts", "slots")
+
+    def __init__(self, source):
+        # 짝수 위치는 고정 문자열, 홀수 위치는 값 이름
+        self.parts = _PLACEHOLDER.split(source)
+        self.slots = tuple((i, self.parts[i]) for i in range(1, len(self.parts), 2))
+
+    def render(self, **values):
+        """값을 채운 문자열 (모든 값은 이미 HTML로 안전한 문자열이어야 함)"""
+        out = list(self.parts)
+        for i, name in self.slots:
+            out[i] = values[name]
+        return "".join(out)
+
+
+def compile_template(source):
+    """템플릿 문자열 분석"""
+    return CompiledTemplate(source)
+
+
+@lru_cache(maxsize=None)
+def load_template(name):
+    """utils/report_templates/<name>.html을 읽어 분석 (프로세스당 한 번)"""
+    with open(os.path.join(TEMPLATE_DIR, f"{name}.html"), "r", encoding="utf-8") as f:
+        return compile_template(f.read())
+
+
+# 작은 조각 템플릿
+_BANNER = compile_template(
+    '<table width="100%" cellpadding="{{padding}}" cellspacing="0" style="background-color: {{background}}; '
+    'border: 1px solid {{border}}; border-radius: 5px; margin-bottom: 20px;">\n'
+    '    <tr><td style="text-align: center;">{{content}}</td></tr>\n'
+    '</table>\n')
+_INFO_BANNER_CONTENT = compile_template(
+    '<strong style="color: {{color}}; font-size: 16px;">{{title}}</strong>\n'
+    '<div style="font-size: 12px; color: {{color}}; margin-top: 5px;">{{detail}}</div>')
+_BADGE = compile_template(
+    '<span style="background-color: {{color}}; color: white; padding: 2px 6px; border-radius: 10px; '
+    'font-size: 10px; margin-left: 5px;">{{text}}</span>')
+_CONTENT_ROW = compile_template(
+    '                <tr><td style="font-size: 12px; color: #666; padding-top: 5px;">{{content}}</td></tr>')
+_EMPTY_ROWS = '    <tr><td style="text-align: center; color: #666; padding: 20px;">해당하는 작업이 없습니다</td></tr>\n'
+_MEMO_ROW = compile_template(
+    '    <tr><td style="padding: 10px; background-color: #f8f9fa; border-radius: 5px;">{{memo}}</td></tr>\n')
+
+# 안내 배너 종류별 (배경, 테두리, 글자색)
+BANNER_STYLES = {
+    "test": ("#fff3cd", "#ffeaa7", "#856404"),
+    "routine": ("#e8f4fd", "#17a2b8", "#0c5460"),
+    "immediate": ("#fff3cd", "#ffc107", "#856404"),
+}
+
+
+@lru_cache(maxsize=ROW_CACHE_SIZE)
+def _task_row(title, content, category, category_color, completed, important, date_badge):
+    """작업 행 HTML (같은 내용의 행은 캐시된 조각 재사용)"""
+    if date_badge:
+        # 다른 날짜의 미완료 중요 일정
+        marker = "⭐ "
+        background, border_color, text_style = "#fff3e0", "#ff6b00", ""
+        badges = (_BADGE.render(color=category_color, text=escape_html(category))
+                  + _BADGE.render(color="#ff6b00", text=date_badge))
+    else:
+        marker = ("✅ " if completed else "⏳ ") + ("⭐ " if important else "")
+        background = "#f8f9fa"
+        border_color = "#4caf50" if completed else "#2196f3"
+        text_style = "text-decoration: line-through; color: #666;" if completed else ""
+        badges = _BADGE.render(color=category_color, text=escape_html(category))
+
+    content_row = _CONTENT_ROW.render(content=escape_html(content)) if content else ""
+    return load_template("task_row").render(
+        background=background, border_color=border_color, text_style=text_style, marker=marker,
+        title=escape_html(title), badges=badges, content_row=content_row)
+
+
+def report_timestamp(now=None):
+    """리포트에 표시하는 작성 시각"""
+    return (now or datetime.now()).strftime("%Y년 %m월 %d일 %H:%M")
+
+
+def report_date_label(date_str):
+    """YYYY-MM-DD를 리포트 표시 형식으로"""
+    return datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y년 %m월 %d일")
+
+
+class ReportRenderer:
+    """카테고리 색상을 알고 있는 리포트 렌더러
+
+    Args:
+        category_colors (CategoryColorMap | iterable): 배지 색상 조회표
+            (보통 storage_manager.category_colors). Category 목록을 주면 조회표를 새로 만든다.
+    """
+
+    def __init__(self, category_colors=()):
+        if not isinstance(category_colors, CategoryColorMap):
+            category_colors = CategoryColorMap(category_colors)
+        self.category_colors = category_colors
+
+    def category_color(self, category_name):
+        """카테고리 색상 (없는 카테고리는 기본 색상)"""
+        return self.category_colors.get(category_name)
+
+    # --- 조각 ---
+
+    def banner(self, kind, content):
+        """안내 배너
+
+        Args:
+            kind (str): "test", "routine", "immediate", "filter" 또는 "filter_all"
+            content (str): 배너 내용 HTML
+        """
+        if kind == "filter":
+            background, border = "#e8f4fd", "#bee5eb"
+        elif kind == "filter_all":
+            background, border = "#d4edda", "#c3e6cb"
+        else:
+            background, border, _ = BANNER_STYLES[kind]
+        padding = "15" if kind in ("routine", "immediate") else "10"
+        return _BANNER.render(padding=padding, background=background, border=border, content=content)
+
+    def test_banner(self):
+        """테스트 메일 안내"""
+        return self.banner("test", "<strong>🧪 테스트 메일입니다</strong>")
+
+    def info_banner(self, kind, title, detail):
+        """루틴/즉시 발송 안내 배너"""
+        color = BANNER_STYLES[kind][2]
+        return self.banner(kind, _INFO_BANNER_CONTENT.render(color=color, title=title, detail=escape_html(detail)))
+
+    def category_filter_banner(self, selected_categories):
+        """포함된 카테고리 안내 (None 또는 빈 목록이면 모든 카테고리)"""
+        if selected_categories:
+            names = escape_html(", ".join(selected_categories))
+            return self.banner("filter", f"<strong>📂 포함된 카테고리:</strong> {names}")
+        return self.banner("filter_all", "<strong>📂 포함된 카테고리:</strong> 모든 카테고리")
+
+    def summary(self, heading, total, completed):
+        """작업 수와 완료율 요약"""
+        completion_rate = f"{completed / total * 100:.0f}" if total else "0"
+        return load_template("summary").render(
+            heading=heading, total=str(total), completed=str(completed),
+            incomplete=str(total - completed), completion_rate=completion_rate)
+
+    def task_rows(self, tasks):
+        """작업 행 HTML 목록"""
+        color = self.category_color
+        return [
+            _task_row(task.title, (task.content or "")[:CONTENT_PREVIEW_LENGTH], task.category,
+                      color(task.category), task.completed, task.important, None)
+            for task in tasks
+        ]
+
+    def task_section(self, title, tasks, show_count=True):
+        """작업 목록 섹션"""
+        if show_count:
+            title = f"{title} ({len(tasks)}개)"
+        rows = "".join(self.task_rows(tasks)) if tasks else _EMPTY_ROWS
+        return load_template("section").render(title=title, rows=rows, accent_color="#e0e0e0", title_color="#333")
+
+    def content_sections(self, content_types, tasks_by_kind):
+        """설정에서 선택한 종류의 작업 목록 섹션들 (작업이 없는 종류는 생략)
+
+        Args:
+            content_types (iterable): "all", "completed", "incomplete" 중 포함할 종류
+            tasks_by_kind (dict): 종류별 작업 목록
+        """
+        return [self.task_section(title, tasks_by_kind[kind])
+                for kind, title in CONTENT_SECTIONS
+                if kind in content_types and tasks_by_kind.get(kind)]
+
+    def important_section(self, tasks):
+        """다른 날짜의 미완료 중요 일정 섹션 (없으면 빈 문자열)"""
+        if not tasks:
+            return ""
+        color = self.category_color
+        rows = "".join(
+            _task_row(task.title, (task.content or "")[:CONTENT_PREVIEW_LENGTH], task.category,
+                      color(task.category), task.completed, task.important,
+                      f"{task.created_date[5:7]}/{task.created_date[8:10]}")
+            for task in tasks[:IMPORTANT_TASKS_LIMIT]
+        )
+        return load_template("section").render(title="📌 미완료 중요 일정 (최근 30일)", rows=rows,
+                                                accent_color="#ff6b00", title_color="#ff6b00")
+
+    def memo_section(self, memo):
+        """추가 메모 섹션 (메모가 없으면 빈 문자열)"""
+        memo = (memo or "").strip()
+        if not memo:
+            return ""
+        return load_template("section").render(title="📝 추가 메모", rows=_MEMO_ROW.render(memo=escape_multiline(memo)),
+                                                accent_color="#e0e0e0", title_color="#333")
+
+    # --- 전체 문서 ---
+
+    def page(self, page_title, header_title, header_subtitle, blocks, footer):
+        """공통 메일 레이아웃으로 감싸기
+
+        Args:
+            page_title (str): 문서 제목
+            header_title (str): 머리글 제목
+            header_subtitle (str): 머리글 부제목 (작성 시각 등)
+            blocks (list): 본문에 차례로 넣을 HTML 조각
+            footer (str): 바닥글 HTML
+        """
+        return load_template("page").render(
+            page_title=page_title, header_title=header_title, header_subtitle=header_subtitle,
+            body="".join(block for block in blocks if block), footer=footer)
+
+    def render_report(self, *, page_title, header_title, header_subtitle, banners, summary_heading,
+                      total, completed, sections, footer):
+        """요약 + 작업 목록 형식의 리포트"""
+        blocks = list(banners)
+        blocks.append(self.summary(summary_heading, total, completed))
+        blocks.extend(sections)
+        return self.page(page_title, header_title, header_subtitle, blocks, footer)
+
+    def render_task_share(self, task, now=None, category_color=None):
+        """개별 일정 공유 메일 (category_color를 주면 배지 색상으로 사용)"""
+        current_time = report_timestamp(now)
+        status = "완료" if task.completed else "미완료"
+        if task.content:
+            content, content_style = escape_multiline(task.content), "color: #666; line-height: 1.6;"
+        else:
+            content, content_style = "내용이 없습니다.", "color: #999; font-style: italic;"
+        body = load_template("task_share").render(
+            status=status, status_color="#4CAF50" if task.completed else "#FF9800",
+            title=escape_html(task.title), category=escape_html(task.category),
+            category_color=category_color or self.category_color(task.category), created_date=escape_html(task.created_date),
+            content=content, content_style=content_style)
+        return self.page("일정 공유", "📋 일정 공유", current_time, [body],
+                         f"🤖 Todolist PM에서 자동 생성 | {current_time}")
+
+
+def render_daily_report(renderer, tasks_data, content_types, selected_categories=None, include_important=True,
+                        memo="", is_test=False, now=None):
+    """데일리 리포트 (리포트 화면과 명령줄 리포트 생성 공용)
+
+    Args:
+        renderer (ReportRenderer): 렌더러
+        tasks_data (dict): all/completed/incomplete/total/completed_count/important_tasks
+        content_types (list): 포함할 작업 목록 종류 (all/completed/incomplete)
+        selected_categories (list, optional): 선택한 카테고리 (None이면 전체)
+        include_important (bool, optional): 미완료 중요 일정 섹션 포함 여부
+        memo (str, optional): 추가 메모
+        is_test (bool, optional): 테스트 발송 리포트인지 여부
+    """
+    current_time = report_timestamp(now)
+
+    banners = [renderer.test_banner()] if is_test else []
+    banners.append(renderer.category_filter_banner(selected_categories))
+
+    sections = renderer.content_sections(content_types, tasks_data)
+    if include_important:
+        sections.append(renderer.important_section(tasks_data.get("important_tasks")))
+    sections.append(renderer.memo_section(memo))
+
+    return renderer.render_report(
+        page_title="Todolist 리포트", header_title="📋 Todolist 리포트", header_subtitle=current_time,
+        banners=banners, summary_heading="📊 데일리 리포트",
+        total=tasks_data["total"], completed=tasks_data["completed_count"],
+        sections=sections, footer=f"🤖 Todolist PM에서 자동 생성됨 | {current_time}")
+
+
+def render_routine_report(renderer, routine, tasks_data, date_str, immediate=False, now=None):
+    """데일리 루틴 리포트 (자동 발송과 설정 화면의 즉시 발송 공용)
+
+    Args:
+        renderer (ReportRenderer): 렌더러
+        routine (dict): 루틴 설정
+        tasks_data (dict): all/completed/incomplete/total/completed_count/important_tasks
+        date_str (str): 리포트 날짜 (YYYY-MM-DD)
+        immediate (bool, optional): 설정 화면에서 즉시 발송한 리포트인지 여부
+    """
+    current_time = report_timestamp(now)
+    report_date = report_date_label(date_str)
+    routine_name = routine.get("name", "Unknown")
+
+    if immediate:
+        banner = renderer.info_banner("immediate", "⚡ 즉시 발송 리포트", f"루틴명: {routine_name} | 수동 실행")
+        page_title, header_title, header_subtitle = "루틴 리포트 (즉시 발송)", "⚡ 루틴 리포트 (즉시 발송)", current_time
+        footer_prefix = "⚡ Todolist PM 루틴 즉시 발송"
+    else:
+        banner = renderer.info_banner("routine", "🔄 루틴 리포트", f"루틴명: {routine_name} | 자동 발송")
+        page_title, header_title, header_subtitle = "루틴 리포트", "🔄 루틴 리포트", f"{current_time} 자동 발송"
+        footer_prefix = "🤖 Todolist PM 자동 루틴에서 발송"
+
+    sections = renderer.content_sections(routine.get("content_types", ["all"]), tasks_data)
+    if routine.get("include_important_tasks", True):
+        sections.append(renderer.important_section(tasks_data.get("important_tasks")))
+    sections.append(renderer.memo_section(routine.get("memo", "")))
+
+    return renderer.render_report(
+        page_title=page_title, header_title=header_title, header_subtitle=header_subtitle,
+        banners=[banner, renderer.category_filter_banner(routine.get("selected_categories"))],
+        summary_heading=f"📊 {report_date} 업무 현황",
+        total=tasks_data["total"], completed=tasks_data["completed_count"],
+        sections=sections,
+        footer=f"{footer_prefix} | {current_time}<br>루틴: {escape_html(routine_name)} - {report_date}")
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+루틴/메일 예약 통합 스케줄러
+
+데일리 루틴(data/daily_routines.json)과 메일 예약(data/email_schedules.json)의
+다음 발송 시각을 계산하여 힙에 넣어 두고, 가장 이른 시각 하나에만 타이머를 건다.
+UI와 무관한 모듈이며, 타이머는 호출하는 쪽(MainWindow의 단발 QTimer)이
+next_delay()로 받은 시간만큼 걸고 만료되면 run_due()를 호출한다.
+
+    - 놓친 발송: 앱이 꺼져 있었거나 타이머가 늦게 깨어나 발송 시각을 지난 경우,
+      지난 발송 이후 catch_up_window 안의 발송 시각이면 한 번만 바로 실행한다.
+      설정을 만들거나 고친 시각(created_at/updated_at) 이전의 발송 시각은 놓친 발송으로
+      보지 않으며, 발송 이력도 작성 시각도 없으면 현재 시각 이후부터 계획한다.
+    - 설정 변경: 설정 파일의 수정 시각이 바뀌면 replan_if_changed()가 다시 계획한다.
+      대기 시간은 MAX_TIMER_SECONDS로 제한하여 절전 복귀나 시계 변경도 반영한다.
+"""
+
+import heapq
+import os
+from datetime import datetime, timedelta
+
+from utils.daily_routine_checker import RUN_FAILED, RUN_SENT, RUN_SKIPPED, WEEKDAY_NAMES, DailyRoutineChecker
+from utils.durable_io import atomic_write_json, load_json_with_recovery
+from utils.email_sender import EmailSender
+from utils.logger import get_logger
+
+logger = get_logger("routine")
+
+EMAIL_SCHEDULES_FILE = os.path.join("data", "email_schedules.json")
+
+# 놓친 발송을 실행해 주는 기간 (이보다 오래된 발송 시각은 건너뜀)
+CATCH_UP_WINDOW = timedelta(hours=12)
+# 발송 실패(RUN_FAILED) 시 재시도 간격 (catch_up_window 안에서만 재시도)
+RETRY_DELAY = timedelta(minutes=5)
+# 타이머 최대 대기 시간 (초)
+MAX_TIMER_SECONDS = 15 * 60
+
+# 발송 이력 필드 (스케줄러가 기록하는 값)
+SEND_HISTORY_FIELDS = ("last_sent_date", "last_sent_time", "total_sent_count")
+
+SOURCE_ROUTINE = "routine"
+SOURCE_EMAIL_SCHEDULE = "email_schedule"
+
+
+def parse_send_time(value):
+    """발송 시각 문자열(HH:MM)을 (시, 분)으로 변환 (잘못된 값이면 None)"""
+    try:
+        hour, minute = (int(part) for part in str(value).split(":"))
+    except ValueError:
+        return None
+    if 0 <= hour < 24 and 0 <= minute < 60:
+        return hour, minute
+    return None
+
+
+def next_fire_time(send_time, after, weekdays=None, send_date=None):
+    """after 이후(초과)의 첫 발송 시각 계산
+
+    Args:
+        send_time (str): 발송 시각 (HH:MM)
+        after (datetime): 기준 시각
+        weekdays (iterable, optional): 발송 요일 이름 목록. None이면 매일
+        send_date (str, optional): 1회 발송 날짜 (YYYY-MM-DD). 지정하면 요일은 무시
+
+    Returns:
+        datetime: 다음 발송 시각 (없으면 None)
+    """
+    parsed = parse_send_time(send_time)
+    if parsed is None:
+        return None
+    hour, minute = parsed
+
+    if send_date:
+        try:
+            fire_time = datetime.strptime(send_date, "%Y-%m-%d").replace(hour=hour, minute=minute)
+        except ValueError:
+            return None
+        return fire_time if fire_time > after else None
+
+    allowed = set(weekdays) if weekdays is not None else set(WEEKDAY_NAMES)
+    if not allowed & set(WEEKDAY_NAMES):
+        return None
+
+    candidate = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= after:
+        candidate += timedelta(days=1)
+    for _ in range(7):
+        if WEEKDAY_NAMES[candidate.weekday()] in allowed:
+            return candidate
+        candidate += timedelta(days=1)
+    return None
+
+
+def last_sent_at(item):
+    """설정 항목의 마지막 발송 시각 (기록이 없으면 None)"""
+    date_str = item.get("last_sent_date")
+    if not date_str:
+        return None
+    try:
+        return datetime.strptime(f"{date_str} {item.get('last_sent_time') or '00:00'}", "%Y-%m-%d %H:%M")
+    except ValueError:
+        return None
+
+
+def edited_at(item):
+    """설정 항목을 만들거나 마지막으로 고친 시각 (기록이 없으면 None)"""
+    value = item.get("updated_at") or item.get("created_at")
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    # 시간대가 있는 값은 현지 시각으로 맞춤 (스케줄러 시계는 현지 시각 기준)
+    return moment.astimezone().replace(tzinfo=None) if moment.tzinfo else moment
+
+
+def merge_send_history(items, path):
+    """저장 전에 파일에 기록된 발송 이력을 메모리 목록에 반영
+
+    대화상자가 열려 있는 동안 스케줄러가 발송 이력을 기록할 수 있으므로, 대화상자가
+    가진 이전 목록으로 파일을 덮어써 이력이 사라지지 않도록 한다.
+
+    Args:
+        items (list): 저장할 루틴/예약 목록 (직접 수정됨)
+        path (str): 설정 파일 경로
+    """
+    stored = load_json_with_recovery(path, default=[], validate=lambda data: isinstance(data, list))
+    stored_by_id = {item.get("id"): item for item in stored if isinstance(item, dict)}
+    for item in items:
+        stored_item = stored_by_id.get(item.get("id"))
+        if stored_item and (stored_item.get("total_sent_count") or 0) > (item.get("total_sent_count") or 0):
+            for field in SEND_HISTORY_FIELDS:
+                item[field] = stored_item.get(field)
+
+
+class ScheduledJob:
+    """스케줄러에 등록된 발송 작업"""
+
+    __slots__ = ("source", "item", "send_time", "weekdays", "send_date", "next_fire")
+
+    def __init__(self, source, item, send_time, weekdays=None, send_date=None):
+        self.source = source
+        self.item = item
+        self.send_time = send_time
+        self.weekdays = weekdays
+        self.send_date = send_date
+        self.next_fire = None
+
+    @property
+    def key(self):
+        return self.source, self.item.get("id")
+
+    @property
+    def name(self):
+        return self.item.get("name", "Unknown")
+
+    def next_after(self, after):
+        """after 이후의 다음 발송 시각"""
+        return next_fire_time(self.send_time, after, self.weekdays, self.send_date)
+
+
+class RoutineScheduler:
+    """다음 발송 시각 우선순위 큐 기반 스케줄러"""
+
+    def __init__(self, storage_manager, routine_checker=None, email_schedules_file=EMAIL_SCHEDULES_FILE,
+                 catch_up_window=CATCH_UP_WINDOW, clock=datetime.now):
+        """스케줄러 초기화
+
+        Args:
+            storage_manager (StorageManager): 스토리지 매니저 (메일 내용 생성용)
+            routine_checker (DailyRoutineChecker, optional): 루틴 실행기. 기본값은 새로 생성
+            email_schedules_file (str, optional): 메일 예약 파일 경로
+            catch_up_window (timedelta, optional): 놓친 발송을 실행해 주는 기간
+            clock (callable, optional): 현재 시각 함수
+        """
+        self.storage_manager = storage_manager
+        self.routine_checker = routine_checker if routine_checker else DailyRoutineChecker(storage_manager)
+        self.email_schedules_file = email_schedules_file
+        self.catch_up_window = catch_up_window
+        self.clock = clock
+
+        self.jobs = {}        # (출처, ID) -> ScheduledJob
+        self.heap = []        # (발송 시각, 순번, 키)
+        self._seq = 0
+        self._file_stamps = None
+
+    # 계획
+
+    def _source_files(self):
+        return self.routine_checker.routines_file, self.email_schedules_file
+
+    def _read_file_stamps(self):
+        """설정 파일 수정 시각 (변경 감지용)"""
+        stamps = []
+        for path in self._source_files():
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def load_email_schedules(self):
+        """메일 예약 목록 로드"""
+        return load_json_with_recovery(self.email_schedules_file, default=[],
+                                       validate=lambda data: isinstance(data, list))
+
+    def _build_jobs(self):
+        """설정 파일에서 발송 작업 목록 구성"""
+        jobs = []
+        for routine in self.routine_checker.load_routines():
+            if routine.get("enabled", True) and routine.get("id"):
+                jobs.append(ScheduledJob(SOURCE_ROUTINE, routine, routine.get("send_time", "00:00"),
+                                         weekdays=routine.get("weekdays", [])))
+
+        for schedule in self.load_email_schedules():
+            if not schedule.get("enabled", True) or not schedule.get("id"):
+                continue
+            send_time = schedule.get("send_time", "09:00")
+            if not schedule.get("is_recurring", False):
+                if schedule.get("send_date"):
+                    jobs.append(ScheduledJob(SOURCE_EMAIL_SCHEDULE, schedule, send_time,
+                                             send_date=schedule["send_date"]))
+            elif schedule.get("frequency") == "weekly":
+                jobs.append(ScheduledJob(SOURCE_EMAIL_SCHEDULE, schedule, send_time,
+                                         weekdays=[schedule.get("weekday", "monday")]))
+            else:
+                jobs.append(ScheduledJob(SOURCE_EMAIL_SCHEDULE, schedule, send_time))
+        return jobs
+
+    def _push(self, job, fire_time):
+        """작업의 다음 발송 시각 등록"""
+        job.next_fire = fire_time
+        if fire_time is not None:
+            self._seq += 1
+            heapq.heappush(self.heap, (fire_time, self._seq, job.key))
+
+    def plan(self):
+        """설정 파일을 읽어 모든 작업의 다음 발송 시각을 다시 계산"""
+        now = self.clock()
+        catch_up_from = now - self.catch_up_window
+
+        self._file_stamps = self._read_file_stamps()
+        self.jobs = {}
+        self.heap = []
+
+        for job in self._build_jobs():
+            self.jobs[job.key] = job
+
+            # 마지막 발송(또는 설정을 만들거나 고친 시각) 이후 놓친 발송 시각이 있으면 바로 실행
+            # (catch_up_window 이내만). 둘 다 모르면 놓친 발송은 보지 않음
+            floors = [moment for moment in (last_sent_at(job.item), edited_at(job.item)) if moment]
+            after = max(floors + [catch_up_from]) if floors else now
+            fire_time = job.next_after(after)
+            if fire_time is not None and fire_time <= now:
+                logger.info("놓친 발송 예정: %s (%s)", job.name, fire_time.strftime("%Y-%m-%d %H:%M"))
+            self._push(job, fire_time)
+
+        if self.heap:
+            logger.debug("발송 계획 %d건, 가장 이른 발송: %s", len(self.heap), self.heap[0][0])
+        return len(self.heap)
+
+    def replan_if_changed(self):
+        """설정 파일이 바뀌었으면 다시 계획
+
+        Returns:
+            bool: 다시 계획했는지 여부
+        """
+        if self._file_stamps is not None and self._read_file_stamps() == self._file_stamps:
+            return False
+        self.plan()
+        return True
+
+    def next_delay(self):
+        """다음 발송까지 대기할 시간(초). MAX_TIMER_SECONDS를 넘지 않음"""
+        if not self.heap:
+            return MAX_TIMER_SECONDS
+        delay = (self.heap[0][0] - self.clock()).total_seconds()
+        return min(max(delay, 0), MAX_TIMER_SECONDS)
+
+    # 실행
+
+    def run_due(self):
+        """발송 시각이 된 작업 실행 후 다음 발송 시각 등록
+
+        Returns:
+            list: 실행한 작업 이름 목록
+        """
+        executed = []
+        now = self.clock()
+        while self.heap and self.heap[0][0] <= now:
+            fire_time, _, key = heapq.heappop(self.heap)
+            job = self.jobs.get(key)
+            if job is None or job.next_fire != fire_time:
+                continue  # 다시 계획되어 무효가 된 항목
+
+            try:
+                status = self._run_job(job, fire_time)
+            except Exception:
+                logger.exception("예약 발송 중 오류: %s", job.name)
+                status = RUN_FAILED
+
+            if status == RUN_FAILED:
+                if now + RETRY_DELAY - fire_time <= self.catch_up_window:
+                    logger.warning("예약 발송 실패, %d분 후 재시도: %s", RETRY_DELAY.seconds // 60, job.name)
+                    self._push(job, now + RETRY_DELAY)
+                else:
+                    self._push(job, job.next_after(now))
+                continue
+
+            if status == RUN_SENT:
+                executed.append(job.name)
+            else:
+                # 이미 발송했거나 설정 문제로 건너뛴 경우 재시도하지 않음
+                logger.debug("예약 발송 건너뜀: %s", job.name)
+            # 여러 번 놓친 경우에도 한 번만 실행하고 다음 발송은 현재 시각 이후로
+            self._push(job, job.next_after(max(now, fire_time)))
+
+        if executed:
+            # 발송 이력 저장으로 바뀐 수정 시각은 변경으로 보지 않음
+            self._file_stamps = self._read_file_stamps()
+        return executed
+
+    def _run_job(self, job, fire_time):
+        """작업 하나 실행 (실행 결과 RUN_SENT, RUN_SKIPPED, RUN_FAILED 반환)"""
+        date_str = fire_time.strftime("%Y-%m-%d")
+        if job.source == SOURCE_ROUTINE:
+            return self.routine_checker.run_routine(job.item, date_str)
+        return self.run_email_schedule(job.item.get("id"), fire_time)
+
+    def run_email_schedule(self, schedule_id, fire_time):
+        """메일 예약 하나 발송 후 발송 이력 저장 (1회 예약은 비활성화)
+
+        Args:
+            schedule_id (str): 예약 ID
+            fire_time (datetime): 발송 예정 시각
+
+        Returns:
+            str: 실행 결과 (RUN_SENT, 이미 발송했거나 보낼 수 없는 설정이면 RUN_SKIPPED, 오류는 RUN_FAILED)
+        """
+        schedules = self.load_email_schedules()
+        schedule = next((item for item in schedules if item.get("id") == schedule_id), None)
+        if schedule is None or not schedule.get("enabled", True):
+            return RUN_SKIPPED
+        last_sent = last_sent_at(schedule)
+        if last_sent and last_sent >= fire_time.replace(second=0, microsecond=0):
+            return RUN_SKIPPED  # 이미 발송됨
+        if not schedule.get("recipients"):
+            logger.warning("수신자가 없어 메일 예약을 건너뜁니다: %s", schedule.get("name"))
+            return RUN_SKIPPED
+
+        # 발송 대기열에 넣으면 발송 처리로 기록 (실패 시 재시도는 대기열이 담당)
+        sender = EmailSender(self.storage_manager)
+        dedup_key = f"schedule:{schedule_id}:{fire_time.strftime('%Y-%m-%d %H:%M')}"
+        if not sender.send_scheduled_email(schedule, dedup_key=dedup_key):
+            return RUN_FAILED
+
+        now = self.clock()
+        schedule["last_sent_date"] = now.strftime("%Y-%m-%d")
+        schedule["last_sent_time"] = now.strftime("%H:%M")
+        schedule["total_sent_count"] = schedule.get("total_sent_count", 0) + 1
+        if not schedule.get("is_recurring", False):
+            schedule["enabled"] = False
+
+        atomic_write_json(self.email_schedules_file, schedules)
+        logger.info("자동 발송 대기열 추가: %s (총 %d회)", schedule.get("name"), schedule["total_sent_count"])
+        return RUN_SENT
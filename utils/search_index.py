@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 검색 색인
+
+작업 제목/내용의 역색인(검색어 -> 작업 ID)을 메모리에 두고, StorageManager의 변경 알림
+경로에서 작업 단위로 증분 갱신한다.
+
+토큰 규칙
+    - 한글 음절 구간: 두 글자씩 겹쳐 자른 바이그램("회의록" -> "회의", "의록").
+      조사나 어미가 붙어도 어간의 바이그램이 그대로 남으므로 형태소 분석 없이 찾을 수 있다.
+      한 글자짜리 구간은 그 글자 하나를 토큰으로 쓴다.
+    - 그 밖의 글자/숫자 구간: 소문자로 바꾼 단어 하나.
+    - 제목의 토큰은 내용보다 가중치를 높게 준다 (TITLE_WEIGHT).
+
+검색은 질의의 모든 토큰을 포함하는 작업만 돌려준다(AND). 입력 중인 마지막 단어는
+접두어로 취급하고, 한 글자 한글 질의는 그 글자로 시작하거나 끝나는 바이그램을 모두 찾는다.
+점수는 토큰별 (가중치 x IDF)의 합이며 같은 점수는 최근 작업이 먼저 온다.
+
+색인은 data/search_index.json에 작업별 지문(제목/내용 CRC)과 토큰 가중치로 저장하며,
+다음 실행 때 지문이 같은 작업은 다시 토큰화하지 않고 그대로 사용한다. 작업 데이터에서
+언제든 다시 만들 수 있으므로 파일이 없거나 읽을 수 없으면 조용히 새로 만든다.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+import unicodedata
+import zlib
+from bisect import bisect_left
+from operator import itemgetter
+
+from utils.durable_io import atomic_write_json
+from utils.logger import get_logger
+
+logger = get_logger("storage")
+
+SEARCH_INDEX_FILE = "search_index.json"
+INDEX_VERSION = 1
+TITLE_WEIGHT = 3
+DEFAULT_LIMIT = 50
+
+_HANGUL_START, _HANGUL_END = "가", "힣"
+_TOKEN_RE = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+
+
+def _normalize(text):
+    """소문자 + NFC (조합형으로 입력된 한글도 완성형으로)"""
+    if not text:
+        return ""
+    if not text.isascii():
+        text = unicodedata.normalize("NFC", text)
+    return text.lower()
+
+
+def _is_hangul(run):
+    return _HANGUL_START <= run[0] <= _HANGUL_END
+
+
+def tokenize(text):
+    """색인용 토큰 목록 (중복 포함)
+
+    Args:
+        text (str): 작업 제목이나 내용
+
+    Returns:
+        list: 토큰 목록
+    """
+    tokens = []
+    for run in _TOKEN_RE.findall(_normalize(text)):
+        if _is_hangul(run) and len(run) > 1:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def parse_query(query):
+    """검색어를 (토큰, 접두어 여부) 목록으로 변환 (중복 제거)
+
+    입력 중인 마지막 단어(검색어가 공백으로 끝나지 않을 때)는 접두어로 찾는다.
+    """
+    runs = _TOKEN_RE.findall(_normalize(query))
+    typing_last = bool(runs) and not query[-1:].isspace()
+    terms = []
+    for i, run in enumerate(runs):
+        prefix = typing_last and i == len(runs) - 1
+        if _is_hangul(run) and len(run) > 1:
+            terms.extend((run[j:j + 2], False) for j in range(len(run) - 1))
+        else:
+            terms.append((run, prefix))
+    return list(dict.fromkeys(terms))
+
+
+def task_matches(task, terms):
+    """작업이 질의 토큰을 모두 포함하는지 (색인 없이 검사, 색인 검색과 같은 규칙)
+
+    Args:
+        task (Task): 작업
+        terms (list): parse_query() 결과
+    """
+    tokens = set(tokenize(task.title))
+    tokens.update(tokenize(task.content))
+    for token, prefix in terms:
+        if len(token) == 1 and _is_hangul(token):
+            # 그 글자로 시작하거나 끝나는 토큰
+            if not any(token in t for t in tokens):
+                return False
+        elif prefix:
+            if not any(t.startswith(token) for t in tokens):
+                return False
+        elif token not in tokens:
+            return False
+    return True
+
+
+def fingerprint(task):
+    """작업 제목/내용 지문 (내용이 바뀌었는지 확인용)"""
+    return zlib.crc32(f"{task.title}\0{task.content or ''}".encode("utf-8"))
+
+
+def task_terms(task):
+    """작업의 토큰 -> 가중치"""
+    weights = {}
+    for token in tokenize(task.title):
+        weights[token] = weights.get(token, 0) + TITLE_WEIGHT
+    for token in tokenize(task.content):
+        weights[token] = weights.get(token, 0) + 1
+    return weights
+
+
+class SearchIndex:
+    """작업 제목/내용 역색인
+
+    Attributes:
+        postings (dict): 토큰 -> {작업 ID: 가중치}
+        docs (dict): 작업 ID -> (지문, 토큰 튜플)
+        dates (dict): 작업 ID -> 생성 날짜 (같은 점수의 정렬 기준)
+    """
+
+    def __init__(self, index_file=None):
+        """검색 색인 초기화
+
+        Args:
+            index_file (str, optional): 저장 파일 경로. None이면 저장하지 않음
+        """
+        self.index_file = index_file
+        self.postings = {}
+        self.docs = {}
+        self.dates = {}
+        self.dirty = False
+        self._vocabulary = None  # 정렬된 토큰 목록 (접두어 검색용, 토큰이 늘면 다시 만듦)
+
+    def __len__(self):
+        return len(self.docs)
+
+    def __contains__(self, task_id):
+        return task_id in self.docs
+
+    # --- 갱신 ---
+
+    def _add_terms(self, task_id, terms):
+        postings = self.postings
+        for token, weight in terms.items():
+            posting = postings.get(token)
+            if posting is None:
+                postings[token] = {task_id: weight}
+                self._vocabulary = None
+            else:
+                posting[task_id] = weight
+
+    def remove(self, task_id):
+        """작업을 색인에서 제거"""
+        doc = self.docs.pop(task_id, None)
+        if doc is None:
+            return
+        del self.dates[task_id]
+        postings = self.postings
+        for token in doc[1]:
+            posting = postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(task_id, None)
+            if not posting:
+                del postings[token]
+                self._vocabulary = None
+        self.dirty = True
+
+    def update(self, task, task_fingerprint=None):
+        """작업 추가/갱신 (제목/내용이 그대로면 날짜만 갱신)"""
+        if task_fingerprint is None:
+            task_fingerprint = fingerprint(task)
+        doc = self.docs.get(task.id)
+        if doc is not None and doc[0] == task_fingerprint:
+            if self.dates[task.id] != task.created_date:
+                self.dates[task.id] = task.created_date
+                self.dirty = True
+            return
+        if doc is not None:
+            self.remove(task.id)
+        terms = task_terms(task)
+        self.docs[task.id] = (task_fingerprint, tuple(terms))
+        self.dates[task.id] = task.created_date
+        self._add_terms(task.id, terms)
+        self.dirty = True
+
+    def sync(self, tasks):
+        """작업 목록과 색인을 맞춤 (저장된 색인 중 지문이 같은 작업은 다시 토큰화하지 않음)
+
+        Returns:
+            int: 새로 토큰화한 작업 수
+        """
+        live_ids = set()
+        tokenized = 0
+        for task in tasks:
+            live_ids.add(task.id)
+            task_fingerprint = fingerprint(task)
+            doc = self.docs.get(task.id)
+            if doc is None or doc[0] != task_fingerprint:
+                tokenized += 1
+            self.update(task, task_fingerprint)
+        for task_id in [task_id for task_id in self.docs if task_id not in live_ids]:
+            self.remove(task_id)
+        return tokenized
+
+    def apply_changes(self, changes, get_task):
+        """저장소 변경 알림 반영
+
+        Args:
+            changes (TaskChangeSet): 변경 내역
+            get_task (callable): 작업 ID -> Task (없으면 None)
+        """
+        for task_id in changes.removed:
+            self.remove(task_id)
+        for task_id in changes.added | changes.updated:
+            task = get_task(task_id)
+            if task is None:
+                self.remove(task_id)
+            else:
+                self.update(task)
+
+    # --- 검색 ---
+
+    def _prefix_tokens(self, prefix):
+        """접두어로 시작하는 토큰 목록"""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        end = bisect_left(vocabulary, prefix + "\U0010ffff", start)
+        return vocabulary[start:end]
+
+    def _term_postings(self, token, prefix):
+        """질의 토큰 하나에 해당하는 {작업 ID: 가중치}"""
+        single_hangul = len(token) == 1 and _is_hangul(token)
+        if not prefix and not single_hangul:
+            return self.postings.get(token, {})
+
+        tokens = self._prefix_tokens(token)
+        if single_hangul:
+            # 한 글자 한글: 그 글자로 끝나는 바이그램도 포함
+            tokens += [t for t in self._vocabulary if len(t) == 2 and t[1] == token and t[0] != token]
+        if len(tokens) == 1:
+            return self.postings[tokens[0]]
+        merged = {}
+        for t in tokens:
+            for task_id, weight in self.postings[t].items():
+                if weight > merged.get(task_id, 0):
+                    merged[task_id] = weight
+        return merged
+
+    def _match(self, terms):
+        """질의 토큰별 게시 목록(짧은 순)과 모든 토큰을 포함하는 작업 ID"""
+        if not terms:
+            return [], ()
+
+        term_postings = sorted((self._term_postings(token, prefix) for token, prefix in terms), key=len)
+        if not term_postings[0]:
+            return term_postings, ()
+
+        # 가장 짧은 목록부터 교집합 (dict 키 뷰의 교집합은 C 수준에서 처리됨)
+        candidates = term_postings[0].keys()
+        for posting in term_postings[1:]:
+            candidates = candidates & posting.keys()
+            if not candidates:
+                break
+        return term_postings, candidates
+
+    def matching_ids(self, query):
+        """검색어의 모든 토큰을 포함하는 작업 ID 집합 (점수 계산/정렬 없음, 조회 조건용)"""
+        _, candidates = self._match(parse_query(query))
+        return set(candidates)
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """검색
+
+        Args:
+            query (str): 검색어
+            limit (int, optional): 최대 결과 수
+
+        Returns:
+            list: (작업 ID, 생성 날짜, 점수) 목록 (점수 높은 순, 같으면 최근 날짜 순)
+        """
+        term_postings, candidates = self._match(parse_query(query))
+        if not candidates:
+            return []
+
+        total = len(self.docs)
+        scores = None
+        for posting in term_postings:
+            idf = math.log(1 + total / len(posting))
+            if scores is None:
+                scores = {task_id: posting[task_id] * idf for task_id in candidates}
+            else:
+                scores = {task_id: score + posting[task_id] * idf for task_id, score in scores.items()}
+
+        dates = self.dates
+        return [(task_id, dates[task_id], score) for task_id, score in self._top(scores, limit)]
+
+    def _top(self, scores, limit):
+        """점수 상위 limit개 (같은 점수는 최근 날짜 먼저)
+
+        비교 키를 튜플로 만드는 비용을 피하려고 점수만으로 상위 목록을 고른 뒤,
+        경계 점수와 같은 작업들만 날짜로 다시 고른다.
+        """
+        def rank(item):
+            return item[1], self.dates[item[0]]
+
+        if len(scores) <= limit:
+            return sorted(scores.items(), key=rank, reverse=True)
+
+        top = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        threshold = top[-1][1]
+        above = sorted((item for item in top if item[1] > threshold), key=rank, reverse=True)
+        ties = [task_id for task_id, score in scores.items() if score == threshold]
+        recent_ties = heapq.nlargest(limit - len(above), ties, key=self.dates.__getitem__)
+        return above + [(task_id, threshold) for task_id in recent_ties]
+
+    # --- 저장 ---
+
+    def load(self):
+        """저장된 색인 불러오기 (없거나 형식이 다르면 빈 색인)"""
+        if not self.index_file or not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return
+            for task_id, (task_fingerprint, created_date, tokens, weights) in data["docs"].items():
+                terms = dict(zip(tokens.split(), map(int, weights.split())))
+                self.docs[task_id] = (task_fingerprint, tuple(terms))
+                self.dates[task_id] = created_date
+                self._add_terms(task_id, terms)
+        except (OSError, AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning("검색 색인 파일을 읽을 수 없어 새로 만듭니다: %s", e)
+            self.postings, self.docs, self.dates, self._vocabulary = {}, {}, {}, None
+        self.dirty = False
+
+    def save(self):
+        """변경된 색인 저장 (작업별 토큰과 가중치를 각각 공백으로 이은 문자열)"""
+        if not self.index_file or not self.dirty:
+            return
+        postings, dates = self.postings, self.dates
+        docs = {
+            task_id: [task_fingerprint, dates[task_id], " ".join(tokens),
+                      " ".join(str(postings[token][task_id]) for token in tokens)]
+            for task_id, (task_fingerprint, tokens) in self.docs.items()
+        }
+        # 작업 데이터에서 다시 만들 수 있으므로 스냅샷 없이 한 줄로 저장
+        atomic_write_json(self.index_file, {"version": INDEX_VERSION, "docs": docs}, indent=None, snapshots=0)
+        self.dirty = False
+
+
+def search_index_path(data_dir):
+    """데이터 디렉토리의 검색 색인 파일 경로"""
+    return os.path.join(data_dir, SEARCH_INDEX_FILE)
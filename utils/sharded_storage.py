@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+월별 분할 작업 저장소
+
+작업을 생성 월 기준으로 data/tasks/YYYY-MM.json 파일에 나누어 저장한다.
+시작 시에는 이번 달과 앞뒤 달만 로드하고, 나머지 달은 get_tasks_by_date,
+달력 통계, 내보내기 등에서 해당 기간을 조회할 때 처음 한 번 로드한다.
+
+다른 날짜의 중요 미완료 작업은 모든 날짜 목록에 함께 표시되므로,
+전체 월의 중요 미완료 작업만 따로 모은 data/tasks/open_important.json을
+항상 로드해 둔다. 이 파일은 작업 저장 시마다 함께 갱신된다.
+
+self.tasks에는 현재 메모리에 올라온 작업만 들어 있으므로, 전체 이력이 필요한
+곳에서는 get_all_tasks()를 사용해야 한다.
+
+data/tasks/months.json에는 달마다 가장 이른 완료 작업 날짜를 기록해 둔다. 완료 작업
+보관은 이 요약으로 보관할 작업이 있을 수 있는 달만 불러온다.
+"""
+
+import glob
+import os
+import sys
+from datetime import date
+
+from utils.durable_io import atomic_write_json, load_json_with_recovery
+from utils.logger import get_logger
+from utils.storage import StorageManager, save_storage_settings
+from utils.task_loader import dump_tasks, load_tasks_file
+
+logger = get_logger("storage")
+
+SHARD_DIR_NAME = "tasks"
+OPEN_IMPORTANT_FILE = "open_important.json"
+MONTH_SUMMARY_FILE = "months.json"
+
+
+def first_completed_date(tasks):
+    """작업 중 가장 이른 완료 작업 날짜 (완료 작업이 없으면 None)"""
+    return min((task.created_date for task in tasks if task.completed), default=None)
+
+
+def month_key(date_str):
+    """날짜 문자열의 월 키 (YYYY-MM)"""
+    return date_str[:7]
+
+
+def adjacent_months(today=None):
+    """이번 달과 앞뒤 달의 월 키 목록"""
+    today = today if today else date.today()
+    months = []
+    for offset in (-1, 0, 1):
+        year, month = today.year, today.month + offset
+        if month == 0:
+            year, month = year - 1, 12
+        elif month == 13:
+            year, month = year + 1, 1
+        months.append(f"{year:04d}-{month:02d}")
+    return months
+
+
+def write_shards(shard_dir, tasks):
+    """작업 목록을 월별 파일과 중요 미완료 작업 파일로 나누어 저장
+
+    Args:
+        shard_dir (str): 월별 파일 디렉토리
+        tasks (list): Task 목록
+
+    Returns:
+        int: 생성된 월 파일 수
+    """
+    months = {}
+    for task in tasks:
+        months.setdefault(month_key(task.created_date), []).append(task)
+
+    os.makedirs(shard_dir, exist_ok=True)
+    for month, month_tasks in months.items():
+        atomic_write_json(os.path.join(shard_dir, f"{month}.json"), dump_tasks(month_tasks))
+
+    open_important = [task for task in tasks if task.important and not task.completed]
+    atomic_write_json(os.path.join(shard_dir, OPEN_IMPORTANT_FILE), dump_tasks(open_important))
+    summaries = {month: first_completed_date(month_tasks) for month, month_tasks in months.items()}
+    atomic_write_json(os.path.join(shard_dir, MONTH_SUMMARY_FILE), summaries, snapshots=0)
+    return len(months)
+
+
+class ShardedStorageManager(StorageManager):
+    """월별 파일로 나누어 저장하고 필요한 달만 로드하는 스토리지 매니저"""
+
+    def __init__(self, data_dir="data", eager_months=None):
+        """월별 분할 스토리지 매니저 초기화
+
+        Args:
+            data_dir (str, optional): 데이터 저장 디렉토리. 기본값은 "data"
+            eager_months (list, optional): 시작 시 로드할 월 키 목록. 기본값은 이번 달과 앞뒤 달
+        """
+        self.shard_dir = os.path.join(data_dir, SHARD_DIR_NAME)
+        self.open_important_file = os.path.join(self.shard_dir, OPEN_IMPORTANT_FILE)
+        self.month_summary_file = os.path.join(self.shard_dir, MONTH_SUMMARY_FILE)
+        self.eager_months = eager_months if eager_months is not None else adjacent_months()
+        self.known_months = set()     # 디스크에 파일이 있는 달
+        self.loaded_months = set()    # 메모리에 전부 올라온 달
+        self.dirty_months = set()     # 저장이 필요한 달
+        self.month_summaries = {}     # 달 -> 가장 이른 완료 작업 날짜 (없으면 None, 기록이 없는 달은 모름)
+
+        # 월별 파일 로드 및 인덱스 구성
+        super().__init__(data_dir)
+
+    def _shard_path(self, month):
+        """월 파일 경로"""
+        return os.path.join(self.shard_dir, f"{month}.json")
+
+    def _scan_months(self):
+        """디스크에 있는 월 키 목록"""
+        pattern = os.path.join(self.shard_dir, "[0-9][0-9][0-9][0-9]-[0-9][0-9].json")
+        return {os.path.basename(path)[:-len(".json")] for path in glob.glob(pattern)}
+
+    def _read_month(self, month):
+        """월 파일의 작업 목록 읽기"""
+        return load_tasks_file(self._shard_path(month))
+
+    def _load_tasks(self):
+        """가까운 달의 작업과 중요 미완료 작업만 로드"""
+        if not os.path.isdir(self.shard_dir) and os.path.exists(self.tasks_file):
+            # 기존 tasks.json을 처음 한 번 월별 파일로 분할 (원본은 백업용으로 유지)
+            legacy_tasks = load_tasks_file(self.tasks_file)
+            month_count = write_shards(self.shard_dir, legacy_tasks)
+            logger.info("작업 %d개를 월별 파일 %d개로 분할했습니다.", len(legacy_tasks), month_count)
+
+        self.known_months = self._scan_months()
+        self.month_summaries = load_json_with_recovery(self.month_summary_file, default={},
+                                                       validate=lambda data: isinstance(data, dict))
+
+        tasks = []
+        loaded_ids = set()
+        for month in self.eager_months:
+            if month in self.known_months:
+                for task in self._read_month(month):
+                    tasks.append(task)
+                    loaded_ids.add(task.id)
+            self.loaded_months.add(month)
+
+        # 로드하지 않은 달의 중요 미완료 작업 (다른 날짜 목록에 함께 표시됨)
+        for task in load_tasks_file(self.open_important_file):
+            if task.id not in loaded_ids and month_key(task.created_date) not in self.loaded_months:
+                tasks.append(task)
+                loaded_ids.add(task.id)
+
+        logger.info("월별 작업 로드: %s (전체 %d개월 중)", sorted(self.loaded_months), len(self.known_months))
+        return tasks
+
+    def _load_month(self, month):
+        """아직 로드하지 않은 달의 작업을 메모리로 불러오기"""
+        self.loaded_months.add(month)
+        if month not in self.known_months:
+            return
+
+        added = 0
+        for task in self._read_month(month):
+            # 중요 작업 인덱스로 먼저 올라온 작업은 메모리의 객체를 그대로 사용
+            if task.id in self.index:
+                continue
+            self.index.add(task)
+            added += 1
+        logger.debug("월별 작업 추가 로드: %s (%d개)", month, added)
+
+    def _ensure_loaded(self, start_date=None, end_date=None):
+        """기간에 해당하는 달의 작업을 필요 시 로드"""
+        start_month = month_key(start_date) if start_date else None
+        end_month = month_key(end_date) if end_date else None
+
+        for month in sorted(self.known_months - self.loaded_months):
+            if start_month and month < start_month:
+                continue
+            if end_month and month > end_month:
+                continue
+            self._load_month(month)
+
+    def _ensure_task_month_loaded(self, task_id):
+        """작업이 속한 달 전체를 로드하고 해당 날짜 반환 (중요 작업 인덱스로만 올라온 작업 대비)"""
+        date_str = self.index.indexed_date(task_id)
+        if date_str:
+            self._ensure_loaded(date_str, date_str)
+        return date_str
+
+    def _mark_dirty(self, *date_strs):
+        """저장할 달 표시"""
+        for date_str in date_strs:
+            if date_str:
+                self.dirty_months.add(month_key(date_str))
+        self.tasks_changed = True
+
+    def add_task(self, task):
+        """작업 추가"""
+        super().add_task(task)
+        self._mark_dirty(task.created_date)
+
+    def update_task(self, task_id, updated_task):
+        """작업 업데이트 (날짜가 바뀌면 이전 달과 새 달 모두 저장)"""
+        old_date = self._ensure_task_month_loaded(task_id)
+        if super().update_task(task_id, updated_task):
+            self._mark_dirty(old_date, updated_task.created_date)
+            return True
+        return False
+
+    def delete_task(self, task_id):
+        """작업 삭제"""
+        old_date = self._ensure_task_month_loaded(task_id)
+        if super().delete_task(task_id):
+            self._mark_dirty(old_date)
+            return True
+        return False
+
+    def move_task(self, task_id, target_index):
+        """작업 순서 변경"""
+        date_str = self._ensure_task_month_loaded(task_id)
+        if super().move_task(task_id, target_index):
+            self._mark_dirty(date_str)
+            return True
+        return False
+
+    def delete_category(self, category_name):
+        """카테고리 삭제 (해당 카테고리 작업이 있는 달 저장)"""
+        changed_dates = [task.created_date for task in self.get_all_tasks() if task.category == category_name]
+        if super().delete_category(category_name):
+            self._mark_dirty(*changed_dates)
+            return True
+        return False
+
+    def _month_tasks(self, month):
+        """메모리에 올라온 달의 작업 (날짜 순)"""
+        return [
+            task
+            for date_str in self.index.dates_in_range(f"{month}-01", f"{month}-31")
+            for task in self.index.tasks_on_date(date_str)
+        ]
+
+    def _archive_candidates(self, end_date):
+        """보관 대상 완료 작업 (월 요약으로 end_date 이전 완료 작업이 있을 수 있는 달만 로드)"""
+        end_month = month_key(end_date)
+        months = []
+        for month in sorted(self.known_months):
+            if month > end_month:
+                break
+            first_completed = self.month_summaries.get(month, end_date)
+            if first_completed is not None and first_completed <= end_date:
+                months.append(month)
+
+        candidates = []
+        for month in months:
+            if month not in self.loaded_months:
+                self._load_month(month)
+            month_tasks = self._month_tasks(month)
+            # 기록이 없던 달도 요약을 남겨 다음 보관 때는 읽지 않도록 함 (보관 후 저장 시 다시 계산)
+            self.month_summaries[month] = first_completed_date(month_tasks)
+            candidates.extend(task for task in month_tasks if task.completed and task.created_date <= end_date)
+
+        if months:
+            atomic_write_json(self.month_summary_file, self.month_summaries, snapshots=0)
+        logger.debug("보관 대상 확인: %d개월 (전체 %d개월 중)", len(months), len(self.known_months))
+        return candidates
+
+    def _remove_archived(self, tasks):
+        """보관한 작업 제거 (보관 대상 기간의 달은 조회할 때 이미 로드됨)"""
+        super()._remove_archived(tasks)
+        self._mark_dirty(*{task.created_date for task in tasks})
+
+    def _save_tasks(self):
+        """변경된 달의 파일과 중요 미완료 작업 파일 저장"""
+        os.makedirs(self.shard_dir, exist_ok=True)
+
+        dirty_months, self.dirty_months = self.dirty_months, set()
+        month_dates = {}
+        for date_str in self.index.dates():
+            month = month_key(date_str)
+            if month in dirty_months:
+                month_dates.setdefault(month, []).append(date_str)
+
+        for month in dirty_months:
+            month_tasks = [
+                task
+                for date_str in sorted(month_dates.get(month, ()))
+                for task in self.index.tasks_on_date(date_str)
+            ]
+            path = self._shard_path(month)
+            if month_tasks:
+                atomic_write_json(path, dump_tasks(month_tasks))
+                self.known_months.add(month)
+                self.month_summaries[month] = first_completed_date(month_tasks)
+            else:
+                if os.path.exists(path):
+                    os.remove(path)
+                self.known_months.discard(month)
+                self.month_summaries.pop(month, None)
+
+        atomic_write_json(self.open_important_file, dump_tasks(self.index.important_open_tasks()))
+        if dirty_months:
+            atomic_write_json(self.month_summary_file, self.month_summaries, snapshots=0)
+
+
+def migrate_json_to_shards(data_dir="data"):
+    """기존 tasks.json을 월별 파일로 분할하고 저장소 설정을 sharded로 변경 (1회성)
+
+    원본 JSON 파일은 백업용으로 그대로 남겨둔다.
+
+    Args:
+        data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+
+    Returns:
+        int: 생성된 월 파일 수
+    """
+    tasks_file = os.path.join(data_dir, "tasks.json")
+    tasks = load_tasks_file(tasks_file)
+    month_count = write_shards(os.path.join(data_dir, SHARD_DIR_NAME), tasks)
+
+    save_storage_settings({"backend": "sharded"}, data_dir)
+    logger.info("월별 분할 완료: 작업 %d개 -> 월 파일 %d개", len(tasks), month_count)
+    return month_count
+
+
+if __name__ == "__main__":
+    # 사용법: python -m utils.sharded_storage [데이터 디렉토리]
+    migrate_json_to_shards(sys.argv[1] if len(sys.argv) > 1 else "data")
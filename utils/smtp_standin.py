@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+로컬 SMTP 대역 서버
+
+실제 메일 서버 없이 SMTP 발송을 점검하기 위한 최소한의 SMTP 수신 서버.
+표준 라이브러리 socketserver만 사용하며 받은 메일은 메모리(messages)에 보관하고,
+maildir 경로를 주면 파일로도 저장한다. 인증(AUTH PLAIN/LOGIN)은 어떤 계정이든
+통과시키고, TLS는 지원하지 않는다.
+
+코드에서 사용:
+    with SmtpStandIn() as server:
+        transport = SmtpTransport(host=server.host, port=server.port)
+        ...
+        server.messages  # [(보낸 사람, 받는 사람 목록, 원문 bytes), ...]
+
+단독 실행 (메일 설정의 transport를 smtp / localhost / 8025로 지정):
+    python -m utils.smtp_standin [--port 8025] [--maildir data/mail_sink]
+"""
+
+import argparse
+import base64
+import mailbox
+import socket
+import socketserver
+import sys
+import threading
+
+from utils.logger import get_logger, setup_logging
+
+logger = get_logger("email")
+
+DEFAULT_PORT = 8025
+MAX_LINE_LENGTH = 65536
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """SMTP 세션 하나 처리"""
+
+    # 응답을 줄마다 바로 보내므로 Nagle 지연을 끔 (여러 줄 응답에서 수십 ms씩 지연됨)
+    disable_nagle_algorithm = True
+
+    def reply(self, line):
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def reset(self):
+        self.mail_from = None
+        self.rcpt_to = []
+
+    def read_line(self):
+        try:
+            line = self.rfile.readline(MAX_LINE_LENGTH)
+        except OSError:
+            return None  # 클라이언트가 연결을 끊음
+        if not line:
+            return None
+        return line.rstrip(b"\r\n")
+
+    def read_data(self):
+        """DATA 본문을 "." 줄까지 읽기 (점 덧붙임 복원)"""
+        lines = []
+        while True:
+            line = self.read_line()
+            if line is None or line == b".":
+                return b"\r\n".join(lines) + b"\r\n"
+            if line.startswith(b".."):
+                line = line[1:]
+            lines.append(line)
+
+    def handle(self):
+        server = self.server
+        self.reset()
+        self.reply(f"220 {server.host_name} todolist SMTP stand-in")
+
+        while True:
+            line = self.read_line()
+            if line is None:
+                return
+            command, _, argument = line.decode("utf-8", "replace").partition(" ")
+            command = command.upper()
+
+            if command in ("EHLO", "HELO"):
+                self.reset()
+                if command == "EHLO":
+                    self.reply(f"250-{server.host_name}")
+                    self.reply("250-8BITMIME")
+                    self.reply("250-SMTPUTF8")
+                    self.reply("250 AUTH PLAIN LOGIN")
+                else:
+                    self.reply(f"250 {server.host_name}")
+            elif command == "AUTH":
+                mechanism = argument.split(" ", 1)[0].upper()
+                if mechanism == "PLAIN":
+                    if " " not in argument:
+                        self.reply("334 ")
+                        self.read_line()
+                    self.reply("235 2.7.0 Authentication successful")
+                elif mechanism == "LOGIN":
+                    self.reply("334 " + base64.b64encode(b"Username:").decode("ascii"))
+                    self.read_line()
+                    self.reply("334 " + base64.b64encode(b"Password:").decode("ascii"))
+                    self.read_line()
+                    self.reply("235 2.7.0 Authentication successful")
+                else:
+                    self.reply("504 5.5.4 Unrecognized authentication type")
+            elif command == "MAIL":
+                self.mail_from = argument.partition(":")[2].strip().split(" ")[0].strip("<>")
+                self.rcpt_to = []
+                self.reply("250 OK")
+            elif command == "RCPT":
+                if self.mail_from is None:
+                    self.reply("503 5.5.1 Need MAIL command")
+                    continue
+                self.rcpt_to.append(argument.partition(":")[2].strip().split(" ")[0].strip("<>"))
+                self.reply("250 OK")
+            elif command == "DATA":
+                if not self.rcpt_to:
+                    self.reply("503 5.5.1 Need RCPT command")
+                    continue
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                server.deliver(self.mail_from, self.rcpt_to, self.read_data())
+                self.reset()
+                self.reply("250 OK")
+            elif command == "RSET":
+                self.reset()
+                self.reply("250 OK")
+            elif command == "NOOP":
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 5.5.2 Command not implemented")
+
+
+class _ThreadingSmtpServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class SmtpStandIn:
+    """테스트용 로컬 SMTP 서버
+
+    Attributes:
+        messages (list): 받은 메일 (보낸 사람, 받는 사람 목록, 원문 bytes)
+        session_count (int): 받은 연결 수 (연결 재사용 확인용)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, maildir_path=None):
+        """SMTP 대역 서버 초기화
+
+        Args:
+            host (str, optional): 바인딩 주소. 기본값은 127.0.0.1
+            port (int, optional): 포트. 0이면 빈 포트를 자동 선택
+            maildir_path (str, optional): 받은 메일을 저장할 maildir 경로
+        """
+        self.messages = []
+        self.session_count = 0
+        self._maildir = mailbox.Maildir(maildir_path, create=True) if maildir_path else None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._sessions = set()  # 열려 있는 연결 (종료 시 함께 닫음)
+
+        standin = self
+
+        class Handler(_SmtpHandler):
+            def setup(self):
+                super().setup()
+                with standin._lock:
+                    standin.session_count += 1
+                    standin._sessions.add(self.connection)
+
+            def finish(self):
+                with standin._lock:
+                    standin._sessions.discard(self.connection)
+                super().finish()
+
+        self._server = _ThreadingSmtpServer((host, port), Handler)
+        self._server.host_name = "localhost"
+        self._server.deliver = self.deliver
+        self.host, self.port = self._server.server_address[:2]
+
+    def deliver(self, mail_from, rcpt_to, data):
+        """받은 메일 보관"""
+        with self._lock:
+            self.messages.append((mail_from, list(rcpt_to), data))
+            if self._maildir is not None:
+                self._maildir.add(data)
+        logger.debug("SMTP 대역 서버 수신: %s -> %s (%d bytes)", mail_from, rcpt_to, len(data))
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="smtp-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료 (열려 있는 연결도 끊음)"""
+        self._server.shutdown()
+        self._server.server_close()
+        with self._lock:
+            sessions, self._sessions = self._sessions, set()
+        for connection in sessions:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main(argv=None):
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="Todolist 로컬 SMTP 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (기본값: {DEFAULT_PORT})")
+    parser.add_argument("--maildir", default=None, help="받은 메일을 저장할 maildir 경로")
+    args = parser.parse_args(argv)
+
+    setup_logging(debug=True)
+    server = SmtpStandIn(args.host, args.port, args.maildir)
+    logger.info("SMTP 대역 서버 시작: %s:%s", server.host, server.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    logger.info("SMTP 대역 서버 종료 (수신 %d건)", len(server.messages))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SQLite 기반 작업 저장소
+
+StorageManager와 동일한 API를 제공하되, 작업 데이터를 data/tasks.db에 저장하고
+날짜/카테고리/상태 조회를 인덱스로 처리한다. 카테고리는 기존과 같이
+categories.json으로 관리한다.
+"""
+
+import os
+import sqlite3
+import sys
+
+from models.task import Task
+from utils.logger import get_logger
+from utils.render_utils import CategoryColorMap
+from utils.storage import (StorageManager, add_archived_counts, build_task_stats, merge_month_stats, month_date_range,
+                           save_storage_settings)
+from utils.task_archive import ARCHIVE_DIR_NAME, TaskArchive
+from utils.task_loader import load_tasks_file
+from utils.task_query import ORDER_DATE, ORDER_RECENT, ORDER_STORAGE
+from utils.task_rank import rank_after, rank_between, spread_ranks
+from utils.undo_history import (AddTaskCommand, DeleteCategoryCommand, DeleteTaskCommand, MoveTaskCommand,
+                                UndoHistory)
+
+logger = get_logger("storage")
+
+
+TASK_COLUMNS = ("id", "title", "content", "category", "created_date",
+                "important", "completed", "bg_color", "sort_order")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT 'ETC',
+    created_date TEXT NOT NULL,
+    important INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0,
+    bg_color TEXT NOT NULL DEFAULT 'none',
+    sort_order INTEGER
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_id ON tasks (id);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_date ON tasks (created_date, sort_order);
+CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks (category);
+CREATE INDEX IF NOT EXISTS idx_tasks_important_completed ON tasks (important, completed);
+"""
+
+# 날짜 내 정렬: order가 없는 작업은 뒤로, 같은 order는 입력 순서대로
+DATE_ORDER_BY = "ORDER BY sort_order IS NULL, sort_order, seq"
+
+# TaskQuery 정렬 -> ORDER BY 절
+QUERY_ORDER_BY = {
+    ORDER_STORAGE: "ORDER BY seq",
+    ORDER_DATE: "ORDER BY created_date, sort_order IS NULL, sort_order, seq",
+    ORDER_RECENT: "ORDER BY created_date DESC, seq",
+}
+
+# 검색어 조건의 작업 ID를 IN 절로 넘기는 최대 개수 (SQLite 인자 수 제한 이내)
+MAX_SQL_IN_IDS = 500
+
+
+def task_to_row(task):
+    """Task 객체를 DB 행 튜플로 변환 (TASK_COLUMNS 순서)"""
+    return (
+        task.id,
+        task.title,
+        task.content or "",
+        task.category or "ETC",
+        task.created_date,
+        1 if task.important else 0,
+        1 if task.completed else 0,
+        task.bg_color or "none",
+        getattr(task, 'order', None),
+    )
+
+
+def row_to_task(row):
+    """DB 행(sqlite3.Row)을 Task 객체로 변환"""
+    return Task.from_record({
+        "id": row["id"],
+        "title": row["title"],
+        "content": row["content"],
+        "category": row["category"],
+        "created_date": row["created_date"],
+        "important": bool(row["important"]),
+        "completed": bool(row["completed"]),
+        "bg_color": row["bg_color"],
+        "order": row["sort_order"],
+    })
+
+
+def query_conditions(task_query):
+    """TaskQuery의 검색어 외 조건을 WHERE 조건 목록과 인자로 변환
+
+    Returns:
+        tuple: (조건 문자열 목록, 인자 목록)
+    """
+    conditions = []
+    params = []
+    if task_query.start_date is not None:
+        conditions.append("created_date >= ?")
+        params.append(task_query.start_date)
+    if task_query.end_date is not None:
+        conditions.append("created_date <= ?")
+        params.append(task_query.end_date)
+    if task_query.exclude_date is not None:
+        conditions.append("created_date != ?")
+        params.append(task_query.exclude_date)
+    if task_query.categories is not None:
+        conditions.append(f"category IN ({', '.join('?' * len(task_query.categories))})")
+        params.extend(sorted(task_query.categories))
+    if task_query.important is not None:
+        conditions.append("important = ?")
+        params.append(1 if task_query.important else 0)
+    if task_query.completed is not None:
+        conditions.append("completed = ?")
+        params.append(1 if task_query.completed else 0)
+    return conditions, params
+
+
+def connect_database(db_path):
+    """DB 연결 생성 및 스키마 준비
+
+    Args:
+        db_path (str): SQLite 파일 경로
+
+    Returns:
+        sqlite3.Connection: 연결 객체
+    """
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    conn.commit()
+    return conn
+
+
+class SqliteStorageManager(StorageManager):
+    """SQLite 작업 저장소 (StorageManager 호환)"""
+
+    def __init__(self, data_dir="data", db_path=None):
+        """SQLite 스토리지 매니저 초기화
+
+        Args:
+            data_dir (str, optional): 데이터 저장 디렉토리. 기본값은 "data"
+            db_path (str, optional): DB 파일 경로. 기본값은 data_dir/tasks.db
+        """
+        self.data_dir = data_dir
+        self.tasks_file = os.path.join(data_dir, "tasks.json")
+        self.categories_file = os.path.join(data_dir, "categories.json")
+        self.db_path = db_path if db_path else os.path.join(data_dir, "tasks.db")
+
+        # 변경 알림 리스너
+        self.change_listeners = []
+        self._pending_changes = None
+        self._batch_depth = 0
+        self._search_index = None
+        self._important_open = None  # 중요 미완료 작업 캐시 (변경 알림마다 비움)
+        self.undo_history = UndoHistory(self)
+        self.archive = TaskArchive(os.path.join(data_dir, ARCHIVE_DIR_NAME))
+
+        os.makedirs(data_dir, exist_ok=True)
+        self.conn = connect_database(self.db_path)
+
+        # 카테고리는 기존 JSON 파일 사용
+        self.categories = self._load_categories()
+        self.ensure_etc_category()
+        self.category_colors = CategoryColorMap(self.categories)
+
+        # 작업은 변경 즉시 DB에 기록되므로 tasks_changed는 항상 False
+        self.tasks_changed = False
+        self.categories_changed = False
+
+    @property
+    def tasks(self):
+        """전체 작업 목록 (호환용, 전체 조회이므로 조회 전용으로 사용)"""
+        rows = self.conn.execute("SELECT * FROM tasks ORDER BY seq").fetchall()
+        return [row_to_task(row) for row in rows]
+
+    def close(self):
+        """카테고리 변경 저장 후 DB 연결 종료"""
+        self.save_data()
+        self.save_search_index()
+        try:
+            self.conn.close()
+        except sqlite3.Error as e:
+            logger.error("DB 종료 중 오류: %s", e)
+
+    def _fetch_tasks(self, sql, params=()):
+        """쿼리 결과를 Task 목록으로 반환"""
+        return [row_to_task(row) for row in self.conn.execute(sql, params)]
+
+    def get_task(self, task_id):
+        """ID로 작업 조회 (없으면 None)"""
+        tasks = self._fetch_tasks("SELECT * FROM tasks WHERE id = ?", (task_id,))
+        return tasks[0] if tasks else None
+
+    def save_data(self):
+        """변경된 데이터가 있는 경우 저장 (작업은 이미 DB에 기록됨)"""
+        try:
+            if self.categories_changed:
+                self._save_categories()
+                self.categories_changed = False
+        except Exception as e:
+            logger.error("데이터 저장 중 오류 발생: %s", e)
+
+    def _save_tasks(self):
+        """작업 데이터 저장 (DB는 변경 즉시 커밋되므로 별도 처리 없음)"""
+        self.conn.commit()
+
+    def add_task(self, task):
+        """작업 추가
+
+        Args:
+            task (Task): 추가할 작업 객체
+        """
+        if getattr(task, 'order', None) is None:
+            row = self.conn.execute(
+                "SELECT MAX(sort_order) FROM tasks WHERE created_date = ?",
+                (task.created_date,)
+            ).fetchone()
+            task.order = rank_after(row[0])
+
+        with self.conn:
+            self.conn.execute(
+                f"INSERT INTO tasks ({', '.join(TASK_COLUMNS)}) VALUES ({', '.join('?' * len(TASK_COLUMNS))})",
+                task_to_row(task)
+            )
+        self._notify_changes(added=(task.id,), dates=(task.created_date,))
+        self.undo_history.record(AddTaskCommand(task.to_dict()))
+
+    def _existing_ids(self, tasks):
+        """작업 중 DB에 이미 있는 ID"""
+        ids = [task.id for task in tasks]
+        existing_ids = set()
+        for start in range(0, len(ids), MAX_SQL_IN_IDS):
+            chunk = ids[start:start + MAX_SQL_IN_IDS]
+            existing_ids.update(row[0] for row in self.conn.execute(
+                f"SELECT id FROM tasks WHERE id IN ({', '.join('?' * len(chunk))})", chunk))
+        return existing_ids
+
+    def _last_order(self, date_str):
+        """날짜 작업의 가장 큰 order (작업이 없으면 0)"""
+        row = self.conn.execute("SELECT MAX(sort_order) FROM tasks WHERE created_date = ?", (date_str,)).fetchone()
+        return row[0] or 0
+
+    def _insert_imported(self, tasks):
+        """가져온 작업을 한 트랜잭션으로 추가 (중간에 실패하면 하나도 추가되지 않음)"""
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO tasks ({', '.join(TASK_COLUMNS)}) VALUES ({', '.join('?' * len(TASK_COLUMNS))})",
+                map(task_to_row, tasks)
+            )
+        with self.batch_changes():
+            self._notify_changes(added=[task.id for task in tasks], dates={task.created_date for task in tasks})
+            for task in tasks:
+                self.undo_history.record(AddTaskCommand(task.to_dict()))
+
+    def update_task(self, task_id, updated_task):
+        """작업 업데이트
+
+        Args:
+            task_id (str): 업데이트할 작업의 ID
+            updated_task (Task): 업데이트된 작업 객체
+
+        Returns:
+            bool: 업데이트 성공 여부
+        """
+        old_row = self.conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if old_row is None:
+            return False
+
+        row = task_to_row(updated_task)
+        with self.conn:
+            cursor = self.conn.execute(
+                f"UPDATE tasks SET {', '.join(f'{col} = ?' for col in TASK_COLUMNS)} WHERE id = ?",
+                row + (task_id,)
+            )
+        if cursor.rowcount == 0:
+            return False
+
+        self._notify_changes(updated=(task_id,), dates=(old_row["created_date"], updated_task.created_date))
+        self._record_update(row_to_task(old_row).to_dict(), updated_task)
+        return True
+
+    def delete_task(self, task_id):
+        """작업 삭제
+
+        Args:
+            task_id (str): 삭제할 작업의 ID
+
+        Returns:
+            bool: 삭제 성공 여부
+        """
+        row = self.conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if row is None:
+            return False
+
+        # 같은 날짜 다른 작업의 order는 당기지 않음 (order는 연속 번호가 아닌 정렬 키)
+        with self.conn:
+            self.conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        self._notify_changes(removed=(task_id,), dates=(row["created_date"],))
+        self.undo_history.record(DeleteTaskCommand(row_to_task(row).to_dict()))
+        return True
+
+    def reorder_tasks(self, date_str, source_index, target_index):
+        """특정 날짜의 작업 순서 변경
+
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD)
+            source_index (int): 원본 인덱스
+            target_index (int): 대상 인덱스
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            ids = [row["id"] for row in self.conn.execute(
+                f"SELECT id FROM tasks WHERE created_date = ? {DATE_ORDER_BY}", (date_str,)
+            )]
+
+            if source_index < 0 or source_index >= len(ids):
+                logger.warning("잘못된 소스 인덱스: %d, 작업 수: %d", source_index, len(ids))
+                return False
+            if target_index < 0 or target_index >= len(ids):
+                logger.warning("잘못된 타겟 인덱스: %d, 작업 수: %d", target_index, len(ids))
+                return False
+
+            return self.move_task(ids[source_index], target_index)
+
+        except sqlite3.Error as e:
+            logger.error("작업 순서 변경 중 오류: %s", e)
+            return False
+
+    def move_task(self, task_id, target_index):
+        """작업을 같은 날짜 목록(order 순)의 target_index 위치로 이동 (보통 옮긴 작업의 행 하나만 수정)
+
+        Args:
+            task_id (str): 옮길 작업 ID
+            target_index (int): 이동 후 위치 (0: 맨 앞)
+
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            row = self.conn.execute("SELECT created_date, title FROM tasks WHERE id = ?", (task_id,)).fetchone()
+            if row is None:
+                return False
+            date_str = row["created_date"]
+
+            rows = self.conn.execute(
+                f"SELECT id, sort_order FROM tasks WHERE created_date = ? {DATE_ORDER_BY}", (date_str,)
+            ).fetchall()
+            ids = [r["id"] for r in rows]
+            if target_index < 0 or target_index >= len(ids):
+                logger.warning("잘못된 타겟 인덱스: %d, 작업 수: %d", target_index, len(ids))
+                return False
+            if ids[target_index] == task_id:
+                return True
+
+            orders = {r["id"]: r["sort_order"] for r in rows}
+            source_index = ids.index(task_id)
+            ids.remove(task_id)
+            ids.insert(target_index, task_id)
+            before = orders[ids[target_index - 1]] if target_index > 0 else None
+            after = orders[ids[target_index + 1]] if target_index + 1 < len(ids) else None
+
+            new_order = None
+            if None not in orders.values():
+                new_order = rank_between(before, after)
+            with self.conn:
+                if new_order is not None:
+                    self.conn.execute("UPDATE tasks SET sort_order = ? WHERE id = ?", (new_order, task_id))
+                else:
+                    self.conn.executemany(
+                        "UPDATE tasks SET sort_order = ? WHERE id = ?",
+                        list(zip(spread_ranks(len(ids)), ids))
+                    )
+                    logger.debug("작업 순서 값 다시 매김 %s: 작업 %d개", date_str, len(ids))
+            self._notify_changes(reordered_dates=(date_str,))
+            self.undo_history.record(MoveTaskCommand(task_id, row["title"], source_index, target_index))
+            return True
+
+        except sqlite3.Error as e:
+            logger.error("작업 순서 변경 중 오류: %s", e)
+            return False
+
+    def get_tasks_by_date(self, date_str):
+        """특정 날짜의 작업 목록 조회 (순서대로 정렬)
+
+        Args:
+            date_str (str): 조회할 날짜 (YYYY-MM-DD)
+
+        Returns:
+            list: 해당 날짜에 생성된 작업 목록 + 다른 날짜의 중요 미완료 작업
+        """
+        date_tasks = self._fetch_tasks(
+            f"SELECT * FROM tasks WHERE created_date = ? {DATE_ORDER_BY}", (date_str,)
+        )
+
+        # order 필드가 없는 경우 위치 기준으로 보정 (저장하지 않음, order가 없는 작업은 목록 끝에 모여 있음)
+        for i, task in enumerate(date_tasks):
+            if task.order is None:
+                task.order = rank_after(date_tasks[i - 1].order if i > 0 else None)
+
+        important_tasks = [task for task in self._important_open_tasks() if task.created_date != date_str]
+
+        return important_tasks + date_tasks
+
+    def _important_open_tasks(self):
+        """전체 중요 미완료 작업 (입력 순서)
+
+        날짜를 바꿀 때마다 같은 행을 다시 읽어 Task로 만들지 않도록 캐시하고, 작업이 바뀌면
+        _notify_changes에서 비운다.
+        """
+        if self._important_open is None:
+            self._important_open = self._fetch_tasks(
+                "SELECT * FROM tasks WHERE important = 1 AND completed = 0 ORDER BY seq"
+            )
+        return self._important_open
+
+    def _notify_changes(self, **changes):
+        """중요 미완료 작업 캐시를 비운 뒤 변경 알림"""
+        self._important_open = None
+        super()._notify_changes(**changes)
+
+    def query(self, task_query):
+        """조건에 맞는 작업 조회 (조건을 WHERE 절로 바꿔 DB 인덱스 사용, 커서를 지연 순회)
+
+        검색어 조건은 검색 색인에서 찾은 작업 ID로 처리한다. ID가 적으면 IN 절로 함께 넘기고,
+        많으면 행을 읽으면서 거른다.
+
+        Args:
+            task_query (TaskQuery): 조회 조건
+
+        Returns:
+            iterator: 작업 반복자 (지연 평가)
+        """
+        text_ids = self._query_text_ids(task_query)
+        conditions, params = query_conditions(task_query)
+        if text_ids is not None and len(text_ids) <= MAX_SQL_IN_IDS:
+            conditions.append(f"id IN ({', '.join('?' * len(text_ids))})")
+            params.extend(text_ids)
+            text_ids = None
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.conn.execute(f"SELECT * FROM tasks {where} {QUERY_ORDER_BY[task_query.order]}", params)
+        if text_ids is not None:
+            rows = (row for row in rows if row["id"] in text_ids)
+        return map(row_to_task, rows)
+
+    def _remove_archived(self, tasks):
+        """보관한 작업을 DB에서 삭제 (되돌리기 기록 없이)"""
+        with self.conn:
+            self.conn.executemany("DELETE FROM tasks WHERE id = ?", ((task.id,) for task in tasks))
+
+    def delete_category(self, category_name):
+        """카테고리 삭제
+
+        Args:
+            category_name (str): 삭제할 카테고리 이름
+
+        Returns:
+            bool: 삭제 성공 여부
+        """
+        if category_name == "ETC":
+            return False
+
+        for i, category in enumerate(self.categories):
+            if category.name == category_name:
+                # 해당 카테고리를 사용하는 작업들의 카테고리를 ETC로 변경
+                changed_ids = [row["id"] for row in self.conn.execute(
+                    "SELECT id FROM tasks WHERE category = ?", (category_name,)
+                )]
+                with self.conn:
+                    self.conn.execute(
+                        "UPDATE tasks SET category = 'ETC' WHERE category = ?", (category_name,)
+                    )
+
+                del self.categories[i]
+                self.categories_changed = True
+                self._notify_changes(updated=changed_ids, categories_changed=True)
+                self.undo_history.record(DeleteCategoryCommand(category.to_dict(), i, changed_ids))
+                return True
+        return False
+
+    def get_task_stats(self, date_str):
+        """특정 날짜의 작업 통계 조회
+
+        Args:
+            date_str (str): 조회할 날짜 (YYYY-MM-DD)
+
+        Returns:
+            dict: 작업 총 개수와 완료율을 포함한 통계
+        """
+        row = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(completed), 0), "
+            "COALESCE(SUM(important AND NOT completed), 0) FROM tasks WHERE created_date = ?",
+            (date_str,)
+        ).fetchone()
+        return build_task_stats(*add_archived_counts(row, self.archive.count_on_date(date_str)))
+
+    def get_month_stats(self, year, month):
+        """한 달 동안의 날짜별 작업 통계 일괄 조회 (날짜 인덱스 범위 조회 + GROUP BY)
+
+        Args:
+            year (int): 연도
+            month (int): 월
+
+        Returns:
+            dict: 날짜(YYYY-MM-DD) -> 통계 (작업이 있는 날짜만)
+        """
+        start_date, end_date = month_date_range(year, month)
+        rows = self.conn.execute(
+            "SELECT created_date, COUNT(*), COALESCE(SUM(completed), 0), "
+            "COALESCE(SUM(important AND NOT completed), 0) FROM tasks "
+            "WHERE created_date BETWEEN ? AND ? GROUP BY created_date",
+            (start_date, end_date)
+        ).fetchall()
+        return merge_month_stats({row[0]: tuple(row[1:]) for row in rows},
+                                 self.archive.counts_in_range(start_date, end_date))
+
+
+def migrate_json_to_sqlite(data_dir="data", db_path=None, overwrite=False):
+    """기존 tasks.json을 SQLite DB로 일괄 이전 (1회성)
+
+    원본 JSON 파일은 백업용으로 그대로 남겨두고, 저장소 설정을 sqlite로 변경한다.
+
+    Args:
+        data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+        db_path (str, optional): DB 파일 경로. 기본값은 data_dir/tasks.db
+        overwrite (bool, optional): DB에 작업이 이미 있으면 비우고 다시 이전할지 여부
+
+    Returns:
+        int: 이전된 작업 수
+
+    Raises:
+        RuntimeError: DB에 이미 작업이 있고 overwrite가 False인 경우
+    """
+    tasks_file = os.path.join(data_dir, "tasks.json")
+    db_path = db_path if db_path else os.path.join(data_dir, "tasks.db")
+
+    tasks = load_tasks_file(tasks_file)
+
+    # 날짜별 order 누락 보정 (JSON 목록 순서 기준)
+    next_order = {}
+    for task in tasks:
+        if task.order is None:
+            next_order[task.created_date] = next_order.get(task.created_date, 0) + 1
+            task.order = next_order[task.created_date]
+        else:
+            next_order[task.created_date] = max(next_order.get(task.created_date, 0), task.order)
+
+    os.makedirs(data_dir, exist_ok=True)
+    conn = connect_database(db_path)
+    try:
+        existing = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        if existing and not overwrite:
+            raise RuntimeError(f"DB에 이미 작업 {existing}개가 있습니다: {db_path}")
+
+        with conn:
+            conn.execute("DELETE FROM tasks")
+            # 중복 ID는 마지막 항목 기준으로 유지
+            conn.executemany(
+                f"INSERT OR REPLACE INTO tasks ({', '.join(TASK_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(TASK_COLUMNS))})",
+                [task_to_row(task) for task in tasks]
+            )
+    finally:
+        conn.close()
+
+    save_storage_settings({"backend": "sqlite"}, data_dir)
+    logger.info("SQLite 이전 완료: 작업 %d개 -> %s", len(tasks), db_path)
+    return len(tasks)
+
+
+if __name__ == "__main__":
+    # 사용법: python -m utils.sqlite_storage [데이터 디렉토리] [--overwrite]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    migrate_json_to_sqlite(args[0] if args else "data", overwrite="--overwrite" in sys.argv)
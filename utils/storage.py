@@ -1,11 +1,143 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
+import calendar
+import heapq
+import logging
 import os
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import chain
+from operator import attrgetter
 from models.task import Task
 from models.category import Category
+from utils.durable_io import atomic_write_json, load_json_with_recovery
+from utils.logger import get_logger
+from utils.render_utils import CategoryColorMap
+from utils.search_index import DEFAULT_LIMIT, SearchIndex, search_index_path
+from utils.task_archive import ARCHIVE_DIR_NAME, DEFAULT_ARCHIVE_AGE_DAYS, TaskArchive, archive_end_date
+from utils.task_events import TaskChangeSet
+from utils.task_index import TaskIndex
+from utils.task_loader import dump_tasks, load_tasks_file
+from utils.task_rank import rank_after, rank_between, spread_ranks
+from utils.task_query import ORDER_DATE, ORDER_RECENT, TaskQuery, execute_plan, plan_query
+from utils.undo_history import (AddCategoryCommand, AddTaskCommand, DeleteCategoryCommand, DeleteTaskCommand,
+                                MoveTaskCommand, ReorderCategoriesCommand, UndoHistory, UpdateTaskCommand)
+
+logger = get_logger("storage")
+
+# 리포트에 함께 싣는 미완료 중요 일정의 조회 기간(일)
+IMPORTANT_TASKS_DAYS = 30
+
+
+def build_task_stats(total_count, completed_count, important_open_count=0):
+    """날짜 집계 값으로 통계 딕셔너리 생성
+
+    Args:
+        total_count (int): 전체 작업 수
+        completed_count (int): 완료 작업 수
+        important_open_count (int, optional): 중요 미완료 작업 수
+
+    Returns:
+        dict: 작업 총 개수와 완료율을 포함한 통계
+    """
+    if total_count == 0:
+        return {"total": 0, "completed": 0, "completion_rate": 0, "important_open": 0}
+
+    return {
+        "total": total_count,
+        "completed": completed_count,
+        "completion_rate": (completed_count / total_count) * 100,
+        "important_open": important_open_count
+    }
+
+
+def build_report_data(date_tasks, important_tasks=()):
+    """리포트용 작업 분류와 통계를 한 번의 순회로 생성
+
+    Args:
+        date_tasks (iterable): 리포트 날짜의 작업 (order 순, 카테고리 필터 적용됨)
+        important_tasks (iterable, optional): 다른 날짜의 미완료 중요 작업 (최신순)
+
+    Returns:
+        dict: all/completed/incomplete 목록, total/completed_count/completion_rate, important_tasks
+    """
+    all_tasks, completed, incomplete = [], [], []
+    for task in date_tasks:
+        all_tasks.append(task)
+        (completed if task.completed else incomplete).append(task)
+
+    total = len(all_tasks)
+    return {
+        "all": all_tasks,
+        "completed": completed,
+        "incomplete": incomplete,
+        "total": total,
+        "completed_count": len(completed),
+        "completion_rate": (len(completed) / total * 100) if total else 0,
+        "important_tasks": list(important_tasks),
+    }
+
+
+def add_archived_counts(counts, archived_count):
+    """날짜 집계 값에 보관된 작업 수 더하기 (보관 작업은 모두 완료 작업)
+
+    Args:
+        counts (tuple): (전체, 완료, 중요 미완료) 작업 수
+        archived_count (int): 보관된 작업 수
+
+    Returns:
+        tuple: (전체, 완료, 중요 미완료) 작업 수
+    """
+    total_count, completed_count, important_open_count = counts
+    return total_count + archived_count, completed_count + archived_count, important_open_count
+
+
+def merge_month_stats(date_counts, archived_counts):
+    """날짜별 집계 값과 보관 작업 수를 합쳐 날짜별 통계 생성
+
+    Args:
+        date_counts (dict): 날짜 -> (전체, 완료, 중요 미완료) 작업 수
+        archived_counts (dict): 날짜 -> 보관된 작업 수
+
+    Returns:
+        dict: 날짜 -> build_task_stats() 통계
+    """
+    stats = {}
+    for date_str in date_counts.keys() | archived_counts.keys():
+        counts = add_archived_counts(date_counts.get(date_str, (0, 0, 0)), archived_counts.get(date_str, 0))
+        stats[date_str] = build_task_stats(*counts)
+    return stats
+
+
+def report_queries(date_str, categories=None, important_days=IMPORTANT_TASKS_DAYS):
+    """리포트 날짜 작업과 미완료 중요 일정 조회 조건
+
+    Args:
+        date_str (str): 리포트 날짜 (YYYY-MM-DD)
+        categories (iterable, optional): 포함할 카테고리 (None이나 빈 목록이면 전체)
+        important_days (int, optional): 미완료 중요 일정을 모을 기간(일). None이면 모으지 않음
+
+    Returns:
+        tuple: (날짜 작업 TaskQuery, 중요 일정 TaskQuery 또는 None)
+    """
+    date_query = TaskQuery(date_str, date_str, categories, order=ORDER_DATE)
+    if important_days is None:
+        return date_query, None
+    important_query = TaskQuery(important_window_start(date_str, important_days), date_str, categories,
+                                completed=False, important=True, exclude_date=date_str, order=ORDER_RECENT)
+    return date_query, important_query
+
+
+def important_window_start(date_str, days):
+    """미완료 중요 일정 조회 기간의 시작일 (YYYY-MM-DD)"""
+    return (datetime.strptime(date_str, "%Y-%m-%d") - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def month_date_range(year, month):
+    """월의 첫날과 마지막 날 (YYYY-MM-DD)"""
+    last_day = calendar.monthrange(year, month)[1]
+    return f"{year:04d}-{month:02d}-01", f"{year:04d}-{month:02d}-{last_day:02d}"
 
 
 class StorageManager:
@@ -21,131 +153,196 @@ class StorageManager:
         self.tasks_file = os.path.join(data_dir, "tasks.json")
         self.categories_file = os.path.join(data_dir, "categories.json")
 
+        # 변경 알림 리스너
+        self.change_listeners = []
+        self._pending_changes = None
+        self._batch_depth = 0
+        self._search_index = None  # 첫 검색 때 만듦
+        self.undo_history = UndoHistory(self)  # 되돌리기/다시 실행 기록
+        self.archive = TaskArchive(os.path.join(data_dir, ARCHIVE_DIR_NAME))  # 오래된 완료 작업 보관소
+
         # 데이터 로드
-        self.tasks = self._load_tasks()
+        self.index = TaskIndex(self._load_tasks())  # ID/날짜/중요 미완료 인덱스 (작업 원본)
         self.categories = self._load_categories()
 
         # ETC 카테고리 존재 확인
         self.ensure_etc_category()
+        self.category_colors = CategoryColorMap(self.categories)  # 카테고리 이름 -> 색상
 
         # 변경 감지 플래그
         self.tasks_changed = False
         self.categories_changed = False
 
+    @property
+    def tasks(self):
+        """메모리의 작업 목록 (입력 순, 인덱스에서 만든 복사본이므로 조회 전용으로 사용)"""
+        return self.index.all_tasks()
+
     def _load_tasks(self):
         """작업 데이터 로드"""
-        if os.path.exists(self.tasks_file):
-            try:
-                with open(self.tasks_file, "r", encoding="utf-8") as f:
-                    tasks_data = json.load(f)
-                return [Task.from_dict(task_dict) for task_dict in tasks_data]
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"작업 데이터 로드 중 오류 발생: {e}")
-                return []
-        return []
+        # 파일이 손상된 경우 최신 스냅샷에서 자동 복구, 잘못된 레코드는 격리 보고서로 분리
+        return load_tasks_file(self.tasks_file)
 
     def _load_categories(self):
         """카테고리 데이터 로드"""
-        if os.path.exists(self.categories_file):
+        categories_data = load_json_with_recovery(self.categories_file,
+                                                  validate=lambda data: isinstance(data, list))
+        if categories_data is not None:
             try:
-                with open(self.categories_file, "r", encoding="utf-8") as f:
-                    categories_data = json.load(f)
-
-                print(f"로드된 카테고리 데이터: {categories_data}")  # 디버그용
-
                 categories = [Category.from_dict(cat_dict) for cat_dict in categories_data]
 
                 # 기존 카테고리들에 templates 속성이 없으면 추가
                 for category in categories:
                     if not hasattr(category, 'templates'):
                         category.templates = []
-                        print(f"카테고리 '{category.name}'에 빈 templates 추가")
+                        logger.debug("카테고리 '%s'에 빈 templates 추가", category.name)
 
-                print("카테고리 로드 완료:")
-                for category in categories:
-                    template_count = len(getattr(category, 'templates', []))
-                    print(f"  카테고리 '{category.name}': 템플릿 {template_count}개")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for category in categories:
+                        logger.debug("카테고리 로드: '%s' 템플릿 %d개",
+                                     category.name, len(getattr(category, 'templates', [])))
 
                 return categories
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"카테고리 데이터 로드 중 오류 발생: {e}")
+            except KeyError as e:
+                logger.error("카테고리 데이터 로드 중 오류 발생: %s", e)
                 # 기본 카테고리 반환
                 return Category.get_default_categories()
-        # 파일이 없으면 기본 카테고리 반환
-        print("카테고리 파일이 없어 기본 카테고리 생성")
+        # 파일이 없거나 복구할 수 없으면 기본 카테고리 반환
+        logger.info("카테고리 파일이 없어 기본 카테고리 생성")
         return Category.get_default_categories()
 
     def save_data(self):
         """변경된 데이터가 있는 경우 저장"""
         try:
             if self.tasks_changed:
-                print("작업 데이터 저장 중...")
                 self._save_tasks()
                 self.tasks_changed = False
-                print("작업 데이터 저장 완료")
+                logger.debug("작업 데이터 저장 완료")
 
             if self.categories_changed:
-                print("카테고리 데이터 저장 중...")
                 self._save_categories()
                 self.categories_changed = False
-                print("카테고리 데이터 저장 완료")
-        except Exception as e:
-            print(f"데이터 저장 중 오류 발생: {e}")
-            import traceback
-            traceback.print_exc()
+                logger.debug("카테고리 데이터 저장 완료")
+        except Exception:
+            logger.exception("데이터 저장 중 오류 발생")
+
+    def close(self):
+        """종료 전 변경된 데이터 저장"""
+        self.save_data()
+        self.save_search_index()
+
+    def _ensure_loaded(self, start_date=None, end_date=None):
+        """기간의 작업이 메모리에 올라와 있도록 보장 (기본 저장소는 전체를 미리 로드하므로 무시)
+
+        지연 로드 저장소가 재정의한다. 날짜를 지정하지 않으면 전체 기간을 의미한다.
+
+        Args:
+            start_date (str, optional): 시작일 (YYYY-MM-DD)
+            end_date (str, optional): 종료일 (YYYY-MM-DD)
+        """
+
+    def add_change_listener(self, listener):
+        """작업 변경 리스너 등록
+
+        Args:
+            listener (callable): TaskChangeSet을 인자로 받는 함수
+        """
+        if listener not in self.change_listeners:
+            self.change_listeners.append(listener)
+
+    def remove_change_listener(self, listener):
+        """작업 변경 리스너 해제"""
+        if listener in self.change_listeners:
+            self.change_listeners.remove(listener)
+
+    @contextmanager
+    def batch_changes(self):
+        """블록 안의 변경을 하나로 합쳐 끝날 때 한 번만 알림 (중첩 가능)"""
+        self._batch_depth += 1
+        self.undo_history.begin_group()
+        try:
+            yield
+        finally:
+            self.undo_history.end_group()
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_changes is not None:
+                changes, self._pending_changes = self._pending_changes, None
+                self._dispatch_changes(changes)
+
+    def _notify_changes(self, **changes):
+        """변경 내역을 리스너에 알림 (batch_changes 안에서는 모아 두었다가 한 번에 알림)
+
+        Args:
+            **changes: TaskChangeSet 생성 인자
+        """
+        change_set = TaskChangeSet(**changes)
+        self.undo_history.refresh_watched(change_set, self.get_task)
+        if self._search_index is not None:
+            self._search_index.apply_changes(change_set, self.get_task)
+        if change_set.categories_changed:
+            # 리스너가 새 색상을 바로 읽을 수 있도록 먼저 갱신
+            self.category_colors.rebuild(self.categories)
+        if self._batch_depth:
+            if self._pending_changes is None:
+                self._pending_changes = change_set
+            else:
+                self._pending_changes.merge(change_set)
+            return
+        self._dispatch_changes(change_set)
+
+    def _dispatch_changes(self, change_set):
+        """리스너 호출 (리스너 오류는 저장소 동작에 영향을 주지 않음)"""
+        if change_set.is_empty():
+            return
+        for listener in list(self.change_listeners):
+            try:
+                listener(change_set)
+            except Exception:
+                logger.exception("작업 변경 리스너 처리 중 오류")
+
+    def get_task(self, task_id):
+        """ID로 작업 조회
+
+        Args:
+            task_id (str): 작업 ID
+
+        Returns:
+            Task: 작업 객체 (없으면 None)
+        """
+        return self.index.get(task_id)
+
+    def get_all_tasks(self):
+        """전체 기간의 작업 목록 (내보내기/보고서 등 전체 이력이 필요한 곳에서 사용)
+
+        Returns:
+            list: 작업 목록
+        """
+        self._ensure_loaded()
+        return self.tasks
 
     def _save_tasks(self):
         """작업 데이터 저장"""
-        tasks_data = [task.to_dict() for task in self.tasks]
-        with open(self.tasks_file, "w", encoding="utf-8") as f:
-            json.dump(tasks_data, f, ensure_ascii=False, indent=2)
+        atomic_write_json(self.tasks_file, dump_tasks(self.tasks))
 
     def _save_categories(self):
         """카테고리 데이터 저장"""
         try:
-            print("카테고리 저장 시작:")
-            for category in self.categories:
-                template_count = len(getattr(category, 'templates', []))
-                print(f"  카테고리 '{category.name}': 템플릿 {template_count}개")
-                if template_count > 0:
-                    print(f"    템플릿 목록: {[t.get('title', 'No Title') for t in category.templates]}")
-
-            categories_data = []
-            for cat in self.categories:
-                cat_dict = cat.to_dict()
-                categories_data.append(cat_dict)
-
-            print(f"저장할 전체 카테고리 데이터:")
-            for i, cat_data in enumerate(categories_data):
-                print(f"  {i}: {cat_data}")
+            categories_data = [cat.to_dict() for cat in self.categories]
+
+            if logger.isEnabledFor(logging.DEBUG):
+                for cat_data in categories_data:
+                    logger.debug("카테고리 저장: '%s' 템플릿 %d개",
+                                 cat_data.get('name'), len(cat_data.get('templates', [])))
 
             # 디렉토리 존재 확인
             os.makedirs(self.data_dir, exist_ok=True)
 
-            with open(self.categories_file, "w", encoding="utf-8") as f:
-                json.dump(categories_data, f, ensure_ascii=False, indent=2)
-
-            print(f"카테고리 데이터 파일 저장 완료: {self.categories_file}")
+            # 임시 파일 fsync 후 원자적 교체로 저장되므로 다시 읽어 검증하지 않음
+            atomic_write_json(self.categories_file, categories_data)
+            logger.debug("카테고리 데이터 파일 저장 완료: %s", self.categories_file)
 
-            # 저장 후 파일 검증
-            if os.path.exists(self.categories_file):
-                file_size = os.path.getsize(self.categories_file)
-                print(f"저장된 파일 크기: {file_size} bytes")
-
-                # 파일 내용 재확인
-                with open(self.categories_file, "r", encoding="utf-8") as f:
-                    saved_data = json.load(f)
-                print(f"저장 후 검증 - 카테고리 수: {len(saved_data)}")
-                for cat_data in saved_data:
-                    template_count = len(cat_data.get('templates', []))
-                    print(f"  검증: '{cat_data['name']}' - 템플릿 {template_count}개")
-            else:
-                print("경고: 파일이 저장되지 않았습니다!")
-
-        except Exception as e:
-            print(f"카테고리 저장 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("카테고리 저장 중 오류")
 
     def add_task(self, task):
         """작업 추가
@@ -153,18 +350,78 @@ class StorageManager:
         Args:
             task (Task): 추가할 작업 객체
         """
+        self._ensure_loaded(task.created_date, task.created_date)
+
         # 해당 날짜의 마지막 순서 번호 계산
-        date_tasks = [t for t in self.tasks if t.created_date == task.created_date]
+        date_tasks = self.index.tasks_on_date(task.created_date)
         if hasattr(task, 'order') and task.order is not None:
             # order가 이미 설정되어 있으면 그대로 사용
             pass
         else:
             # 새 작업이면 마지막 순서로 설정
-            max_order = max([getattr(t, 'order', 0) for t in date_tasks] + [0])
-            task.order = max_order + 1
+            max_order = max([getattr(t, 'order', 0) or 0 for t in date_tasks] + [0])
+            task.order = rank_after(max_order)
 
-        self.tasks.append(task)
+        self.index.add(task)
         self.tasks_changed = True
+        self._notify_changes(added=(task.id,), dates=(task.created_date,))
+        self.undo_history.record(AddTaskCommand(task.to_dict()))
+
+    def import_tasks(self, tasks):
+        """작업 일괄 가져오기 (변경 알림과 저장을 한 번에, 되돌리기도 한 단계)
+
+        이미 있는 ID의 작업은 건너뛰므로 ID가 있는 파일은 다시 가져와도 중복되지 않는다.
+        order가 없는 작업은 날짜별로 기존 작업 뒤에 입력 순서대로 붙인다.
+
+        Args:
+            tasks (iterable): 가져올 작업 목록
+
+        Returns:
+            int: 추가한 작업 수
+        """
+        new_tasks = self._prepare_import(list(tasks))
+        if new_tasks:
+            self._insert_imported(new_tasks)
+        return len(new_tasks)
+
+    def _prepare_import(self, tasks):
+        """가져올 작업 중 새 작업만 골라 order 지정"""
+        existing_ids = self._existing_ids(tasks)
+        seen_ids = set()
+        new_tasks = []
+        for task in tasks:
+            if task.id in existing_ids or task.id in seen_ids:
+                continue
+            seen_ids.add(task.id)
+            new_tasks.append(task)
+
+        last_orders = {}  # 날짜 -> 지금까지의 마지막 order
+        for task in new_tasks:
+            date_str = task.created_date
+            if date_str not in last_orders:
+                last_orders[date_str] = self._last_order(date_str)
+            if task.order is None:
+                task.order = rank_after(last_orders[date_str])
+            last_orders[date_str] = max(last_orders[date_str], task.order)
+        return new_tasks
+
+    def _existing_ids(self, tasks):
+        """작업 중 저장소에 이미 있는 ID"""
+        if tasks:
+            dates = [task.created_date for task in tasks]
+            self._ensure_loaded(min(dates), max(dates))
+        return {task.id for task in tasks if task.id in self.index}
+
+    def _last_order(self, date_str):
+        """날짜 작업의 가장 큰 order (작업이 없으면 0)"""
+        return max((task.order or 0 for task in self.index.tasks_on_date(date_str)), default=0)
+
+    def _insert_imported(self, tasks):
+        """가져온 작업 추가 후 바로 저장"""
+        with self.batch_changes():
+            for task in tasks:
+                self.add_task(task)
+        self.save_data()
 
     def update_task(self, task_id, updated_task):
         """작업 업데이트
@@ -176,12 +433,33 @@ class StorageManager:
         Returns:
             bool: 업데이트 성공 여부
         """
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                self.tasks[i] = updated_task
-                self.tasks_changed = True
-                return True
-        return False
+        self._ensure_loaded(updated_task.created_date, updated_task.created_date)
+
+        task = self.index.get(task_id)
+        if task is None:
+            return False
+
+        old_date = self.index.indexed_date(task_id)
+        if task is updated_task:
+            # UI에서 객체를 직접 수정한 경우: 인덱스 위치만 갱신 (변경 전 상태는 화면에 나갈 때 기억해 둔 값)
+            before = self.undo_history.watched_state(task_id)
+            self.index.refresh(task)
+        else:
+            before = task.to_dict()
+            self.index.replace(task_id, updated_task)
+
+        self.tasks_changed = True
+        self._notify_changes(updated=(task_id,), dates=(old_date, updated_task.created_date))
+        self._record_update(before, updated_task)
+        return True
+
+    def _record_update(self, before, updated_task):
+        """작업 수정 되돌리기 기록 (변경 전 상태를 모르거나 바뀐 것이 없으면 기록하지 않음)"""
+        after = updated_task.to_dict()
+        if before is None:
+            logger.debug("변경 전 상태를 알 수 없어 되돌리기 기록 생략: %s", updated_task.id)
+        elif before != after:
+            self.undo_history.record(UpdateTaskCommand(before, after))
 
     def delete_task(self, task_id):
         """작업 삭제
@@ -192,24 +470,15 @@ class StorageManager:
         Returns:
             bool: 삭제 성공 여부
         """
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                deleted_task = self.tasks[i]
-                del self.tasks[i]
-
-                # 삭제된 작업 이후의 순서 재정렬
-                self._reorder_tasks_after_deletion(deleted_task.created_date, getattr(deleted_task, 'order', 0))
-
-                self.tasks_changed = True
-                return True
-        return False
+        deleted_task = self.index.remove(task_id)
+        if deleted_task is None:
+            return False
 
-    def _reorder_tasks_after_deletion(self, date_str, deleted_order):
-        """작업 삭제 후 순서 재정렬"""
-        date_tasks = [t for t in self.tasks if t.created_date == date_str]
-        for task in date_tasks:
-            if hasattr(task, 'order') and task.order > deleted_order:
-                task.order -= 1
+        # 같은 날짜 다른 작업의 order는 당기지 않음 (order는 연속 번호가 아닌 정렬 키)
+        self.tasks_changed = True
+        self._notify_changes(removed=(task_id,), dates=(deleted_task.created_date,))
+        self.undo_history.record(DeleteTaskCommand(deleted_task.to_dict()))
+        return True
 
     def reorder_tasks(self, date_str, source_index, target_index):
         """특정 날짜의 작업 순서 변경
@@ -222,66 +491,76 @@ class StorageManager:
         Returns:
             bool: 성공 여부
         """
-        try:
-            # 해당 날짜의 작업들만 필터링 (중요한 다른 날짜 작업 제외)
-            date_only_tasks = [t for t in self.tasks if t.created_date == date_str]
+        self._ensure_loaded(date_str, date_str)
 
-            if source_index < 0 or source_index >= len(date_only_tasks):
-                print(f"잘못된 소스 인덱스: {source_index}, 작업 수: {len(date_only_tasks)}")
-                return False
-            if target_index < 0 or target_index >= len(date_only_tasks):
-                print(f"잘못된 타겟 인덱스: {target_index}, 작업 수: {len(date_only_tasks)}")
-                return False
+        # 해당 날짜의 작업들만 (order 순, 다른 날짜의 중요 작업 제외)
+        date_only_tasks = self.index.tasks_on_date(date_str)
 
-            print(f"순서 변경 전 작업 순서:")
-            for i, task in enumerate(date_only_tasks):
-                print(f"  {i}: {task.title} (order: {getattr(task, 'order', 'None')})")
+        if source_index < 0 or source_index >= len(date_only_tasks):
+            logger.warning("잘못된 소스 인덱스: %d, 작업 수: %d", source_index, len(date_only_tasks))
+            return False
+        if target_index < 0 or target_index >= len(date_only_tasks):
+            logger.warning("잘못된 타겟 인덱스: %d, 작업 수: %d", target_index, len(date_only_tasks))
+            return False
 
-            # 실제 순서 변경 - 원본 tasks 리스트에서 직접 수행
-            # 1. 이동할 작업과 대상 작업의 실제 인덱스 찾기
-            source_task = date_only_tasks[source_index]
-            target_task = date_only_tasks[target_index]
+        return self.move_task(date_only_tasks[source_index].id, target_index)
 
-            # 2. 전체 tasks 리스트에서 실제 인덱스 찾기
-            source_real_index = -1
-            target_real_index = -1
+    def move_task(self, task_id, target_index):
+        """작업을 같은 날짜 목록(order 순)의 target_index 위치로 이동
 
-            for i, task in enumerate(self.tasks):
-                if task.id == source_task.id:
-                    source_real_index = i
-                if task.id == target_task.id:
-                    target_real_index = i
+        옮긴 작업의 order만 앞뒤 작업 order의 중간 값으로 바꾼다 (task_rank).
+        중간 값이 없거나 order가 없는 작업이 있을 때만 날짜 작업 전체의 order를 다시 매긴다.
 
-            if source_real_index == -1 or target_real_index == -1:
-                print(f"실제 인덱스를 찾을 수 없음: source={source_real_index}, target={target_real_index}")
-                return False
-
-            # 3. 실제 tasks 리스트에서 순서 변경
-            moved_task = self.tasks.pop(source_real_index)
+        Args:
+            task_id (str): 옮길 작업 ID
+            target_index (int): 이동 후 위치 (0: 맨 앞)
 
-            # target_real_index 조정 (source가 target보다 앞에 있었다면)
-            if source_real_index < target_real_index:
-                target_real_index -= 1
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            task = self.index.get(task_id)
+            if task is None:
+                return False
+            date_str = task.created_date
+            self._ensure_loaded(date_str, date_str)
 
-            self.tasks.insert(target_real_index, moved_task)
+            date_tasks = self.index.tasks_on_date(date_str)
+            if target_index < 0 or target_index >= len(date_tasks):
+                logger.warning("잘못된 타겟 인덱스: %d, 작업 수: %d", target_index, len(date_tasks))
+                return False
+            if date_tasks[target_index] is task:
+                return True
 
-            # 4. 해당 날짜의 모든 작업의 order 필드 재계산
-            updated_date_tasks = [t for t in self.tasks if t.created_date == date_str]
-            for i, task in enumerate(updated_date_tasks):
-                task.order = i + 1
+            # 날짜 목록 안에서 이동 (전체 목록은 건드리지 않음)
+            source_index = date_tasks.index(task)
+            date_tasks.remove(task)
+            date_tasks.insert(target_index, task)
+            before = date_tasks[target_index - 1].order if target_index > 0 else None
+            after = date_tasks[target_index + 1].order if target_index + 1 < len(date_tasks) else None
+
+            new_order = None
+            if all(getattr(t, 'order', None) is not None for t in date_tasks):
+                new_order = rank_between(before, after)
+            if new_order is not None:
+                task.order = new_order
+            else:
+                for t, order in zip(date_tasks, spread_ranks(len(date_tasks))):
+                    t.order = order
+                logger.debug("작업 순서 값 다시 매김 %s: 작업 %d개", date_str, len(date_tasks))
+            self.index.mark_date_dirty(date_str)
 
-            print(f"순서 변경 후 작업 순서:")
-            for i, task in enumerate(updated_date_tasks):
-                print(f"  {i}: {task.title} (order: {getattr(task, 'order', 'None')})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("작업 순서 변경 %s: '%s' -> %d번째 (order %s)", date_str, task.title,
+                             target_index, task.order)
 
             self.tasks_changed = True
-            print(f"작업 순서 변경 완료: {source_index} -> {target_index}")
+            self._notify_changes(reordered_dates=(date_str,))
+            self.undo_history.record(MoveTaskCommand(task_id, task.title, source_index, target_index))
             return True
 
-        except Exception as e:
-            print(f"작업 순서 변경 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("작업 순서 변경 중 오류")
             return False
 
     def get_tasks_by_date(self, date_str):
@@ -293,42 +572,199 @@ class StorageManager:
         Returns:
             list: 해당 날짜에 생성된 작업 목록 + 다른 날짜의 중요 미완료 작업
         """
-        # 해당 날짜의 작업
-        date_tasks = [task for task in self.tasks if task.created_date == date_str]
+        self._ensure_loaded(date_str, date_str)
 
-        # order 필드가 없는 경우 추가
+        # 해당 날짜의 작업 (인덱스에서 order 순으로 조회)
+        date_tasks = self.index.tasks_on_date(date_str)
+
+        # order 필드가 없는 경우 위치 기준으로 추가 (order가 없는 작업은 목록 끝에 모여 있음)
+        needs_order = False
         for i, task in enumerate(date_tasks):
             if not hasattr(task, 'order') or task.order is None:
-                task.order = i + 1
+                task.order = rank_after(date_tasks[i - 1].order if i > 0 else None)
+                needs_order = True
+        if needs_order:
+            self.index.mark_date_dirty(date_str)
+            date_tasks = self.index.tasks_on_date(date_str)
 
-        # order 순으로 정렬 (order가 없으면 999로 처리하여 뒤로)
-        date_tasks.sort(key=lambda x: getattr(x, 'order', 999))
+        # 다른 날짜의 중요 미완료 작업
+        important_tasks = self.index.important_open_tasks(exclude_date=date_str)
 
-        print(f"날짜 {date_str}의 작업 순서:")
-        for i, task in enumerate(date_tasks):
-            print(f"  위치 {i}: {task.title} (order: {getattr(task, 'order', 'None')})")
+        # 중요 작업을 먼저, 그 다음 해당 날짜 작업 (order 순서 유지)
+        tasks = important_tasks + date_tasks
 
-        # 다른 날짜의 중요 미완료 작업
-        important_tasks = [
-            task for task in self.tasks
-            if task.created_date != date_str and task.important and not task.completed
-        ]
+        # 화면에서 객체를 직접 고친 뒤 update_task를 부르므로 되돌리기용으로 현재 상태를 기억
+        self.undo_history.watch(tasks)
+        return tasks
 
-        # 다른 날짜의 중요 작업에도 임시 order 할당 (음수로 구분)
-        for i, task in enumerate(important_tasks):
-            task.temp_order = -(i + 1)  # 음수로 설정하여 맨 앞에 표시
+    def collect_report_data(self, date_str, categories=None, important_days=IMPORTANT_TASKS_DAYS):
+        """리포트용 작업 데이터 일괄 조회 (날짜 작업과 미완료 중요 일정을 query()로 조회)
 
-        # 중요 작업을 먼저, 그 다음 해당 날짜 작업 (order 순서 유지)
-        return important_tasks + date_tasks
+        Args:
+            date_str (str): 리포트 날짜 (YYYY-MM-DD)
+            categories (iterable, optional): 포함할 카테고리 (None이나 빈 목록이면 전체)
+            important_days (int, optional): 미완료 중요 일정을 모을 기간(일). None이면 모으지 않음
+
+        Returns:
+            dict: build_report_data()와 같은 형식
+        """
+        date_query, important_query = report_queries(date_str, categories, important_days)
+        important_tasks = self.query(important_query) if important_query is not None else ()
+        return build_report_data(self.query(date_query), important_tasks)
+
+    def query(self, task_query):
+        """조건에 맞는 작업 조회
+
+        메모리 인덱스에서 예상 후보가 가장 적은 경로(날짜/중요 미완료/검색 색인/전체)를
+        고른 뒤 남은 조건을 싼 것부터 적용한다 (task_query.plan_query).
+
+        Args:
+            task_query (TaskQuery): 조회 조건
+
+        Returns:
+            iterator: 작업 반복자 (지연 평가)
+        """
+        text_ids = self._query_text_ids(task_query)
+        if not (task_query.important is True and task_query.completed is False):
+            # 중요 미완료 작업은 지연 로드 저장소도 항상 메모리에 두므로 로드가 필요 없음
+            self._ensure_loaded(task_query.start_date, task_query.end_date)
+
+        plan = plan_query(task_query, self.index, text_ids)
+        logger.debug("작업 조회 %r: %s 경로 (후보 %d개)", task_query, plan.source, plan.estimate)
+        return execute_plan(task_query, plan, self.index, self.index.by_id.values(), text_ids)
+
+    def query_with_archive(self, task_query):
+        """보관된 작업까지 포함한 조회 (내보내기용, 보관 파일은 필요한 연도만 읽음)
+
+        저장소 작업 뒤에 보관 작업이 이어진다. 날짜 정렬이면 두 결과를 날짜 순으로 합친다.
+
+        Args:
+            task_query (TaskQuery): 조회 조건
+
+        Returns:
+            iterator: 작업 반복자 (지연 평가)
+        """
+        tasks = self.query(task_query)
+        archived_tasks = self.archive.query(task_query)
+        if task_query.order == ORDER_DATE:
+            return heapq.merge(tasks, archived_tasks, key=attrgetter("created_date"))
+        if task_query.order == ORDER_RECENT:
+            return heapq.merge(tasks, archived_tasks, key=attrgetter("created_date"), reverse=True)
+        return chain(tasks, archived_tasks)
+
+    def archive_completed(self, age_days=DEFAULT_ARCHIVE_AGE_DAYS, today=None, force=False):
+        """오래된 완료 작업을 연도별 보관 파일로 옮기기
+
+        보관 파일과 요약을 먼저 기록한 뒤 저장소에서 지우고 바로 저장한다. 그 사이에 종료되면
+        작업이 양쪽에 남을 수 있지만 다음 보관 때 이미 보관된 ID는 건너뛰고 저장소에서만 지운다.
+        보관은 되돌리기 대상이 아니므로 되돌리기 기록은 비운다.
+
+        마지막으로 보관한 기준일을 저장소 설정(archive_cutoff)에 남겨 두고, 기준일이 그 이후로
+        옮겨지지 않았으면 대상을 다시 찾지 않는다.
+
+        Args:
+            age_days (int, optional): 보관 기준 나이 (일). 기본값은 365
+            today (datetime.date, optional): 기준일. 기본값은 오늘
+            force (bool, optional): 기준일이 그대로여도 대상을 다시 찾을지 여부
+
+        Returns:
+            int: 저장소에서 옮긴 작업 수
+
+        Raises:
+            RuntimeError: 기존 보관 파일이 손상된 경우 (저장소의 작업은 그대로 남음)
+        """
+        end_date = archive_end_date(age_days, today)
+        last_cutoff = load_storage_settings(self.data_dir).get(ARCHIVE_CUTOFF_SETTING)
+        if not force and last_cutoff and end_date <= last_cutoff:
+            logger.debug("보관 기준일 %s가 지난 보관(%s) 이후로 바뀌지 않아 건너뜀", end_date, last_cutoff)
+            return 0
+
+        tasks = self._archive_candidates(end_date)
+        if tasks:
+            self.archive.add(tasks)
+            self._remove_archived(tasks)
+            self.undo_history.clear()
+            self._notify_changes(removed=[task.id for task in tasks], dates={task.created_date for task in tasks})
+            self.save_data()
+            logger.info("%s 이전 완료 작업 %d개를 보관했습니다.", end_date, len(tasks))
+
+        save_storage_settings({ARCHIVE_CUTOFF_SETTING: max(end_date, last_cutoff or "")}, self.data_dir)
+        return len(tasks)
+
+    def _archive_candidates(self, end_date):
+        """end_date까지의 완료 작업 (보관 대상)"""
+        return list(self.query(TaskQuery(end_date=end_date, completed=True)))
+
+    def _remove_archived(self, tasks):
+        """보관한 작업을 저장소에서 제거 (되돌리기/저널 기록 없이)
+
+        Args:
+            tasks (list): 보관한 작업 목록
+        """
+        for task in tasks:
+            self.index.remove(task.id)
+        self.tasks_changed = True
+
+    def _query_text_ids(self, task_query):
+        """검색어 조건에 맞는 작업 ID 집합 (검색어가 없으면 None)"""
+        if task_query.text is None:
+            return None
+        return self.get_search_index().matching_ids(task_query.text)
+
+    def search_tasks(self, query, limit=DEFAULT_LIMIT):
+        """제목/내용 검색 (관련도 순, 같으면 최근 작업 먼저)
+
+        처음 호출할 때 전체 작업으로 검색 색인을 만들며(저장된 색인 중 바뀌지 않은 작업은
+        재사용), 이후에는 변경 알림 경로에서 증분 갱신된다.
+
+        Args:
+            query (str): 검색어
+            limit (int, optional): 최대 결과 수
 
-    def add_category(self, category):
+        Returns:
+            list: 작업 목록
+        """
+        results = []
+        for task_id, _, _ in self.get_search_index().search(query, limit):
+            task = self.get_task(task_id)
+            if task is not None:
+                results.append(task)
+        return results
+
+    def get_search_index(self):
+        """검색 색인 (없으면 저장된 색인을 불러와 현재 작업과 맞춘 뒤 반환)"""
+        if self._search_index is None:
+            search_index = SearchIndex(search_index_path(self.data_dir))
+            search_index.load()
+            reused = len(search_index)
+            tokenized = search_index.sync(self.get_all_tasks())
+            logger.info("검색 색인 준비: 작업 %d개 (저장된 색인 %d개, 새로 색인 %d개)",
+                        len(search_index), reused, tokenized)
+            self._search_index = search_index
+        return self._search_index
+
+    def save_search_index(self):
+        """검색 색인이 바뀌었으면 저장"""
+        if self._search_index is None:
+            return
+        try:
+            self._search_index.save()
+        except Exception:
+            logger.exception("검색 색인 저장 중 오류")
+
+    def add_category(self, category, index=None):
         """카테고리 추가
 
         Args:
             category (Category): 추가할 카테고리 객체
+            index (int, optional): 삽입 위치 (기본값은 맨 뒤)
         """
-        self.categories.append(category)
+        if index is None or index >= len(self.categories):
+            index = len(self.categories)
+        self.categories.insert(index, category)
         self.categories_changed = True
+        self._notify_changes(categories_changed=True)
+        self.undo_history.record(AddCategoryCommand(category.to_dict(), index))
 
     def delete_category(self, category_name):
         """카테고리 삭제
@@ -346,13 +782,17 @@ class StorageManager:
         for i, category in enumerate(self.categories):
             if category.name == category_name:
                 # 해당 카테고리를 사용하는 작업들의 카테고리를 ETC로 변경
-                for task in self.tasks:
+                changed_ids = []
+                for task in self.get_all_tasks():
                     if task.category == category_name:
                         task.category = "ETC"
+                        changed_ids.append(task.id)
                         self.tasks_changed = True
 
                 del self.categories[i]
                 self.categories_changed = True
+                self._notify_changes(updated=changed_ids, categories_changed=True)
+                self.undo_history.record(DeleteCategoryCommand(category.to_dict(), i, changed_ids))
                 return True
         return False
 
@@ -368,34 +808,29 @@ class StorageManager:
         """
         try:
             if source_index < 0 or source_index >= len(self.categories):
-                print(f"잘못된 소스 인덱스: {source_index}, 카테고리 수: {len(self.categories)}")
+                logger.warning("잘못된 소스 인덱스: %d, 카테고리 수: %d", source_index, len(self.categories))
                 return False
             if target_index < 0 or target_index >= len(self.categories):
-                print(f"잘못된 타겟 인덱스: {target_index}, 카테고리 수: {len(self.categories)}")
+                logger.warning("잘못된 타겟 인덱스: %d, 카테고리 수: %d", target_index, len(self.categories))
                 return False
             if source_index == target_index:
                 return True
 
-            print(f"카테고리 순서 변경: {source_index} -> {target_index}")
-            print(f"변경 전 순서:")
-            for i, cat in enumerate(self.categories):
-                print(f"  {i}: {cat.name}")
-
             # 카테고리 순서 변경
             moved_category = self.categories.pop(source_index)
             self.categories.insert(target_index, moved_category)
 
-            print(f"변경 후 순서:")
-            for i, cat in enumerate(self.categories):
-                print(f"  {i}: {cat.name}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("카테고리 순서 변경: %d -> %d, 결과 %s", source_index, target_index,
+                             [cat.name for cat in self.categories])
 
             self.categories_changed = True
+            self._notify_changes(categories_changed=True)
+            self.undo_history.record(ReorderCategoriesCommand(source_index, target_index))
             return True
 
-        except Exception as e:
-            print(f"카테고리 순서 변경 중 오류: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("카테고리 순서 변경 중 오류")
             return False
 
     def ensure_etc_category(self):
@@ -406,7 +841,7 @@ class StorageManager:
             etc_category = Category("ETC", "#EA4335")
             self.categories.append(etc_category)
             self.categories_changed = True
-            print("ETC 카테고리가 자동으로 생성되었습니다.")
+            logger.info("ETC 카테고리가 자동으로 생성되었습니다.")
 
     def get_task_stats(self, date_str):
         """특정 날짜의 작업 통계 조회
@@ -417,20 +852,24 @@ class StorageManager:
         Returns:
             dict: 작업 총 개수와 완료율을 포함한 통계
         """
-        tasks = [task for task in self.tasks if task.created_date == date_str]
-        total_count = len(tasks)
+        self._ensure_loaded(date_str, date_str)
+        counts = add_archived_counts(self.index.stats_on_date(date_str), self.archive.count_on_date(date_str))
+        return build_task_stats(*counts)
 
-        if total_count == 0:
-            return {"total": 0, "completed": 0, "completion_rate": 0}
+    def get_month_stats(self, year, month):
+        """한 달 동안의 날짜별 작업 통계 일괄 조회
 
-        completed_count = sum(1 for task in tasks if task.completed)
-        completion_rate = (completed_count / total_count) * 100
+        Args:
+            year (int): 연도
+            month (int): 월
 
-        return {
-            "total": total_count,
-            "completed": completed_count,
-            "completion_rate": completion_rate
-        }
+        Returns:
+            dict: 날짜(YYYY-MM-DD) -> get_task_stats()와 같은 형식의 통계 (작업이 있는 날짜만)
+        """
+        start_date, end_date = month_date_range(year, month)
+        self._ensure_loaded(start_date, end_date)
+        return merge_month_stats(self.index.stats_in_range(start_date, end_date),
+                                 self.archive.counts_in_range(start_date, end_date))
 
     def export_to_csv(self, file_path, date_range=None, categories=None, completed=None, include_header=True,
                       fields=None):
@@ -463,33 +902,8 @@ class StorageManager:
                 if include_header:
                     writer.writerow(export_fields)
 
-                # 필터링된 작업 목록
-                filtered_tasks = self.tasks
-
-                # 날짜 범위 필터링
-                if date_range:
-                    start_date, end_date = date_range
-                    filtered_tasks = [
-                        task for task in filtered_tasks
-                        if start_date <= task.created_date <= end_date
-                    ]
-
-                # 카테고리 필터링
-                if categories:
-                    filtered_tasks = [
-                        task for task in filtered_tasks
-                        if task.category in categories
-                    ]
-
-                # 완료 상태 필터링
-                if completed is not None:
-                    filtered_tasks = [
-                        task for task in filtered_tasks
-                        if task.completed == completed
-                    ]
-
                 # 데이터 작성
-                for task in filtered_tasks:
+                for task in self.query_with_archive(TaskQuery.from_filters(date_range, categories, completed)):
                     task_dict = task.to_dict()
                     row = [task_dict.get(field, "") for field in export_fields]
                     writer.writerow(row)
@@ -497,5 +911,65 @@ class StorageManager:
             return True
 
         except Exception as e:
-            print(f"CSV 내보내기 중 오류 발생: {e}")
-            return False
\ No newline at end of file
+            logger.error("CSV 내보내기 중 오류 발생: %s", e)
+            return False
+
+
+STORAGE_SETTINGS_FILE = "storage_settings.json"
+ARCHIVE_CUTOFF_SETTING = "archive_cutoff"  # 마지막으로 보관한 기준일 (YYYY-MM-DD)
+
+
+def load_storage_settings(data_dir="data"):
+    """저장소 설정 로드 (data/storage_settings.json)
+
+    Args:
+        data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+
+    Returns:
+        dict: 저장소 설정 (파일이 없으면 빈 딕셔너리)
+    """
+    settings_file = os.path.join(data_dir, STORAGE_SETTINGS_FILE)
+    return load_json_with_recovery(settings_file, default={}, validate=lambda data: isinstance(data, dict))
+
+
+def save_storage_settings(settings, data_dir="data"):
+    """저장소 설정 저장 (기존 설정과 병합)
+
+    Args:
+        settings (dict): 변경할 설정 항목
+        data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+    """
+    merged = load_storage_settings(data_dir)
+    merged.update(settings)
+    atomic_write_json(os.path.join(data_dir, STORAGE_SETTINGS_FILE), merged)
+
+
+def create_storage_manager(data_dir="data", backend=None):
+    """설정된 저장 방식에 맞는 스토리지 매니저 생성
+
+    Args:
+        data_dir (str, optional): 데이터 디렉토리. 기본값은 "data"
+        backend (str, optional): "json", "journal", "sqlite" 또는 "sharded". 지정하지 않으면 저장소 설정을 따름
+
+    Returns:
+        StorageManager: 스토리지 매니저 객체
+    """
+    settings = load_storage_settings(data_dir)
+    if backend is None:
+        backend = settings.get("backend", "json")
+
+    if backend == "sqlite":
+        from utils.sqlite_storage import SqliteStorageManager
+        return SqliteStorageManager(data_dir)
+
+    if backend == "sharded":
+        from utils.sharded_storage import ShardedStorageManager
+        return ShardedStorageManager(data_dir)
+
+    if backend == "journal":
+        from utils.task_journal import JournaledStorageManager, DEFAULT_COMPACT_BYTES
+        return JournaledStorageManager(data_dir, settings.get("journal_compact_bytes", DEFAULT_COMPACT_BYTES))
+
+    if backend != "json":
+        logger.warning("알 수 없는 저장 방식 '%s', JSON 저장소를 사용합니다.", backend)
+    return StorageManager(data_dir)
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+완료 작업 보관 (콜드 아카이브)
+
+일정 기간(기본 365일)이 지난 완료 작업을 작업 저장소에서 빼서 연도별 압축 파일로 옮긴다.
+    data/archive/2024.jsonl.gz        작업 레코드 (한 줄에 하나, 작업 파일과 같은 필드)
+    data/archive/2024.summary.json    날짜별 작업 수 요약
+
+요약 파일은 작아서 시작할 때 모두 읽어 두고, 달력 통계(보관 작업은 모두 완료 작업)를
+요약만으로 계산한다. 작업 레코드는 CSV 내보내기처럼 실제로 필요할 때만 해당 연도 파일을
+한 줄씩 풀어 읽는다.
+
+보관 파일은 연도 전체를 임시 파일에 다시 쓴 뒤 원자적으로 교체하므로 기록 도중 종료되어도
+이전 파일이 온전히 남는다. 다시 쓰기 전에는 기존 파일을 엄격하게 읽어, 손상된 파일이면
+일부만 읽은 내용으로 덮어쓰지 않고 보관을 중단한다. 요약에는 보관 파일 크기를 함께 적어 두고, 크기가 맞지 않으면
+(보관 파일만 교체되고 요약 기록 전에 종료된 경우 등) 보관 파일을 읽어 요약을 다시 만든다.
+"""
+
+import glob
+import gzip
+import json
+import os
+import tempfile
+import zlib
+from datetime import datetime, timedelta
+
+from models.task import Task
+from utils.durable_io import atomic_write_json, load_json_with_recovery
+from utils.logger import get_logger
+from utils.task_query import ORDER_RECENT, ORDER_STORAGE, sort_tasks
+
+logger = get_logger("storage")
+
+ARCHIVE_DIR_NAME = "archive"
+
+# 보관 대상 완료 작업의 기준 나이 (일)
+DEFAULT_ARCHIVE_AGE_DAYS = 365
+
+# 보관 파일 압축 수준 (9는 느리고 크기 차이는 작음)
+COMPRESS_LEVEL = 6
+
+
+def archive_end_date(age_days, today=None):
+    """보관 대상이 되는 마지막 날짜 (이 날짜까지 포함)
+
+    Args:
+        age_days (int): 보관 기준 나이 (일)
+        today (datetime.date, optional): 기준일. 기본값은 오늘
+
+    Returns:
+        str: YYYY-MM-DD
+    """
+    today = today or datetime.now().date()
+    return (today - timedelta(days=age_days + 1)).strftime("%Y-%m-%d")
+
+
+class TaskArchive:
+    """연도별 완료 작업 보관 파일 관리 클래스"""
+
+    def __init__(self, archive_dir):
+        """보관소 초기화 (요약 파일만 읽음)
+
+        Args:
+            archive_dir (str): 보관 디렉토리 (data/archive)
+        """
+        self.archive_dir = archive_dir
+        self.summaries = {}  # 연도 -> {"count": 작업 수, "bytes": 보관 파일 크기, "dates": {날짜: 작업 수}}
+        for path in glob.glob(os.path.join(archive_dir, "[0-9][0-9][0-9][0-9].jsonl.gz")):
+            year = os.path.basename(path)[:4]
+            self.summaries[year] = self._load_summary(year)
+
+    def _archive_path(self, year):
+        return os.path.join(self.archive_dir, f"{year}.jsonl.gz")
+
+    def _summary_path(self, year):
+        return os.path.join(self.archive_dir, f"{year}.summary.json")
+
+    def _load_summary(self, year):
+        """요약 로드 (없거나 보관 파일과 맞지 않으면 다시 만듦)"""
+        summary = load_json_with_recovery(self._summary_path(year),
+                                          validate=lambda data: isinstance(data, dict) and "dates" in data)
+        if summary is not None and summary.get("bytes") == os.path.getsize(self._archive_path(year)):
+            return summary
+
+        logger.warning("보관 요약이 없거나 맞지 않아 다시 만듭니다: %s", year)
+        records = self._read_records(year)
+        summary = self._build_summary(year, records)
+        try:
+            self._write_summary(year, summary)
+        except OSError as e:
+            logger.error("보관 요약 저장 중 오류 (%s): %s", year, e)
+        return summary
+
+    def _build_summary(self, year, records):
+        """작업 레코드 목록으로 요약 생성"""
+        dates = {}
+        for record in records:
+            created_date = record.get("created_date")
+            if created_date:
+                dates[created_date] = dates.get(created_date, 0) + 1
+        return {
+            "year": year,
+            "count": sum(dates.values()),
+            "bytes": os.path.getsize(self._archive_path(year)),
+            "dates": dict(sorted(dates.items())),
+        }
+
+    def _write_summary(self, year, summary):
+        # 요약은 보관 파일에서 언제든 다시 만들 수 있으므로 스냅샷을 남기지 않음
+        atomic_write_json(self._summary_path(year), summary, indent=None, snapshots=0)
+
+    def __len__(self):
+        return sum(summary["count"] for summary in self.summaries.values())
+
+    def years(self):
+        """보관 파일이 있는 연도 목록 (오름차순)"""
+        return sorted(self.summaries)
+
+    def count_on_date(self, date_str):
+        """날짜의 보관 작업 수"""
+        summary = self.summaries.get(date_str[:4])
+        return summary["dates"].get(date_str, 0) if summary else 0
+
+    def counts_in_range(self, start_date, end_date):
+        """기간 내 날짜별 보관 작업 수 (보관 작업이 있는 날짜만)
+
+        Args:
+            start_date (str): 시작일 (YYYY-MM-DD, 포함)
+            end_date (str): 종료일 (YYYY-MM-DD, 포함)
+
+        Returns:
+            dict: 날짜 -> 작업 수
+        """
+        counts = {}
+        for year in self._years_in_range(start_date, end_date):
+            for date_str, count in self.summaries[year]["dates"].items():
+                if start_date <= date_str <= end_date:
+                    counts[date_str] = count
+        return counts
+
+    def _years_in_range(self, start_date=None, end_date=None):
+        """기간과 겹치는 보관 연도 (오름차순)"""
+        return [
+            year for year in self.years()
+            if (start_date is None or year >= start_date[:4]) and (end_date is None or year <= end_date[:4])
+        ]
+
+    def _iter_records(self, year, strict=False):
+        """연도 보관 파일의 작업 레코드를 한 줄씩 읽기
+
+        Args:
+            year (str): 연도
+            strict (bool, optional): 손상된 줄이나 잘린 파일이면 건너뛰지 않고 RuntimeError 발생
+
+        Yields:
+            dict: 작업 레코드
+        """
+        path = self._archive_path(year)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        record = None
+                    if isinstance(record, dict):
+                        yield record
+                    elif strict:
+                        raise RuntimeError(f"손상된 보관 레코드: {path}:{line_number}")
+                    else:
+                        logger.warning("손상된 보관 레코드 건너뜀: %s:%d", path, line_number)
+        except (OSError, EOFError, zlib.error) as e:
+            if strict:
+                raise RuntimeError(f"보관 파일을 끝까지 읽을 수 없습니다 ({path}): {e}") from e
+            # 잘린 파일이면 읽은 데까지만 사용
+            logger.error("보관 파일 읽기 중 오류 (%s): %s", path, e)
+
+    def _read_records(self, year, strict=False):
+        """연도 보관 파일의 작업 레코드 목록"""
+        return list(self._iter_records(year, strict))
+
+    def iter_tasks(self, start_date=None, end_date=None):
+        """기간 내 보관 작업 (연도 파일을 필요할 때 하나씩 풀어 읽는 지연 반복자)
+
+        Args:
+            start_date (str, optional): 시작일 (YYYY-MM-DD, 포함)
+            end_date (str, optional): 종료일 (YYYY-MM-DD, 포함)
+
+        Yields:
+            Task: 보관 작업 (연도 오름차순, 연도 안에서는 보관 파일 순)
+        """
+        for year in self._years_in_range(start_date, end_date):
+            dates = self.summaries[year]["dates"]
+            if not any((start_date is None or d >= start_date) and (end_date is None or d <= end_date)
+                       for d in dates):
+                continue
+            for record in self._iter_records(year):
+                created_date = record.get("created_date", "")
+                if (start_date is None or created_date >= start_date) and \
+                        (end_date is None or created_date <= end_date):
+                    try:
+                        yield Task.from_record(record)
+                    except (KeyError, TypeError, AttributeError, ValueError) as e:
+                        logger.warning("보관 레코드 변환 실패 (%s): %s", record.get("id"), e)
+
+    def query(self, task_query):
+        """조회 조건에 맞는 보관 작업 (지연 반복자)
+
+        보관 작업은 모두 완료 작업이므로 미완료 조건이면 파일을 읽지 않는다.
+        ORDER_STORAGE가 아니면 연도별로 정렬해 이어 붙인다 (연도 순서도 정렬 방향을 따름).
+
+        Args:
+            task_query (TaskQuery): 조회 조건
+
+        Returns:
+            iterator: 작업 반복자
+        """
+        if task_query.completed is False or not self.summaries:
+            return iter(())
+        if task_query.order == ORDER_STORAGE:
+            return task_query.apply(self.iter_tasks(task_query.start_date, task_query.end_date))
+        return self._query_sorted(task_query)
+
+    def _query_sorted(self, task_query):
+        years = self._years_in_range(task_query.start_date, task_query.end_date)
+        if task_query.order == ORDER_RECENT:
+            years.reverse()
+        for year in years:
+            start_date = max(task_query.start_date or "", f"{year}-01-01")
+            end_date = min(task_query.end_date or "9999", f"{year}-12-31")
+            yield from sort_tasks(task_query.apply(self.iter_tasks(start_date, end_date)), task_query.order)
+
+    def add(self, tasks):
+        """작업을 연도별 보관 파일에 추가 (이미 보관된 ID는 건너뜀)
+
+        기존 연도 파일이 손상되어 끝까지 읽을 수 없으면 그 연도 파일은 그대로 두고 RuntimeError를
+        낸다. 앞서 기록한 연도는 남지만 작업은 아직 저장소에 있으므로 다음 보관 때 ID로 걸러진다.
+
+        Args:
+            tasks (iterable): 보관할 작업 목록
+
+        Returns:
+            int: 새로 보관한 작업 수
+
+        Raises:
+            RuntimeError: 기존 보관 파일이 손상된 경우
+        """
+        by_year = {}
+        for task in tasks:
+            by_year.setdefault(task.created_date[:4], []).append(task)
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        added = 0
+        for year, year_tasks in sorted(by_year.items()):
+            # 일부만 읽은 내용으로 연도 파일을 다시 쓰면 나머지가 사라지므로 엄격하게 읽음
+            records = self._read_records(year, strict=True) if year in self.summaries else []
+            archived_ids = {record.get("id") for record in records}
+            new_records = [task.to_dict() for task in year_tasks if task.id not in archived_ids]
+            if not new_records and year in self.summaries:
+                continue
+
+            records.extend(new_records)
+            self._write_records(year, records)
+            summary = self._build_summary(year, records)
+            self._write_summary(year, summary)
+            self.summaries[year] = summary
+            added += len(new_records)
+            logger.info("작업 %d개 보관: %s (연도 전체 %d개)", len(new_records), self._archive_path(year),
+                        len(records))
+        return added
+
+    def _write_records(self, year, records):
+        """연도 보관 파일을 임시 파일에 쓴 뒤 원자적으로 교체"""
+        path = self._archive_path(year)
+        fd, temp_path = tempfile.mkstemp(prefix=f".{year}.", suffix=".tmp", dir=self.archive_dir)
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                with gzip.GzipFile(filename=f"{year}.jsonl", mode="wb", fileobj=raw,
+                                   compresslevel=COMPRESS_LEVEL, mtime=0) as f:
+                    for record in records:
+                        f.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+                        f.write(b"\n")
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 변경 알림
+
+StorageManager는 작업을 추가/수정/삭제/순서 변경할 때마다 TaskChangeSet을 만들어
+등록된 리스너에 전달한다. 화면은 전달받은 ID와 날짜만 보고 해당 행과 달력 셀만
+갱신한다.
+
+리스너는 변경을 일으킨 스레드에서 바로 호출된다. 여러 변경을 한 번에 처리하는
+경우에는 batch_changes() 안에서 변경하면 끝날 때 하나로 합쳐 한 번만 알린다.
+"""
+
+
+class TaskChangeSet:
+    """저장소 변경 내역
+
+    Attributes:
+        added (set): 추가된 작업 ID
+        updated (set): 내용이 바뀐 작업 ID
+        removed (set): 삭제된 작업 ID
+        reordered_dates (set): 작업 순서가 바뀐 날짜
+        dates (set): 작업 수/완료/중요 통계가 바뀌었을 수 있는 날짜
+        categories_changed (bool): 카테고리 목록 변경 여부
+    """
+
+    __slots__ = ("added", "updated", "removed", "reordered_dates", "dates", "categories_changed")
+
+    def __init__(self, added=(), updated=(), removed=(), reordered_dates=(), dates=(), categories_changed=False):
+        self.added = set(added)
+        self.updated = set(updated)
+        self.removed = set(removed)
+        self.reordered_dates = set(reordered_dates)
+        self.dates = {date_str for date_str in dates if date_str}
+        self.categories_changed = categories_changed
+
+    def __repr__(self):
+        return (f"TaskChangeSet(added={self.added}, updated={self.updated}, removed={self.removed}, "
+                f"reordered_dates={self.reordered_dates}, dates={self.dates}, "
+                f"categories_changed={self.categories_changed})")
+
+    @property
+    def task_ids(self):
+        """변경된 모든 작업 ID"""
+        return self.added | self.updated | self.removed
+
+    def is_empty(self):
+        """변경 내역이 없는지 여부"""
+        return not (self.added or self.updated or self.removed or self.reordered_dates
+                    or self.dates or self.categories_changed)
+
+    def merge(self, other):
+        """다른 변경 내역을 합치기 (추가 후 삭제된 작업 등은 최종 상태 기준으로 정리)
+
+        Args:
+            other (TaskChangeSet): 뒤에 일어난 변경 내역
+        """
+        # 이번 묶음에서 추가된 작업이 다시 삭제되면 알릴 필요가 없음
+        added_then_removed = self.added & other.removed
+        self.added |= other.added
+        self.removed |= other.removed
+        self.added -= added_then_removed
+        self.removed -= added_then_removed
+
+        # 추가/삭제된 작업은 수정 목록에서 뺀다. 일괄 추가처럼 변경이 많이 쌓여도 합칠 때마다
+        # 전체를 다시 계산하지 않도록 이번에 들어온 ID만 확인
+        self.updated |= other.updated
+        self.updated -= other.added
+        self.updated -= other.removed
+        self.updated -= added_then_removed
+        self.updated.difference_update([task_id for task_id in other.updated
+                                        if task_id in self.added or task_id in self.removed])
+        self.reordered_dates |= other.reordered_dates
+        self.dates |= other.dates
+        self.categories_changed = self.categories_changed or other.categories_changed
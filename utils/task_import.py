@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 파일 가져오기 (JSONL/CSV)
+
+    - JSONL: 한 줄에 작업 딕셔너리 하나 (작업 파일/보관 파일과 같은 필드)
+    - CSV: 첫 줄이 헤더. 필드 이름(title 등)과 CSV 내보내기 헤더(제목 등)를 모두 인식하고,
+      중요/완료 값은 예/아니오, true/false, 1/0을 받는다. 빈 칸은 기본값을 쓴다.
+
+파일 전체를 먼저 읽고 검사해 (작업 목록, 오류 목록)을 돌려주므로, 호출하는 쪽에서
+오류가 하나라도 있으면 아무것도 추가하지 않을 수 있다. 저장은 StorageManager.import_tasks()가
+한 번에 처리한다.
+"""
+
+import csv
+import json
+import os
+
+from models.task import Task
+from utils.csv_exporter import CSV_FIELD_LABELS
+from utils.task_loader import validate_task_record
+
+IMPORT_FORMATS = ("jsonl", "csv")
+
+# CSV 헤더 -> 필드 이름 (필드 이름 자체도 허용)
+CSV_HEADER_FIELDS = {label: field for field, label in CSV_FIELD_LABELS.items()}
+CSV_HEADER_FIELDS.update({field: field for field in ("id", "title", "content", "category", "created_date",
+                                                     "important", "completed", "bg_color", "order")})
+
+TRUE_VALUES = {"예", "y", "yes", "true", "1"}
+FALSE_VALUES = {"아니오", "n", "no", "false", "0", ""}
+
+
+def detect_format(path):
+    """파일 확장자로 가져오기 형식 추정 (.csv가 아니면 JSONL)"""
+    return "csv" if os.path.splitext(path)[1].lower() == ".csv" else "jsonl"
+
+
+def read_jsonl_records(f):
+    """JSONL 파일 객체에서 (줄 번호, 레코드) 목록과 오류 목록 읽기 (빈 줄은 건너뜀)"""
+    records, errors = [], []
+    for line_number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            records.append((line_number, json.loads(line)))
+        except ValueError as e:
+            errors.append((line_number, f"JSON 형식 오류: {e}"))
+    return records, errors
+
+
+def _parse_bool(value):
+    normalized = value.strip().lower()
+    if normalized in TRUE_VALUES:
+        return True
+    if normalized in FALSE_VALUES:
+        return False
+    raise ValueError(f"예/아니오 값이 아님: {value!r}")
+
+
+def read_csv_records(f):
+    """CSV 파일 객체에서 (줄 번호, 레코드) 목록과 오류 목록 읽기"""
+    records, errors = [], []
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return records, errors
+
+    fields = [CSV_HEADER_FIELDS.get(name.strip()) for name in header]
+    unknown = [name for name, field in zip(header, fields) if field is None]
+    if unknown:
+        errors.append((1, f"알 수 없는 열: {', '.join(unknown)}"))
+        return records, errors
+    if "title" not in fields:
+        errors.append((1, "제목(title) 열이 없음"))
+        return records, errors
+
+    for row in reader:
+        line_number = reader.line_num
+        if not any(cell.strip() for cell in row):
+            continue
+        if len(row) > len(fields):
+            errors.append((line_number, f"열 개수가 헤더보다 많음 ({len(row)}개)"))
+            continue
+        record = {}
+        try:
+            for field, value in zip(fields, row):
+                if field in ("important", "completed"):
+                    record[field] = _parse_bool(value)
+                elif value == "":
+                    # 빈 칸은 기본값 사용 (제목은 검사에서 걸러짐)
+                    if field == "title":
+                        record[field] = value
+                elif field == "order":
+                    record[field] = int(value)
+                else:
+                    record[field] = value
+        except ValueError as e:
+            errors.append((line_number, str(e)))
+            continue
+        records.append((line_number, record))
+    return records, errors
+
+
+def load_import_file(path, file_format=None):
+    """가져올 파일을 읽어 Task 목록으로 변환
+
+    Args:
+        path (str): JSONL 또는 CSV 파일 경로
+        file_format (str, optional): "jsonl" 또는 "csv" (기본값은 확장자로 추정)
+
+    Returns:
+        tuple: (Task 목록, (줄 번호, 오류 내용) 목록)
+    """
+    file_format = file_format or detect_format(path)
+    if file_format not in IMPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 가져오기 형식: {file_format}")
+
+    # 엑셀에서 저장한 CSV와 CSV 내보내기 파일은 BOM이 붙어 있음
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        records, errors = read_csv_records(f) if file_format == "csv" else read_jsonl_records(f)
+
+    tasks = []
+    for line_number, record in records:
+        error = validate_task_record(record)
+        if error is None and not record["title"].strip():
+            error = "제목이 비어 있음"
+        if error is not None:
+            errors.append((line_number, error))
+            continue
+        tasks.append(Task.from_record(record))
+    errors.sort()
+    return tasks, errors
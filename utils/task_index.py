@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 보조 인덱스
+
+StorageManager가 보유하는 메모리 인덱스로, 전체 작업 목록을 매번 훑지 않고
+ID/날짜/중요 미완료 여부로 작업을 찾을 수 있게 한다. 모든 변경 경로에서
+증분으로 갱신된다.
+
+ID 사전(by_id)은 입력 순서를 유지하는 작업 원본이기도 하다. 저장 순서와 전체 목록은
+여기서 만들므로 수정/삭제 때 별도의 목록을 훑을 필요가 없다.
+
+UI 코드는 작업 객체를 직접 수정한 뒤 update_task를 호출하므로, 인덱스는 각 작업이
+어느 키로 등록되어 있는지 따로 기억해 두고 refresh() 시 달라진 부분만 옮긴다.
+
+날짜별 집계(전체/완료/중요 미완료 수)도 같은 경로에서 함께 갱신하므로
+달력처럼 여러 날짜의 통계를 반복 조회하는 화면은 작업을 훑지 않고 집계만 읽는다.
+"""
+
+
+def is_important_open(task):
+    """중요 미완료 작업 여부"""
+    return bool(task.important) and not task.completed
+
+
+def order_key(task):
+    """날짜 내 정렬 키 (order가 없으면 뒤로)"""
+    order = getattr(task, 'order', None)
+    return (order is None, order if order is not None else 0)
+
+
+class TaskIndex:
+    """작업 ID/날짜/중요 미완료 인덱스"""
+
+    def __init__(self, tasks=()):
+        """인덱스 초기화
+
+        Args:
+            tasks (iterable, optional): 초기 작업 목록 (목록 순서가 입력 순서가 됨)
+        """
+        self.rebuild(tasks)
+
+    def rebuild(self, tasks):
+        """전체 작업 목록으로 인덱스 재구성
+
+        Args:
+            tasks (iterable): 작업 목록
+        """
+        self.by_id = {}                 # id -> Task (입력 순, 작업 원본)
+        self.by_date = {}               # 날짜 -> order 순 작업 목록
+        self.important_open = {}        # id -> Task (중요 미완료 작업)
+        self._keys = {}                 # id -> (등록된 날짜, 중요 미완료 여부, 완료 여부)
+        self.date_stats = {}            # 날짜 -> [전체, 완료, 중요 미완료] 수
+        self._seq = {}                  # id -> 입력 순번
+        self._next_seq = 0
+        self._unsorted_dates = set()    # 정렬이 필요한 날짜 (조회 시 정렬)
+
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __contains__(self, task_id):
+        return task_id in self.by_id
+
+    def get(self, task_id):
+        """ID로 작업 조회
+
+        Args:
+            task_id (str): 작업 ID
+
+        Returns:
+            Task: 작업 객체 (없으면 None)
+        """
+        return self.by_id.get(task_id)
+
+    def all_tasks(self):
+        """전체 작업 목록 (입력 순, 복사본)"""
+        return list(self.by_id.values())
+
+    def position(self, task_id):
+        """작업의 입력 순번 (입력 순 정렬 키)"""
+        return self._seq.get(task_id, 0)
+
+    def indexed_date(self, task_id):
+        """작업이 현재 등록되어 있는 날짜 (직접 수정되기 전의 날짜, 없으면 None)"""
+        keys = self._keys.get(task_id)
+        return keys[0] if keys else None
+
+    def add(self, task):
+        """작업 등록
+
+        Args:
+            task (Task): 등록할 작업
+        """
+        if task.id in self.by_id:
+            # 중복 ID는 마지막 작업 기준으로 유지
+            self.remove(task.id)
+
+        self.by_id[task.id] = task
+        self._seq[task.id] = self._next_seq
+        self._next_seq += 1
+        self._link(task)
+
+    def remove(self, task_id):
+        """작업 등록 해제
+
+        Args:
+            task_id (str): 작업 ID
+
+        Returns:
+            Task: 해제된 작업 (없으면 None)
+        """
+        task = self.by_id.pop(task_id, None)
+        if task is None:
+            return None
+
+        self._seq.pop(task_id, None)
+        self._unlink(task)
+        return task
+
+    def replace(self, task_id, new_task):
+        """같은 ID의 작업 객체 교체 (입력 순서 유지)
+
+        Args:
+            task_id (str): 기존 작업 ID
+            new_task (Task): 새 작업 객체
+        """
+        old_task = self.by_id.get(task_id)
+        if old_task is None or new_task.id != task_id:
+            seq = self._seq.get(task_id)
+            self.remove(task_id)
+            self.add(new_task)
+            if seq is not None:
+                self._seq[new_task.id] = seq
+            return
+
+        self._unlink(old_task)
+        self.by_id[task_id] = new_task
+        self._link(new_task)
+
+    def _link(self, task):
+        """날짜 목록/중요 미완료/집계에 작업 등록 (by_id에는 이미 있는 상태)"""
+        date_str = task.created_date
+        important_open = is_important_open(task)
+
+        date_tasks = self.by_date.setdefault(date_str, [])
+        if date_tasks and order_key(task) < order_key(date_tasks[-1]):
+            self._unsorted_dates.add(date_str)
+        date_tasks.append(task)
+
+        if important_open:
+            self.important_open[task.id] = task
+
+        completed = bool(task.completed)
+        self._keys[task.id] = (date_str, important_open, completed)
+        self._update_stats(date_str, 1, completed, important_open)
+
+    def _unlink(self, task):
+        """날짜 목록/중요 미완료/집계에서 작업 제거"""
+        date_str, important_open, completed = self._keys.pop(task.id)
+        self.important_open.pop(task.id, None)
+        self._remove_from_date(date_str, task)
+        self._update_stats(date_str, -1, completed, important_open)
+
+    def refresh(self, task):
+        """작업 객체가 직접 수정된 뒤 인덱스 위치 갱신
+
+        Args:
+            task (Task): 수정된 작업 (이미 등록된 객체)
+        """
+        if task.id not in self._keys:
+            self.add(task)
+            return
+
+        old_date, was_important_open, was_completed = self._keys[task.id]
+        new_date = task.created_date
+        now_important_open = is_important_open(task)
+        now_completed = bool(task.completed)
+
+        if old_date != new_date:
+            self._remove_from_date(old_date, task)
+            self.by_date.setdefault(new_date, []).append(task)
+        # order가 바뀌었을 수 있으므로 다음 조회 시 정렬
+        self._unsorted_dates.add(new_date)
+
+        if was_important_open != now_important_open:
+            if now_important_open:
+                self.important_open[task.id] = task
+            else:
+                self.important_open.pop(task.id, None)
+
+        if (old_date, was_important_open, was_completed) != (new_date, now_important_open, now_completed):
+            self._update_stats(old_date, -1, was_completed, was_important_open)
+            self._update_stats(new_date, 1, now_completed, now_important_open)
+
+        self._keys[task.id] = (new_date, now_important_open, now_completed)
+
+    def mark_date_dirty(self, date_str):
+        """날짜 작업의 order가 바뀌었음을 표시 (다음 조회 시 정렬)"""
+        self._unsorted_dates.add(date_str)
+
+    def _update_stats(self, date_str, delta, completed, important_open):
+        """날짜 집계에 작업 하나를 더하거나 빼기"""
+        stats = self.date_stats.get(date_str)
+        if stats is None:
+            stats = self.date_stats[date_str] = [0, 0, 0]
+        stats[0] += delta
+        if completed:
+            stats[1] += delta
+        if important_open:
+            stats[2] += delta
+        if stats[0] <= 0:
+            del self.date_stats[date_str]
+
+    def _remove_from_date(self, date_str, task):
+        """날짜 목록에서 작업 제거"""
+        date_tasks = self.by_date.get(date_str)
+        if not date_tasks:
+            return
+        for i, date_task in enumerate(date_tasks):
+            if date_task is task:
+                del date_tasks[i]
+                break
+        if not date_tasks:
+            del self.by_date[date_str]
+            self._unsorted_dates.discard(date_str)
+
+    def _sorted_date_tasks(self, date_str):
+        """정렬된 날짜 작업 목록 (내부 목록 그대로 반환)"""
+        date_tasks = self.by_date.get(date_str)
+        if date_tasks is None:
+            return []
+        if date_str in self._unsorted_dates:
+            # 같은 order는 입력 순서 유지
+            date_tasks.sort(key=lambda t: (order_key(t), self._seq.get(t.id, 0)))
+            self._unsorted_dates.discard(date_str)
+        return date_tasks
+
+    def tasks_on_date(self, date_str):
+        """날짜의 작업 목록 (order 순, 복사본)
+
+        Args:
+            date_str (str): 날짜 (YYYY-MM-DD)
+
+        Returns:
+            list: 작업 목록
+        """
+        return list(self._sorted_date_tasks(date_str))
+
+    def count_on_date(self, date_str):
+        """날짜의 작업 수"""
+        return len(self.by_date.get(date_str, ()))
+
+    def important_open_tasks(self, exclude_date=None):
+        """중요 미완료 작업 목록 (입력 순)
+
+        Args:
+            exclude_date (str, optional): 제외할 날짜
+
+        Returns:
+            list: 작업 목록
+        """
+        tasks = [
+            task for task in self.important_open.values()
+            if task.created_date != exclude_date
+        ]
+        tasks.sort(key=lambda t: self._seq.get(t.id, 0))
+        return tasks
+
+    def stats_on_date(self, date_str):
+        """날짜 집계 조회
+
+        Returns:
+            tuple: (전체, 완료, 중요 미완료) 작업 수
+        """
+        stats = self.date_stats.get(date_str)
+        return tuple(stats) if stats else (0, 0, 0)
+
+    def stats_in_range(self, start_date, end_date):
+        """기간 내 날짜별 집계 (작업이 있는 날짜만)
+
+        Args:
+            start_date (str): 시작일 (YYYY-MM-DD, 포함)
+            end_date (str): 종료일 (YYYY-MM-DD, 포함)
+
+        Returns:
+            dict: 날짜 -> (전체, 완료, 중요 미완료)
+        """
+        return {
+            date_str: tuple(stats)
+            for date_str, stats in self.date_stats.items()
+            if start_date <= date_str <= end_date
+        }
+
+    def dates(self):
+        """작업이 있는 날짜 목록"""
+        return list(self.by_date.keys())
+
+    def dates_in_range(self, start_date=None, end_date=None):
+        """기간 내 작업이 있는 날짜 목록 (오름차순)
+
+        Args:
+            start_date (str, optional): 시작일 (YYYY-MM-DD, 포함). None이면 처음부터
+            end_date (str, optional): 종료일 (YYYY-MM-DD, 포함). None이면 끝까지
+        """
+        return sorted(
+            date_str for date_str in self.by_date
+            if (start_date is None or date_str >= start_date) and (end_date is None or date_str <= end_date)
+        )
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 변경 저널 (append-only)
+
+작업이 바뀔 때마다 tasks.json 전체를 다시 쓰는 대신, 변경된 작업 레코드만
+data/tasks.journal에 한 줄씩(JSON Lines) 추가한다. 저널이 일정 크기를 넘으면
+백그라운드 스레드에서 tasks.json 스냅샷으로 압축하고, 시작 시에는
+스냅샷 + 저널을 재생하여 상태를 복원한다.
+
+저널 연산 형식:
+    {"op": "add", "task": {...}}
+    {"op": "update", "task": {...}}
+    {"op": "delete", "id": "..."}
+    {"op": "rank", "orders": {"id": order, ...}}   (순서 변경: order가 바뀐 작업만)
+    {"op": "reorder", "date": "YYYY-MM-DD", "ids": [...]}   (이전 버전 저널 재생용)
+    {"op": "recategorize", "from": "LB", "to": "ETC"}
+"""
+
+import glob
+import json
+import os
+import threading
+import time
+
+from models.task import Task
+from utils.durable_io import atomic_write_json
+from utils.logger import get_logger
+from utils.storage import StorageManager
+from utils.task_loader import dump_tasks
+
+logger = get_logger("storage")
+
+# 저널 압축 기준 크기 (1MB)
+DEFAULT_COMPACT_BYTES = 1024 * 1024
+
+# 재생 시 기존 작업 객체에 덮어쓸 필드
+TASK_FIELDS = ("title", "content", "category", "created_date", "important", "completed", "bg_color", "order")
+
+
+class TaskJournal:
+    """append-only 저널 파일 관리 클래스"""
+
+    def __init__(self, journal_file, compact_threshold=DEFAULT_COMPACT_BYTES):
+        """저널 초기화
+
+        Args:
+            journal_file (str): 저널 파일 경로
+            compact_threshold (int, optional): 압축을 시작할 저널 크기 (바이트)
+        """
+        self.journal_file = journal_file
+        self.compact_threshold = compact_threshold
+        self._lock = threading.Lock()
+
+    def _sealed_segments(self):
+        """압축 대기 중인(봉인된) 저널 조각 목록 (오래된 순)"""
+        return sorted(glob.glob(f"{self.journal_file}.sealed-*"))
+
+    def read_ops(self):
+        """봉인된 조각과 현재 저널의 모든 연산을 순서대로 읽기
+
+        마지막 줄이 중간에 잘린 경우(기록 중 종료) 해당 줄은 건너뛴다.
+
+        Returns:
+            list: 연산 딕셔너리 목록
+        """
+        ops = []
+        for path in self._sealed_segments() + [self.journal_file]:
+            if not os.path.exists(path):
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        ops.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning("저널 손상 줄 건너뜀: %s:%d", path, line_no)
+        return ops
+
+    def append(self, ops):
+        """연산 목록을 저널 끝에 추가하고 디스크에 반영
+
+        Args:
+            ops (list): 연산 딕셔너리 목록
+        """
+        if not ops:
+            return
+        lines = "".join(json.dumps(op, ensure_ascii=False) + "\n" for op in ops)
+        with self._lock:
+            with open(self.journal_file, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def size(self):
+        """현재 저널 파일 크기 (바이트)"""
+        try:
+            return os.path.getsize(self.journal_file)
+        except OSError:
+            return 0
+
+    def needs_compaction(self):
+        """압축이 필요한 크기인지 확인"""
+        return self.size() >= self.compact_threshold
+
+    def seal(self):
+        """현재 저널을 봉인하여 이후 기록이 새 파일로 가도록 전환
+
+        Returns:
+            list: 이번 압축에 포함될 봉인 조각 경로 목록
+        """
+        with self._lock:
+            if os.path.exists(self.journal_file):
+                os.replace(self.journal_file, f"{self.journal_file}.sealed-{time.time_ns()}")
+            return self._sealed_segments()
+
+    def discard(self, segments):
+        """스냅샷에 반영된 봉인 조각 삭제
+
+        Args:
+            segments (list): 삭제할 조각 경로 목록
+        """
+        for path in segments:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+class JournaledStorageManager(StorageManager):
+    """변경분만 저널에 기록하는 스토리지 매니저"""
+
+    def __init__(self, data_dir="data", compact_threshold=DEFAULT_COMPACT_BYTES):
+        """저널 스토리지 매니저 초기화
+
+        Args:
+            data_dir (str, optional): 데이터 저장 디렉토리. 기본값은 "data"
+            compact_threshold (int, optional): 저널 압축 기준 크기 (바이트)
+        """
+        os.makedirs(data_dir, exist_ok=True)
+        self.journal = TaskJournal(os.path.join(data_dir, "tasks.journal"), compact_threshold)
+        self.pending_ops = []
+        self._compaction_thread = None
+
+        # 스냅샷(tasks.json) 로드 및 인덱스 구성
+        super().__init__(data_dir)
+
+        # 스냅샷 이후의 저널 재생
+        ops = self.journal.read_ops()
+        for op in ops:
+            try:
+                self._apply_op(op)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.error("저널 연산 재생 중 오류 (%s): %s", op.get('op'), e)
+        if ops:
+            logger.info("저널 재생 완료: 연산 %d개", len(ops))
+
+    def _apply_op(self, op):
+        """저널 연산 하나를 메모리 상태에 적용 (재생용, 중복 적용해도 같은 결과)"""
+        kind = op["op"]
+        if kind in ("add", "update"):
+            task = Task.from_dict(op["task"])
+            existing = self.index.get(task.id)
+            if existing is not None:
+                for field in TASK_FIELDS:
+                    setattr(existing, field, getattr(task, field))
+                self.index.refresh(existing)
+            else:
+                self.index.add(task)
+        elif kind == "delete":
+            self.index.remove(op["id"])
+        elif kind == "rank":
+            for task_id, order in op["orders"].items():
+                task = self.index.get(task_id)
+                if task is not None:
+                    task.order = order
+                    self.index.mark_date_dirty(task.created_date)
+        elif kind == "reorder":
+            self._apply_reorder(op["date"], op["ids"])
+        elif kind == "recategorize":
+            for task in self.index.by_id.values():
+                if task.category == op["from"]:
+                    task.category = op["to"]
+
+    def _apply_reorder(self, date_str, ordered_ids):
+        """날짜 작업들의 order를 주어진 ID 순서대로 다시 매김"""
+        date_tasks = self.index.tasks_on_date(date_str)
+        by_id = {task.id: task for task in date_tasks}
+        ordered = [by_id[task_id] for task_id in ordered_ids if task_id in by_id]
+        # 저널 이후 추가된 작업 등 목록에 없는 작업은 뒤에 유지
+        listed = set(ordered_ids)
+        ordered += [task for task in date_tasks if task.id not in listed]
+        for i, task in enumerate(ordered):
+            task.order = i + 1
+        self.index.mark_date_dirty(date_str)
+
+    def _record(self, op):
+        """저장 대기 연산 추가"""
+        self.pending_ops.append(op)
+        self.tasks_changed = True
+
+    def add_task(self, task):
+        """작업 추가 (저널 기록)"""
+        super().add_task(task)
+        self._record({"op": "add", "task": task.to_dict()})
+
+    def update_task(self, task_id, updated_task):
+        """작업 업데이트 (저널 기록)"""
+        if super().update_task(task_id, updated_task):
+            self._record({"op": "update", "task": updated_task.to_dict()})
+            return True
+        return False
+
+    def delete_task(self, task_id):
+        """작업 삭제 (저널 기록)"""
+        if super().delete_task(task_id):
+            self._record({"op": "delete", "id": task_id})
+            return True
+        return False
+
+    def move_task(self, task_id, target_index):
+        """작업 순서 변경 (order가 바뀐 작업만 저널에 기록, 보통 옮긴 작업 하나)"""
+        task = self.index.get(task_id)
+        if task is None:
+            return False
+        self._ensure_loaded(task.created_date, task.created_date)
+        date_tasks = self.index.tasks_on_date(task.created_date)
+        old_orders = {t.id: t.order for t in date_tasks}
+
+        if super().move_task(task_id, target_index):
+            orders = {t.id: t.order for t in date_tasks if t.order != old_orders[t.id]}
+            if orders:
+                self._record({"op": "rank", "orders": orders})
+            return True
+        return False
+
+    def delete_category(self, category_name):
+        """카테고리 삭제 (작업 카테고리 변경을 저널에 기록)"""
+        if super().delete_category(category_name):
+            self._record({"op": "recategorize", "from": category_name, "to": "ETC"})
+            return True
+        return False
+
+    def _remove_archived(self, tasks):
+        """보관한 작업 제거 (삭제 연산을 작업마다 남기지 않고 바로 스냅샷으로 압축)"""
+        super()._remove_archived(tasks)
+        if self._compaction_thread and self._compaction_thread.is_alive():
+            self._compaction_thread.join()
+        self.compact(wait=True)
+
+    def _save_tasks(self):
+        """대기 중인 연산을 저널에 추가하고, 필요하면 백그라운드 압축 시작"""
+        ops, self.pending_ops = self.pending_ops, []
+        self.journal.append(ops)
+
+        if self.journal.needs_compaction():
+            self.compact()
+
+    def compact(self, wait=False):
+        """저널을 tasks.json 스냅샷으로 압축
+
+        스냅샷 데이터는 호출 스레드에서 만들고, 파일 기록은 백그라운드 스레드에서 수행한다.
+
+        Args:
+            wait (bool, optional): 압축 완료까지 대기할지 여부
+        """
+        if self._compaction_thread and self._compaction_thread.is_alive():
+            if wait:
+                self._compaction_thread.join()
+            return
+
+        # 대기 연산을 먼저 기록한 뒤 봉인해야 스냅샷과 저널이 일치함
+        ops, self.pending_ops = self.pending_ops, []
+        self.journal.append(ops)
+
+        tasks_data = dump_tasks(self.tasks)
+        segments = self.journal.seal()
+
+        self._compaction_thread = threading.Thread(
+            target=self._write_snapshot, args=(tasks_data, segments),
+            name="TaskJournalCompaction", daemon=False
+        )
+        self._compaction_thread.start()
+        if wait:
+            self._compaction_thread.join()
+
+    def _write_snapshot(self, tasks_data, segments):
+        """스냅샷 파일 기록 후 반영된 저널 조각 삭제 (백그라운드 스레드)"""
+        try:
+            atomic_write_json(self.tasks_file, tasks_data, indent=None)
+            self.journal.discard(segments)
+            logger.info("저널 압축 완료: 작업 %d개", len(tasks_data['tasks']))
+        except Exception as e:
+            # 조각을 지우지 않았으므로 다음 시작 시 재생됨
+            logger.error("저널 압축 중 오류: %s", e)
+
+    def close(self):
+        """대기 중인 변경 기록 및 진행 중인 압축 완료 대기"""
+        self.save_data()
+        self.save_search_index()
+        if self._compaction_thread and self._compaction_thread.is_alive():
+            self._compaction_thread.join()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 데이터 일괄 로더
+
+작업 파일은 스키마 버전이 붙은 형식으로 저장한다.
+    {"schema_version": 2, "tasks": [{...}, ...]}
+
+이전 형식(작업 딕셔너리 목록만 있는 파일)은 버전 1로 취급하여 레코드마다 검증하고,
+현재 버전으로 저장된 파일은 신뢰할 수 있는 데이터로 보고 검증 없이 바로 객체를 만든다.
+어느 쪽이든 객체로 만들 수 없는 레코드는 건너뛰고 모아서 data/quarantine/에
+한 번에 보고서로 남긴다.
+"""
+
+import os
+from datetime import datetime
+
+from models.task import Task, date_to_ordinal
+from utils.durable_io import atomic_write_json, load_json_with_recovery
+from utils.logger import get_logger
+
+logger = get_logger("storage")
+
+# 현재 작업 파일 스키마 버전
+TASKS_SCHEMA_VERSION = 2
+
+QUARANTINE_DIR_NAME = "quarantine"
+
+
+def dump_task_records(records):
+    """작업 레코드 목록을 스키마 버전이 붙은 저장 형식으로 감싸기
+
+    Args:
+        records (list): 작업 딕셔너리 목록
+
+    Returns:
+        dict: 저장할 데이터
+    """
+    return {"schema_version": TASKS_SCHEMA_VERSION, "tasks": records}
+
+
+def dump_tasks(tasks):
+    """Task 목록을 저장 형식으로 변환"""
+    return dump_task_records([task.to_dict() for task in tasks])
+
+
+def is_tasks_data(data):
+    """작업 파일 형식 검사 (이전 목록 형식 포함)"""
+    if isinstance(data, list):
+        return True
+    return (isinstance(data, dict) and isinstance(data.get("schema_version"), int)
+            and isinstance(data.get("tasks"), list))
+
+
+def unwrap_task_records(data):
+    """저장 형식에서 스키마 버전과 레코드 목록 꺼내기
+
+    Args:
+        data: 작업 파일에서 읽은 데이터
+
+    Returns:
+        tuple: (스키마 버전, 작업 레코드 목록)
+    """
+    if isinstance(data, list):
+        return 1, data
+    return data["schema_version"], data["tasks"]
+
+
+def validate_task_record(record):
+    """작업 레코드 검사
+
+    Args:
+        record: 작업 레코드
+
+    Returns:
+        str: 오류 내용 (올바른 레코드면 None)
+    """
+    if not isinstance(record, dict):
+        return "딕셔너리 형식이 아님"
+    if not isinstance(record.get("title"), str):
+        return "제목(title) 누락 또는 형식 오류"
+    if "id" in record and not isinstance(record["id"], str):
+        return "ID 형식 오류"
+    for field in ("content", "category", "bg_color"):
+        if record.get(field) is not None and not isinstance(record[field], str):
+            return f"{field} 형식 오류"
+    created_date = record.get("created_date")
+    if created_date is not None and date_to_ordinal(created_date) is None:
+        return f"날짜 형식 오류: {created_date!r}"
+    order = record.get("order")
+    if order is not None and (not isinstance(order, int) or isinstance(order, bool)):
+        return f"순서 형식 오류: {order!r}"
+    return None
+
+
+def _quarantine_entry(position, record, error):
+    """격리 항목 생성"""
+    return {
+        "index": position,
+        "id": record.get("id") if isinstance(record, dict) else None,
+        "error": error,
+        "record": record,
+    }
+
+
+def load_task_records(records, trusted=False):
+    """작업 레코드 목록을 Task 목록으로 일괄 변환
+
+    Args:
+        records (list): 작업 레코드 목록
+        trusted (bool, optional): 현재 스키마로 저장된 데이터인지 여부. True이면 레코드별 검증을 생략
+
+    Returns:
+        tuple: (Task 목록, 격리된 레코드 목록)
+    """
+    from_record = Task.from_record
+    tasks = None
+    positions = None  # 각 Task가 나온 레코드 위치 (검증 로드 시)
+    quarantine = []
+
+    if trusted:
+        try:
+            tasks = [from_record(record) for record in records]
+        except (KeyError, TypeError, AttributeError, ValueError):
+            # 손상된 레코드가 섞여 있으면 레코드별 검증으로 다시 로드
+            tasks = None
+
+    if tasks is None:
+        tasks = []
+        positions = []
+        for position, record in enumerate(records):
+            error = validate_task_record(record)
+            if error is None:
+                try:
+                    tasks.append(from_record(record))
+                    positions.append(position)
+                    continue
+                except (KeyError, TypeError, AttributeError, ValueError) as e:
+                    error = str(e)
+            quarantine.append(_quarantine_entry(position, record, error))
+
+    # 중복 ID는 마지막 레코드 기준으로 유지
+    last_seen = {task.id: i for i, task in enumerate(tasks)}
+    if len(last_seen) != len(tasks):
+        kept = []
+        for i, task in enumerate(tasks):
+            if last_seen[task.id] == i:
+                kept.append(task)
+            else:
+                position = positions[i] if positions is not None else i
+                quarantine.append(_quarantine_entry(position, records[position], "중복 ID (이후 레코드로 대체됨)"))
+        tasks = kept
+
+    return tasks, quarantine
+
+
+def write_quarantine_report(quarantine, source_path):
+    """격리된 레코드를 보고서 파일로 저장
+
+    Args:
+        quarantine (list): 격리된 레코드 목록
+        source_path (str): 레코드를 읽은 파일 경로
+
+    Returns:
+        str: 보고서 파일 경로 (격리된 레코드가 없으면 None)
+    """
+    if not quarantine:
+        return None
+
+    source_path = os.path.abspath(source_path)
+    report_dir = os.path.join(os.path.dirname(source_path), QUARANTINE_DIR_NAME)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    report_path = os.path.join(report_dir, f"{os.path.basename(source_path)}.{stamp}.json")
+
+    atomic_write_json(report_path, {
+        "source": source_path,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "count": len(quarantine),
+        "records": quarantine,
+    }, snapshots=0)
+    return report_path
+
+
+def load_tasks_file(path):
+    """작업 파일을 읽어 Task 목록으로 변환 (손상 시 스냅샷 복구, 잘못된 레코드는 격리)
+
+    Args:
+        path (str): 작업 파일 경로
+
+    Returns:
+        list: Task 목록
+    """
+    data = load_json_with_recovery(path, default=[], validate=is_tasks_data)
+    schema_version, records = unwrap_task_records(data)
+    if schema_version > TASKS_SCHEMA_VERSION:
+        logger.warning("지원하지 않는 작업 파일 버전 %s: %s (레코드별 검증 후 로드)", schema_version, path)
+
+    tasks, quarantine = load_task_records(records, trusted=schema_version == TASKS_SCHEMA_VERSION)
+    if quarantine:
+        try:
+            report_path = write_quarantine_report(quarantine, path)
+            logger.warning("잘못된 작업 레코드 %d개를 제외했습니다: %s", len(quarantine), report_path)
+        except OSError as e:
+            logger.warning("잘못된 작업 레코드 %d개를 제외했습니다 (보고서 저장 실패: %s)", len(quarantine), e)
+    return tasks
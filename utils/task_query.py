@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업 조회 조건과 실행 계획
+
+TaskQuery는 날짜 범위/카테고리/완료 상태/중요 여부/검색어 조건을 담는 불변 객체로,
+where()로 조건을 바꾼 새 조회를 만들어 조합한다. 실행은 저장소가 맡는다.
+    - StorageManager.query(): 메모리 인덱스에서 후보가 가장 적은 경로를 고르고
+      (plan_query) 남은 조건을 싼 것부터 적용
+    - SqliteStorageManager.query(): 조건을 WHERE 절로 바꿔 DB 인덱스 사용
+    - TaskQuery.filter(): 이미 가지고 있는 작업 목록을 거를 때
+실행 결과는 모두 지연 반복자이다. 정렬이 필요할 때만 거른 결과를 모아 정렬한다.
+
+후보 경로 (plan_query)
+    - date: 기간 내 날짜의 작업 (TaskIndex.by_date, 제외 날짜는 건너뜀)
+    - important_open: 중요 미완료 작업 (중요=예, 완료=아니오 조건일 때)
+    - text: 검색 색인에서 찾은 작업 ID
+    - scan: 전체 작업
+날짜 범위가 있으면 날짜 경로를 먼저 후보로 두고, 예상 후보 수가 더 적은 경로가 있으면
+그것을 쓴다. 후보 경로가 이미 보장하는 조건은 다시 검사하지 않는다.
+"""
+
+from collections import namedtuple
+from itertools import chain, filterfalse
+from operator import attrgetter
+
+from utils.search_index import parse_query, task_matches
+from utils.task_index import order_key
+
+# 결과 정렬
+ORDER_STORAGE = "storage"   # 입력 순 (저장된 순서)
+ORDER_DATE = "date"         # 날짜 오름차순, 같은 날짜는 order 순
+ORDER_RECENT = "recent"     # 날짜 내림차순, 같은 날짜는 입력 순
+ORDERS = (ORDER_STORAGE, ORDER_DATE, ORDER_RECENT)
+
+# 후보 경로
+SOURCE_DATE = "date"
+SOURCE_IMPORTANT = "important_open"
+SOURCE_TEXT = "text"
+SOURCE_SCAN = "scan"
+
+# source: 후보 경로, estimate: 예상 후보 수, covered: 경로가 보장하는 조건, dates: 날짜 경로의 날짜 목록
+QueryPlan = namedtuple("QueryPlan", "source estimate covered dates")
+
+_CREATED_DATE = attrgetter("created_date")
+_COMPLETED = attrgetter("completed")
+_IMPORTANT = attrgetter("important")
+
+
+class TaskQuery:
+    """작업 조회 조건
+
+    Args:
+        start_date (str, optional): 시작일 (YYYY-MM-DD, 포함)
+        end_date (str, optional): 종료일 (YYYY-MM-DD, 포함)
+        categories (iterable, optional): 포함할 카테고리 (None이나 빈 목록이면 전체)
+        completed (bool, optional): 완료 상태 (None: 모두)
+        important (bool, optional): 중요 여부 (None: 모두)
+        text (str, optional): 제목/내용 검색어 (검색창과 같은 규칙, 모든 단어 포함)
+        exclude_date (str, optional): 제외할 날짜
+        order (str, optional): 결과 정렬 (ORDER_STORAGE/ORDER_DATE/ORDER_RECENT)
+    """
+
+    __slots__ = ("start_date", "end_date", "categories", "completed", "important", "text", "exclude_date",
+                 "order", "_terms")
+
+    def __init__(self, start_date=None, end_date=None, categories=None, completed=None, important=None,
+                 text=None, exclude_date=None, order=ORDER_STORAGE):
+        if order not in ORDERS:
+            raise ValueError(f"알 수 없는 정렬: {order}")
+        terms = parse_query(text) if text and text.strip() else []
+
+        self.start_date = start_date or None
+        self.end_date = end_date or None
+        self.categories = frozenset(categories) if categories else None
+        self.completed = None if completed is None else bool(completed)
+        self.important = None if important is None else bool(important)
+        # 토큰이 하나도 없는 검색어는 조건이 없는 것으로 취급
+        self.text = text if terms else None
+        self.exclude_date = exclude_date or None
+        self.order = order
+        self._terms = terms
+
+    @classmethod
+    def from_filters(cls, date_range=None, categories=None, completed=None, **conditions):
+        """내보내기 화면의 필터 형식(date_range 튜플)으로 조회 생성"""
+        start_date, end_date = date_range if date_range else (None, None)
+        return cls(start_date, end_date, categories, completed, **conditions)
+
+    def where(self, **conditions):
+        """조건 일부를 바꾼 새 조회
+
+        Args:
+            **conditions: 생성자 인자 (date_range=(시작일, 종료일)도 가능)
+
+        Returns:
+            TaskQuery: 새 조회
+        """
+        if "date_range" in conditions:
+            date_range = conditions.pop("date_range")
+            conditions["start_date"], conditions["end_date"] = date_range if date_range else (None, None)
+        fields = {
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "categories": self.categories,
+            "completed": self.completed,
+            "important": self.important,
+            "text": self.text,
+            "exclude_date": self.exclude_date,
+            "order": self.order,
+        }
+        unknown = set(conditions) - set(fields)
+        if unknown:
+            raise TypeError(f"알 수 없는 조회 조건: {', '.join(sorted(unknown))}")
+        fields.update(conditions)
+        return TaskQuery(**fields)
+
+    @property
+    def date_range(self):
+        """(시작일, 종료일) 튜플 (날짜 조건이 없으면 None)"""
+        if self.start_date is None and self.end_date is None:
+            return None
+        return self.start_date, self.end_date
+
+    def _checks(self, skip, text_ids):
+        """검사할 조건 목록 (싼 조건부터)
+
+        완료/중요 조건은 attrgetter를 그대로 쓰고 filterfalse로 뒤집어, 작업마다
+        파이썬 함수를 호출하지 않게 한다.
+
+        Args:
+            skip (iterable): 이미 보장된 조건 이름 (date/exclude_date/important/completed/categories/text)
+            text_ids (set): 검색 색인에서 찾은 작업 ID (None이면 작업마다 토큰을 만들어 검사)
+
+        Returns:
+            list: (Task를 받는 함수, 결과가 참인 작업을 남길지) 목록
+        """
+        checks = []
+        if self.completed is not None and "completed" not in skip:
+            checks.append((_COMPLETED, self.completed))
+        if self.important is not None and "important" not in skip:
+            checks.append((_IMPORTANT, self.important))
+        if self.exclude_date is not None and "exclude_date" not in skip:
+            exclude_date = self.exclude_date
+            checks.append((lambda task: task.created_date == exclude_date, False))
+        if self.date_range is not None and "date" not in skip:
+            start_date, end_date = self.start_date, self.end_date
+            if start_date is None:
+                checks.append((lambda task: task.created_date <= end_date, True))
+            elif end_date is None:
+                checks.append((lambda task: task.created_date >= start_date, True))
+            else:
+                checks.append((lambda task: start_date <= task.created_date <= end_date, True))
+        if self.categories is not None and "categories" not in skip:
+            categories = self.categories
+            checks.append((lambda task: task.category in categories, True))
+        if self.text is not None and "text" not in skip:
+            if text_ids is not None:
+                checks.append((lambda task: task.id in text_ids, True))
+            else:
+                terms = self._terms
+                checks.append((lambda task: task_matches(task, terms), True))
+        return checks
+
+    def matches(self, task):
+        """작업이 모든 조건을 만족하는지"""
+        return all(bool(check(task)) == keep for check, keep in self._checks((), None))
+
+    def apply(self, tasks, skip=(), text_ids=None):
+        """작업 반복자에 조건을 지연 적용 (정렬하지 않음)"""
+        for check, keep in self._checks(skip, text_ids):
+            tasks = filter(check, tasks) if keep else filterfalse(check, tasks)
+        return iter(tasks)
+
+    def filter(self, tasks):
+        """작업 목록에서 조건에 맞는 작업 (지연 반복자)
+
+        ORDER_STORAGE는 입력 순서를 그대로 유지한다.
+
+        Args:
+            tasks (iterable): 작업 목록
+
+        Returns:
+            iterator: 작업 반복자
+        """
+        matched = self.apply(tasks)
+        if self.order == ORDER_STORAGE:
+            return matched
+        return sort_tasks(matched, self.order)
+
+    def __repr__(self):
+        conditions = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__[:-1]
+            if getattr(self, name) is not None and not (name == "order" and self.order == ORDER_STORAGE)
+        )
+        return f"TaskQuery({conditions})"
+
+
+def sort_tasks(tasks, order, position=None):
+    """작업 정렬 (지연 반복자로 반환)
+
+    Args:
+        tasks (iterable): 작업 목록
+        order (str): ORDER_STORAGE/ORDER_DATE/ORDER_RECENT
+        position (callable, optional): 작업 ID -> 입력 순번. 없으면 주어진 순서를 입력 순으로 봄
+    """
+    if position is None:
+        tasks = list(tasks)
+    else:
+        tasks = sorted(tasks, key=lambda task: position(task.id))
+
+    # 정렬은 안정적이므로 같은 키의 작업은 입력 순서가 유지된다
+    if order == ORDER_DATE:
+        tasks.sort(key=lambda task: (task.created_date, order_key(task)))
+    elif order == ORDER_RECENT:
+        tasks.sort(key=_CREATED_DATE, reverse=True)
+    return iter(tasks)
+
+
+def plan_query(query, index, text_ids=None):
+    """메모리 인덱스에서 후보를 가져올 경로 선택
+
+    Args:
+        query (TaskQuery): 조회 조건
+        index (TaskIndex): 작업 인덱스
+        text_ids (set, optional): 검색 색인에서 찾은 작업 ID (검색어가 있을 때)
+
+    Returns:
+        QueryPlan: 예상 후보 수가 가장 적은 경로 (같으면 날짜 경로 우선)
+    """
+    plans = []
+    if query.date_range is not None:
+        dates = index.dates_in_range(query.start_date, query.end_date)
+        if query.exclude_date is not None and query.exclude_date in dates:
+            dates.remove(query.exclude_date)
+        plans.append(QueryPlan(SOURCE_DATE, sum(map(index.count_on_date, dates)),
+                               frozenset(("date", "exclude_date")), dates))
+    if query.important is True and query.completed is False:
+        plans.append(QueryPlan(SOURCE_IMPORTANT, len(index.important_open),
+                               frozenset(("important", "completed")), None))
+    if text_ids is not None:
+        plans.append(QueryPlan(SOURCE_TEXT, len(text_ids), frozenset(("text",)), None))
+    plans.append(QueryPlan(SOURCE_SCAN, len(index), frozenset(), None))
+    return min(plans, key=attrgetter("estimate"))
+
+
+def execute_plan(query, plan, index, all_tasks, text_ids=None):
+    """실행 계획대로 후보를 모아 남은 조건을 적용
+
+    Args:
+        query (TaskQuery): 조회 조건
+        plan (QueryPlan): plan_query() 결과
+        index (TaskIndex): 작업 인덱스
+        all_tasks (iterable): 전체 작업 (입력 순, 전체 탐색 경로에서 사용)
+        text_ids (set, optional): 검색 색인에서 찾은 작업 ID
+
+    Returns:
+        iterator: 작업 반복자
+    """
+    if plan.source == SOURCE_DATE:
+        candidates = chain.from_iterable(map(index.tasks_on_date, plan.dates))
+        natural_order = ORDER_DATE
+    elif plan.source == SOURCE_IMPORTANT:
+        candidates = list(index.important_open.values())
+        natural_order = None
+    elif plan.source == SOURCE_TEXT:
+        candidates = [task for task in map(index.get, text_ids) if task is not None]
+        natural_order = None
+    else:
+        candidates = all_tasks
+        natural_order = ORDER_STORAGE
+
+    matched = query.apply(candidates, plan.covered, text_ids)
+    if query.order == natural_order:
+        return matched
+    return sort_tasks(matched, query.order, index.position)
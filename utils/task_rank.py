@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+날짜 내 작업 순서(order) 값 계산
+
+order는 날짜 안에서의 정렬 키일 뿐 연속된 번호일 필요가 없으므로, 작업 사이에
+RANK_STEP 간격을 두고 번호를 매긴다. 작업을 옮길 때는 앞뒤 작업 order의 중간 값을
+옮긴 작업 하나에만 주면 되고, 삭제할 때도 다른 작업의 order를 당기지 않는다.
+중간 값이 남지 않았을 때(같은 자리에 10번 이상 연속으로 끼워 넣은 경우 등)만
+날짜 작업 전체를 다시 RANK_STEP 간격으로 벌린다.
+
+order는 계속 정수이므로 기존 tasks.json/저널/SQLite 형식과 그대로 호환된다.
+"""
+
+RANK_STEP = 1024
+
+
+def rank_after(order):
+    """마지막 작업 뒤에 붙일 order (order가 None이면 첫 작업)"""
+    return (order or 0) + RANK_STEP
+
+
+def rank_between(before, after):
+    """두 order 사이의 값
+
+    Args:
+        before (int): 앞 작업의 order (맨 앞으로 옮길 때 None)
+        after (int): 뒤 작업의 order (맨 뒤로 옮길 때 None)
+
+    Returns:
+        int: 사이 값 (빈 값이 없으면 None: 날짜 작업의 order를 다시 벌려야 함)
+    """
+    if after is None:
+        return rank_after(before)
+    if before is None:
+        return after - RANK_STEP
+    if after - before > 1:
+        return (before + after) // 2
+    return None
+
+
+def spread_ranks(count):
+    """작업 count개에 새로 매길 order 목록 (RANK_STEP 간격)"""
+    return [RANK_STEP * (i + 1) for i in range(count)]
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+작업/카테고리 변경 되돌리기(Undo) / 다시 실행(Redo)
+
+StorageManager의 변경 메서드가 변경 직후 record()로 명령을 남긴다. 명령은 되돌리는 데
+필요한 최소 정보(작업 한 건의 dict, 옮기기 전후 위치, 삭제한 카테고리와 그 카테고리였던
+작업 ID 등)만 보관한다. undo/redo는 같은 StorageManager 메서드를 다시 호출해 적용하므로
+저널/SQLite/월별 파일 등 저장소별 기록 경로와 변경 알림을 그대로 탄다.
+
+    - batch_changes 블록 안의 명령은 한 단계로 묶는다 (완료 체크 + 우선순위 이동 등)
+    - 같은 작업을 COALESCE_SECONDS 안에 연달아 수정/이동하면 한 단계로 합친다
+    - 보관한 명령의 대략적인 크기 합이 max_bytes를 넘으면 오래된 단계부터 버린다
+
+UI는 get_tasks_by_date로 받은 작업 객체를 직접 고친 뒤 update_task를 부르므로, 메모리
+저장소에서는 update_task 시점에 변경 전 값이 이미 사라져 있다. 그래서 화면에 나간 작업의
+변경 전 상태를 watch()로 기억해 두고(최대 MAX_WATCHED개), 변경 알림마다 최신 상태로
+갱신한다. 기억해 둔 상태가 없는 작업을 직접 고친 변경은 기록하지 않는다.
+"""
+
+import time
+from collections import OrderedDict, deque
+
+from models.category import Category
+from models.task import Task
+from utils.logger import get_logger
+
+logger = get_logger("storage")
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024  # 보관할 명령 크기 합의 상한
+COALESCE_SECONDS = 1.5  # 같은 작업의 연속 수정/이동을 합치는 시간
+MAX_WATCHED = 2000  # 변경 전 상태를 기억할 화면 작업 수
+LABEL_TITLE_LENGTH = 30
+
+# 되돌릴 때 기존 작업 객체에 덮어쓸 필드
+TASK_FIELDS = ("title", "content", "category", "created_date", "important", "completed", "bg_color", "order")
+
+
+def _short_title(title):
+    return title if len(title) <= LABEL_TITLE_LENGTH else title[:LABEL_TITLE_LENGTH] + "…"
+
+
+def _restore_task(storage, task_data):
+    """저장된 작업 객체를 task_data 상태로 되돌림 (화면이 들고 있는 객체를 유지하도록 제자리 수정)"""
+    task = storage.get_task(task_data["id"])
+    if task is None:
+        logger.warning("되돌릴 작업을 찾을 수 없음: %s", task_data["id"])
+        return False
+    restored = Task.from_dict(task_data)
+    for field in TASK_FIELDS:
+        setattr(task, field, getattr(restored, field))
+    return storage.update_task(task.id, task)
+
+
+class UndoCommand:
+    """되돌리기 명령 (하위 클래스가 undo/redo 구현)
+
+    Attributes:
+        label (str): 메뉴/상태 표시줄에 보일 설명
+        size (int): 대략적인 보관 크기 (바이트)
+        timestamp (float): 기록 시각 (time.monotonic)
+    """
+
+    def __init__(self, label, payload=None):
+        self.label = label
+        self.size = 64 + len(repr(payload)) if payload is not None else 64
+        self.timestamp = time.monotonic()
+
+    def undo(self, storage):
+        raise NotImplementedError
+
+    def redo(self, storage):
+        raise NotImplementedError
+
+    def merge(self, other):
+        """뒤이은 명령을 이 명령에 합칠 수 있으면 합치고 True"""
+        return False
+
+
+class AddTaskCommand(UndoCommand):
+    """작업 추가"""
+
+    def __init__(self, task_data):
+        super().__init__(f"작업 추가 '{_short_title(task_data['title'])}'", task_data)
+        self.task_data = task_data
+
+    def undo(self, storage):
+        storage.delete_task(self.task_data["id"])
+
+    def redo(self, storage):
+        storage.add_task(Task.from_dict(self.task_data))
+
+
+class DeleteTaskCommand(UndoCommand):
+    """작업 삭제"""
+
+    def __init__(self, task_data):
+        super().__init__(f"작업 삭제 '{_short_title(task_data['title'])}'", task_data)
+        self.task_data = task_data
+
+    def undo(self, storage):
+        storage.add_task(Task.from_dict(self.task_data))
+
+    def redo(self, storage):
+        storage.delete_task(self.task_data["id"])
+
+
+class UpdateTaskCommand(UndoCommand):
+    """작업 수정 (변경 전후 작업 dict)"""
+
+    def __init__(self, before, after):
+        super().__init__(f"작업 수정 '{_short_title(after['title'])}'", (before, after))
+        self.before = before
+        self.after = after
+
+    def undo(self, storage):
+        _restore_task(storage, self.before)
+
+    def redo(self, storage):
+        _restore_task(storage, self.after)
+
+    def merge(self, other):
+        if not isinstance(other, UpdateTaskCommand) or other.after["id"] != self.after["id"]:
+            return False
+        self.after = other.after
+        return True
+
+
+class MoveTaskCommand(UndoCommand):
+    """날짜 안에서 작업 위치 이동"""
+
+    def __init__(self, task_id, title, from_index, to_index):
+        super().__init__(f"작업 순서 변경 '{_short_title(title)}'")
+        self.task_id = task_id
+        self.from_index = from_index
+        self.to_index = to_index
+
+    def undo(self, storage):
+        storage.move_task(self.task_id, self.from_index)
+
+    def redo(self, storage):
+        storage.move_task(self.task_id, self.to_index)
+
+    def merge(self, other):
+        if not isinstance(other, MoveTaskCommand) or other.task_id != self.task_id:
+            return False
+        self.to_index = other.to_index
+        return True
+
+
+class AddCategoryCommand(UndoCommand):
+    """카테고리 추가"""
+
+    def __init__(self, category_data, index):
+        super().__init__(f"카테고리 추가 '{category_data['name']}'", category_data)
+        self.category_data = category_data
+        self.index = index
+
+    def undo(self, storage):
+        storage.delete_category(self.category_data["name"])
+
+    def redo(self, storage):
+        storage.add_category(Category.from_dict(self.category_data), self.index)
+
+
+class DeleteCategoryCommand(UndoCommand):
+    """카테고리 삭제 (그 카테고리였다가 ETC로 바뀐 작업 ID 포함)"""
+
+    def __init__(self, category_data, index, task_ids):
+        super().__init__(f"카테고리 삭제 '{category_data['name']}'", (category_data, task_ids))
+        self.category_data = category_data
+        self.index = index
+        self.task_ids = list(task_ids)
+
+    def undo(self, storage):
+        name = self.category_data["name"]
+        storage.add_category(Category.from_dict(self.category_data), self.index)
+        for task_id in self.task_ids:
+            task = storage.get_task(task_id)
+            if task is not None and task.category == "ETC":
+                task.category = name
+                storage.update_task(task_id, task)
+
+    def redo(self, storage):
+        storage.delete_category(self.category_data["name"])
+
+
+class ReorderCategoriesCommand(UndoCommand):
+    """카테고리 순서 변경"""
+
+    def __init__(self, source_index, target_index):
+        super().__init__("카테고리 순서 변경")
+        self.source_index = source_index
+        self.target_index = target_index
+
+    def undo(self, storage):
+        storage.reorder_categories(self.target_index, self.source_index)
+
+    def redo(self, storage):
+        storage.reorder_categories(self.source_index, self.target_index)
+
+
+class CompositeCommand(UndoCommand):
+    """batch_changes 블록 하나에서 나온 명령 묶음"""
+
+    def __init__(self, commands):
+        super().__init__(commands[0].label)
+        self.commands = commands
+        self.size = sum(command.size for command in commands)
+
+    def undo(self, storage):
+        for command in reversed(self.commands):
+            command.undo(storage)
+
+    def redo(self, storage):
+        for command in self.commands:
+            command.redo(storage)
+
+
+class UndoHistory:
+    """되돌리기/다시 실행 기록
+
+    Args:
+        storage (StorageManager): 명령을 적용할 저장소
+        max_bytes (int, optional): 보관할 명령 크기 합의 상한
+        coalesce_seconds (float, optional): 같은 작업의 연속 변경을 합치는 시간 (0이면 합치지 않음)
+    """
+
+    def __init__(self, storage, max_bytes=DEFAULT_MAX_BYTES, coalesce_seconds=COALESCE_SECONDS):
+        self.storage = storage
+        self.max_bytes = max_bytes
+        self.coalesce_seconds = coalesce_seconds
+        self.undo_stack = deque()
+        self.redo_stack = []
+        self.total_bytes = 0
+        self._group = None
+        self._group_depth = 0
+        self._applying = False
+        self._watched = OrderedDict()  # 작업 ID -> 화면에 나간 작업의 현재 상태 dict
+
+    # --- 기록 ---
+
+    def record(self, command):
+        """변경 직후 명령 기록 (undo/redo 적용 중에는 무시)"""
+        if self._applying:
+            return
+        if self._group is not None:
+            self._group.append(command)
+            return
+        self._push(command)
+
+    def begin_group(self):
+        """명령 묶기 시작 (중첩 가능, batch_changes에서 호출)"""
+        if self._group_depth == 0:
+            self._group = []
+        self._group_depth += 1
+
+    def end_group(self):
+        """명령 묶기 끝 (가장 바깥 블록이 끝날 때 한 단계로 기록)"""
+        self._group_depth -= 1
+        if self._group_depth:
+            return
+        commands, self._group = self._group, None
+        if self._applying or not commands:
+            return
+        self._push(commands[0] if len(commands) == 1 else CompositeCommand(commands))
+
+    def _push(self, command):
+        self._clear_redo()
+        top = self.undo_stack[-1] if self.undo_stack else None
+        if (top is not None and command.timestamp - top.timestamp <= self.coalesce_seconds
+                and top.merge(command)):
+            top.timestamp = command.timestamp
+            return
+
+        self.undo_stack.append(command)
+        self.total_bytes += command.size
+        while self.total_bytes > self.max_bytes and len(self.undo_stack) > 1:
+            self.total_bytes -= self.undo_stack.popleft().size
+
+    def _clear_redo(self):
+        for command in self.redo_stack:
+            self.total_bytes -= command.size
+        self.redo_stack.clear()
+
+    def clear(self):
+        """기록 전체 삭제"""
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.total_bytes = 0
+
+    # --- 적용 ---
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def undo_label(self):
+        """다음에 되돌릴 단계 설명 (없으면 None)"""
+        return self.undo_stack[-1].label if self.undo_stack else None
+
+    def redo_label(self):
+        """다음에 다시 실행할 단계 설명 (없으면 None)"""
+        return self.redo_stack[-1].label if self.redo_stack else None
+
+    def undo(self):
+        """마지막 단계 되돌리기
+
+        Returns:
+            str: 되돌린 단계 설명 (되돌릴 것이 없으면 None)
+        """
+        if not self.undo_stack:
+            return None
+        command = self.undo_stack.pop()
+        self._apply(command.undo)
+        self.redo_stack.append(command)
+        return command.label
+
+    def redo(self):
+        """마지막으로 되돌린 단계 다시 실행
+
+        Returns:
+            str: 다시 실행한 단계 설명 (없으면 None)
+        """
+        if not self.redo_stack:
+            return None
+        command = self.redo_stack.pop()
+        self._apply(command.redo)
+        # 다시 실행한 단계는 뒤이은 변경과 합치지 않음
+        command.timestamp = float("-inf")
+        self.undo_stack.append(command)
+        return command.label
+
+    def _apply(self, action):
+        """기록을 끈 채 명령 적용 (변경 알림은 한 번으로 묶음)"""
+        self._applying = True
+        try:
+            with self.storage.batch_changes():
+                action(self.storage)
+        finally:
+            self._applying = False
+
+    # --- 화면에 나간 작업의 변경 전 상태 ---
+
+    def watch(self, tasks):
+        """화면에 나간 작업의 현재 상태를 기억 (이미 기억 중이면 최근 순서만 갱신)"""
+        watched = self._watched
+        for task in tasks:
+            if task.id in watched:
+                watched.move_to_end(task.id)
+            else:
+                watched[task.id] = task.to_dict()
+        while len(watched) > MAX_WATCHED:
+            watched.popitem(last=False)
+
+    def watched_state(self, task_id):
+        """기억해 둔 작업 상태 (없으면 None)"""
+        return self._watched.get(task_id)
+
+    def refresh_watched(self, changes, get_task):
+        """변경 알림 내용으로 기억해 둔 작업 상태 갱신
+
+        Args:
+            changes (TaskChangeSet): 변경 내역
+            get_task (callable): 작업 ID -> Task
+        """
+        watched = self._watched
+        if not watched:
+            return
+        for task_id in changes.removed:
+            watched.pop(task_id, None)
+        stale = [task_id for task_id in changes.updated | changes.added if task_id in watched]
+        if changes.reordered_dates:
+            stale += [task_id for task_id, state in watched.items()
+                      if state["created_date"] in changes.reordered_dates]
+        for task_id in stale:
+            task = get_task(task_id)
+            if task is None:
+                watched.pop(task_id, None)
+            else:
+                watched[task_id] = task.to_dict()